@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks do Sistema
+=====================
+
+Medições de desempenho sem interface gráfica (nenhum Tk é criado):
+- medicao (cronometragem, percentis, RSS e alocações)
+- gerador_dados (gerador de dados sintéticos, também usado como script)
+- dados (escalas medidas e seus arquivos de dados)
+- casos (o que é medido: persistência, mutações, buscas e relatórios)
+- executar (linha de comando que gera o JSON de resultados)
+- comparar (compara com uma linha de base e falha em regressões)
+- importacao (tempo de importação em processos novos, sem tkinter nos caminhos sem interface)
+
+A linha de base versionada é benchmarks/linha_base.json (ver comparar.py
+para atualizá-la).
+
+Uso:
+    python benchmarks/executar.py -o resultados.json
+    python benchmarks/comparar.py benchmarks/linha_base.json resultados.json
+"""
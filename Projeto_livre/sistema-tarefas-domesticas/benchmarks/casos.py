@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Casos de Benchmark
+==================
+
+Cada caso recebe um Contexto (cópia própria do arquivo de dados da escala)
+e devolve a Execucao a medir. Os relatórios do mixin GerarRelatorios são
+registrados automaticamente, então um relatório novo já entra na medição.
+"""
+
+import contextlib
+import inspect
+import os
+import random
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.mixins.gerar_relatorios import GerarRelatorios
+from package.models.residencia import Residencia
+
+from .medicao import Execucao, medir, pico_rss_bytes
+
+# Consultas por amostra nos casos de busca por ID
+CONSULTAS_POR_AMOSTRA = 1000
+
+# Finalizações por amostra (limitado pelas atividades pendentes)
+FINALIZACOES_POR_AMOSTRA = 100
+
+CASOS: Dict[str, Callable[['Contexto'], Execucao]] = {}
+
+
+def caso(nome: str):
+    """Decorador que registra a função de preparação de um caso."""
+    def registrar(preparar: Callable[['Contexto'], Execucao]):
+        CASOS[nome] = preparar
+        return preparar
+    return registrar
+
+
+class Contexto:
+    """
+    Ambiente de um caso: cópia do arquivo de dados e parâmetros da medição.
+
+    Attributes:
+        arquivo (str): Cópia do sistema_tarefas.json que o caso pode alterar
+        aleatorio (random.Random): Gerador com semente fixa
+        repeticoes (int): Amostras que serão medidas
+        aquecimento (int): Execuções descartadas
+    """
+
+    def __init__(self, arquivo_dados: str, diretorio: str, semente: int,
+                 repeticoes: int, aquecimento: int):
+        """
+        Inicializa o contexto copiando o arquivo de dados.
+
+        Args:
+            arquivo_dados (str): Arquivo da escala (não é alterado)
+            diretorio (str): Diretório temporário do caso
+            semente (int): Semente do gerador aleatório
+            repeticoes (int): Amostras que serão medidas
+            aquecimento (int): Execuções descartadas
+        """
+        self.arquivo = os.path.join(diretorio, 'sistema_tarefas.json')
+        shutil.copyfile(arquivo_dados, self.arquivo)
+        self.aleatorio = random.Random(semente)
+        self.repeticoes = repeticoes
+        self.aquecimento = aquecimento
+
+    @property
+    def execucoes(self) -> int:
+        """Total de chamadas da função medida (aquecimento + amostras + alocações)."""
+        return self.aquecimento + self.repeticoes + 1
+
+    def criar_gerenciador(self, carregar: bool = True) -> GerenciadorTarefas:
+        """
+        Cria um gerenciador ligado à cópia do arquivo.
+
+        Args:
+            carregar (bool): Se True, carrega os dados antes de devolver
+
+        Returns:
+            GerenciadorTarefas: Gerenciador pronto para uso
+        """
+        gerenciador = GerenciadorTarefas(Residencia("Casa Benchmark"),
+                                         ArmazenamentoDados(self.arquivo))
+        if carregar and not gerenciador.carregar_dados():
+            raise RuntimeError(f"Não foi possível carregar {self.arquivo}")
+        return gerenciador
+
+
+# === PERSISTÊNCIA ===
+
+@caso('armazenamento.salvar_em_json')
+def _salvar_em_json(contexto: Contexto) -> Execucao:
+    dados = contexto.criar_gerenciador().montar_dados()
+    armazenamento = ArmazenamentoDados(contexto.arquivo)
+    return Execucao(lambda _: armazenamento.salvar_em_json(dados))
+
+
+@caso('armazenamento.carregar_do_json')
+def _carregar_do_json(contexto: Contexto) -> Execucao:
+    armazenamento = ArmazenamentoDados(contexto.arquivo)
+    return Execucao(lambda _: armazenamento.carregar_do_json())
+
+
+@caso('gerenciador.salvar_dados')
+def _salvar_dados(contexto: Contexto) -> Execucao:
+    gerenciador = contexto.criar_gerenciador()
+    return Execucao(lambda _: gerenciador.salvar_dados())
+
+
+@caso('gerenciador.carregar_dados')
+def _carregar_dados(contexto: Contexto) -> Execucao:
+    gerenciador = contexto.criar_gerenciador(carregar=False)
+    return Execucao(lambda _: gerenciador.carregar_dados())
+
+
+@caso('gerenciador.carregar_dados_cache')
+def _carregar_dados_cache(contexto: Contexto) -> Execucao:
+    armazenamento = ArmazenamentoDados(contexto.arquivo, usar_cache=True)
+    gerenciador = GerenciadorTarefas(Residencia("Casa Benchmark"), armazenamento)
+    # A primeira leitura grava o cache; as medidas são todas de inicialização quente
+    gerenciador.carregar_dados()
+    return Execucao(lambda _: gerenciador.carregar_dados())
+
+
+# === MUTAÇÕES ===
+
+def _lotes_pendentes(contexto: Contexto,
+                     gerenciador: GerenciadorTarefas) -> Tuple[Iterator[List[str]], int]:
+    """Divide as atividades pendentes em um lote por execução."""
+    pendentes = [a.id_atividade for a in gerenciador.obter_atividades_pendentes()]
+    contexto.aleatorio.shuffle(pendentes)
+    lote = min(FINALIZACOES_POR_AMOSTRA, len(pendentes) // contexto.execucoes)
+    if lote < 1:
+        raise RuntimeError("Atividades pendentes insuficientes para a medição")
+    lotes = iter([pendentes[i:i + lote] for i in range(0, lote * contexto.execucoes, lote)])
+    return lotes, lote
+
+
+@caso('gerenciador.finalizar_atividade')
+def _finalizar_atividade(contexto: Contexto) -> Execucao:
+    gerenciador = contexto.criar_gerenciador()
+    lotes, lote = _lotes_pendentes(contexto, gerenciador)
+
+    def finalizar(ids: List[str]):
+        for atividade_id in ids:
+            gerenciador.finalizar_atividade(atividade_id)
+
+    return Execucao(finalizar, preparar=lambda: next(lotes), lote=lote)
+
+
+@caso('gerenciador.finalizar_atividades')
+def _finalizar_atividades(contexto: Contexto) -> Execucao:
+    gerenciador = contexto.criar_gerenciador()
+    lotes, lote = _lotes_pendentes(contexto, gerenciador)
+    return Execucao(gerenciador.finalizar_atividades, preparar=lambda: next(lotes), lote=lote)
+
+
+# === BUSCAS POR ID ===
+
+def _consultas(contexto: Contexto, ids: List[str]) -> Callable[[], List[str]]:
+    """Sorteia, antes de cada amostra, os IDs consultados."""
+    return lambda: [contexto.aleatorio.choice(ids) for _ in range(CONSULTAS_POR_AMOSTRA)]
+
+
+@caso('gerenciador.obter_atividade_por_id')
+def _obter_atividade_por_id(contexto: Contexto) -> Execucao:
+    gerenciador = contexto.criar_gerenciador()
+    ids = [a.id_atividade for a in gerenciador.consultar_atividades()]
+
+    def consultar(consultas: List[str]):
+        for atividade_id in consultas:
+            gerenciador.obter_atividade_por_id(atividade_id)
+
+    return Execucao(consultar, preparar=_consultas(contexto, ids), lote=CONSULTAS_POR_AMOSTRA)
+
+
+@caso('gerenciador.obter_morador_por_id')
+def _obter_morador_por_id(contexto: Contexto) -> Execucao:
+    gerenciador = contexto.criar_gerenciador()
+    ids = [m.id for m in gerenciador.obter_moradores()]
+
+    def consultar(consultas: List[str]):
+        for morador_id in consultas:
+            gerenciador.obter_morador_por_id(morador_id)
+
+    return Execucao(consultar, preparar=_consultas(contexto, ids), lote=CONSULTAS_POR_AMOSTRA)
+
+
+# === RELATÓRIOS ===
+
+def _registrar_relatorios():
+    """Registra um caso para cada relatório público de GerarRelatorios."""
+    for nome, _ in inspect.getmembers(GerarRelatorios, inspect.isfunction):
+        if nome.startswith('_'):
+            continue
+
+        def preparar(contexto: Contexto, nome=nome) -> Execucao:
+            relatorio = getattr(contexto.criar_gerenciador(), nome)
+            return Execucao(lambda _: relatorio())
+
+        CASOS[f'relatorios.{nome}'] = preparar
+
+
+_registrar_relatorios()
+
+
+def executar_caso(nome: str, arquivo_dados: str, repeticoes: int,
+                  aquecimento: int, semente: int) -> Dict[str, Any]:
+    """
+    Prepara e mede um caso (chamado em um processo próprio pelo executor).
+
+    As mensagens que o sistema imprime são descartadas para não misturar
+    com a saída do benchmark.
+
+    Args:
+        nome (str): Nome do caso em CASOS
+        arquivo_dados (str): Arquivo de dados da escala
+        repeticoes (int): Amostras medidas
+        aquecimento (int): Execuções descartadas
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        Dict[str, Any]: Resultado de medir() mais o RSS do processo
+    """
+    with tempfile.TemporaryDirectory(prefix='benchmark_') as diretorio, \
+            open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        contexto = Contexto(arquivo_dados, diretorio, semente, repeticoes, aquecimento)
+        execucao = CASOS[nome](contexto)
+        rss_preparacao = pico_rss_bytes()
+
+        resultado = medir(execucao, repeticoes, aquecimento)
+        resultado['rss_preparacao_bytes'] = rss_preparacao
+        resultado['pico_rss_bytes'] = pico_rss_bytes()
+        return resultado
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparação com a Linha de Base
+==============================
+
+Compara resultados do executar.py com uma linha de base gravada antes
+(por exemplo, a do último release) e sai com código 1 se algum caso
+ficou mais lento.
+
+Um caso só é regressão se as duas condições valerem:
+- as amostras atuais são maiores que as da base segundo o teste de
+  Mann-Whitney (unilateral, nível 'alfa'), que não supõe distribuição
+  normal e resiste a amostras atípicas
+- a mediana piorou mais que o limiar, que é o maior entre o limiar fixo
+  e 'fator_ruido' vezes o ruído medido (desvio absoluto mediano relativo)
+
+Vários arquivos de cada lado são juntados, para somar rodadas repetidas.
+
+A linha de base versionada fica em benchmarks/linha_base.json (escalas
+padrão, semente 42). Para atualizá-la, depois de uma mudança de
+desempenho intencional ou de trocar a máquina de referência, rode o
+executar.py na mesma máquina que faz a comparação e versione o arquivo
+junto com a mudança:
+
+    python benchmarks/executar.py -o benchmarks/linha_base.json
+
+Exemplos:
+    python benchmarks/executar.py -o atual.json
+    python benchmarks/comparar.py benchmarks/linha_base.json atual.json
+    python benchmarks/comparar.py base.json atual_1.json atual_2.json --limiar 10 --alfa 0.01
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Adicionar o diretório do projeto ao path
+DIRETORIO_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIRETORIO_PROJETO)
+
+from benchmarks.executar import VERSAO_FORMATO, formatar_tempo
+
+# Até este tamanho (em cada lado) o valor-p é exato; acima, aproximação normal
+LIMITE_TESTE_EXATO = 50
+
+# Situações possíveis de cada caso
+REGRESSAO = 'regressao'
+MELHORIA = 'melhoria'
+ESTAVEL = 'estavel'
+INCONCLUSIVO = 'inconclusivo'
+NOVO = 'novo'
+REMOVIDO = 'removido'
+ERRO = 'erro'
+
+ICONES = {
+    REGRESSAO: '❌', MELHORIA: '🚀', ESTAVEL: '✅', INCONCLUSIVO: '❔',
+    NOVO: '🆕', REMOVIDO: '🗑️', ERRO: '⚠️'
+}
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Compara resultados de benchmark com uma linha de base.")
+    parser.add_argument('base', help="JSON da linha de base (gerado por executar.py)")
+    parser.add_argument('atual', nargs='+', help="JSON(s) da medição atual")
+    parser.add_argument('-b', '--base-extra', nargs='+', default=[], metavar='JSON',
+                        help="Mais rodadas da linha de base, juntadas à primeira")
+    parser.add_argument('--limiar', type=float, default=5.0,
+                        help="Piora mínima da mediana, em %% (padrão: %(default)s)")
+    parser.add_argument('--fator-ruido', type=float, default=3.0,
+                        help="Múltiplo do ruído medido usado como limiar mínimo (padrão: %(default)s)")
+    parser.add_argument('--alfa', type=float, default=0.05,
+                        help="Nível de significância do teste (padrão: %(default)s)")
+    parser.add_argument('-c', '--casos', nargs='+',
+                        help="Comparar só estes casos (padrão: todos)")
+    parser.add_argument('--falhar-removidos', action='store_true',
+                        help="Também falhar se um caso da base sumiu ou deu erro")
+    parser.add_argument('--json', metavar='ARQ', help="Grava a comparação também em JSON")
+    return parser
+
+
+def carregar_resultados(caminhos: List[str]) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[str, Any]]:
+    """
+    Lê um ou mais JSONs de resultados e junta as amostras de cada caso.
+
+    Args:
+        caminhos (List[str]): Arquivos gerados por executar.py
+
+    Returns:
+        Tuple: {(caso, escala): {'amostras_ns', 'erro'}} e o ambiente do primeiro arquivo
+
+    Raises:
+        ValueError: Se um arquivo tiver versão de formato desconhecida
+    """
+    resultados = {}
+    ambiente = {}
+    for caminho in caminhos:
+        with open(caminho, 'r', encoding='utf-8') as arquivo:
+            documento = json.load(arquivo)
+        if documento.get('versao_formato') != VERSAO_FORMATO:
+            raise ValueError(f"{caminho}: versão de formato {documento.get('versao_formato')} "
+                             f"não suportada (esperada {VERSAO_FORMATO})")
+        ambiente = ambiente or documento.get('ambiente', {})
+
+        for registro in documento['resultados']:
+            chave = (registro['caso'], registro['escala'])
+            acumulado = resultados.setdefault(chave, {'amostras_ns': [], 'erro': None})
+            if 'erro' in registro:
+                acumulado['erro'] = registro['erro']
+            else:
+                acumulado['amostras_ns'].extend(registro['amostras_ns'])
+    return resultados, ambiente
+
+
+def _postos(valores: List[float]) -> List[float]:
+    """Postos (1..n) com a média dos postos nos empates."""
+    ordem = sorted(range(len(valores)), key=valores.__getitem__)
+    postos = [0.0] * len(valores)
+    inicio = 0
+    while inicio < len(ordem):
+        fim = inicio
+        while fim + 1 < len(ordem) and valores[ordem[fim + 1]] == valores[ordem[inicio]]:
+            fim += 1
+        medio = (inicio + fim) / 2 + 1
+        for posicao in range(inicio, fim + 1):
+            postos[ordem[posicao]] = medio
+        inicio = fim + 1
+    return postos
+
+
+@lru_cache(maxsize=None)
+def _distribuicao_u(m: int, n: int) -> Tuple[int, ...]:
+    """
+    Quantas ordenações de m + n valores distintos dão cada U (0..m*n).
+
+    Usa a recorrência f(m, n, u) = f(m - 1, n, u - n) + f(m, n - 1, u).
+    """
+    if m == 0 or n == 0:
+        return (1,)
+    sem_ultimo_x = _distribuicao_u(m - 1, n)
+    sem_ultimo_y = _distribuicao_u(m, n - 1)
+    contagens = [0] * (m * n + 1)
+    for u, quantidade in enumerate(sem_ultimo_y):
+        contagens[u] += quantidade
+    for u, quantidade in enumerate(sem_ultimo_x):
+        contagens[u + n] += quantidade
+    return tuple(contagens)
+
+
+def mann_whitney_maior(atual: List[float], base: List[float]) -> float:
+    """
+    Valor-p unilateral do teste de Mann-Whitney para "atual tende a ser maior que base".
+
+    Exato para amostras pequenas sem empates; senão, aproximação normal
+    com correção de empates e de continuidade.
+
+    Args:
+        atual (List[float]): Amostras atuais
+        base (List[float]): Amostras da linha de base
+
+    Returns:
+        float: Valor-p (1.0 se algum lado estiver vazio)
+    """
+    m, n = len(atual), len(base)
+    if not m or not n:
+        return 1.0
+
+    valores = list(atual) + list(base)
+    postos = _postos(valores)
+    u = sum(postos[:m]) - m * (m + 1) / 2
+    tem_empates = len(set(valores)) < len(valores)
+
+    if not tem_empates and max(m, n) <= LIMITE_TESTE_EXATO:
+        distribuicao = _distribuicao_u(m, n)
+        # P(U >= u): as ordenações com U pelo menos o observado
+        return sum(distribuicao[math.ceil(u):]) / math.comb(m + n, m)
+
+    total = m + n
+    empates = {}
+    for valor in valores:
+        empates[valor] = empates.get(valor, 0) + 1
+    correcao = sum(t ** 3 - t for t in empates.values()) / (total * (total - 1))
+    variancia = m * n / 12 * ((total + 1) - correcao)
+    if variancia <= 0:
+        return 1.0
+    z = (u - m * n / 2 - 0.5) / math.sqrt(variancia)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def ruido_relativo(amostras: List[float]) -> float:
+    """
+    Desvio absoluto mediano dividido pela mediana.
+
+    Args:
+        amostras (List[float]): Amostras de tempo
+
+    Returns:
+        float: Ruído relativo (0.0 se não houver amostras suficientes)
+    """
+    if len(amostras) < 2:
+        return 0.0
+    mediana = statistics.median(amostras)
+    if mediana <= 0:
+        return 0.0
+    return statistics.median(abs(a - mediana) for a in amostras) / mediana
+
+
+def comparar_caso(base: Optional[Dict[str, Any]], atual: Optional[Dict[str, Any]],
+                  limiar: float, fator_ruido: float, alfa: float) -> Dict[str, Any]:
+    """
+    Compara as amostras de um caso.
+
+    Args:
+        base (Dict): Amostras e erro da linha de base (None se o caso é novo)
+        atual (Dict): Amostras e erro atuais (None se o caso foi removido)
+        limiar (float): Piora mínima da mediana, em fração (0.05 = 5%)
+        fator_ruido (float): Múltiplo do ruído usado como limiar mínimo
+        alfa (float): Nível de significância
+
+    Returns:
+        Dict[str, Any]: Medianas, variação, limiar usado, valor-p e situação
+    """
+    if atual is None:
+        return {'situacao': REMOVIDO}
+    if base is None:
+        return {'situacao': NOVO, 'atual_ns': statistics.median(atual['amostras_ns'] or [0])}
+    if atual['erro'] or not atual['amostras_ns'] or not base['amostras_ns']:
+        return {'situacao': ERRO, 'erro': atual['erro'] or base['erro'] or "sem amostras"}
+
+    mediana_base = statistics.median(base['amostras_ns'])
+    mediana_atual = statistics.median(atual['amostras_ns'])
+    variacao = mediana_atual / mediana_base - 1 if mediana_base else 0.0
+    ruido = max(ruido_relativo(base['amostras_ns']), ruido_relativo(atual['amostras_ns']))
+    limiar_efetivo = max(limiar, fator_ruido * ruido)
+
+    if variacao >= 0:
+        p = mann_whitney_maior(atual['amostras_ns'], base['amostras_ns'])
+    else:
+        p = mann_whitney_maior(base['amostras_ns'], atual['amostras_ns'])
+
+    if abs(variacao) < limiar_efetivo:
+        situacao = ESTAVEL
+    elif p >= alfa:
+        situacao = INCONCLUSIVO
+    else:
+        situacao = REGRESSAO if variacao > 0 else MELHORIA
+
+    return {
+        'situacao': situacao,
+        'base_ns': mediana_base,
+        'atual_ns': mediana_atual,
+        'variacao': variacao,
+        'limiar': limiar_efetivo,
+        'p': p,
+        'amostras': (len(base['amostras_ns']), len(atual['amostras_ns']))
+    }
+
+
+def comparar(base: Dict[Tuple[str, str], Dict[str, Any]], atual: Dict[Tuple[str, str], Dict[str, Any]],
+             limiar: float = 0.05, fator_ruido: float = 3.0, alfa: float = 0.05,
+             casos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Compara todos os casos presentes em algum dos lados.
+
+    Args:
+        base (Dict): Resultados da linha de base (de carregar_resultados)
+        atual (Dict): Resultados atuais (de carregar_resultados)
+        limiar (float): Piora mínima da mediana, em fração
+        fator_ruido (float): Múltiplo do ruído usado como limiar mínimo
+        alfa (float): Nível de significância
+        casos (List[str]): Restringe a estes casos (opcional)
+
+    Returns:
+        List[Dict[str, Any]]: Uma comparação por (caso, escala), na ordem da base
+    """
+    chaves = list(base) + [chave for chave in atual if chave not in base]
+    comparacoes = []
+    for caso, escala in chaves:
+        if casos and caso not in casos:
+            continue
+        comparacao = comparar_caso(base.get((caso, escala)), atual.get((caso, escala)),
+                                   limiar, fator_ruido, alfa)
+        comparacoes.append({'caso': caso, 'escala': escala, **comparacao})
+    return comparacoes
+
+
+def avisar_ambientes(base: Dict[str, Any], atual: Dict[str, Any]):
+    """Avisa se as medições vieram de máquinas ou Pythons diferentes."""
+    for campo in ('python', 'implementacao', 'processador', 'cpus'):
+        if base.get(campo) != atual.get(campo):
+            print(f"⚠️ Ambientes diferentes em '{campo}': {base.get(campo)} -> {atual.get(campo)}",
+                  file=sys.stderr)
+
+
+def imprimir_tabela(comparacoes: List[Dict[str, Any]]):
+    """Imprime a comparação em forma de tabela."""
+    print(f"{'':2} {'escala':>7} {'caso':<45} {'base':>10} {'atual':>10} "
+          f"{'variação':>9} {'limiar':>7} {'p':>7}")
+    print("-" * 106)
+    for c in comparacoes:
+        icone = ICONES[c['situacao']]
+        if 'variacao' in c:
+            print(f"{icone:2} {c['escala']:>7} {c['caso']:<45} {formatar_tempo(c['base_ns']):>10} "
+                  f"{formatar_tempo(c['atual_ns']):>10} {c['variacao']:>+9.1%} {c['limiar']:>7.1%} "
+                  f"{c['p']:>7.4f}")
+        else:
+            detalhe = c.get('erro') or c['situacao']
+            print(f"{icone:2} {c['escala']:>7} {c['caso']:<45} {detalhe}")
+
+
+def main(argv=None) -> int:
+    """Função principal da comparação."""
+    args = criar_parser().parse_args(argv)
+
+    try:
+        base, ambiente_base = carregar_resultados([args.base] + args.base_extra)
+        atual, ambiente_atual = carregar_resultados(args.atual)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Não foi possível ler os resultados: {e}", file=sys.stderr)
+        return 2
+
+    avisar_ambientes(ambiente_base, ambiente_atual)
+    comparacoes = comparar(base, atual, args.limiar / 100, args.fator_ruido, args.alfa, args.casos)
+    imprimir_tabela(comparacoes)
+
+    contagem = {}
+    for c in comparacoes:
+        contagem[c['situacao']] = contagem.get(c['situacao'], 0) + 1
+    print("-" * 106)
+    print("📊 " + " | ".join(f"{ICONES[s]} {s}: {q}" for s, q in contagem.items()))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(comparacoes, arquivo, indent=2, ensure_ascii=False)
+        print(f"💾 Comparação salva em: {args.json}")
+
+    falhou = contagem.get(REGRESSAO, 0)
+    if args.falhar_removidos:
+        falhou += contagem.get(REMOVIDO, 0) + contagem.get(ERRO, 0)
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
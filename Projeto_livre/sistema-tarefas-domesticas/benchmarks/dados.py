@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dados para Benchmarks
+=====================
+
+Escalas medidas e criação do arquivo de dados de cada uma com o gerador
+de dados sintéticos (mesma semente, mesmo arquivo).
+"""
+
+from typing import Dict, NamedTuple
+
+from .gerador_dados import ParametrosGeracao, gravar_json
+
+
+class Escala(NamedTuple):
+    """Quantidade de atividades e moradores de uma escala."""
+    atividades: int
+    moradores: int
+
+
+ESCALAS: Dict[str, Escala] = {
+    'minima': Escala(100, 10),
+    'pequena': Escala(10_000, 100),
+    'media': Escala(100_000, 1_000),
+    'grande': Escala(1_000_000, 10_000),
+}
+
+ESCALAS_PADRAO = ['minima', 'pequena']
+
+# Período coberto pelos dados de cada escala
+ANOS_POR_ESCALA = 2
+
+
+def gerar_arquivo(caminho: str, escala: Escala, semente: int = 42) -> str:
+    """
+    Cria o arquivo sistema_tarefas.json de uma escala.
+
+    Args:
+        caminho (str): Arquivo a criar
+        escala (Escala): Quantidades de atividades e moradores
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        str: O caminho do arquivo criado
+    """
+    gravar_json(caminho, ParametrosGeracao(moradores=escala.moradores,
+                                           total_atividades=escala.atividades,
+                                           anos=ANOS_POR_ESCALA,
+                                           semente=semente))
+    return caminho
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Executor de Benchmarks
+======================
+
+Gera os dados de cada escala, mede cada caso em um processo novo (para
+que o pico de RSS seja só daquele caso) e grava um JSON com mediana, p95,
+amostras brutas, pico de RSS e alocações de cada medição.
+
+Exemplos:
+    python benchmarks/executar.py
+    python benchmarks/executar.py -e media grande -c "relatorios.*" -n 5
+    python benchmarks/executar.py --dados /tmp/dados_bench -o base.json
+"""
+
+import argparse
+import fnmatch
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Adicionar o diretório do projeto ao path
+DIRETORIO_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIRETORIO_PROJETO)
+
+from benchmarks.casos import CASOS, executar_caso
+from benchmarks.dados import ESCALAS, ESCALAS_PADRAO, gerar_arquivo
+
+# Versão do formato do JSON de resultados
+VERSAO_FORMATO = 1
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Mede os caminhos críticos do sistema sem interface gráfica.")
+    parser.add_argument('-e', '--escalas', nargs='+', choices=list(ESCALAS), default=ESCALAS_PADRAO,
+                        help="Escalas medidas (padrão: %(default)s)")
+    parser.add_argument('-c', '--casos', nargs='+', default=['*'],
+                        help="Casos a medir, aceita padrões como 'relatorios.*' (padrão: todos)")
+    parser.add_argument('-n', '--repeticoes', type=int, default=10,
+                        help="Amostras por caso (padrão: %(default)s)")
+    parser.add_argument('-a', '--aquecimento', type=int, default=1,
+                        help="Execuções descartadas antes das amostras (padrão: %(default)s)")
+    parser.add_argument('-s', '--semente', type=int, default=42,
+                        help="Semente dos dados e dos sorteios (padrão: %(default)s)")
+    parser.add_argument('-o', '--saida',
+                        help="Arquivo JSON de resultados (padrão: benchmarks/resultados/<data>.json)")
+    parser.add_argument('--dados',
+                        help="Diretório para guardar e reaproveitar os arquivos de dados gerados")
+    parser.add_argument('--sem-isolamento', action='store_true',
+                        help="Medir no próprio processo (mais rápido, RSS acumulado)")
+    parser.add_argument('-l', '--listar', action='store_true', help="Listar os casos e sair")
+    return parser
+
+
+def selecionar_casos(padroes: List[str]) -> List[str]:
+    """Retorna os casos que casam com algum dos padrões, na ordem de registro."""
+    return [nome for nome in CASOS if any(fnmatch.fnmatchcase(nome, p) for p in padroes)]
+
+
+def descrever_ambiente() -> Dict[str, Any]:
+    """Informações da máquina e da versão do código medida."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=DIRETORIO_PROJETO,
+                                capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        'python': platform.python_version(),
+        'implementacao': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'commit': commit
+    }
+
+
+def medir_caso(nome: str, arquivo: str, args) -> Dict[str, Any]:
+    """Mede um caso, em um processo novo a menos que --sem-isolamento."""
+    parametros = (nome, arquivo, args.repeticoes, args.aquecimento, args.semente)
+    if args.sem_isolamento:
+        return executar_caso(*parametros)
+
+    contexto = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as pool:
+        return pool.submit(executar_caso, *parametros).result()
+
+
+def formatar_tempo(nanossegundos: float) -> str:
+    """Formata uma duração para o resumo no terminal."""
+    for unidade, fator in (('s', 1e9), ('ms', 1e6), ('µs', 1e3)):
+        if nanossegundos >= fator:
+            return f"{nanossegundos / fator:.2f} {unidade}"
+    return f"{nanossegundos:.0f} ns"
+
+
+def main(argv=None) -> int:
+    """Função principal dos benchmarks."""
+    args = criar_parser().parse_args(argv)
+
+    casos = selecionar_casos(args.casos)
+    if args.listar:
+        print('\n'.join(casos))
+        return 0
+    if not casos:
+        print("❌ Nenhum caso corresponde aos padrões informados!", file=sys.stderr)
+        return 2
+
+    saida = args.saida or os.path.join(DIRETORIO_PROJETO, 'benchmarks', 'resultados',
+                                       f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    diretorio_temporario = None
+    diretorio_dados = args.dados
+    if not diretorio_dados:
+        diretorio_temporario = tempfile.TemporaryDirectory(prefix='benchmark_dados_')
+        diretorio_dados = diretorio_temporario.name
+
+    resultados = []
+    falhas = 0
+    try:
+        for nome_escala in args.escalas:
+            escala = ESCALAS[nome_escala]
+            arquivo = os.path.join(diretorio_dados, f"sistema_tarefas_{nome_escala}_{args.semente}.json")
+            if not os.path.exists(arquivo):
+                print(f"🏗️ Gerando dados '{nome_escala}': {escala.atividades} atividades, "
+                      f"{escala.moradores} moradores...", file=sys.stderr)
+                gerar_arquivo(arquivo, escala, args.semente)
+
+            for nome in casos:
+                registro = {'caso': nome, 'escala': nome_escala,
+                            'atividades': escala.atividades, 'moradores': escala.moradores}
+                try:
+                    registro.update(medir_caso(nome, arquivo, args))
+                    print(f"⏱️ {nome_escala:>7} {nome:<45} mediana {formatar_tempo(registro['mediana_ns']):>10}"
+                          f"  p95 {formatar_tempo(registro['p95_ns']):>10}", file=sys.stderr)
+                except Exception as e:
+                    falhas += 1
+                    registro['erro'] = f"{type(e).__name__}: {e}"
+                    print(f"❌ {nome_escala:>7} {nome}: {registro['erro']}", file=sys.stderr)
+                resultados.append(registro)
+    finally:
+        if diretorio_temporario:
+            diretorio_temporario.cleanup()
+
+    documento = {
+        'versao_formato': VERSAO_FORMATO,
+        'data': datetime.now().isoformat(),
+        'ambiente': descrever_ambiente(),
+        'parametros': {'repeticoes': args.repeticoes, 'aquecimento': args.aquecimento,
+                       'semente': args.semente, 'isolado': not args.sem_isolamento},
+        'resultados': resultados
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(documento, arquivo, indent=2, ensure_ascii=False)
+
+    print(f"💾 Resultados salvos em: {saida}", file=sys.stderr)
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
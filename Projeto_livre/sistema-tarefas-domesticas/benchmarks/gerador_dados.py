@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de Dados Sintéticos
+===========================
+
+Gera arquivos sistema_tarefas.json realistas e reproduzíveis (mesma
+semente, mesmo arquivo) para benchmarks e testes de carga. Os registros
+são emitidos um a um e passam pelo contrato de serialização dos modelos
+(from_dict/to_dict de Morador e AtividadeDomestica), então o arquivo
+gerado carrega com carregar_dados() sem ajustes.
+
+Exemplos:
+    python benchmarks/gerador_dados.py dados.json
+    python benchmarks/gerador_dados.py dados.json -m 40 -p 25 --anos 3 -s 7
+    python benchmarks/gerador_dados.py dados.json -t 1000000 -m 10000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import string
+import sys
+from bisect import bisect
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Adicionar o diretório do projeto ao path (execução direta do script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from package.models.atividade_domestica import AtividadeDomestica
+from package.models.enums import CategoriaAtividade, SituacaoTarefa
+from package.models.morador import Morador
+from package.models.residencia import Residencia
+
+# Data de referência padrão ("hoje" dos dados), fixa para a reprodutibilidade
+REFERENCIA_PADRAO = datetime(2025, 7, 1)
+
+# Horário em que as tarefas são criadas (segundos desde a meia-noite)
+INICIO_DIA = 7 * 3600
+FIM_DIA = 22 * 3600
+
+MIX_CATEGORIAS_PADRAO = {
+    'COZINHA': 0.35,
+    'LIMPEZA': 0.30,
+    'ROUPAS': 0.15,
+    'JARDIM': 0.10,
+    'MANUTENCAO': 0.10,
+}
+
+TAREFAS_POR_CATEGORIA = {
+    CategoriaAtividade.COZINHA: ["Lavar louça", "Limpar fogão", "Preparar almoço",
+                                 "Organizar geladeira", "Secar pratos", "Limpar pia"],
+    CategoriaAtividade.LIMPEZA: ["Varrer sala", "Aspirar tapete", "Lavar banheiro",
+                                 "Passar pano", "Tirar pó", "Levar lixo"],
+    CategoriaAtividade.JARDIM: ["Regar plantas", "Podar arbustos", "Varrer quintal",
+                                "Adubar canteiro", "Cortar grama"],
+    CategoriaAtividade.ROUPAS: ["Lavar roupa", "Passar roupa", "Dobrar toalhas",
+                                "Estender roupa", "Guardar roupa"],
+    CategoriaAtividade.MANUTENCAO: ["Trocar lâmpada", "Consertar torneira", "Pintar parede",
+                                    "Apertar parafusos", "Limpar calhas"],
+}
+
+COMPLEMENTOS_TAREFA = ["da sala", "do quarto", "da cozinha", "da varanda", "do banheiro",
+                       "da lavanderia", "com cuidado", "antes do jantar", "no fim de semana"]
+
+DESCRICOES = ["Usar os produtos do armário", "Não esquecer os cantos",
+              "Combinado na reunião da casa", "Fazer antes das visitas chegarem",
+              "Verificar se falta material"]
+
+SILABAS = ["ma", "ri", "a", "jo", "se", "an", "na", "pe", "dro", "lu", "ca", "be",
+           "tri", "go", "mes", "fer", "nan", "da", "el", "ra", "fa", "bi", "li", "vi",
+           "to", "re", "sa", "mu", "el", "ju", "lia", "car", "los", "hel", "ena"]
+
+
+def _prazo_lognormal(aleatorio: random.Random, mediana: float, dispersao: float) -> float:
+    return aleatorio.lognormvariate(math.log(mediana), dispersao)
+
+
+def _prazo_exponencial(aleatorio: random.Random, mediana: float, dispersao: float) -> float:
+    return aleatorio.expovariate(math.log(2) / mediana)
+
+
+def _prazo_uniforme(aleatorio: random.Random, mediana: float, dispersao: float) -> float:
+    return aleatorio.uniform(0, 2 * mediana)
+
+
+# Distribuição do prazo de realização: (aleatorio, mediana, dispersao) -> horas
+DISTRIBUICOES_PRAZO: Dict[str, Callable[[random.Random, float, float], float]] = {
+    'lognormal': _prazo_lognormal,
+    'exponencial': _prazo_exponencial,
+    'uniforme': _prazo_uniforme,
+}
+
+
+class ParametrosGeracao(NamedTuple):
+    """
+    Parâmetros de um conjunto de dados sintético.
+
+    Attributes:
+        moradores (int): Quantidade de moradores
+        atividades_por_dia (float): Média diária de atividades criadas (Poisson)
+        total_atividades (int): Se informado, quantidade exata de atividades,
+            distribuídas igualmente pelos dias (substitui atividades_por_dia)
+        anos (float): Período coberto pelos dados, terminando em referencia
+        referencia (datetime): "Hoje" dos dados (fim do período)
+        mix_categorias (Dict[str, float]): Peso de cada categoria (nome do enum)
+        taxa_finalizadas (float): Fração de atividades finalizadas
+        taxa_canceladas (float): Fração de atividades canceladas
+        taxa_sem_responsavel (float): Fração de atividades sem responsável
+        taxa_descricao (float): Fração de atividades com descrição
+        distribuicao_prazo (str): Chave de DISTRIBUICOES_PRAZO
+        prazo_mediana_horas (float): Mediana do tempo até finalizar/cancelar
+        prazo_dispersao (float): Desvio do logaritmo (só lognormal)
+        tamanho_nome_morador (Tuple[int, int]): Letras do nome (mín., máx.)
+        tamanho_nome_tarefa (Tuple[int, int]): Caracteres do nome (mín., máx.)
+        registrar_historico (bool): Se grava o histórico de tarefas dos moradores
+        semente (int): Semente do gerador aleatório
+    """
+    moradores: int = 5
+    atividades_por_dia: float = 6.0
+    total_atividades: Optional[int] = None
+    anos: float = 1.0
+    referencia: datetime = REFERENCIA_PADRAO
+    mix_categorias: Dict[str, float] = MIX_CATEGORIAS_PADRAO
+    taxa_finalizadas: float = 0.6
+    taxa_canceladas: float = 0.1
+    taxa_sem_responsavel: float = 0.05
+    taxa_descricao: float = 0.2
+    distribuicao_prazo: str = 'lognormal'
+    prazo_mediana_horas: float = 6.0
+    prazo_dispersao: float = 1.0
+    tamanho_nome_morador: Tuple[int, int] = (4, 14)
+    tamanho_nome_tarefa: Tuple[int, int] = (8, 40)
+    registrar_historico: bool = True
+    semente: int = 42
+
+    @property
+    def dias(self) -> int:
+        """Retorna a quantidade de dias do período."""
+        return max(1, round(self.anos * 365))
+
+    def validar(self):
+        """
+        Verifica se os parâmetros são coerentes.
+
+        Raises:
+            ValueError: Se algum parâmetro for inválido
+        """
+        if self.moradores < 1:
+            raise ValueError("É preciso pelo menos 1 morador")
+        if self.total_atividades is None and self.atividades_por_dia < 0:
+            raise ValueError("Atividades por dia não pode ser negativo")
+        if self.total_atividades is not None and self.total_atividades < 0:
+            raise ValueError("Total de atividades não pode ser negativo")
+        if self.anos <= 0:
+            raise ValueError("O período deve ser positivo")
+        for taxa in (self.taxa_finalizadas, self.taxa_canceladas,
+                     self.taxa_sem_responsavel, self.taxa_descricao):
+            if not 0 <= taxa <= 1:
+                raise ValueError("Taxas devem estar entre 0 e 1")
+        if self.taxa_finalizadas + self.taxa_canceladas > 1:
+            raise ValueError("Finalizadas + canceladas não pode passar de 1")
+        if not self.mix_categorias or sum(self.mix_categorias.values()) <= 0:
+            raise ValueError("O mix de categorias precisa de algum peso positivo")
+        for nome, peso in self.mix_categorias.items():
+            if nome not in CategoriaAtividade.__members__:
+                raise ValueError(f"Categoria desconhecida: {nome}")
+            if peso < 0:
+                raise ValueError("Pesos de categoria não podem ser negativos")
+        if self.distribuicao_prazo not in DISTRIBUICOES_PRAZO:
+            raise ValueError(f"Distribuição de prazo desconhecida: {self.distribuicao_prazo}")
+        if self.prazo_mediana_horas <= 0:
+            raise ValueError("A mediana do prazo deve ser positiva")
+        minimo, maximo = self.tamanho_nome_morador
+        if not 2 <= minimo <= maximo <= 50:
+            raise ValueError("Tamanho do nome do morador deve ficar entre 2 e 50")
+        minimo, maximo = self.tamanho_nome_tarefa
+        if not 3 <= minimo <= maximo:
+            raise ValueError("Tamanho do nome da tarefa deve ser de pelo menos 3")
+
+
+def sufixo_letras(indice: int) -> str:
+    """
+    Converte um índice em letras (0 -> "a", 25 -> "z", 26 -> "aa").
+
+    Args:
+        indice (int): Índice não negativo
+
+    Returns:
+        str: Sequência de letras única para o índice
+    """
+    letras = []
+    indice += 1
+    while indice:
+        indice, resto = divmod(indice - 1, 26)
+        letras.append(string.ascii_lowercase[resto])
+    return ''.join(reversed(letras))
+
+
+class GeradorDados:
+    """
+    Emite os registros de um conjunto de dados sintético.
+
+    Os moradores (IDs, nomes e pesos de responsabilidade) são sorteados na
+    criação; as atividades são geradas sob demanda, dia a dia, em ordem
+    cronológica. Pontos e histórico dos moradores acompanham as atividades
+    finalizadas já emitidas, por isso moradores() deve ser lido depois de
+    atividades() para que os dois fiquem coerentes.
+
+    Attributes:
+        parametros (ParametrosGeracao): Parâmetros da geração
+        contagem (Counter): Atividades emitidas por situação
+    """
+
+    def __init__(self, parametros: ParametrosGeracao):
+        """
+        Inicializa o gerador e sorteia os moradores.
+
+        Args:
+            parametros (ParametrosGeracao): Parâmetros da geração
+
+        Raises:
+            ValueError: Se os parâmetros forem inválidos
+        """
+        parametros.validar()
+        self.parametros = parametros
+        self.contagem: Counter = Counter()
+        self._aleatorio = random.Random(parametros.semente)
+        self._ids_usados = set()
+        self._inicio = parametros.referencia - timedelta(days=parametros.dias)
+        self._prazo = DISTRIBUICOES_PRAZO[parametros.distribuicao_prazo]
+
+        categorias = [(CategoriaAtividade[nome], peso)
+                      for nome, peso in parametros.mix_categorias.items() if peso > 0]
+        self._categorias = [categoria for categoria, _ in categorias]
+        self._pesos_categorias = list(accumulate(peso for _, peso in categorias))
+
+        self._ids_moradores = [self._novo_id('pessoa_') for _ in range(parametros.moradores)]
+        self._nomes_moradores = self._sortear_nomes(parametros.moradores)
+        # Alguns moradores fazem bem mais tarefas que outros
+        self._pesos_moradores = list(accumulate(self._aleatorio.lognormvariate(0, 0.6)
+                                                for _ in self._ids_moradores))
+        self._pontos = dict.fromkeys(self._ids_moradores, 0)
+        self._historicos: Dict[str, List[str]] = {m: [] for m in self._ids_moradores}
+
+    def residencia(self) -> Dict[str, Any]:
+        """
+        Retorna a residência serializada, sem a lista de moradores.
+
+        Returns:
+            Dict[str, Any]: Residência no formato de Residencia.to_dict()
+        """
+        dados = Residencia.from_dict({
+            'id': 'casa_' + format(self._aleatorio.getrandbits(32), '08x'),
+            'nome_casa': 'Casa Sintética',
+            'data_criacao': (self._inicio - timedelta(days=30)).isoformat(),
+        }).to_dict()
+        del dados['moradores']
+        return dados
+
+    def moradores(self) -> Iterator[Dict[str, Any]]:
+        """
+        Emite os moradores com os pontos das atividades já emitidas.
+
+        Yields:
+            Dict[str, Any]: Morador no formato de Morador.to_dict()
+        """
+        for morador_id, nome in zip(self._ids_moradores, self._nomes_moradores):
+            cadastro = self._inicio - timedelta(days=self._aleatorio.randint(0, 30))
+            yield Morador.from_dict({
+                'id': morador_id,
+                'nome': nome,
+                'data_cadastro': cadastro.isoformat(),
+                'pontos_realizadas': self._pontos[morador_id],
+                'disponivel': self._aleatorio.random() < 0.9,
+                'historico_tarefas': self._historicos[morador_id],
+            }).to_dict()
+
+    def atividades(self) -> Iterator[Dict[str, Any]]:
+        """
+        Emite as atividades em ordem de criação.
+
+        Atividades cujo prazo sorteado termina depois da data de referência
+        ficam pendentes, como aconteceria na casa de verdade.
+
+        Yields:
+            Dict[str, Any]: Atividade no formato de AtividadeDomestica.to_dict()
+        """
+        parametros = self.parametros
+        aleatorio = self._aleatorio
+        dias = parametros.dias
+
+        for dia in range(dias):
+            if parametros.total_atividades is not None:
+                quantidade = (parametros.total_atividades * (dia + 1) // dias
+                              - parametros.total_atividades * dia // dias)
+            else:
+                quantidade = self._sortear_poisson(parametros.atividades_por_dia)
+
+            data_dia = self._inicio + timedelta(days=dia)
+            for segundos in sorted(aleatorio.randrange(INICIO_DIA, FIM_DIA)
+                                   for _ in range(quantidade)):
+                yield self._gerar_atividade(data_dia + timedelta(seconds=segundos))
+
+    def _gerar_atividade(self, criacao: datetime) -> Dict[str, Any]:
+        """Sorteia uma atividade criada no instante dado e atualiza os moradores."""
+        parametros = self.parametros
+        aleatorio = self._aleatorio
+
+        categoria = self._categorias[bisect(self._pesos_categorias,
+                                            aleatorio.random() * self._pesos_categorias[-1])]
+        responsavel_id = None
+        if aleatorio.random() >= parametros.taxa_sem_responsavel:
+            responsavel_id = self._ids_moradores[bisect(self._pesos_moradores,
+                                                        aleatorio.random() * self._pesos_moradores[-1])]
+
+        situacao = SituacaoTarefa.PENDENTE
+        finalizacao = None
+        sorteio = aleatorio.random()
+        if sorteio < parametros.taxa_finalizadas + parametros.taxa_canceladas:
+            horas = self._prazo(aleatorio, parametros.prazo_mediana_horas, parametros.prazo_dispersao)
+            fim = criacao + timedelta(hours=horas)
+            if fim <= parametros.referencia:
+                finalizacao = fim
+                situacao = (SituacaoTarefa.FINALIZADA if sorteio < parametros.taxa_finalizadas
+                            else SituacaoTarefa.CANCELADA)
+
+        descricao = ''
+        if aleatorio.random() < parametros.taxa_descricao:
+            descricao = aleatorio.choice(DESCRICOES)
+
+        atividade = AtividadeDomestica.from_dict({
+            'id_atividade': self._novo_id('ativ_'),
+            'categoria': categoria.name,
+            'nome_tarefa': self._sortear_nome_tarefa(categoria),
+            'descricao': descricao,
+            'situacao': situacao.name,
+            'data_criacao': criacao.isoformat(),
+            'data_finalizacao': finalizacao.isoformat() if finalizacao else None,
+            'responsavel_id': responsavel_id,
+        })
+
+        if situacao == SituacaoTarefa.FINALIZADA and responsavel_id:
+            self._pontos[responsavel_id] += atividade.pontos_tarefa
+            if parametros.registrar_historico:
+                self._historicos[responsavel_id].append(atividade.id_atividade)
+
+        self.contagem[situacao.name] += 1
+        return atividade.to_dict()
+
+    def _novo_id(self, prefixo: str) -> str:
+        """Sorteia um ID no formato dos modelos, sem repetir nenhum já emitido."""
+        while True:
+            bits = self._aleatorio.getrandbits(32)
+            if bits not in self._ids_usados:
+                self._ids_usados.add(bits)
+                return f"{prefixo}{bits:08x}"
+
+    def _sortear_poisson(self, media: float) -> int:
+        """Sorteia a quantidade de atividades de um dia (Poisson)."""
+        if media <= 0:
+            return 0
+        if media > 30:
+            # Aproximação normal: o método de Knuth fica lento para médias altas
+            return max(0, round(self._aleatorio.gauss(media, math.sqrt(media))))
+        limite = math.exp(-media)
+        quantidade, produto = 0, self._aleatorio.random()
+        while produto > limite:
+            quantidade += 1
+            produto *= self._aleatorio.random()
+        return quantidade
+
+    def _sortear_palavra(self, tamanho: int) -> str:
+        """Junta sílabas até ter exatamente o tamanho pedido."""
+        palavra = ''
+        while len(palavra) < tamanho:
+            palavra += self._aleatorio.choice(SILABAS)
+        return palavra[:tamanho]
+
+    def _sortear_nomes(self, quantidade: int) -> List[str]:
+        """Sorteia nomes de moradores válidos (só letras e espaços) e distintos."""
+        minimo, maximo = self.parametros.tamanho_nome_morador
+        nomes, usados = [], set()
+        for indice in range(quantidade):
+            for _ in range(10):
+                tamanho = self._aleatorio.randint(minimo, maximo)
+                if tamanho >= 7:
+                    # Nome e sobrenome, com o espaço contando no tamanho
+                    primeiro = self._aleatorio.randint(2, tamanho - 3)
+                    nome = (self._sortear_palavra(primeiro) + ' '
+                            + self._sortear_palavra(tamanho - primeiro - 1))
+                else:
+                    nome = self._sortear_palavra(tamanho)
+                if nome.title() not in usados:
+                    break
+            else:
+                # Muitas colisões (nomes curtos): o sufixo garante unicidade
+                sufixo = sufixo_letras(indice)
+                nome = (nome[:max(2, maximo - len(sufixo) - 1)] + ' ' + sufixo)[:50]
+            usados.add(nome.title())
+            nomes.append(nome)
+        return nomes
+
+    def _sortear_nome_tarefa(self, categoria: CategoriaAtividade) -> str:
+        """Sorteia um nome de tarefa da categoria dentro dos limites de tamanho."""
+        minimo, maximo = self.parametros.tamanho_nome_tarefa
+        alvo = self._aleatorio.randint(minimo, maximo)
+        nome = self._aleatorio.choice(TAREFAS_POR_CATEGORIA[categoria])
+        while len(nome) < alvo:
+            nome += ' ' + self._aleatorio.choice(COMPLEMENTOS_TAREFA)
+        nome = nome[:alvo].rstrip()
+        return nome if len(nome) >= 3 else nome.ljust(3, 'a')
+
+
+def _escrever_lista(arquivo, registros: Iterator[Dict[str, Any]], recuo: str) -> int:
+    """
+    Escreve uma lista JSON registro a registro, no mesmo estilo de indent=2.
+
+    Returns:
+        int: Quantidade de registros escritos
+    """
+    quantidade = 0
+    separador = '\n' + recuo
+    for registro in registros:
+        texto = json.dumps(registro, indent=2, ensure_ascii=False, default=str)
+        arquivo.write((',\n' if quantidade else '\n') + recuo + texto.replace('\n', separador))
+        quantidade += 1
+    arquivo.write(('\n' + recuo[:-2] if quantidade else '') + ']')
+    return quantidade
+
+
+def gravar_json(caminho: str, parametros: ParametrosGeracao) -> Dict[str, Any]:
+    """
+    Gera um sistema_tarefas.json sem montar os dados inteiros na memória.
+
+    O arquivo tem a mesma estrutura de ArmazenamentoDados.salvar_em_json();
+    as atividades vêm antes da residência para que os pontos dos moradores
+    já incluam todas as finalizações. É escrito em um arquivo temporário e
+    renomeado no fim, então um arquivo pela metade nunca fica no caminho.
+
+    Args:
+        caminho (str): Arquivo a criar
+        parametros (ParametrosGeracao): Parâmetros da geração
+
+    Returns:
+        Dict[str, Any]: Resumo (moradores, atividades, situações e bytes)
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos
+    """
+    gerador = GeradorDados(parametros)
+    metadados = {
+        'versao': '1.0',
+        'data_salvamento': parametros.referencia.isoformat(),
+        'sistema': 'Tarefas Domésticas',
+        'gerador': {nome: (valor.isoformat() if isinstance(valor, datetime) else valor)
+                    for nome, valor in parametros._asdict().items()}
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+    temporario = caminho + '.tmp'
+    try:
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            cabecalho = json.dumps(metadados, indent=2, ensure_ascii=False)
+            arquivo.write('{\n  "metadata": ' + cabecalho.replace('\n', '\n  ')
+                          + ',\n  "dados": {\n    "atividades": [')
+            total_atividades = _escrever_lista(arquivo, gerador.atividades(), '      ')
+
+            residencia = json.dumps(gerador.residencia(), indent=2, ensure_ascii=False)
+            arquivo.write(',\n    "residencia": ' + residencia[:-2].replace('\n', '\n    ')
+                          + ',\n      "moradores": [')
+            total_moradores = _escrever_lista(arquivo, gerador.moradores(), '        ')
+            arquivo.write('\n    }\n  }\n}')
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+    return {
+        'moradores': total_moradores,
+        'atividades': total_atividades,
+        'situacoes': dict(gerador.contagem),
+        'bytes': os.path.getsize(caminho)
+    }
+
+
+# Formatos de saída: nome -> função (caminho, parametros) -> resumo
+FORMATOS: Dict[str, Callable[[str, ParametrosGeracao], Dict[str, Any]]] = {
+    'json': gravar_json,
+}
+
+
+def _intervalo(texto: str) -> Tuple[int, int]:
+    """Converte "4-14" (ou "8") em (mínimo, máximo)."""
+    minimo, _, maximo = texto.partition('-')
+    return int(minimo), int(maximo or minimo)
+
+
+def _mix(texto: str) -> Dict[str, float]:
+    """Converte "COZINHA=3,LIMPEZA=2" em pesos por categoria."""
+    pesos = {}
+    for parte in texto.split(','):
+        nome, _, peso = parte.partition('=')
+        pesos[nome.strip().upper()] = float(peso)
+    return pesos
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    padrao = ParametrosGeracao()
+    parser = argparse.ArgumentParser(
+        description="Gera dados sintéticos de uma casa no formato do sistema.")
+    parser.add_argument('saida', help="Arquivo a criar")
+    parser.add_argument('-f', '--formato', choices=list(FORMATOS), default='json')
+    parser.add_argument('-m', '--moradores', type=int, default=padrao.moradores)
+    parser.add_argument('-p', '--por-dia', type=float, default=padrao.atividades_por_dia,
+                        help="Média de atividades por dia (padrão: %(default)s)")
+    parser.add_argument('-t', '--total', type=int,
+                        help="Quantidade exata de atividades (substitui --por-dia)")
+    parser.add_argument('--anos', type=float, default=padrao.anos)
+    parser.add_argument('--referencia', type=datetime.fromisoformat, default=padrao.referencia,
+                        help="Data final dos dados, ISO 8601 (padrão: %(default)s)")
+    parser.add_argument('--categorias', type=_mix, default=padrao.mix_categorias,
+                        help="Pesos por categoria, ex.: COZINHA=3,LIMPEZA=2,JARDIM=1")
+    parser.add_argument('--finalizadas', type=float, default=padrao.taxa_finalizadas)
+    parser.add_argument('--canceladas', type=float, default=padrao.taxa_canceladas)
+    parser.add_argument('--sem-responsavel', type=float, default=padrao.taxa_sem_responsavel)
+    parser.add_argument('--prazo', choices=list(DISTRIBUICOES_PRAZO), default=padrao.distribuicao_prazo)
+    parser.add_argument('--prazo-horas', type=float, default=padrao.prazo_mediana_horas,
+                        help="Mediana do tempo de realização (padrão: %(default)s)")
+    parser.add_argument('--prazo-dispersao', type=float, default=padrao.prazo_dispersao)
+    parser.add_argument('--nome-morador', type=_intervalo, default=padrao.tamanho_nome_morador,
+                        help="Tamanho dos nomes de moradores, ex.: 4-14")
+    parser.add_argument('--nome-tarefa', type=_intervalo, default=padrao.tamanho_nome_tarefa,
+                        help="Tamanho dos nomes de tarefas, ex.: 8-40")
+    parser.add_argument('--sem-historico', action='store_true',
+                        help="Não gravar o histórico de tarefas dos moradores")
+    parser.add_argument('-s', '--semente', type=int, default=padrao.semente)
+    return parser
+
+
+def main(argv=None) -> int:
+    """Função principal do gerador."""
+    args = criar_parser().parse_args(argv)
+    parametros = ParametrosGeracao(
+        moradores=args.moradores,
+        atividades_por_dia=args.por_dia,
+        total_atividades=args.total,
+        anos=args.anos,
+        referencia=args.referencia,
+        mix_categorias=args.categorias,
+        taxa_finalizadas=args.finalizadas,
+        taxa_canceladas=args.canceladas,
+        taxa_sem_responsavel=args.sem_responsavel,
+        distribuicao_prazo=args.prazo,
+        prazo_mediana_horas=args.prazo_horas,
+        prazo_dispersao=args.prazo_dispersao,
+        tamanho_nome_morador=args.nome_morador,
+        tamanho_nome_tarefa=args.nome_tarefa,
+        registrar_historico=not args.sem_historico,
+        semente=args.semente
+    )
+
+    try:
+        resumo = FORMATOS[args.formato](args.saida, parametros)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    print(f"✅ {resumo['atividades']} atividades e {resumo['moradores']} moradores "
+          f"gravados em {args.saida} ({resumo['bytes'] / 1024 / 1024:.1f} MiB)")
+    print(f"📊 Situações: {resumo['situacoes']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tempo de Importação
+===================
+
+Mede quanto tempo cada ponto de entrada leva para ser importado, sempre
+em um interpretador novo (o cache de módulos de um processo já aquecido
+esconderia o custo), e verifica que os caminhos sem interface não
+carregam o tkinter.
+
+Grava o mesmo formato de executar.py, então comparar.py serve para os
+dois. Sai com código 1 se um alvo sem interface importar o tkinter.
+
+Exemplos:
+    python benchmarks/importacao.py
+    python benchmarks/importacao.py -n 30 -o importacao.json
+    python benchmarks/importacao.py --detalhes package.controllers
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Adicionar o diretório do projeto ao path
+DIRETORIO_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIRETORIO_PROJETO)
+
+from benchmarks.executar import VERSAO_FORMATO, descrever_ambiente, formatar_tempo
+from benchmarks.medicao import percentil
+
+# Alvo -> se pode carregar o tkinter
+ALVOS = {
+    'package': False,
+    'package.models': False,
+    'package.mixins': False,
+    'package.utils': False,
+    'package.controllers': False,
+    'package.controllers.gerenciador_tarefas': False,
+    'package.views.executor_tarefas': False,
+    'package.views.servidor_http': False,
+    'relatorios_lote': False,
+    'diagnostico_memoria': False,
+    'servidor': False,
+    'package.views.interface_visual': True,
+}
+
+# Executado no processo novo: mede só a importação, não a subida do interpretador
+CODIGO_MEDICAO = (
+    "import sys, time, json\n"
+    "inicio = time.perf_counter_ns()\n"
+    "import {alvo}\n"
+    "duracao = time.perf_counter_ns() - inicio\n"
+    "print(json.dumps({{'ns': duracao, 'modulos': len(sys.modules),"
+    " 'tkinter': 'tkinter' in sys.modules}}))\n"
+)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Mede o tempo de importação dos pontos de entrada em processos novos.")
+    parser.add_argument('alvos', nargs='*', default=list(ALVOS),
+                        help="Módulos medidos (padrão: todos os pontos de entrada conhecidos)")
+    parser.add_argument('-n', '--repeticoes', type=int, default=15,
+                        help="Processos por alvo (padrão: %(default)s)")
+    parser.add_argument('-o', '--saida', help="Arquivo JSON de resultados (opcional)")
+    parser.add_argument('--detalhes', metavar='ALVO',
+                        help="Mostra os módulos mais caros de um alvo (python -X importtime) e sai")
+    parser.add_argument('--limite', type=int, default=20,
+                        help="Módulos listados em --detalhes (padrão: %(default)s)")
+    return parser
+
+
+def _executar(argumentos: List[str]) -> subprocess.CompletedProcess:
+    """Roda o Python atual no diretório do projeto, sem bytecode desatualizado."""
+    return subprocess.run([sys.executable] + argumentos, cwd=DIRETORIO_PROJETO,
+                          capture_output=True, text=True, check=True)
+
+
+def medir_importacao(alvo: str, repeticoes: int) -> Dict[str, Any]:
+    """
+    Importa um alvo em 'repeticoes' processos novos.
+
+    Args:
+        alvo (str): Nome do módulo
+        repeticoes (int): Quantidade de processos
+
+    Returns:
+        Dict[str, Any]: Estatísticas no formato de executar.py, mais a
+        quantidade de módulos carregados e se o tkinter foi carregado
+    """
+    amostras = []
+    medicao = {}
+    for _ in range(repeticoes):
+        saida = _executar(['-c', CODIGO_MEDICAO.format(alvo=alvo)]).stdout
+        medicao = json.loads(saida.strip().splitlines()[-1])
+        amostras.append(medicao['ns'])
+
+    return {
+        'repeticoes': len(amostras),
+        'lote': 1,
+        'mediana_ns': statistics.median(amostras),
+        'p95_ns': percentil(amostras, 95),
+        'minimo_ns': min(amostras),
+        'maximo_ns': max(amostras),
+        'amostras_ns': amostras,
+        'modulos': medicao['modulos'],
+        'tkinter': medicao['tkinter']
+    }
+
+
+def detalhar_importacao(alvo: str, limite: int) -> List[Dict[str, Any]]:
+    """
+    Lista os módulos com maior tempo próprio de importação (python -X importtime).
+
+    Args:
+        alvo (str): Nome do módulo
+        limite (int): Quantidade de módulos listados
+
+    Returns:
+        List[Dict[str, Any]]: Módulo, tempo próprio e acumulado (µs)
+    """
+    saida = _executar(['-X', 'importtime', '-c', f'import {alvo}']).stderr
+    modulos = []
+    for linha in saida.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|')
+        modulos.append({'modulo': nome.strip(), 'proprio_us': int(proprio),
+                        'acumulado_us': int(acumulado)})
+    modulos.sort(key=lambda m: m['proprio_us'], reverse=True)
+    return modulos[:limite]
+
+
+def main(argv=None) -> int:
+    """Função principal do benchmark de importação."""
+    args = criar_parser().parse_args(argv)
+
+    if args.detalhes:
+        for modulo in detalhar_importacao(args.detalhes, args.limite):
+            print(f"{modulo['proprio_us']:>8} µs  {modulo['acumulado_us']:>8} µs  {modulo['modulo']}")
+        return 0
+
+    resultados = []
+    violacoes = 0
+    for alvo in args.alvos:
+        registro = {'caso': f'importacao.{alvo}', 'escala': 'processo'}
+        try:
+            registro.update(medir_importacao(alvo, args.repeticoes))
+        except (subprocess.CalledProcessError, ValueError) as e:
+            registro['erro'] = f"{type(e).__name__}: {e}"
+            print(f"❌ {alvo}: {registro['erro']}", file=sys.stderr)
+            resultados.append(registro)
+            violacoes += 1
+            continue
+
+        proibido = registro['tkinter'] and not ALVOS.get(alvo, True)
+        violacoes += proibido
+        icone = '❌' if proibido else '⏱️'
+        print(f"{icone} {alvo:<42} mediana {formatar_tempo(registro['mediana_ns']):>10}"
+              f"  p95 {formatar_tempo(registro['p95_ns']):>10}  {registro['modulos']:>4} módulos"
+              f"{'  (tkinter!)' if proibido else ''}", file=sys.stderr)
+        resultados.append(registro)
+
+    if args.saida:
+        documento = {
+            'versao_formato': VERSAO_FORMATO,
+            'data': datetime.now().isoformat(),
+            'ambiente': descrever_ambiente(),
+            'parametros': {'repeticoes': args.repeticoes},
+            'resultados': resultados
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.saida)), exist_ok=True)
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(documento, arquivo, indent=2, ensure_ascii=False)
+        print(f"💾 Resultados salvos em: {args.saida}", file=sys.stderr)
+
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
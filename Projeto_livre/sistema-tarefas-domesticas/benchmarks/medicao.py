@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Medição de Desempenho
+=====================
+
+Cronometra uma função várias vezes e resume as amostras (mediana, p95,
+mínimo, máximo), mede as alocações de uma execução extra com tracemalloc
+e lê o pico de memória residente (RSS) do processo.
+"""
+
+import gc
+import math
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class Execucao(NamedTuple):
+    """
+    O que um caso de benchmark executa.
+
+    Attributes:
+        funcao (Callable): Trabalho medido; recebe o valor de preparar()
+        preparar (Callable): Chamado antes de cada amostra, fora do tempo
+        lote (int): Operações por chamada de funcao (o tempo é dividido por ele)
+    """
+    funcao: Callable[[Any], Any]
+    preparar: Optional[Callable[[], Any]] = None
+    lote: int = 1
+
+
+def percentil(amostras: List[float], p: float) -> float:
+    """
+    Percentil pelo método do posto mais próximo.
+
+    Args:
+        amostras (List[float]): Valores medidos
+        p (float): Percentil entre 0 e 100
+
+    Returns:
+        float: Valor do percentil (0.0 se não houver amostras)
+    """
+    if not amostras:
+        return 0.0
+    ordenadas = sorted(amostras)
+    posto = max(1, math.ceil(p / 100 * len(ordenadas)))
+    return ordenadas[posto - 1]
+
+
+def pico_rss_bytes() -> Optional[int]:
+    """
+    Retorna o pico de memória residente do processo, em bytes.
+
+    Returns:
+        Optional[int]: Pico de RSS (None se a plataforma não informar)
+    """
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KiB; macOS em bytes
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def medir(execucao: Execucao, repeticoes: int = 10, aquecimento: int = 1) -> Dict[str, Any]:
+    """
+    Mede uma execução.
+
+    As amostras de tempo são por operação (tempo da chamada / lote). A
+    execução medida com tracemalloc é separada, porque o rastreamento
+    deixa o código bem mais lento.
+
+    Args:
+        execucao (Execucao): Função, preparação e tamanho do lote
+        repeticoes (int): Amostras guardadas
+        aquecimento (int): Execuções descartadas antes das amostras
+
+    Returns:
+        Dict[str, Any]: Estatísticas, amostras brutas e alocações
+    """
+    amostras = []
+    for indice in range(aquecimento + repeticoes):
+        argumento = execucao.preparar() if execucao.preparar else None
+        gc.collect()
+        inicio = time.perf_counter_ns()
+        execucao.funcao(argumento)
+        duracao = time.perf_counter_ns() - inicio
+        if indice >= aquecimento:
+            amostras.append(duracao / execucao.lote)
+
+    return {
+        'repeticoes': len(amostras),
+        'lote': execucao.lote,
+        'mediana_ns': statistics.median(amostras) if amostras else 0.0,
+        'p95_ns': percentil(amostras, 95),
+        'minimo_ns': min(amostras, default=0.0),
+        'maximo_ns': max(amostras, default=0.0),
+        'amostras_ns': amostras,
+        'alocacoes': medir_alocacoes(execucao)
+    }
+
+
+def medir_alocacoes(execucao: Execucao) -> Dict[str, int]:
+    """
+    Executa uma vez com tracemalloc e mede as alocações da chamada.
+
+    Args:
+        execucao (Execucao): Função, preparação e tamanho do lote
+
+    Returns:
+        Dict[str, int]: Pico de bytes alocados durante a chamada, bytes e
+        blocos que continuaram alocados depois dela
+    """
+    argumento = execucao.preparar() if execucao.preparar else None
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        blocos_antes = sys.getallocatedblocks()
+        antes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        execucao.funcao(argumento)
+        depois, pico = tracemalloc.get_traced_memory()
+        blocos_depois = sys.getallocatedblocks()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'pico_bytes': pico - antes,
+        'liquido_bytes': depois - antes,
+        'blocos_liquidos': blocos_depois - blocos_antes
+    }
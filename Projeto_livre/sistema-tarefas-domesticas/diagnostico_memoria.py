@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diagnóstico de Memória - Sistema de Tarefas Domésticas
+======================================================
+
+Ponto de entrada sem interface gráfica que carrega um arquivo de dados
+sob o tracemalloc e mostra quanta memória cada parte ocupa. O arquivo
+de dados só é lido, nunca gravado.
+
+Exemplos:
+    python diagnostico_memoria.py dados/sistema_tarefas.json
+    python diagnostico_memoria.py casa.json --operacao relatorios --repeticoes 5
+    python diagnostico_memoria.py casa.json --snapshot antes.snap
+    python diagnostico_memoria.py --comparar antes.snap depois.snap
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Adicionar o diretório do projeto ao path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from package.controllers.diagnostico_memoria import (
+    AGRUPAMENTOS, OPERACOES, diagnosticar, comparar_arquivos_snapshot,
+    imprimir_diagnostico, imprimir_comparacao
+)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Mostra a memória ocupada por um arquivo de dados carregado.")
+    parser.add_argument('arquivo', nargs='?', default=os.path.join('dados', 'sistema_tarefas.json'),
+                        help="Arquivo sistema_tarefas.json (padrão: dados/sistema_tarefas.json)")
+    parser.add_argument('-n', '--limite', type=int, default=15,
+                        help="Quantidade de locais de alocação listados")
+    parser.add_argument('--agrupar', choices=AGRUPAMENTOS, default='lineno',
+                        help="Agrupamento dos locais de alocação")
+    parser.add_argument('--quadros', type=int, default=1,
+                        help="Frames guardados por alocação (use com --agrupar traceback)")
+    parser.add_argument('--operacao', choices=sorted(OPERACOES),
+                        help="Operação comparada antes/depois para achar retenções")
+    parser.add_argument('--repeticoes', type=int, default=1,
+                        help="Vezes que a operação é executada")
+    parser.add_argument('--snapshot', metavar='ARQ',
+                        help="Grava o snapshot final do tracemalloc para comparar depois")
+    parser.add_argument('--comparar', nargs=2, metavar=('ANTES', 'DEPOIS'),
+                        help="Compara dois snapshots gravados com --snapshot e sai")
+    parser.add_argument('--json', metavar='ARQ', help="Grava o diagnóstico também em JSON")
+    return parser
+
+
+def main(argv=None) -> int:
+    """Função principal do diagnóstico de memória."""
+    args = criar_parser().parse_args(argv)
+
+    if args.comparar:
+        print(f"🔍 Comparando {args.comparar[0]} -> {args.comparar[1]}")
+        imprimir_comparacao(comparar_arquivos_snapshot(*args.comparar, args.limite, args.agrupar))
+        return 0
+
+    if not os.path.exists(args.arquivo):
+        print(f"❌ Arquivo não encontrado: {args.arquivo}", file=sys.stderr)
+        return 2
+
+    try:
+        diagnostico = diagnosticar(args.arquivo, limite=args.limite, agrupar=args.agrupar,
+                                   quadros=args.quadros, operacao=args.operacao,
+                                   repeticoes=args.repeticoes, caminho_snapshot=args.snapshot)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    imprimir_diagnostico(diagnostico)
+    if args.snapshot:
+        print(f"💾 Snapshot salvo em: {args.snapshot}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(diagnostico, arquivo, indent=2, ensure_ascii=False)
+        print(f"💾 Diagnóstico salvo em: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,9 +12,12 @@ Data: 2025
 Versão: 1.0
 """
 
+import argparse
+import importlib.util
 import sys
 import os
 import tkinter as tk
+from datetime import datetime
 from tkinter import messagebox
 
 # Adicionar o diretório do projeto ao path
@@ -25,12 +28,92 @@ try:
     from package.views.interface_visual import InterfaceVisual
     from package.controllers.armazenamento_dados import ArmazenamentoDados
     from package.models.residencia import Residencia
+    from package.utils.metricas import Instrumentacao, RegistroMetricas
+    from package.utils.perfilador import MODOS, criar_perfilador
+    from package.views.executor_tarefas import ExecutorTarefas
 except ImportError as e:
     print(f"❌ Erro ao importar módulos: {e}")
     print("📁 Verifique se a estrutura de pastas está correta!")
     sys.exit(1)
 
 
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser das opções de diagnóstico da linha de comando."""
+    parser = argparse.ArgumentParser(description="Sistema de Controle de Tarefas Domésticas")
+    parser.add_argument('--sem-cache', action='store_true',
+                        help="Sempre lê o JSON, sem usar nem gravar o cache de inicialização")
+    parser.add_argument('--metricas', default=os.environ.get('TAREFAS_METRICAS'),
+                        help="Grava métricas de desempenho ao sair (.json ou .prom); "
+                             "padrão: variável TAREFAS_METRICAS")
+    parser.add_argument('--perfil', choices=list(MODOS),
+                        help="Perfila a sessão com cProfile ou por amostragem")
+    parser.add_argument('--perfil-acoes', nargs='+', metavar='METODO',
+                        help="Perfila só estes métodos da interface, aceita padrões "
+                             "(ex.: _gerar_relatorio_performance '_gerar_relatorio_*')")
+    parser.add_argument('--perfil-saida',
+                        help="Prefixo dos arquivos do perfil (padrão: dados/perfil_<data>)")
+    parser.add_argument('--perfil-intervalo', type=float, default=5.0, metavar='MS',
+                        help="Intervalo da amostragem em ms (padrão: %(default)s)")
+    parser.add_argument('--perfil-top', type=int, default=20, metavar='N',
+                        help="Funções listadas no resumo (padrão: %(default)s)")
+    return parser
+
+
+def iniciar_perfilador(args):
+    """
+    Cria e liga o perfilador pedido na linha de comando.
+    
+    Sem --perfil-acoes, a thread principal fica no escopo a sessão inteira;
+    em ambos os casos, os trabalhos enviados ao ExecutorTarefas de dentro
+    do escopo também são perfilados.
+    
+    Args:
+        args: Opções da linha de comando
+        
+    Returns:
+        Perfilador: Perfilador ativo (ou None se --perfil não foi usado)
+    """
+    if not args.perfil:
+        return None
+    
+    perfilador = criar_perfilador(args.perfil, intervalo=args.perfil_intervalo / 1000)
+    perfilador.propagar_em(ExecutorTarefas, 'executar')
+    
+    if args.perfil_acoes:
+        # Precisa acontecer antes de criar a interface (os botões guardam os métodos)
+        acoes = perfilador.restringir_a(InterfaceVisual, args.perfil_acoes)
+        if not acoes:
+            print(f"⚠️ Nenhum método da interface corresponde a: {' '.join(args.perfil_acoes)}")
+        print(f"🔬 Perfilando ({args.perfil}) as ações: {', '.join(acoes)}")
+    else:
+        perfilador.entrar()
+        print(f"🔬 Perfilando ({args.perfil}) a sessão inteira")
+    return perfilador
+
+
+def finalizar_perfilador(perfilador, args):
+    """
+    Encerra o perfil, grava os arquivos e mostra as funções mais quentes.
+    
+    Args:
+        perfilador (Perfilador): Perfilador ativo
+        args: Opções da linha de comando
+    """
+    perfilador.parar()
+    prefixo = args.perfil_saida or os.path.join('dados', f"perfil_{datetime.now():%Y%m%d_%H%M%S}")
+    
+    try:
+        arquivos = perfilador.salvar(prefixo)
+    except OSError as e:
+        print(f"❌ Erro ao salvar perfil: {e}")
+        arquivos = []
+    
+    print("-" * 60)
+    print(perfilador.resumo(args.perfil_top))
+    for arquivo in arquivos:
+        print(f"🔬 Perfil salvo em: {arquivo}")
+
+
 def criar_estrutura_diretorios():
     """Cria estrutura de diretórios necessária para o projeto."""
     diretorios = [
@@ -46,15 +129,9 @@ def criar_estrutura_diretorios():
 
 
 def verificar_dependencias():
-    """Verifica se todas as dependências estão disponíveis."""
+    """Verifica se todas as dependências estão disponíveis (sem importá-las)."""
     dependencias = ['tkinter', 'json', 'datetime', 'enum']
-    faltando = []
-    
-    for dep in dependencias:
-        try:
-            __import__(dep)
-        except ImportError:
-            faltando.append(dep)
+    faltando = [dep for dep in dependencias if importlib.util.find_spec(dep) is None]
     
     if faltando:
         print(f"❌ Dependências faltando: {', '.join(faltando)}")
@@ -64,8 +141,13 @@ def verificar_dependencias():
     return True
 
 
-def inicializar_sistema():
-    """Inicializa o sistema de tarefas domésticas."""
+def inicializar_sistema(usar_cache: bool = True):
+    """
+    Inicializa o sistema de tarefas domésticas.
+    
+    Args:
+        usar_cache (bool): Usa o cache de inicialização ao lado do arquivo de dados
+    """
     print("🏡 Inicializando Sistema de Tarefas Domésticas...")
     
     # Verificar dependências
@@ -81,17 +163,12 @@ def inicializar_sistema():
         residencia = Residencia("Casa Principal")
         
         # Inicializar armazenamento
-        armazenamento = ArmazenamentoDados("dados/sistema_tarefas.json")
+        armazenamento = ArmazenamentoDados("dados/sistema_tarefas.json", usar_cache=usar_cache)
         
         # Inicializar gerenciador principal
         gerenciador = GerenciadorTarefas(residencia, armazenamento)
         
-        # Tentar carregar dados existentes
-        if gerenciador.carregar_dados():
-            print("📂 Dados carregados com sucesso!")
-        else:
-            print("📝 Iniciando com dados em branco...")
-        
+        # Os dados são carregados em segundo plano, com a janela já aberta
         print("✅ Sistema inicializado com sucesso!")
         return gerenciador
         
@@ -100,8 +177,10 @@ def inicializar_sistema():
         return None
 
 
-def main():
+def main(argv=None):
     """Função principal do sistema."""
+    args = criar_parser().parse_args(argv)
+    
     print("=" * 60)
     print("🏡 SISTEMA DE CONTROLE DE TAREFAS DOMÉSTICAS")
     print("=" * 60)
@@ -109,14 +188,23 @@ def main():
     print("🎯 Aplicando: Herança, Polimorfismo, Mixin, Composição")
     print("-" * 60)
     
+    # Diagnóstico opcional: métricas e perfil (antes de criar a interface)
+    instrumentacao = None
+    if args.metricas:
+        instrumentacao = Instrumentacao(RegistroMetricas()).ativar()
+        print(f"📈 Métricas ativas, serão salvas em: {args.metricas}")
+    perfilador = iniciar_perfilador(args)
+    
     # Inicializar sistema
-    gerenciador = inicializar_sistema()
+    gerenciador = inicializar_sistema(usar_cache=not args.sem_cache)
     
     if gerenciador is None:
         print("❌ Falha na inicialização do sistema!")
         input("Pressione Enter para sair...")
         return
     
+    interface = None
+    
     try:
         # Criar janela principal
         root = tk.Tk()
@@ -137,8 +225,9 @@ def main():
         # Configurar fechamento da aplicação
         def on_closing():
             if messagebox.askokcancel("Sair", "Deseja realmente sair do sistema?"):
-                print("💾 Salvando dados finais...")
-                gerenciador.salvar_dados()
+                # Esperar salvamentos em segundo plano; o salvamento final
+                # fica só no finally, para não gravar o JSON e o cache duas vezes
+                interface.encerrar()
                 print("👋 Sistema encerrado!")
                 root.destroy()
         
@@ -147,6 +236,9 @@ def main():
         # Inicializar interface visual
         interface = InterfaceVisual(root, gerenciador)
         
+        # Carregar dados sem bloquear a janela
+        interface.carregar_dados_em_segundo_plano()
+        
         print("🖥️ Interface gráfica carregada!")
         print("🚀 Sistema pronto para uso!")
         print("-" * 60)
@@ -159,10 +251,19 @@ def main():
         messagebox.showerror("Erro", f"Erro crítico na interface:\n{e}")
     
     finally:
-        # Salvar dados ao encerrar
-        if gerenciador:
+        # Salvar dados ao encerrar (nunca por cima de um carregamento incompleto)
+        if gerenciador and interface is not None and interface.dados_carregados:
+            print("💾 Salvando dados finais...")
             gerenciador.salvar_dados()
-        print("📊 Dados salvos com segurança!")
+            print("📊 Dados salvos com segurança!")
+        
+        if perfilador is not None:
+            finalizar_perfilador(perfilador, args)
+        
+        if instrumentacao is not None:
+            instrumentacao.desativar()
+            if instrumentacao.registro.salvar(args.metricas):
+                print(f"📈 Métricas salvas em: {args.metricas}")
 
 
 if __name__ == "__main__":
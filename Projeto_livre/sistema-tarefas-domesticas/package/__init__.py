@@ -15,23 +15,30 @@ __version__ = "1.0.0"
 __author__ = "Projeto Acadêmico POO"
 __description__ = "Sistema de controle de tarefas domésticas com POO"
 
-# Importações principais para facilitar uso do pacote
-from .models import *
-from .controllers import *
-from .mixins import *
-from .views import *
+from ._exportacao_preguicosa import exportacoes_preguicosas
 
-__all__ = [
-    # Models
-    'Pessoa', 'Morador', 'AtividadeDomestica', 'Residencia',
-    'CategoriaAtividade', 'SituacaoTarefa',
-    
-    # Controllers  
-    'GerenciadorTarefas', 'ArmazenamentoDados',
-    
-    # Mixins
-    'GerarRelatorios',
-    
-    # Views
-    'InterfaceVisual'
-]
\ No newline at end of file
+# Exportações do pacote e o subpacote de cada uma. Nada é importado aqui:
+# cada subpacote só é carregado no primeiro acesso (ver _exportacao_preguicosa), para
+# que scripts sem interface não carreguem o tkinter e a camada de views.
+_EXPORTACOES_POR_SUBPACOTE = {
+    'models': ['Pessoa', 'Morador', 'AtividadeDomestica', 'Residencia',
+               'CategoriaAtividade', 'SituacaoTarefa'],
+    'controllers': ['GerenciadorTarefas', 'ArmazenamentoDados', 'ExportadorRelatorios',
+                    'gerar_relatorios_em_paralelo', 'executar_lote', 'diagnosticar'],
+    'mixins': ['GerarRelatorios'],
+    'utils': ['EsbocoQuantis', 'AcumuladorTopK', 'AmostraLimitada', 'mais_comuns',
+              'IndiceBusca', 'normalizar', 'RegistroMetricas', 'Instrumentacao',
+              'PerfiladorDeterministico', 'PerfiladorAmostragem', 'criar_perfilador'],
+    'views': ['InterfaceVisual', 'ReconciliadorTreeview', 'ListaVirtual', 'ExecutorTarefas',
+              'TokenCancelamento', 'OperacaoCancelada', 'AgendadorAtualizacao',
+              'OrdenacaoColunas', 'InterfaceLinhaComando', 'ServidorTarefas', 'ApiTarefas']
+}
+_EXPORTACOES = {nome: subpacote
+                for subpacote, nomes in _EXPORTACOES_POR_SUBPACOTE.items()
+                for nome in nomes}
+
+# "from package import *" traz as exportações sem interface. As views ficam
+# de fora para que a importação com * não carregue o tkinter; importe-as
+# pelo nome (from package import InterfaceVisual) ou de package.views.
+__getattr__, __dir__, __all__ = exportacoes_preguicosas(
+    globals(), _EXPORTACOES, subpacotes=_EXPORTACOES_POR_SUBPACOTE, fora_de_all=('views',))
\ No newline at end of file
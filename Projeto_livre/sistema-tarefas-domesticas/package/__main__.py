@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Linha de Comando do Sistema
+===========================
+
+Permite `python -m package ...` (ver package/views/linha_comando.py).
+"""
+
+import sys
+
+from .views.linha_comando import main
+
+if __name__ == "__main__":
+    sys.exit(main())
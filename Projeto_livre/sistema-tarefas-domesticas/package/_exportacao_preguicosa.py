@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportação Preguiçosa dos Pacotes
+=================================
+
+Monta o __getattr__, o __dir__ e o __all__ de um __init__ a partir de um
+mapa exportação -> módulo. Nenhum módulo é importado até o primeiro acesso
+ao nome, de modo que importar um pacote não carrega as dependências
+pesadas (tkinter, pool de processos, cProfile) das exportações não usadas.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def exportacoes_preguicosas(namespace: Dict[str, Any], exportacoes: Dict[str, str],
+                            subpacotes: Iterable[str] = (),
+                            fora_de_all: Iterable[str] = ()) -> Tuple[Callable, Callable, List[str]]:
+    """
+    Cria as funções de módulo que importam cada exportação no primeiro acesso.
+
+    Uso em um __init__:
+        __getattr__, __dir__, __all__ = exportacoes_preguicosas(globals(), _EXPORTACOES)
+
+    Args:
+        namespace (Dict): globals() do pacote (guarda os valores já importados)
+        exportacoes (Dict[str, str]): Nome exportado -> módulo, relativo ao pacote
+        subpacotes (Iterable[str]): Módulos que também podem ser acessados pelo nome
+        fora_de_all (Iterable[str]): Módulos cujas exportações ficam fora do __all__
+            (acessíveis pelo nome, mas não trazidas por "import *")
+
+    Returns:
+        Tuple[Callable, Callable, List[str]]: __getattr__, __dir__ e __all__
+    """
+    pacote = namespace['__name__']
+    subpacotes = frozenset(subpacotes)
+    fora_de_all = frozenset(fora_de_all)
+
+    def __getattr__(nome: str):
+        """
+        Importa um subpacote, ou o módulo de uma exportação, no primeiro acesso.
+
+        Args:
+            nome (str): Nome do subpacote ou da exportação
+
+        Returns:
+            Any: O subpacote ou o objeto exportado (guardado no pacote)
+
+        Raises:
+            AttributeError: Se o nome não for exportado pelo pacote
+        """
+        if nome in subpacotes:
+            return importlib.import_module(f'.{nome}', pacote)
+        if nome not in exportacoes:
+            raise AttributeError(f"module {pacote!r} has no attribute {nome!r}")
+        valor = getattr(importlib.import_module(f'.{exportacoes[nome]}', pacote), nome)
+        namespace[nome] = valor
+        return valor
+
+    def __dir__():
+        """Inclui as exportações ainda não importadas."""
+        return sorted(set(namespace) | set(exportacoes) | subpacotes)
+
+    __all__ = [nome for nome, modulo in exportacoes.items() if modulo not in fora_de_all]
+    return __getattr__, __dir__, __all__
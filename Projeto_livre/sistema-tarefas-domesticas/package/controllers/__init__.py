@@ -7,14 +7,25 @@ Controladores do Sistema
 Classes controladoras que gerenciam a lógica de negócio:
 - GerenciadorTarefas (controladora principal + mixin)
 - ArmazenamentoDados (persistência em JSON)
+- ExportadorRelatorios (exportação em fluxo para CSV, JSON Lines e Markdown)
+- gerar_relatorios_em_paralelo (relatórios em um pool de processos)
+- executar_lote (relatórios de muitos arquivos de dados, sem interface)
+- diagnosticar (contagem de memória com o tracemalloc)
 """
 
-# Importar classes controladoras
-from .gerenciador_tarefas import GerenciadorTarefas
-from .armazenamento_dados import ArmazenamentoDados
+from .._exportacao_preguicosa import exportacoes_preguicosas
+
+# Cada exportação e o módulo que a define, importado só no primeiro acesso
+# (ver _exportacao_preguicosa): o GerenciadorTarefas não carrega o pool de processos
+# dos relatórios paralelos nem o tracemalloc do diagnóstico.
+_EXPORTACOES = {
+    'GerenciadorTarefas': 'gerenciador_tarefas',
+    'ArmazenamentoDados': 'armazenamento_dados',
+    'ExportadorRelatorios': 'exportador_relatorios',
+    'gerar_relatorios_em_paralelo': 'relatorios_paralelos',
+    'executar_lote': 'processamento_lote',
+    'diagnosticar': 'diagnostico_memoria'
+}
 
 # Definir exportações
-__all__ = [
-    'GerenciadorTarefas',
-    'ArmazenamentoDados'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = exportacoes_preguicosas(globals(), _EXPORTACOES)
\ No newline at end of file
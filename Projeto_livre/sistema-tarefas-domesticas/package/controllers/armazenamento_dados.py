@@ -8,12 +8,23 @@ Implementa a persistência de dados em JSON.
 Demonstra SERIALIZAÇÃO de objetos em POO.
 """
 
+import gc
+import hashlib
 import json
 import os
+import pickle
 import shutil
+import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# Versão do formato do cache de inicialização. Incrementar sempre que uma
+# classe guardada no cache (modelos, índices, esboços) mudar de atributos.
+VERSAO_CACHE = 1
+
+# Tamanho dos blocos lidos para calcular o hash do arquivo de dados
+BLOCO_HASH = 1 << 20
+
 
 class ArmazenamentoDados:
     """
@@ -27,19 +38,34 @@ class ArmazenamentoDados:
     - Carregar dados do JSON
     - Fazer backup automático
     - Validar integridade dos dados
+    - Cache de inicialização (opcional) com o estado já montado
     """
     
-    def __init__(self, arquivo_json: str):
+    def __init__(self, arquivo_json: str, usar_cache: bool = False):
         """
         Inicializa o sistema de armazenamento.
         
         Args:
             arquivo_json (str): Caminho para o arquivo JSON
+            usar_cache (bool): Guarda o estado carregado em um cache ao lado
+                do arquivo JSON, para a próxima inicialização ser mais rápida
         """
         self._arquivo_json = arquivo_json
         self._arquivo_backup = f"{arquivo_json}.backup"
+        self._arquivo_cache = f"{arquivo_json}.cache"
+        self._usar_cache = usar_cache
         self._criar_diretorios()
-    
+
+    @property
+    def arquivo_json(self) -> str:
+        """Retorna o caminho do arquivo de dados."""
+        return self._arquivo_json
+
+    @property
+    def usar_cache(self) -> bool:
+        """Retorna se o cache de inicialização está ligado."""
+        return self._usar_cache
+
     def salvar_em_json(self, dados: Dict[str, Any]) -> bool:
         """
         Salva dados no arquivo JSON.
@@ -145,6 +171,119 @@ class ArmazenamentoDados:
             print(f"❌ Erro na validação: {e}")
             return False
     
+    def assinatura_arquivo(self) -> Optional[Dict[str, Any]]:
+        """
+        Identifica o conteúdo atual do arquivo JSON.
+        
+        Returns:
+            Optional[Dict]: Tamanho, data de modificação (ns) e hash BLAKE2b,
+            ou None se o arquivo não existir
+        """
+        try:
+            informacoes = os.stat(self._arquivo_json)
+            resumo = hashlib.blake2b(digest_size=16)
+            with open(self._arquivo_json, 'rb') as arquivo:
+                for bloco in iter(lambda: arquivo.read(BLOCO_HASH), b''):
+                    resumo.update(bloco)
+        except OSError:
+            return None
+        
+        return {
+            'tamanho': informacoes.st_size,
+            'modificado_ns': informacoes.st_mtime_ns,
+            'hash': resumo.hexdigest()
+        }
+    
+    def salvar_cache(self, estado: Any, assinatura: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Guarda o estado montado a partir do arquivo JSON no cache (pickle).
+        
+        O cache é gravado em um arquivo temporário e renomeado, então uma
+        falha no meio nunca deixa um cache pela metade.
+        
+        Args:
+            estado (Any): Estado montado a partir do conteúdo atual do JSON
+            assinatura (Dict): Assinatura do JSON de onde o estado veio
+                (padrão: a do arquivo agora)
+            
+        Returns:
+            bool: True se o cache foi gravado
+        """
+        if not self._usar_cache:
+            return False
+        
+        assinatura = assinatura or self.assinatura_arquivo()
+        if assinatura is None:
+            return False
+        
+        cabecalho = {
+            'versao': VERSAO_CACHE,
+            'python': list(sys.version_info[:2]),
+            'assinatura': assinatura
+        }
+        temporario = f"{self._arquivo_cache}.tmp"
+        try:
+            with open(temporario, 'wb') as arquivo:
+                pickle.dump(cabecalho, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(estado, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, self._arquivo_cache)
+            return True
+        except Exception as e:
+            print(f"⚠️ Erro ao salvar cache: {e}")
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            return False
+    
+    def carregar_cache(self) -> Optional[Any]:
+        """
+        Carrega o estado do cache, se ele corresponder ao arquivo JSON atual.
+        
+        O cache só é usado se versão do formato, versão do Python, tamanho,
+        data de modificação e hash do JSON forem os mesmos de quando foi
+        gravado. O arquivo é um pickle: só deve ser usado em diretórios
+        em que apenas o próprio usuário escreve (como o de dados).
+        
+        Returns:
+            Optional[Any]: Estado guardado, ou None se o cache estiver
+            desligado, ausente ou desatualizado
+        """
+        if not self._usar_cache or not os.path.exists(self._arquivo_cache):
+            return None
+        
+        try:
+            with open(self._arquivo_cache, 'rb') as arquivo:
+                if not self._cache_valido(pickle.load(arquivo)):
+                    return None
+                
+                # Sem coletas de ciclos no meio da criação de milhares de objetos
+                coletor_ativo = gc.isenabled()
+                gc.disable()
+                try:
+                    return pickle.load(arquivo)
+                finally:
+                    if coletor_ativo:
+                        gc.enable()
+        except Exception as e:
+            print(f"⚠️ Cache de inicialização ilegível, usando o JSON: {e}")
+            return None
+    
+    def _cache_valido(self, cabecalho: Any) -> bool:
+        """Compara o cabeçalho do cache com o arquivo JSON atual."""
+        if (not isinstance(cabecalho, dict) or cabecalho.get('versao') != VERSAO_CACHE
+                or cabecalho.get('python') != list(sys.version_info[:2])):
+            return False
+        
+        gravada = cabecalho.get('assinatura') or {}
+        try:
+            informacoes = os.stat(self._arquivo_json)
+        except OSError:
+            return False
+        # Tamanho e data primeiro: evitam ler o arquivo inteiro à toa
+        if (informacoes.st_size != gravada.get('tamanho')
+                or informacoes.st_mtime_ns != gravada.get('modificado_ns')):
+            return False
+        return self.assinatura_arquivo() == gravada
+    
     def _criar_diretorios(self):
         """Cria diretórios necessários se não existirem."""
         diretorio = os.path.dirname(self._arquivo_json)
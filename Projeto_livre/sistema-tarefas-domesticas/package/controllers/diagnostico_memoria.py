@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diagnóstico de Memória
+======================
+
+Mede quanta memória um arquivo de dados ocupa depois de carregado, para
+dimensionar máquinas para casas grandes:
+- por categoria (atividades, moradores, históricos, índices, caches...),
+  percorrendo o grafo de objetos a partir de GerenciadorTarefas.estruturas_memoria()
+- por local de alocação, com snapshots do tracemalloc
+- nos intermediários de cada relatório (pico e o que fica retido)
+- antes e depois de uma operação, para achar vazamentos e retenções
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import types
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..mixins.gerar_relatorios import GerarRelatorios
+from ..models.residencia import Residencia
+from .armazenamento_dados import ArmazenamentoDados
+from .gerenciador_tarefas import GerenciadorTarefas
+
+# Tipos compartilhados pelo processo inteiro, que não pertencem aos dados
+TIPOS_IGNORADOS = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                   types.MethodType, types.CodeType, Enum)
+
+# Frames que não interessam na lista de locais de alocação
+FILTROS_SNAPSHOT = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+AGRUPAMENTOS = ('lineno', 'filename', 'traceback')
+
+
+def _relatorios() -> Dict[str, Callable[[GerenciadorTarefas], Any]]:
+    """Um item por relatório público de GerarRelatorios."""
+    return {nome: (lambda g, nome=nome: getattr(g, nome)())
+            for nome in sorted(vars(GerarRelatorios))
+            if not nome.startswith('_') and callable(getattr(GerarRelatorios, nome))}
+
+
+# Operações que podem ser comparadas antes/depois (nenhuma grava em disco)
+OPERACOES: Dict[str, Callable[[GerenciadorTarefas], Any]] = {
+    'recarregar': lambda g: g.carregar_dados(),
+    'montar_dados': lambda g: g.montar_dados(),
+    'relatorios': lambda g: [gerar(g) for gerar in _relatorios().values()],
+    'busca': lambda g: [g.buscar_atividades(c) for c in ('la', 'lav', 'lavar', 'lavar lou')],
+}
+OPERACOES.update({f'relatorio.{nome}': gerar for nome, gerar in _relatorios().items()})
+
+
+def tamanho_profundo(raizes: Iterable[Any], vistos: set) -> Dict[str, int]:
+    """
+    Soma sys.getsizeof() de tudo que é alcançável a partir das raízes.
+
+    Objetos já presentes em 'vistos' (contados por outra categoria) não
+    são contados de novo; os novos são acrescentados a 'vistos'.
+
+    Args:
+        raizes (Iterable[Any]): Objetos de partida
+        vistos (set): IDs de objetos já contados (é atualizado)
+
+    Returns:
+        Dict[str, int]: Bytes e quantidade de objetos
+    """
+    total_bytes = 0
+    objetos = 0
+    pendentes = list(raizes)
+    while pendentes:
+        objeto = pendentes.pop()
+        identificador = id(objeto)
+        if identificador in vistos or isinstance(objeto, TIPOS_IGNORADOS):
+            continue
+        vistos.add(identificador)
+        total_bytes += sys.getsizeof(objeto)
+        objetos += 1
+        pendentes.extend(gc.get_referents(objeto))
+    return {'bytes': total_bytes, 'objetos': objetos}
+
+
+def medir_categorias(gerenciador: GerenciadorTarefas) -> List[Dict[str, Any]]:
+    """
+    Mede a memória de cada categoria de GerenciadorTarefas.estruturas_memoria().
+
+    Args:
+        gerenciador (GerenciadorTarefas): Gerenciador com os dados carregados
+
+    Returns:
+        List[Dict[str, Any]]: Categoria, bytes e objetos, na ordem das categorias
+    """
+    vistos = set()
+    # Os próprios contêineres de raízes não fazem parte dos dados
+    estruturas = gerenciador.estruturas_memoria()
+    vistos.update(id(raizes) for _, raizes in estruturas)
+    return [{'categoria': categoria, **tamanho_profundo(raizes, vistos)}
+            for categoria, raizes in estruturas]
+
+
+def medir_relatorios(gerenciador: GerenciadorTarefas) -> List[Dict[str, Any]]:
+    """
+    Mede os intermediários de cada relatório com o tracemalloc.
+
+    Args:
+        gerenciador (GerenciadorTarefas): Gerenciador com os dados carregados
+
+    Returns:
+        List[Dict[str, Any]]: Por relatório: pico de memória durante a geração,
+        tamanho do resultado e o que continuou alocado depois de descartá-lo
+    """
+    resultados = []
+    for nome, gerar in _relatorios().items():
+        gc.collect()
+        antes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        relatorio = gerar(gerenciador)
+        duracao = time.perf_counter() - inicio
+        com_resultado, pico = tracemalloc.get_traced_memory()
+        del relatorio
+        gc.collect()
+        depois, _ = tracemalloc.get_traced_memory()
+        resultados.append({
+            'relatorio': nome,
+            'pico_bytes': pico - antes,
+            'resultado_bytes': com_resultado - antes,
+            'retido_bytes': depois - antes,
+            'segundos': round(duracao, 4)
+        })
+    return resultados
+
+
+def _descrever_local(estatistica, agrupar: str) -> str:
+    """Texto de um local de alocação (o frame mais recente primeiro)."""
+    if agrupar == 'filename':
+        return estatistica.traceback[0].filename
+    if agrupar == 'traceback':
+        return ' <- '.join(f"{quadro.filename}:{quadro.lineno}"
+                           for quadro in reversed(estatistica.traceback))
+    quadro = estatistica.traceback[0]
+    return f"{quadro.filename}:{quadro.lineno}"
+
+
+def principais_locais(snapshot: tracemalloc.Snapshot, limite: int = 15,
+                      agrupar: str = 'lineno') -> List[Dict[str, Any]]:
+    """
+    Lista os locais que mais alocaram memória ainda viva.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): Snapshot do tracemalloc
+        limite (int): Quantidade de locais
+        agrupar (str): 'lineno', 'filename' ou 'traceback'
+
+    Returns:
+        List[Dict[str, Any]]: Local, bytes e blocos
+    """
+    estatisticas = snapshot.filter_traces(FILTROS_SNAPSHOT).statistics(agrupar)
+    return [{'local': _descrever_local(e, agrupar), 'bytes': e.size, 'blocos': e.count}
+            for e in estatisticas[:limite]]
+
+
+def comparar_snapshots(antes: tracemalloc.Snapshot, depois: tracemalloc.Snapshot,
+                       limite: int = 15, agrupar: str = 'lineno') -> List[Dict[str, Any]]:
+    """
+    Lista os locais cuja memória viva mais mudou entre dois snapshots.
+
+    Args:
+        antes (tracemalloc.Snapshot): Snapshot inicial
+        depois (tracemalloc.Snapshot): Snapshot final
+        limite (int): Quantidade de locais
+        agrupar (str): 'lineno', 'filename' ou 'traceback'
+
+    Returns:
+        List[Dict[str, Any]]: Local, diferença de bytes e de blocos, bytes finais
+    """
+    diferencas = depois.filter_traces(FILTROS_SNAPSHOT).compare_to(
+        antes.filter_traces(FILTROS_SNAPSHOT), agrupar)
+    return [{'local': _descrever_local(d, agrupar), 'diferenca_bytes': d.size_diff,
+             'diferenca_blocos': d.count_diff, 'bytes': d.size}
+            for d in diferencas[:limite] if d.size_diff or d.count_diff]
+
+
+def diagnosticar(caminho: str, limite: int = 15, agrupar: str = 'lineno', quadros: int = 1,
+                 operacao: Optional[str] = None, repeticoes: int = 1,
+                 caminho_snapshot: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Carrega um arquivo de dados sob o tracemalloc e monta o diagnóstico.
+
+    O arquivo só é lido; nenhuma operação disponível grava em disco.
+
+    Args:
+        caminho (str): Arquivo sistema_tarefas.json
+        limite (int): Quantidade de locais de alocação listados
+        agrupar (str): Agrupamento dos locais ('lineno', 'filename' ou 'traceback')
+        quadros (int): Frames guardados por alocação (útil com 'traceback')
+        operacao (str): Chave de OPERACOES a comparar antes/depois (opcional)
+        repeticoes (int): Vezes que a operação é executada antes do segundo snapshot
+        caminho_snapshot (str): Onde gravar o snapshot final (opcional)
+
+    Returns:
+        Dict[str, Any]: Carga, categorias, locais, relatórios e comparação
+
+    Raises:
+        ValueError: Se o agrupamento ou a operação forem desconhecidos
+        RuntimeError: Se o arquivo não puder ser carregado
+    """
+    if agrupar not in AGRUPAMENTOS:
+        raise ValueError(f"Agrupamento desconhecido: {agrupar}")
+    if operacao is not None and operacao not in OPERACOES:
+        raise ValueError(f"Operação desconhecida: {operacao}")
+
+    iniciado_aqui = not tracemalloc.is_tracing()
+    if iniciado_aqui:
+        tracemalloc.start(max(1, quadros))
+    try:
+        gc.collect()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        inicio = time.perf_counter()
+        gerenciador = GerenciadorTarefas(Residencia("Casa Diagnóstico"), ArmazenamentoDados(caminho))
+        if not gerenciador.carregar_dados():
+            raise RuntimeError(f"Não foi possível carregar {caminho}")
+        duracao = time.perf_counter() - inicio
+
+        gc.collect()
+        carregado, pico = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+
+        resumo = gerenciador.obter_resumo_sistema()
+        atividades = resumo['total_atividades']
+        retido = carregado - base
+        diagnostico = {
+            'arquivo': caminho,
+            'carga': {
+                'atividades': atividades,
+                'moradores': resumo['total_moradores'],
+                'segundos': round(duracao, 3),
+                'retido_bytes': retido,
+                'pico_bytes': pico - base,
+                'bytes_por_atividade': round(retido / atividades, 1) if atividades else None,
+                'pico_por_atividade': round((pico - base) / atividades, 1) if atividades else None
+            },
+            'categorias': medir_categorias(gerenciador),
+            'locais': principais_locais(snapshot, limite, agrupar),
+            'relatorios': medir_relatorios(gerenciador),
+            'comparacao': None
+        }
+
+        if operacao is not None:
+            gc.collect()
+            antes = tracemalloc.take_snapshot()
+            atual_antes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for _ in range(max(1, repeticoes)):
+                OPERACOES[operacao](gerenciador)
+            gc.collect()
+            atual_depois, pico_operacao = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            diagnostico['comparacao'] = {
+                'operacao': operacao,
+                'repeticoes': max(1, repeticoes),
+                'retido_bytes': atual_depois - atual_antes,
+                'pico_bytes': pico_operacao - atual_antes,
+                'locais': comparar_snapshots(antes, snapshot, limite, agrupar)
+            }
+
+        if caminho_snapshot:
+            snapshot.dump(caminho_snapshot)
+        return diagnostico
+    finally:
+        if iniciado_aqui:
+            tracemalloc.stop()
+
+
+def comparar_arquivos_snapshot(caminho_antes: str, caminho_depois: str, limite: int = 15,
+                               agrupar: str = 'lineno') -> List[Dict[str, Any]]:
+    """
+    Compara dois snapshots gravados com --snapshot (ex.: antes e depois de uma versão).
+
+    Args:
+        caminho_antes (str): Snapshot inicial
+        caminho_depois (str): Snapshot final
+        limite (int): Quantidade de locais
+        agrupar (str): 'lineno', 'filename' ou 'traceback'
+
+    Returns:
+        List[Dict[str, Any]]: Como em comparar_snapshots()
+    """
+    return comparar_snapshots(tracemalloc.Snapshot.load(caminho_antes),
+                              tracemalloc.Snapshot.load(caminho_depois), limite, agrupar)
+
+
+def formatar_bytes(quantidade: float) -> str:
+    """Formata bytes em B, KiB, MiB ou GiB (com sinal, se negativo)."""
+    sinal = '-' if quantidade < 0 else ''
+    quantidade = abs(quantidade)
+    for unidade in ('B', 'KiB', 'MiB'):
+        if quantidade < 1024:
+            return f"{sinal}{quantidade:.0f} {unidade}" if unidade == 'B' else f"{sinal}{quantidade:.1f} {unidade}"
+        quantidade /= 1024
+    return f"{sinal}{quantidade:.2f} GiB"
+
+
+def imprimir_comparacao(locais: List[Dict[str, Any]]):
+    """Imprime os locais de uma comparação de snapshots."""
+    if not locais:
+        print("   ✅ Nenhuma diferença de memória viva")
+        return
+    for local in locais:
+        print(f"   {formatar_bytes(local['diferenca_bytes']):>12} "
+              f"({local['diferenca_blocos']:+d} blocos)  {local['local']}")
+
+
+def imprimir_diagnostico(diagnostico: Dict[str, Any]):
+    """Imprime o diagnóstico de memória."""
+    carga = diagnostico['carga']
+    print("=" * 60)
+    print("🧠 DIAGNÓSTICO DE MEMÓRIA")
+    print("=" * 60)
+    print(f"📁 Arquivo: {diagnostico['arquivo']}")
+    print(f"📋 Atividades: {carga['atividades']} | 👥 Moradores: {carga['moradores']} "
+          f"| ⏱️ Carga: {carga['segundos']}s")
+    print(f"💾 Retido após a carga: {formatar_bytes(carga['retido_bytes'])} "
+          f"(pico: {formatar_bytes(carga['pico_bytes'])})")
+    if carga['bytes_por_atividade'] is not None:
+        print(f"📏 Por atividade: {formatar_bytes(carga['bytes_por_atividade'])} retidos, "
+              f"{formatar_bytes(carga['pico_por_atividade'])} no pico")
+
+    print("-" * 60)
+    print("📦 POR CATEGORIA (grafo de objetos):")
+    total = sum(c['bytes'] for c in diagnostico['categorias']) or 1
+    for categoria in diagnostico['categorias']:
+        print(f"   {categoria['categoria']:<18} {formatar_bytes(categoria['bytes']):>12} "
+              f"{categoria['bytes'] / total:>6.1%}  ({categoria['objetos']} objetos)")
+
+    print("-" * 60)
+    print("📍 PRINCIPAIS LOCAIS DE ALOCAÇÃO:")
+    for local in diagnostico['locais']:
+        print(f"   {formatar_bytes(local['bytes']):>12} ({local['blocos']} blocos)  {local['local']}")
+
+    print("-" * 60)
+    print("📊 INTERMEDIÁRIOS DOS RELATÓRIOS:")
+    for relatorio in diagnostico['relatorios']:
+        print(f"   {relatorio['relatorio']:<34} pico {formatar_bytes(relatorio['pico_bytes']):>11} "
+              f"| retido {formatar_bytes(relatorio['retido_bytes']):>10} | {relatorio['segundos']}s")
+
+    comparacao = diagnostico['comparacao']
+    if comparacao:
+        print("-" * 60)
+        print(f"🔍 OPERAÇÃO '{comparacao['operacao']}' x{comparacao['repeticoes']}: "
+              f"retido {formatar_bytes(comparacao['retido_bytes'])}, "
+              f"pico {formatar_bytes(comparacao['pico_bytes'])}")
+        imprimir_comparacao(comparacao['locais'])
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe ExportadorRelatorios
+===========================
+
+Exporta relatórios e dados brutos para CSV, JSON Lines e Markdown.
+Todo o conteúdo é produzido por geradores e escrito linha a linha,
+sem montar o texto completo em memória.
+"""
+
+import csv
+import io
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+
+# Formatos suportados (extensão -> nome)
+FORMATOS_EXPORTACAO = {
+    'csv': 'CSV',
+    'jsonl': 'JSON Lines',
+    'md': 'Markdown'
+}
+
+Registro = Tuple[str, Dict[str, Any]]
+
+
+class ExportadorRelatorios:
+    """
+    Classe responsável por exportar relatórios em fluxo.
+
+    Qualquer relatório de GerarRelatorios (dicionário ou lista) é
+    convertido em uma sequência de registros (seção, campos). Cada
+    formato transforma os registros em linhas sob demanda.
+
+    Funcionalidades:
+    - Exportar qualquer relatório do mixin GerarRelatorios
+    - Exportar atividades e moradores brutos
+    - Escrever vários relatórios no mesmo arquivo (EscritorRelatorios)
+    """
+
+    def __init__(self, formato: str = 'csv'):
+        """
+        Inicializa o exportador.
+
+        Args:
+            formato (str): 'csv', 'jsonl' ou 'md'
+
+        Raises:
+            ValueError: Se o formato não for suportado
+        """
+        formato = formato.lower().lstrip('.')
+        if formato not in FORMATOS_EXPORTACAO:
+            raise ValueError(f"Formato não suportado: {formato}. "
+                             f"Use: {', '.join(FORMATOS_EXPORTACAO)}")
+        self._formato = formato
+
+    @property
+    def formato(self) -> str:
+        """Retorna o formato de exportação."""
+        return self._formato
+
+    @classmethod
+    def para_arquivo(cls, caminho: str) -> 'ExportadorRelatorios':
+        """
+        Cria um exportador a partir da extensão do arquivo.
+
+        Args:
+            caminho (str): Caminho do arquivo de saída
+
+        Returns:
+            ExportadorRelatorios: Exportador no formato da extensão
+        """
+        extensao = os.path.splitext(caminho)[1].lstrip('.').lower()
+        if extensao == 'json':
+            extensao = 'jsonl'
+        return cls(extensao or 'csv')
+
+    # === EXPORTAÇÃO PARA ARQUIVO ===
+
+    def exportar_relatorio(self, relatorio: Any, caminho: str,
+                           nome: str = 'relatorio') -> int:
+        """
+        Exporta um relatório de GerarRelatorios para arquivo.
+
+        Args:
+            relatorio: Dicionário ou lista retornado pelo mixin
+            caminho (str): Arquivo de saída
+            nome (str): Nome do relatório (prefixo das seções)
+
+        Returns:
+            int: Número de registros escritos
+        """
+        return self.exportar_registros(registros_relatorio(relatorio, nome), caminho)
+
+    def exportar_atividades(self, atividades: Iterable, caminho: str) -> int:
+        """
+        Exporta atividades brutas (uma linha por atividade).
+
+        Args:
+            atividades (Iterable[AtividadeDomestica]): Atividades
+            caminho (str): Arquivo de saída
+
+        Returns:
+            int: Número de registros escritos
+        """
+        return self.exportar_registros(registros_atividades(atividades), caminho)
+
+    def exportar_moradores(self, moradores: Iterable, caminho: str) -> int:
+        """
+        Exporta moradores brutos (uma linha por morador).
+
+        Args:
+            moradores (Iterable[Morador]): Moradores
+            caminho (str): Arquivo de saída
+
+        Returns:
+            int: Número de registros escritos
+        """
+        return self.exportar_registros(registros_moradores(moradores), caminho)
+
+    def exportar_registros(self, registros: Iterable[Registro], caminho: str) -> int:
+        """
+        Escreve registros em um arquivo novo.
+
+        Args:
+            registros (Iterable): Pares (seção, campos)
+            caminho (str): Arquivo de saída
+
+        Returns:
+            int: Número de registros escritos
+        """
+        diretorio = os.path.dirname(caminho)
+        if diretorio and not os.path.exists(diretorio):
+            os.makedirs(diretorio)
+
+        with self.abrir(caminho) as escritor:
+            return escritor.escrever(registros)
+
+    def abrir(self, caminho: str) -> 'EscritorRelatorios':
+        """
+        Abre um escritor para gravar vários relatórios no mesmo arquivo.
+
+        Args:
+            caminho (str): Arquivo de saída
+
+        Returns:
+            EscritorRelatorios: Escritor (usar com 'with')
+        """
+        arquivo = open(caminho, 'w', encoding='utf-8', newline='')
+        return EscritorRelatorios(arquivo, self._formato, fechar=True)
+
+    # === GERAÇÃO DE LINHAS ===
+
+    def linhas(self, registros: Iterable[Registro]) -> Iterator[str]:
+        """
+        Converte registros em linhas de texto no formato escolhido.
+
+        Args:
+            registros (Iterable): Pares (seção, campos)
+
+        Returns:
+            Iterator[str]: Linhas terminadas em '\\n'
+        """
+        if self._formato == 'jsonl':
+            return _linhas_jsonl(registros)
+        elif self._formato == 'md':
+            return _linhas_markdown(registros)
+        return _linhas_csv(registros)
+
+
+class EscritorRelatorios:
+    """
+    Escritor incremental que mantém o estado do formato entre chamadas.
+
+    Permite escrever relatórios um a um no mesmo arquivo (por exemplo,
+    resultados de vários arquivos de dados em um processamento em lote).
+    """
+
+    def __init__(self, arquivo: TextIO, formato: str, fechar: bool = False):
+        """
+        Inicializa o escritor.
+
+        Args:
+            arquivo (TextIO): Arquivo de texto aberto para escrita
+            formato (str): 'csv', 'jsonl' ou 'md'
+            fechar (bool): Se True, fecha o arquivo ao sair do 'with'
+        """
+        self._arquivo = arquivo
+        self._formato = formato
+        self._fechar = fechar
+        self._total_registros = 0
+        self._estado = {'secao': None, 'colunas': None, 'tabelas': 0}
+
+    @property
+    def total_registros(self) -> int:
+        """Retorna o total de registros já escritos."""
+        return self._total_registros
+
+    def escrever(self, registros: Iterable[Registro]) -> int:
+        """
+        Escreve registros no arquivo, linha a linha.
+
+        Args:
+            registros (Iterable): Pares (seção, campos)
+
+        Returns:
+            int: Número de registros escritos nesta chamada
+        """
+        contador = _ContadorRegistros(registros)
+        if self._formato == 'jsonl':
+            linhas = _linhas_jsonl(contador)
+        elif self._formato == 'md':
+            linhas = _linhas_markdown(contador, self._estado)
+        else:
+            linhas = _linhas_csv(contador, self._estado)
+
+        for linha in linhas:
+            self._arquivo.write(linha)
+
+        self._total_registros += contador.total
+        return contador.total
+
+    def escrever_relatorio(self, relatorio: Any, nome: str,
+                           contexto: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Escreve um relatório, opcionalmente com campos de contexto.
+
+        Args:
+            relatorio: Dicionário ou lista retornado pelo mixin
+            nome (str): Nome do relatório
+            contexto (Dict): Campos extras em cada registro (ex.: arquivo)
+
+        Returns:
+            int: Número de registros escritos
+        """
+        registros = registros_relatorio(relatorio, nome)
+        if contexto:
+            registros = ((secao, {**contexto, **campos}) for secao, campos in registros)
+        return self.escrever(registros)
+
+    def fechar(self):
+        """Fecha o arquivo (se pertencer ao escritor)."""
+        if self._fechar and not self._arquivo.closed:
+            self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, tb):
+        self.fechar()
+        return False
+
+
+class _ContadorRegistros:
+    """Iterador que conta quantos registros passaram por ele."""
+
+    def __init__(self, registros: Iterable[Registro]):
+        self._registros = iter(registros)
+        self.total = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        registro = next(self._registros)
+        self.total += 1
+        return registro
+
+
+# === CONVERSÃO EM REGISTROS ===
+
+def registros_relatorio(relatorio: Any, nome: str = 'relatorio') -> Iterator[Registro]:
+    """
+    Converte um relatório do mixin em registros (seção, campos).
+
+    Campos simples do nível superior formam a seção '<nome>'. Listas e
+    dicionários aninhados viram seções próprias, um registro por item.
+
+    Args:
+        relatorio: Dicionário ou lista retornado pelo mixin
+        nome (str): Nome do relatório
+
+    Returns:
+        Iterator: Registros na ordem do relatório
+    """
+    if isinstance(relatorio, list):
+        yield from _registros_lista(relatorio, nome)
+        return
+
+    if not isinstance(relatorio, dict):
+        yield nome, {'valor': relatorio}
+        return
+
+    simples = {chave: valor for chave, valor in relatorio.items() if _eh_simples(valor)}
+    if simples:
+        yield nome, simples
+
+    for chave, valor in relatorio.items():
+        if _eh_simples(valor):
+            continue
+        secao = f"{nome}.{chave}"
+        if isinstance(valor, (list, tuple)):
+            yield from _registros_lista(valor, secao)
+        elif not valor:
+            continue
+        elif all(isinstance(v, dict) for v in valor.values()):
+            for subchave, subvalor in valor.items():
+                yield secao, {'chave': subchave, **subvalor}
+        else:
+            yield secao, valor
+
+
+def registros_atividades(atividades: Iterable) -> Iterator[Registro]:
+    """
+    Converte atividades em registros usando o contrato de to_dict().
+
+    Args:
+        atividades (Iterable[AtividadeDomestica]): Atividades
+
+    Returns:
+        Iterator: Um registro por atividade
+    """
+    for atividade in atividades:
+        yield 'atividades', atividade.to_dict()
+
+
+def registros_moradores(moradores: Iterable) -> Iterator[Registro]:
+    """
+    Converte moradores em registros usando o contrato de to_dict().
+
+    Args:
+        moradores (Iterable[Morador]): Moradores
+
+    Returns:
+        Iterator: Um registro por morador
+    """
+    for morador in moradores:
+        yield 'moradores', morador.to_dict()
+
+
+def _registros_lista(itens: list, secao: str) -> Iterator[Registro]:
+    """Converte uma lista em registros de uma seção."""
+    for item in itens:
+        if isinstance(item, dict):
+            yield secao, item
+        else:
+            yield secao, {'valor': item}
+
+
+def _eh_simples(valor: Any) -> bool:
+    """Verifica se um valor cabe em uma célula sem ser expandido."""
+    return not isinstance(valor, (dict, list, tuple))
+
+
+def _achatar(campos: Dict[str, Any], prefixo: str = '') -> Dict[str, Any]:
+    """Achata dicionários aninhados em chaves com ponto (para tabelas)."""
+    achatado = {}
+    for chave, valor in campos.items():
+        nome = f"{prefixo}{chave}"
+        if isinstance(valor, dict):
+            achatado.update(_achatar(valor, f"{nome}."))
+        elif isinstance(valor, (list, tuple)):
+            achatado[nome] = '; '.join(str(v) for v in valor)
+        elif valor is None:
+            achatado[nome] = ''
+        elif isinstance(valor, (str, int, float, bool)):
+            achatado[nome] = valor
+        else:
+            achatado[nome] = _para_json(valor)
+    return achatado
+
+
+def _para_json(valor: Any) -> Any:
+    """Converte objetos do domínio (ex.: Morador no ranking) em seu ID."""
+    identificador = getattr(valor, 'id', None)
+    return identificador if isinstance(identificador, str) else str(valor)
+
+
+# === FORMATOS ===
+
+def _linhas_jsonl(registros: Iterable[Registro]) -> Iterator[str]:
+    """Gera uma linha JSON por registro."""
+    for secao, campos in registros:
+        yield json.dumps({'secao': secao, **campos},
+                         ensure_ascii=False, default=_para_json) + '\n'
+
+
+def _linhas_csv(registros: Iterable[Registro],
+                estado: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """Gera linhas CSV; cada seção (ou conjunto novo de colunas) começa com um cabeçalho."""
+    estado = estado if estado is not None else {'secao': None, 'colunas': None, 'tabelas': 0}
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+
+    def linha(valores):
+        escritor.writerow(valores)
+        texto = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return texto
+
+    for secao, campos in registros:
+        achatado = _achatar(campos)
+        if _abrir_tabela(estado, secao, achatado):
+            if estado['tabelas'] > 1:
+                yield '\n'
+            yield linha(['secao'] + list(estado['colunas']))
+        yield linha([secao] + [achatado.get(coluna, '') for coluna in estado['colunas']])
+
+
+def _linhas_markdown(registros: Iterable[Registro],
+                     estado: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """Gera tabelas Markdown; cada seção vira um título com uma ou mais tabelas."""
+    estado = estado if estado is not None else {'secao': None, 'colunas': None, 'tabelas': 0}
+
+    for secao, campos in registros:
+        achatado = _achatar(campos)
+        secao_anterior = estado['secao']
+        if _abrir_tabela(estado, secao, achatado):
+            prefixo = '\n' if estado['tabelas'] > 1 else ''
+            if secao != secao_anterior:
+                yield f"{prefixo}## {secao}\n\n"
+            else:
+                yield prefixo
+            yield '| ' + ' | '.join(_celula_markdown(c) for c in estado['colunas']) + ' |\n'
+            yield '|' + '---|' * len(estado['colunas']) + '\n'
+        yield '| ' + ' | '.join(_celula_markdown(achatado.get(c, ''))
+                                for c in estado['colunas']) + ' |\n'
+
+
+def _abrir_tabela(estado: Dict[str, Any], secao: str, achatado: Dict[str, Any]) -> bool:
+    """
+    Decide se o registro precisa de um cabeçalho novo.
+
+    Uma seção nova começa com as colunas do seu primeiro registro. Dentro
+    da mesma seção, um registro com chaves que a tabela ainda não tem abre
+    outra tabela com as colunas anteriores seguidas das novas, para não
+    perder campos que só aparecem nos registros seguintes.
+
+    Args:
+        estado (Dict): Seção e colunas da tabela atual (atualizado aqui)
+        secao (str): Seção do registro
+        achatado (Dict): Campos do registro já achatados
+
+    Returns:
+        bool: True se um cabeçalho novo deve ser escrito
+    """
+    if secao == estado['secao'] and achatado.keys() <= estado['colunas'].keys():
+        return False
+    if secao == estado['secao']:
+        colunas = {**estado['colunas'], **dict.fromkeys(achatado)}
+    else:
+        colunas = dict.fromkeys(achatado)
+    estado['secao'] = secao
+    estado['colunas'] = colunas
+    estado['tabelas'] += 1
+    return True
+
+
+def _celula_markdown(valor: Any) -> str:
+    """Escapa um valor para uma célula de tabela Markdown."""
+    return str(valor).replace('|', '\\|').replace('\n', ' ')
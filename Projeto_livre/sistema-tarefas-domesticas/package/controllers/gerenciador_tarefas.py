@@ -7,12 +7,15 @@ Classe GerenciadorTarefas
 Controller principal que usa MIXIN e coordena todo o sistema.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
+from collections import defaultdict, Counter
 from ..models.residencia import Residencia
 from ..models.morador import Morador
 from ..models.atividade_domestica import AtividadeDomestica
 from ..models.enums import CategoriaAtividade, SituacaoTarefa
 from ..mixins.gerar_relatorios import GerarRelatorios
+from ..utils.esboco_quantis import EsbocoQuantis
+from ..utils.indice_busca import IndiceBusca
 from .armazenamento_dados import ArmazenamentoDados
 
 
@@ -36,7 +39,23 @@ class GerenciadorTarefas(GerarRelatorios):
         """
         self._residencia = residencia
         self._lista_atividades = []
+        self._indice_atividades: Dict[str, AtividadeDomestica] = {}  # busca por ID em O(1)
         self._armazenamento = armazenamento
+        
+        # Esboços de tempo de realização, atualizados a cada finalização
+        self._esbocos_categoria = defaultdict(EsbocoQuantis)
+        self._esbocos_morador = defaultdict(EsbocoQuantis)
+        
+        # Contadores por situação, mantidos a cada alteração (resumo em O(1))
+        self._contagem_situacao = Counter()
+        
+        # Índice da busca incremental (nome, descrição e facetas)
+        self._indice_busca = IndiceBusca()
+        self._rotular_moradores(self._indice_busca, residencia)
+        
+        # Observadores avisados a cada alteração nos dados
+        self._observadores: List[Callable[[str, Tuple[str, ...]], None]] = []
+        self._versao = 0
     
     @property
     def residencia(self) -> Residencia:
@@ -48,13 +67,51 @@ class GerenciadorTarefas(GerarRelatorios):
         """Retorna lista de atividades."""
         return self._lista_atividades.copy()
     
+    @property
+    def versao(self) -> int:
+        """Retorna o número de alterações feitas nos dados desde a criação."""
+        return self._versao
+    
+    # === OBSERVADORES ===
+    
+    def adicionar_observador(self, observador: Callable[[str, Tuple[str, ...]], None]):
+        """
+        Registra uma função chamada a cada alteração nos dados.
+        
+        Args:
+            observador (Callable): Recebe o nome do evento (ex.: 'atividade_finalizada')
+                e os IDs afetados - de atividades nos eventos 'atividade_*' e
+                'responsavel_atribuido', de moradores nos eventos 'morador_*';
+                vazio em 'dados_carregados' (tudo mudou)
+        """
+        if observador not in self._observadores:
+            self._observadores.append(observador)
+    
+    def remover_observador(self, observador: Callable[[str, Tuple[str, ...]], None]):
+        """Remove um observador registrado."""
+        if observador in self._observadores:
+            self._observadores.remove(observador)
+    
+    def _notificar(self, evento: str, *ids: str):
+        """Incrementa a versão dos dados e avisa os observadores."""
+        self._versao += 1
+        for observador in list(self._observadores):
+            try:
+                observador(evento, ids)
+            except Exception as e:
+                print(f"❌ Erro no observador de '{evento}': {e}")
+    
     # === GERENCIAMENTO DE MORADORES ===
     
     def adicionar_morador(self, nome: str) -> bool:
         """Adiciona novo morador."""
         try:
             morador = Morador(nome)
-            return self._residencia.adicionar_morador(morador)
+            if self._residencia.adicionar_morador(morador):
+                self._indice_busca.definir_rotulo('responsavel', morador.id, morador.nome)
+                self._notificar('morador_adicionado', morador.id)
+                return True
+            return False
         except Exception as e:
             print(f"❌ Erro ao adicionar morador: {e}")
             return False
@@ -68,8 +125,50 @@ class GerenciadorTarefas(GerarRelatorios):
         return self._residencia.obter_morador_por_id(morador_id)
     
     def remover_morador(self, morador_id: str) -> bool:
-        """Remove um morador da residência."""
-        return self._residencia.remover_morador(morador_id)
+        """Remove um morador da residência, deixando suas tarefas sem responsável."""
+        if not self._residencia.remover_morador(morador_id):
+            return False
+        
+        for atividade in self.listar_atividades_por_responsavel(morador_id):
+            atividade.responsavel_id = None
+            self._indice_busca.definir_faceta(atividade.id_atividade, 'responsavel', '')
+        self._esbocos_morador.pop(morador_id, None)
+        
+        self._notificar('morador_removido', morador_id)
+        return True
+    
+    def editar_morador(self, morador_id: str, nome: Optional[str] = None,
+                       disponivel: Optional[bool] = None) -> bool:
+        """
+        Altera nome e/ou disponibilidade de um morador.
+        
+        Args:
+            morador_id (str): ID do morador
+            nome (str): Novo nome (None mantém o atual)
+            disponivel (bool): Nova disponibilidade (None mantém a atual)
+            
+        Returns:
+            bool: True se o morador existe e foi alterado
+            
+        Raises:
+            ValueError: Se o nome ou a disponibilidade forem inválidos
+        """
+        morador = self.obter_morador_por_id(morador_id)
+        if not morador:
+            return False
+        
+        if nome is not None:
+            morador.nome = nome
+            self._indice_busca.definir_rotulo('responsavel', morador_id, morador.nome)
+        if disponivel is not None:
+            morador.disponivel = disponivel
+        
+        self._notificar('morador_editado', morador_id)
+        return True
+    
+    def listar_atividades_por_responsavel(self, morador_id: str) -> List[AtividadeDomestica]:
+        """Lista as atividades atribuídas a um morador."""
+        return [a for a in self._lista_atividades if a.responsavel_id == morador_id]
     
     # === GERENCIAMENTO DE ATIVIDADES ===
     
@@ -80,6 +179,10 @@ class GerenciadorTarefas(GerarRelatorios):
         try:
             atividade = AtividadeDomestica(categoria, nome, descricao, responsavel_id)
             self._lista_atividades.append(atividade)
+            self._indice_atividades[atividade.id_atividade] = atividade
+            self._contagem_situacao[atividade.situacao] += 1
+            self._indexar_atividade(self._indice_busca, atividade)
+            self._notificar('atividade_criada', atividade.id_atividade)
             return atividade
         except Exception as e:
             print(f"❌ Erro ao criar atividade: {e}")
@@ -87,50 +190,225 @@ class GerenciadorTarefas(GerarRelatorios):
     
     def atribuir_responsavel(self, atividade_id: str, morador_id: str) -> bool:
         """Atribui responsável a uma atividade."""
-        atividade = self.obter_atividade_por_id(atividade_id)
-        morador = self.obter_morador_por_id(morador_id)
-        
-        if atividade and morador:
-            atividade.responsavel_id = morador_id
-            return True
-        return False
+        return bool(self.atribuir_responsavel_em_lote([atividade_id], morador_id))
     
     def finalizar_atividade(self, atividade_id: str) -> bool:
         """Finaliza uma atividade e adiciona pontos ao responsável."""
-        atividade = self.obter_atividade_por_id(atividade_id)
+        return bool(self.finalizar_atividades([atividade_id]))
+    
+    def cancelar_atividade(self, atividade_id: str) -> bool:
+        """Cancela uma atividade."""
+        return bool(self.cancelar_atividades([atividade_id]))
+    
+    def excluir_atividade(self, atividade_id: str) -> bool:
+        """Exclui uma atividade permanentemente."""
+        return bool(self.excluir_atividades([atividade_id]))
+    
+    # === OPERAÇÕES EM LOTE ===
+    # Cada operação avisa os observadores uma única vez, com todos os IDs
+    # alterados, para que a interface atualize e salve uma vez só.
+    
+    def atribuir_responsavel_em_lote(self, atividade_ids: List[str], morador_id: str) -> List[str]:
+        """
+        Atribui o mesmo responsável a várias atividades.
         
-        if not atividade or not atividade.esta_pendente:
-            return False
+        Args:
+            atividade_ids (List[str]): IDs das atividades
+            morador_id (str): ID do novo responsável
+            
+        Returns:
+            List[str]: IDs das atividades alteradas
+        """
+        if not self.obter_morador_por_id(morador_id):
+            return []
         
-        if atividade.marcar_finalizada():
+        alteradas = []
+        for atividade_id in dict.fromkeys(atividade_ids):
+            atividade = self.obter_atividade_por_id(atividade_id)
+            if not atividade:
+                continue
+            if atividade.esta_finalizada:
+                self._descartar_tempo_realizacao(atividade, apenas_morador=True)
+            atividade.responsavel_id = morador_id
+            self._indice_busca.definir_faceta(atividade_id, 'responsavel', morador_id)
+            if atividade.esta_finalizada:
+                self._registrar_tempo_realizacao(atividade, apenas_morador=True)
+            alteradas.append(atividade_id)
+        
+        if alteradas:
+            self._notificar('responsavel_atribuido', *alteradas)
+        return alteradas
+    
+    def finalizar_atividades(self, atividade_ids: List[str]) -> List[str]:
+        """
+        Finaliza várias atividades e adiciona os pontos aos responsáveis.
+        
+        Atividades inexistentes ou que não estão pendentes são ignoradas.
+        
+        Args:
+            atividade_ids (List[str]): IDs das atividades
+            
+        Returns:
+            List[str]: IDs das atividades finalizadas
+        """
+        finalizadas = []
+        for atividade_id in dict.fromkeys(atividade_ids):
+            atividade = self.obter_atividade_por_id(atividade_id)
+            if not atividade or not atividade.esta_pendente:
+                continue
+            if not atividade.marcar_finalizada():
+                continue
+            
+            self._contagem_situacao[SituacaoTarefa.PENDENTE] -= 1
+            self._contagem_situacao[SituacaoTarefa.FINALIZADA] += 1
+            self._indice_busca.definir_faceta(atividade_id, 'situacao', atividade.situacao.value)
+            self._registrar_tempo_realizacao(atividade)
+            
             # Adicionar pontos ao responsável
             if atividade.responsavel_id:
                 morador = self.obter_morador_por_id(atividade.responsavel_id)
                 if morador:
                     morador.finalizar_tarefa(atividade_id, atividade.pontos_tarefa)
-            return True
-        return False
+            finalizadas.append(atividade_id)
+        
+        if finalizadas:
+            self._notificar('atividade_finalizada', *finalizadas)
+        return finalizadas
     
-    def cancelar_atividade(self, atividade_id: str) -> bool:
-        """Cancela uma atividade."""
-        atividade = self.obter_atividade_por_id(atividade_id)
-        return atividade.marcar_cancelada() if atividade else False
+    def cancelar_atividades(self, atividade_ids: List[str]) -> List[str]:
+        """
+        Cancela várias atividades pendentes.
+        
+        Args:
+            atividade_ids (List[str]): IDs das atividades
+            
+        Returns:
+            List[str]: IDs das atividades canceladas
+        """
+        canceladas = []
+        for atividade_id in dict.fromkeys(atividade_ids):
+            atividade = self.obter_atividade_por_id(atividade_id)
+            if atividade and atividade.marcar_cancelada():
+                self._contagem_situacao[SituacaoTarefa.PENDENTE] -= 1
+                self._contagem_situacao[SituacaoTarefa.CANCELADA] += 1
+                self._indice_busca.definir_faceta(atividade_id, 'situacao', atividade.situacao.value)
+                canceladas.append(atividade_id)
+        
+        if canceladas:
+            self._notificar('atividade_cancelada', *canceladas)
+        return canceladas
     
-    def excluir_atividade(self, atividade_id: str) -> bool:
-        """Exclui uma atividade permanentemente."""
-        atividade = self.obter_atividade_por_id(atividade_id)
-        if atividade:
-            self._lista_atividades.remove(atividade)
-            return True
-        return False
+    def excluir_atividades(self, atividade_ids: List[str]) -> List[str]:
+        """
+        Exclui várias atividades permanentemente.
+        
+        A lista de atividades é percorrida uma única vez, qualquer que seja
+        a quantidade excluída.
+        
+        Args:
+            atividade_ids (List[str]): IDs das atividades
+            
+        Returns:
+            List[str]: IDs das atividades excluídas
+        """
+        excluidas = []
+        for atividade_id in dict.fromkeys(atividade_ids):
+            atividade = self._indice_atividades.pop(atividade_id, None)
+            if not atividade:
+                continue
+            if atividade.esta_finalizada:
+                self._descartar_tempo_realizacao(atividade)
+            self._contagem_situacao[atividade.situacao] -= 1
+            self._indice_busca.remover(atividade_id)
+            excluidas.append(atividade_id)
+        
+        if excluidas:
+            removidas = set(excluidas)
+            self._lista_atividades[:] = [a for a in self._lista_atividades
+                                         if a.id_atividade not in removidas]
+            self._notificar('atividade_excluida', *excluidas)
+        return excluidas
     
     def obter_atividade_por_id(self, atividade_id: str) -> Optional[AtividadeDomestica]:
         """Obtém atividade por ID."""
-        for atividade in self._lista_atividades:
-            if atividade.id_atividade == atividade_id:
-                return atividade
-        return None
+        return self._indice_atividades.get(atividade_id)
     
+    def contar_atividades(self) -> int:
+        """Retorna o número total de atividades."""
+        return len(self._lista_atividades)
+
+    def consultar_atividades(self, inicio: int = 0, limite: Optional[int] = None) -> List[AtividadeDomestica]:
+        """
+        Retorna uma janela das atividades, sem copiar a lista inteira.
+
+        Args:
+            inicio (int): Posição da primeira atividade
+            limite (int): Quantidade máxima (None para todas a partir de 'inicio')
+
+        Returns:
+            List[AtividadeDomestica]: Atividades da janela, na ordem de criação
+        """
+        inicio = max(0, inicio)
+        fim = None if limite is None else inicio + max(0, limite)
+        return self._lista_atividades[inicio:fim]
+
+    def buscar_atividades(self, consulta: str) -> List[str]:
+        """
+        Busca atividades por nome, descrição, categoria, situação ou responsável.
+
+        Acentos e maiúsculas são ignorados, e cada palavra da consulta pode
+        ser um trecho de palavra ("lou" encontra "Lavar louça"). Consultas
+        que só completam a anterior filtram o resultado anterior.
+
+        Args:
+            consulta (str): Texto digitado (vazio = todas as atividades)
+
+        Returns:
+            List[str]: IDs das atividades encontradas, na ordem de criação
+        """
+        return self._indice_busca.buscar(consulta)
+
+    def filtrar_atividades(self, categoria: Optional[CategoriaAtividade] = None,
+                           situacao: Optional[SituacaoTarefa] = None,
+                           responsavel_id: Optional[str] = None,
+                           busca: Optional[str] = None) -> List[AtividadeDomestica]:
+        """
+        Lista as atividades que atendem a todos os filtros informados.
+        
+        Args:
+            categoria (CategoriaAtividade): Só desta categoria
+            situacao (SituacaoTarefa): Só nesta situação
+            responsavel_id (str): Só deste responsável
+            busca (str): Texto buscado como em buscar_atividades()
+            
+        Returns:
+            List[AtividadeDomestica]: Atividades encontradas (lista nova)
+        """
+        if busca:
+            atividades = [self._indice_atividades[i] for i in self.buscar_atividades(busca)]
+        else:
+            atividades = self._lista_atividades
+        return [a for a in atividades
+                if (categoria is None or a.categoria == categoria)
+                and (situacao is None or a.situacao == situacao)
+                and (responsavel_id is None or a.responsavel_id == responsavel_id)]
+
+    @staticmethod
+    def _indexar_atividade(indice: IndiceBusca, atividade: AtividadeDomestica):
+        """Adiciona (ou reindexa) uma atividade no índice de busca."""
+        indice.adicionar(atividade.id_atividade,
+                         (atividade.nome_tarefa, atividade.descricao),
+                         {'categoria': atividade.categoria.value,
+                          'situacao': atividade.situacao.value,
+                          'responsavel': atividade.responsavel_id or ''})
+
+    @staticmethod
+    def _rotular_moradores(indice: IndiceBusca, residencia: Residencia):
+        """Faz a busca por responsável casar com o nome de cada morador."""
+        indice.definir_rotulo('responsavel', '', 'Não atribuído')
+        for morador in residencia.listar_moradores():
+            indice.definir_rotulo('responsavel', morador.id, morador.nome)
+
     def listar_atividades_por_categoria(self, categoria: CategoriaAtividade = None) -> List[AtividadeDomestica]:
         """Lista atividades filtradas por categoria."""
         if categoria is None:
@@ -149,12 +427,53 @@ class GerenciadorTarefas(GerarRelatorios):
     # === PERSISTÊNCIA ===
     
     def salvar_dados(self) -> bool:
-        """Salva todos os dados do sistema."""
+        """
+        Salva todos os dados do sistema.
+        
+        Chamado na thread que altera os dados (ex.: ao fechar o programa),
+        por isso também atualiza o cache de inicialização a partir dos
+        objetos vivos, se o armazenamento usar cache.
+        """
+        try:
+            if not self.gravar_dados(self.montar_dados()):
+                return False
+            if self._armazenamento.usar_cache:
+                self._armazenamento.salvar_cache(self._estado_atual())
+            return True
+        except Exception as e:
+            print(f"❌ Erro ao salvar: {e}")
+            return False
+
+    def montar_dados(self) -> Dict[str, Any]:
+        """
+        Monta uma cópia serializável dos dados (sem escrever em disco).
+
+        A cópia é independente dos objetos vivos e pode ser gravada em
+        outra thread com gravar_dados().
+
+        Returns:
+            Dict[str, Any]: Residência e atividades em dicionários
+        """
+        return {
+            'residencia': self._residencia.to_dict(),
+            'atividades': [a.to_dict() for a in self._lista_atividades]
+        }
+
+    def gravar_dados(self, dados: Dict[str, Any]) -> bool:
+        """
+        Grava dados montados por montar_dados().
+        
+        Não atualiza o cache de inicialização: remontar os objetos a cada
+        salvamento em segundo plano custaria mais que a própria gravação.
+        O cache fica inválido até o próximo salvar_dados() ou carregamento.
+
+        Args:
+            dados (Dict): Dados a gravar
+
+        Returns:
+            bool: True se gravou com sucesso
+        """
         try:
-            dados = {
-                'residencia': self._residencia.to_dict(),
-                'atividades': [a.to_dict() for a in self._lista_atividades]
-            }
             return self._armazenamento.salvar_em_json(dados)
         except Exception as e:
             print(f"❌ Erro ao salvar: {e}")
@@ -162,27 +481,192 @@ class GerenciadorTarefas(GerarRelatorios):
     
     def carregar_dados(self) -> bool:
         """Carrega dados salvos."""
+        estado = self.ler_dados()
+        if estado is None:
+            return False
+        self.aplicar_dados(estado)
+        return True
+    
+    def ler_dados(self) -> Optional[Dict[str, Any]]:
+        """
+        Lê o arquivo e monta todo o estado carregado, sem alterar o gerenciador.
+        
+        Pode rodar em uma thread de trabalho: só cria objetos novos. Se o
+        armazenamento usar cache e o cache corresponder ao arquivo, o
+        estado vem dele; senão, o JSON é lido e o cache é regravado.
+        
+        Returns:
+            Optional[Dict]: Estado para aplicar_dados(), ou None se não
+            houver dados ou a leitura falhar
+        """
         try:
+            estado = self._armazenamento.carregar_cache()
+            if estado is not None:
+                return estado
+            
+            # Assinatura tirada antes da leitura: se o arquivo mudar no meio,
+            # o cache gravado já nasce inválido
+            assinatura = self._armazenamento.assinatura_arquivo() if self._armazenamento.usar_cache else None
             dados = self._armazenamento.carregar_do_json()
             if not dados:
-                return False
+                return None
             
-            # Carregar residência
-            if 'residencia' in dados:
-                self._residencia = Residencia.from_dict(dados['residencia'])
-            
-            # Carregar atividades
-            if 'atividades' in dados:
-                self._lista_atividades = []
-                for dados_atividade in dados['atividades']:
-                    atividade = AtividadeDomestica.from_dict(dados_atividade)
-                    self._lista_atividades.append(atividade)
-            
-            return True
+            estado = self.montar_estado(dados)
+            if assinatura is not None:
+                self._armazenamento.salvar_cache(estado, assinatura)
+            return estado
             
         except Exception as e:
             print(f"❌ Erro ao carregar: {e}")
-            return False
+            return None
+    
+    def montar_estado(self, dados: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Monta objetos, índices, esboços e contadores a partir dos dados lidos.
+        
+        Índices, esboços e contadores são montados aqui, para que
+        aplicar_dados() seja O(1).
+        
+        Args:
+            dados (Dict): Dados no formato de montar_dados()
+            
+        Returns:
+            Dict[str, Any]: Estado para aplicar_dados()
+        """
+        estado = {'residencia': None, 'atividades': None}
+        
+        # Carregar residência
+        if 'residencia' in dados:
+            estado['residencia'] = Residencia.from_dict(dados['residencia'])
+        
+        # Carregar atividades
+        if 'atividades' in dados:
+            atividades = [AtividadeDomestica.from_dict(dados_atividade)
+                          for dados_atividade in dados['atividades']]
+            esbocos_categoria = defaultdict(EsbocoQuantis)
+            esbocos_morador = defaultdict(EsbocoQuantis)
+            for atividade in atividades:
+                segundos = atividade.tempo_realizacao_segundos
+                if segundos is not None:
+                    esbocos_categoria[atividade.categoria].adicionar(segundos)
+                    if atividade.responsavel_id:
+                        esbocos_morador[atividade.responsavel_id].adicionar(segundos)
+            
+            estado.update({
+                'atividades': atividades,
+                'indice_atividades': {a.id_atividade: a for a in atividades},
+                'esbocos_categoria': esbocos_categoria,
+                'esbocos_morador': esbocos_morador,
+                'contagem_situacao': Counter(a.situacao for a in atividades)
+            })
+            
+            indice_busca = IndiceBusca()
+            for atividade in atividades:
+                self._indexar_atividade(indice_busca, atividade)
+            self._rotular_moradores(indice_busca, estado['residencia'] or self._residencia)
+            estado['indice_busca'] = indice_busca
+        
+        return estado
+    
+    def _estado_atual(self) -> Dict[str, Any]:
+        """Estado vivo no formato de ler_dados() (para o cache de inicialização)."""
+        return {
+            'residencia': self._residencia,
+            'atividades': self._lista_atividades,
+            'indice_atividades': self._indice_atividades,
+            'esbocos_categoria': self._esbocos_categoria,
+            'esbocos_morador': self._esbocos_morador,
+            'contagem_situacao': self._contagem_situacao,
+            'indice_busca': self._indice_busca
+        }
+    
+    def importar_dados(self, dados: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Acrescenta os moradores e atividades de outros dados aos atuais.
+        
+        Moradores com ID ou nome já cadastrado e atividades com ID já
+        existente são ignorados, então importar o mesmo arquivo duas vezes
+        não duplica nada.
+        
+        Args:
+            dados (Dict): Dados no formato de montar_dados()
+            
+        Returns:
+            Dict[str, int]: Quantidade de moradores e de atividades importados
+        """
+        moradores = []
+        for dados_morador in (dados.get('residencia') or {}).get('moradores', []):
+            morador = Morador.from_dict(dados_morador)
+            if self._residencia.adicionar_morador(morador):
+                self._indice_busca.definir_rotulo('responsavel', morador.id, morador.nome)
+                moradores.append(morador.id)
+        
+        atividades = []
+        for dados_atividade in dados.get('atividades', []):
+            atividade = AtividadeDomestica.from_dict(dados_atividade)
+            if atividade.id_atividade in self._indice_atividades:
+                continue
+            self._lista_atividades.append(atividade)
+            self._indice_atividades[atividade.id_atividade] = atividade
+            self._contagem_situacao[atividade.situacao] += 1
+            self._indexar_atividade(self._indice_busca, atividade)
+            if atividade.esta_finalizada:
+                self._registrar_tempo_realizacao(atividade)
+            atividades.append(atividade.id_atividade)
+        
+        if moradores or atividades:
+            self._notificar('dados_importados', *moradores, *atividades)
+        return {'moradores': len(moradores), 'atividades': len(atividades)}
+    
+    def aplicar_dados(self, estado: Dict[str, Any]):
+        """
+        Substitui os dados do gerenciador pelo estado montado em ler_dados().
+        
+        Args:
+            estado (Dict): Resultado de ler_dados()
+        """
+        if estado['residencia'] is not None:
+            self._residencia = estado['residencia']
+        
+        if estado['atividades'] is not None:
+            self._lista_atividades = estado['atividades']
+            self._indice_atividades = estado['indice_atividades']
+            self._esbocos_categoria = estado['esbocos_categoria']
+            self._esbocos_morador = estado['esbocos_morador']
+            self._contagem_situacao = estado['contagem_situacao']
+            self._indice_busca = estado['indice_busca']
+        elif estado['residencia'] is not None:
+            self._rotular_moradores(self._indice_busca, self._residencia)
+        
+        self._notificar('dados_carregados')
+    
+    # === TEMPO DE REALIZAÇÃO ===
+    
+    def _obter_esbocos_tempo_realizacao(self) -> Tuple[Dict, Dict[str, EsbocoQuantis]]:
+        """Retorna os esboços mantidos incrementalmente (sobrescreve o mixin)."""
+        return self._esbocos_categoria, self._esbocos_morador
+    
+    def _registrar_tempo_realizacao(self, atividade: AtividadeDomestica,
+                                    apenas_morador: bool = False):
+        """Adiciona o tempo de realização de uma atividade finalizada aos esboços."""
+        segundos = atividade.tempo_realizacao_segundos
+        if segundos is None:
+            return
+        if not apenas_morador:
+            self._esbocos_categoria[atividade.categoria].adicionar(segundos)
+        if atividade.responsavel_id:
+            self._esbocos_morador[atividade.responsavel_id].adicionar(segundos)
+    
+    def _descartar_tempo_realizacao(self, atividade: AtividadeDomestica,
+                                    apenas_morador: bool = False):
+        """Remove o tempo de realização de uma atividade dos esboços."""
+        segundos = atividade.tempo_realizacao_segundos
+        if segundos is None:
+            return
+        if not apenas_morador:
+            self._esbocos_categoria[atividade.categoria].remover(segundos)
+        if atividade.responsavel_id and atividade.responsavel_id in self._esbocos_morador:
+            self._esbocos_morador[atividade.responsavel_id].remover(segundos)
     
     # === ESTATÍSTICAS RÁPIDAS ===
     
@@ -191,7 +675,33 @@ class GerenciadorTarefas(GerarRelatorios):
         return {
             'total_moradores': self._residencia.total_moradores,
             'total_atividades': len(self._lista_atividades),
-            'atividades_pendentes': len(self.obter_atividades_pendentes()),
-            'atividades_finalizadas': len(self.listar_atividades_por_situacao(SituacaoTarefa.FINALIZADA)),
+            'atividades_pendentes': self._contagem_situacao[SituacaoTarefa.PENDENTE],
+            'atividades_finalizadas': self._contagem_situacao[SituacaoTarefa.FINALIZADA],
             'moradores_disponiveis': len(self._residencia.moradores_disponiveis)
-        }
\ No newline at end of file
+        }
+    
+    def estruturas_memoria(self) -> List[Tuple[str, List[Any]]]:
+        """
+        Agrupa os objetos vivos do gerenciador por categoria, para a
+        contagem de memória do diagnóstico.
+        
+        A ordem importa: um objeto alcançável por várias categorias é
+        contado só na primeira (as atividades antes dos índices que
+        apontam para elas, os históricos antes dos moradores).
+        
+        Returns:
+            List[Tuple[str, List[Any]]]: (categoria, objetos raiz) em ordem
+        """
+        moradores = self._residencia.listar_moradores()
+        estruturas = [
+            ('atividades', list(self._lista_atividades)),
+            ('historicos', [morador._historico_tarefas for morador in moradores]),
+            ('moradores', moradores),
+            ('residencia', [self._residencia]),
+            ('lista_atividades', [self._lista_atividades]),
+            ('indices', [self._indice_atividades, self._contagem_situacao]),
+            ('esbocos', [self._esbocos_categoria, self._esbocos_morador]),
+        ]
+        estruturas += list(self._indice_busca.estruturas_memoria().items())
+        estruturas.append(('outros', [self]))
+        return estruturas
\ No newline at end of file
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Processamento em Lote de Relatórios
+===================================
+
+Gera relatórios para muitos arquivos de dados (um por residência) sem
+interface gráfica. Cada arquivo é carregado por ArmazenamentoDados e
+GerenciadorTarefas em um pool de processos, e os resultados são escritos
+em fluxo em um único arquivo de saída.
+"""
+
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..models.residencia import Residencia
+from .armazenamento_dados import ArmazenamentoDados
+from .gerenciador_tarefas import GerenciadorTarefas
+from .exportador_relatorios import ExportadorRelatorios
+from .relatorios_paralelos import RELATORIOS_DISPONIVEIS, RELATORIOS_PADRAO, validar_relatorios
+
+
+def listar_arquivos_dados(entradas: Iterable[str]) -> List[str]:
+    """
+    Resolve diretórios, padrões glob e arquivos em uma lista de arquivos JSON.
+
+    Diretórios são percorridos recursivamente em busca de '*.json'.
+
+    Args:
+        entradas (Iterable[str]): Diretórios, globs ou arquivos
+
+    Returns:
+        List[str]: Caminhos únicos, em ordem alfabética
+    """
+    arquivos = set()
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            padrao = os.path.join(entrada, '**', '*.json')
+            arquivos.update(glob.glob(padrao, recursive=True))
+        elif glob.has_magic(entrada):
+            arquivos.update(glob.glob(entrada, recursive=True))
+        else:
+            arquivos.add(entrada)
+    return sorted(arquivos)
+
+
+def processar_arquivo(caminho: str, relatorios: List[str],
+                      parametros: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Carrega um arquivo de dados e gera os relatórios pedidos.
+
+    Executado dentro dos processos worker.
+
+    Args:
+        caminho (str): Arquivo sistema_tarefas.json
+        relatorios (List[str]): Nomes de RELATORIOS_DISPONIVEIS
+        parametros (Dict): Argumentos por relatório
+
+    Returns:
+        Dict: Resultado com 'sucesso', 'relatorios' ou 'erro' e métricas
+    """
+    inicio = time.perf_counter()
+    parametros = parametros or {}
+    resultado = {
+        'arquivo': caminho,
+        'sucesso': False,
+        'relatorios': {},
+        'total_atividades': 0,
+        'total_moradores': 0,
+        'erro': None
+    }
+
+    try:
+        if not os.path.isfile(caminho):
+            raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+
+        armazenamento = ArmazenamentoDados(caminho)
+        gerenciador = GerenciadorTarefas(Residencia("Casa Principal"), armazenamento)
+        if not gerenciador.carregar_dados():
+            raise ValueError("Não foi possível carregar os dados do arquivo")
+
+        resumo = gerenciador.obter_resumo_sistema()
+        resultado['total_atividades'] = resumo['total_atividades']
+        resultado['total_moradores'] = resumo['total_moradores']
+
+        for nome in relatorios:
+            metodo = getattr(gerenciador, RELATORIOS_DISPONIVEIS[nome])
+            resultado['relatorios'][nome] = metodo(**parametros.get(nome, {}))
+
+        resultado['sucesso'] = True
+
+    except Exception as e:
+        resultado['erro'] = f"{type(e).__name__}: {e}"
+
+    resultado['duracao'] = time.perf_counter() - inicio
+    return resultado
+
+
+def executar_lote(arquivos: List[str], caminho_saida: str,
+                  relatorios: Optional[List[str]] = None,
+                  parametros: Optional[Dict[str, Dict[str, Any]]] = None,
+                  formato: Optional[str] = None,
+                  max_workers: Optional[int] = None,
+                  progresso: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Processa vários arquivos de dados em paralelo e grava um único resultado.
+
+    Os resultados são escritos assim que cada arquivo termina, com o
+    campo 'arquivo' em todos os registros.
+
+    Args:
+        arquivos (List[str]): Arquivos de dados
+        caminho_saida (str): Arquivo de saída (.csv, .jsonl ou .md)
+        relatorios (List[str]): Relatórios a gerar (padrão: fechamento mensal)
+        parametros (Dict): Argumentos por relatório
+        formato (str): Força o formato de saída (padrão: pela extensão)
+        max_workers (int): Tamanho do pool de processos
+        progresso (Callable): Chamado com (concluídos, total, resultado)
+
+    Returns:
+        Dict: Resumo com totais, falhas por arquivo e vazão
+
+    Raises:
+        ValueError: Se algum relatório não existir ou algum parâmetro
+            estiver fora de LIMITES_PARAMETROS
+    """
+    relatorios = list(relatorios) if relatorios else list(RELATORIOS_PADRAO)
+    validar_relatorios(relatorios, parametros)
+
+    exportador = (ExportadorRelatorios(formato) if formato
+                  else ExportadorRelatorios.para_arquivo(caminho_saida))
+
+    inicio = time.perf_counter()
+    resumo = {
+        'total_arquivos': len(arquivos),
+        'sucesso': 0,
+        'falhas': [],
+        'total_atividades': 0,
+        'total_moradores': 0,
+        'registros_escritos': 0
+    }
+
+    diretorio = os.path.dirname(caminho_saida)
+    if diretorio and not os.path.exists(diretorio):
+        os.makedirs(diretorio)
+
+    with exportador.abrir(caminho_saida) as escritor:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futuros = {executor.submit(processar_arquivo, caminho, relatorios, parametros): caminho
+                       for caminho in arquivos}
+
+            for concluidos, futuro in enumerate(as_completed(futuros), 1):
+                caminho = futuros[futuro]
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    resultado = {'arquivo': caminho, 'sucesso': False,
+                                 'erro': f"{type(e).__name__}: {e}", 'duracao': 0.0}
+
+                if resultado['sucesso']:
+                    resumo['sucesso'] += 1
+                    resumo['total_atividades'] += resultado['total_atividades']
+                    resumo['total_moradores'] += resultado['total_moradores']
+                    for nome, relatorio in resultado['relatorios'].items():
+                        resumo['registros_escritos'] += escritor.escrever_relatorio(
+                            relatorio, nome, {'arquivo': caminho})
+                else:
+                    resumo['falhas'].append({'arquivo': caminho, 'erro': resultado['erro']})
+
+                if progresso:
+                    progresso(concluidos, len(arquivos), resultado)
+
+    duracao = time.perf_counter() - inicio
+    resumo['duracao_segundos'] = round(duracao, 3)
+    resumo['arquivos_por_segundo'] = round(len(arquivos) / duracao, 2) if duracao > 0 else 0.0
+    resumo['atividades_por_segundo'] = (round(resumo['total_atividades'] / duracao, 1)
+                                        if duracao > 0 else 0.0)
+    return resumo
+
+
+def mostrar_progresso(concluidos: int, total: int, resultado: Dict[str, Any]):
+    """Imprime uma linha de progresso em stderr."""
+    if resultado['sucesso']:
+        detalhe = (f"✅ {resultado['arquivo']} "
+                   f"({resultado['total_atividades']} atividades, {resultado['duracao']:.2f}s)")
+    else:
+        detalhe = f"❌ {resultado['arquivo']} - {resultado['erro']}"
+    print(f"[{concluidos}/{total}] {detalhe}", file=sys.stderr, flush=True)
+
+
+def imprimir_resumo(resumo: Dict[str, Any]):
+    """Imprime o resumo final do lote, com as falhas por arquivo."""
+    print("=" * 60)
+    print("📊 RESUMO DO PROCESSAMENTO EM LOTE")
+    print("=" * 60)
+    print(f"📁 Arquivos: {resumo['total_arquivos']} "
+          f"(✅ {resumo['sucesso']} | ❌ {len(resumo['falhas'])})")
+    print(f"📋 Atividades processadas: {resumo['total_atividades']}")
+    print(f"👥 Moradores processados: {resumo['total_moradores']}")
+    print(f"📝 Registros escritos: {resumo['registros_escritos']}")
+    print(f"⏱️ Duração: {resumo['duracao_segundos']}s")
+    print(f"🚀 Vazão: {resumo['arquivos_por_segundo']} arquivos/s | "
+          f"{resumo['atividades_por_segundo']} atividades/s")
+
+    if resumo['falhas']:
+        print("-" * 60)
+        print("❌ FALHAS:")
+        for falha in resumo['falhas']:
+            print(f"   {falha['arquivo']}: {falha['erro']}")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Geração Paralela de Relatórios
+==============================
+
+Executa os relatórios do mixin GerarRelatorios em paralelo usando um pool
+do concurrent.futures. Os workers recebem um snapshot compacto e
+serializável (picklable) dos dados, nunca o grafo de objetos vivo.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Optional
+
+from ..models.residencia import Residencia
+from ..models.atividade_domestica import AtividadeDomestica
+from ..mixins.gerar_relatorios import GerarRelatorios
+
+
+# Relatórios disponíveis (nome curto -> método do mixin)
+RELATORIOS_DISPONIVEIS = {
+    'performance': 'relatorio_performance_moradores',
+    'categorias': 'estatisticas_por_categoria',
+    'historico_mes': 'historico_tarefas_mes',
+    'produtividade_diaria': 'relatorio_produtividade_diaria',
+    'ranking': 'ranking_melhores_moradores',
+    'tempo_realizacao': 'relatorio_tempo_realizacao'
+}
+
+# Faixas aceitas para os parâmetros vindos de fora (linha de comando e API):
+# dias=0 dividiria por zero e um valor enorme estoura o timedelta
+LIMITES_PARAMETROS = {
+    'mes': (1, 12),
+    'dias': (1, 3660)
+}
+
+# Relatórios do fechamento mensal
+RELATORIOS_PADRAO = ['performance', 'categorias', 'historico_mes',
+                     'produtividade_diaria', 'ranking']
+
+# Gerador reconstruído uma única vez em cada processo worker
+_gerador_worker = None
+
+
+class GeradorSnapshot(GerarRelatorios):
+    """
+    Host mínimo do mixin GerarRelatorios, montado a partir de um snapshot.
+
+    Tem apenas os atributos que o mixin exige (_residencia e
+    _lista_atividades), sem armazenamento nem interface.
+    """
+
+    def __init__(self, snapshot: Dict[str, Any]):
+        """
+        Reconstrói residência e atividades a partir do snapshot.
+
+        Args:
+            snapshot (Dict): Dados gerados por criar_snapshot()
+        """
+        campos = snapshot['campos_atividade']
+        self._residencia = Residencia.from_dict(snapshot['residencia'])
+        self._lista_atividades = [
+            AtividadeDomestica.from_dict(dict(zip(campos, valores)))
+            for valores in snapshot['atividades']
+        ]
+
+
+def inteiro_entre(nome: str):
+    """
+    Tipo de argumento inteiro dentro da faixa de LIMITES_PARAMETROS[nome].
+
+    Args:
+        nome (str): Nome do parâmetro
+
+    Returns:
+        Callable[[str], int]: Conversor para o 'type' do argparse
+    """
+    minimo, maximo = LIMITES_PARAMETROS[nome]
+
+    def converter(texto: str) -> int:
+        try:
+            valor = int(texto)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"inteiro inválido: {texto!r}")
+        if not minimo <= valor <= maximo:
+            raise argparse.ArgumentTypeError(f"{valor} fora da faixa {minimo}-{maximo}")
+        return valor
+
+    return converter
+
+
+def validar_relatorios(relatorios: Iterable[str],
+                       parametros: Optional[Dict[str, Dict[str, Any]]] = None):
+    """
+    Confere nomes e parâmetros dos relatórios antes de iniciar um pool.
+
+    Args:
+        relatorios (Iterable[str]): Nomes de RELATORIOS_DISPONIVEIS
+        parametros (Dict): Argumentos por relatório
+
+    Raises:
+        ValueError: Se algum relatório não existir ou algum parâmetro
+            estiver fora de LIMITES_PARAMETROS
+    """
+    desconhecidos = [nome for nome in relatorios if nome not in RELATORIOS_DISPONIVEIS]
+    if desconhecidos:
+        raise ValueError(f"Relatórios desconhecidos: {', '.join(desconhecidos)}")
+
+    for relatorio, argumentos in (parametros or {}).items():
+        for nome, (minimo, maximo) in LIMITES_PARAMETROS.items():
+            valor = argumentos.get(nome)
+            if valor is None:
+                continue
+            if isinstance(valor, bool) or not isinstance(valor, int) or not minimo <= valor <= maximo:
+                raise ValueError(f"{relatorio}: {nome}={valor!r} fora da faixa {minimo}-{maximo}")
+
+
+def criar_snapshot(gerenciador) -> Dict[str, Any]:
+    """
+    Cria um snapshot compacto e serializável dos dados do gerenciador.
+
+    As atividades viram tuplas na ordem de AtividadeDomestica.to_dict(),
+    com os nomes dos campos guardados uma única vez.
+
+    Args:
+        gerenciador (GerenciadorTarefas): Gerenciador com os dados
+
+    Returns:
+        Dict: Snapshot com residência e atividades
+    """
+    campos = None
+    atividades = []
+    for atividade in gerenciador.atividades:
+        dados = atividade.to_dict()
+        if campos is None:
+            campos = tuple(dados)
+        atividades.append(tuple(dados.values()))
+
+    return {
+        'residencia': gerenciador.residencia.to_dict(),
+        'campos_atividade': campos or (),
+        'atividades': atividades
+    }
+
+
+def gerar_relatorios_em_paralelo(gerenciador,
+                                 relatorios: Optional[Iterable[str]] = None,
+                                 parametros: Optional[Dict[str, Dict[str, Any]]] = None,
+                                 max_workers: Optional[int] = None,
+                                 usar_processos: bool = True) -> Dict[str, Any]:
+    """
+    Gera vários relatórios ao mesmo tempo em um pool de workers.
+
+    Args:
+        gerenciador (GerenciadorTarefas): Fonte dos dados
+        relatorios (Iterable[str]): Nomes de RELATORIOS_DISPONIVEIS
+            (padrão: os cinco relatórios do fechamento mensal)
+        parametros (Dict): Argumentos por relatório, ex.:
+            {'historico_mes': {'mes': 5, 'ano': 2025}}
+        max_workers (int): Tamanho do pool (padrão: um por relatório,
+            limitado ao número de CPUs)
+        usar_processos (bool): Se False, usa threads em vez de processos
+
+    Returns:
+        Dict[str, Any]: Resultado de cada relatório, pelo nome. Falhas
+        aparecem como {'erro': mensagem}, como nos relatórios do mixin.
+
+    Raises:
+        ValueError: Se algum relatório não existir ou algum parâmetro
+            estiver fora de LIMITES_PARAMETROS (antes de o pool iniciar)
+    """
+    nomes = list(relatorios) if relatorios is not None else list(RELATORIOS_PADRAO)
+    validar_relatorios(nomes, parametros)
+
+    if not nomes:
+        return {}
+
+    parametros = parametros or {}
+    snapshot = criar_snapshot(gerenciador)
+    workers = max_workers or min(len(nomes), os.cpu_count() or 1)
+
+    if usar_processos:
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=_inicializar_worker,
+                                       initargs=(snapshot,))
+    else:
+        gerador = GeradorSnapshot(snapshot)
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    resultados = {}
+    with executor:
+        if usar_processos:
+            futuros = {executor.submit(_executar_relatorio, nome, parametros.get(nome, {})): nome
+                       for nome in nomes}
+        else:
+            futuros = {executor.submit(_chamar_relatorio, gerador, nome, parametros.get(nome, {})): nome
+                       for nome in nomes}
+
+        for futuro in as_completed(futuros):
+            nome = futuros[futuro]
+            try:
+                resultados[nome] = futuro.result()
+            except Exception as e:
+                print(f"❌ Erro ao gerar relatório '{nome}': {e}")
+                resultados[nome] = {'erro': f"{type(e).__name__}: {e}"}
+
+    # Devolver na ordem pedida
+    return {nome: resultados[nome] for nome in nomes}
+
+
+def _inicializar_worker(snapshot: Dict[str, Any]):
+    """Reconstrói os dados uma vez por processo worker."""
+    global _gerador_worker
+    _gerador_worker = GeradorSnapshot(snapshot)
+
+
+def _executar_relatorio(nome: str, parametros: Dict[str, Any]) -> Any:
+    """Executa um relatório no gerador do processo worker."""
+    return _chamar_relatorio(_gerador_worker, nome, parametros)
+
+
+def _chamar_relatorio(gerador: GerarRelatorios, nome: str, parametros: Dict[str, Any]) -> Any:
+    """Chama o método do mixin correspondente ao relatório."""
+    metodo = getattr(gerador, RELATORIOS_DISPONIVEIS[nome])
+    return metodo(**parametros)
@@ -9,8 +9,21 @@ Demonstra como reutilizar código através de mixins em POO.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from collections import defaultdict, Counter
+from typing import List, Dict, Any, Tuple
+from collections import defaultdict
+from ..utils.esboco_quantis import EsbocoQuantis
+from ..utils.selecao_top import AmostraLimitada, mais_comuns
+
+
+# Faixas do histograma de tempo de realização (limite superior em segundos)
+FAIXAS_TEMPO_REALIZACAO = [
+    (3600, 'Até 1 hora'),
+    (6 * 3600, '1 a 6 horas'),
+    (24 * 3600, '6 a 24 horas'),
+    (3 * 24 * 3600, '1 a 3 dias'),
+    (7 * 24 * 3600, '3 a 7 dias'),
+]
+ROTULO_ULTIMA_FAIXA = 'Mais de 7 dias'
 
 
 class GerarRelatorios:
@@ -29,6 +42,7 @@ class GerarRelatorios:
     - Ranking de pontuação
     - Estatísticas por categoria
     - Histórico de tarefas por período
+    - Distribuição do tempo de realização (p50, p90, p99)
     """
     
     def relatorio_performance_moradores(self) -> Dict[str, Any]:
@@ -88,8 +102,7 @@ class GerarRelatorios:
         if not hasattr(self, '_residencia'):
             raise AttributeError("Mixin requer atributo '_residencia'")
         
-        ranking = self._residencia.obter_ranking_moradores()
-        return ranking[:limite]
+        return self._residencia.obter_ranking_moradores(limite)
     
     def estatisticas_por_categoria(self) -> Dict[str, Any]:
         """
@@ -112,14 +125,14 @@ class GerarRelatorios:
             'pendentes': 0,
             'canceladas': 0,
             'pontos_total': 0,
-            'atividades': []
+            'atividades': AmostraLimitada(5)
         })
         
         for atividade in atividades:
             categoria = atividade.categoria.value
             por_categoria[categoria]['total'] += 1
             por_categoria[categoria]['pontos_total'] += atividade.pontos_tarefa
-            por_categoria[categoria]['atividades'].append(atividade.nome_tarefa)
+            por_categoria[categoria]['atividades'].adicionar(atividade.nome_tarefa)
             
             if atividade.esta_finalizada:
                 por_categoria[categoria]['finalizadas'] += 1
@@ -148,7 +161,7 @@ class GerarRelatorios:
                 'porcentagem_conclusao': round(porcentagem_conclusao, 1),
                 'pontos_total': dados['pontos_total'],
                 'pontos_medio': round(pontos_medio, 1),
-                'atividades_exemplo': dados['atividades'][:5]  # Primeiras 5 como exemplo
+                'atividades_exemplo': dados['atividades'].resultado()  # Primeiras 5 como exemplo
             }
         
         return estatisticas
@@ -264,6 +277,98 @@ class GerarRelatorios:
             'media_diaria': round(len(atividades_recentes) / dias, 1)
         }
     
+    def relatorio_tempo_realizacao(self) -> Dict[str, Any]:
+        """
+        Gera relatório da distribuição do tempo de realização das tarefas.
+        
+        O tempo de realização vai da criação até a finalização. Os quantis
+        vêm de esboços em fluxo, então nenhum histórico de durações é ordenado.
+        
+        Returns:
+            Dict: Distribuição geral, por categoria e por morador
+        """
+        if not hasattr(self, '_lista_atividades'):
+            raise AttributeError("Mixin requer atributo '_lista_atividades'")
+        
+        por_categoria, por_morador = self._obter_esbocos_tempo_realizacao()
+        
+        geral = EsbocoQuantis()
+        for esboco in por_categoria.values():
+            geral.mesclar(esboco)
+        
+        if geral.vazio:
+            return {'erro': 'Nenhuma atividade finalizada'}
+        
+        relatorio = {
+            'data_geracao': datetime.now().strftime("%d/%m/%Y %H:%M"),
+            'total_finalizadas': geral.contagem,
+            'geral': self._resumir_esboco(geral),
+            'por_categoria': {},
+            'por_morador': {}
+        }
+        
+        for categoria, esboco in por_categoria.items():
+            if not esboco.vazio:
+                relatorio['por_categoria'][categoria.value] = self._resumir_esboco(esboco)
+        
+        if hasattr(self, '_residencia'):
+            for morador_id, esboco in por_morador.items():
+                morador = self._residencia.obter_morador_por_id(morador_id)
+                if morador and not esboco.vazio:
+                    relatorio['por_morador'][morador.nome] = self._resumir_esboco(esboco)
+        
+        return relatorio
+    
+    def _obter_esbocos_tempo_realizacao(self) -> Tuple[Dict, Dict[str, EsbocoQuantis]]:
+        """
+        Obtém os esboços de tempo de realização por categoria e por morador.
+        
+        Classes que mantêm os esboços atualizados (como GerenciadorTarefas)
+        sobrescrevem este método; aqui eles são montados em uma passada.
+        """
+        por_categoria = defaultdict(EsbocoQuantis)
+        por_morador = defaultdict(EsbocoQuantis)
+        
+        for atividade in self._lista_atividades:
+            segundos = atividade.tempo_realizacao_segundos
+            if segundos is None:
+                continue
+            por_categoria[atividade.categoria].adicionar(segundos)
+            if atividade.responsavel_id:
+                por_morador[atividade.responsavel_id].adicionar(segundos)
+        
+        return por_categoria, por_morador
+    
+    def _resumir_esboco(self, esboco: EsbocoQuantis) -> Dict[str, Any]:
+        """Resume um esboço em contagem, média, quantis e histograma."""
+        p50, p90, p99 = esboco.quantis([0.5, 0.9, 0.99])
+        limites = [limite for limite, _ in FAIXAS_TEMPO_REALIZACAO]
+        rotulos = [rotulo for _, rotulo in FAIXAS_TEMPO_REALIZACAO] + [ROTULO_ULTIMA_FAIXA]
+        
+        return {
+            'quantidade': esboco.contagem,
+            'media_segundos': round(esboco.media, 1),
+            'p50_segundos': round(p50, 1),
+            'p90_segundos': round(p90, 1),
+            'p99_segundos': round(p99, 1),
+            'media': self._formatar_duracao(esboco.media),
+            'p50': self._formatar_duracao(p50),
+            'p90': self._formatar_duracao(p90),
+            'p99': self._formatar_duracao(p99),
+            'histograma': dict(zip(rotulos, esboco.histograma(limites)))
+        }
+    
+    def _formatar_duracao(self, segundos: float) -> str:
+        """Formata uma duração em segundos de forma legível."""
+        if segundos >= 24 * 3600:
+            return f"{segundos / (24 * 3600):.1f} dia(s)"
+        elif segundos >= 3600:
+            return f"{segundos / 3600:.1f} hora(s)"
+        elif segundos >= 60:
+            return f"{segundos / 60:.0f} minuto(s)"
+        else:
+            return "Menos de 1 minuto"
+    
     def _obter_tarefas_morador_mes(self, morador_id: str) -> List:
         """Obtém tarefas de um morador no mês atual."""
         if not hasattr(self, '_lista_atividades'):
@@ -282,36 +387,36 @@ class GerarRelatorios:
         if not hasattr(self, '_lista_atividades'):
             return []
         
-        atividades_morador = [
-            a for a in self._lista_atividades 
+        categorias = (
+            a.categoria.value for a in self._lista_atividades 
             if a.responsavel_id == morador_id and a.esta_finalizada
-        ]
-        
-        if not atividades_morador:
-            return []
-        
-        categorias = [a.categoria.value for a in atividades_morador]
-        contador = Counter(categorias)
-        return [cat for cat, _ in contador.most_common(3)]
+        )
+        return [cat for cat, _ in mais_comuns(categorias, 3)]
     
     def _obter_semana_do_mes(self, data: datetime) -> int:
         """Obtém o número da semana no mês."""
         return (data.day - 1) // 7 + 1
     
+    def _obter_nome_mes(self, mes: int) -> str:
+        """Obtém o nome do mês em português."""
+        nomes = ['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho',
+                 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro']
+        return nomes[mes - 1] if 1 <= mes <= 12 else str(mes)
+    
     def _obter_top_moradores_mes(self, atividades_mes: List) -> List[Dict[str, Any]]:
         """Obtém top moradores do mês."""
         if not hasattr(self, '_residencia'):
             return []
         
         # Contar atividades finalizadas por morador
-        contador_moradores = defaultdict(int)
-        for atividade in atividades_mes:
-            if atividade.esta_finalizada and atividade.responsavel_id:
-                contador_moradores[atividade.responsavel_id] += 1
+        responsaveis = (
+            a.responsavel_id for a in atividades_mes
+            if a.esta_finalizada and a.responsavel_id
+        )
         
         # Obter nomes dos moradores
         top_moradores = []
-        for morador_id, count in contador_moradores.most_common(5):
+        for morador_id, count in mais_comuns(responsaveis, 5):
             morador = self._residencia.obter_morador_por_id(morador_id)
             if morador:
                 top_moradores.append({
@@ -323,9 +428,9 @@ class GerarRelatorios:
     
     def _obter_categorias_mais_ativas_mes(self, atividades_mes: List) -> List[Dict[str, Any]]:
         """Obtém categorias mais ativas do mês."""
-        contador_categorias = Counter([a.categoria.value for a in atividades_mes])
+        categorias = (a.categoria.value for a in atividades_mes)
         
         return [
             {'categoria': cat, 'quantidade': count}
-            for cat, count in contador_categorias.most_common(5)
+            for cat, count in mais_comuns(categorias, 5)
         ]
\ No newline at end of file
@@ -9,10 +9,21 @@ Demonstra ASSOCIAÇÃO com Morador e uso de enumerações.
 """
 
 from datetime import datetime
+from typing import Optional
 import uuid
 from .enums import CategoriaAtividade, SituacaoTarefa
 
 
+# Pontos que cada categoria de atividade vale
+PONTOS_POR_CATEGORIA = {
+    CategoriaAtividade.COZINHA: 15,      # Tarefas de cozinha valem mais
+    CategoriaAtividade.LIMPEZA: 10,      # Limpeza padrão
+    CategoriaAtividade.JARDIM: 12,       # Jardim vale um pouco mais
+    CategoriaAtividade.ROUPAS: 8,        # Roupas valor médio
+    CategoriaAtividade.MANUTENCAO: 20    # Manutenção vale mais
+}
+
+
 class AtividadeDomestica:
     """
     Classe que representa uma atividade doméstica no sistema.
@@ -146,6 +157,13 @@ class AtividadeDomestica:
         """Retorna os pontos que a tarefa vale."""
         return self._pontos_tarefa
     
+    @property
+    def tempo_realizacao_segundos(self) -> Optional[float]:
+        """Retorna o tempo entre criação e finalização, em segundos (None se não finalizada)."""
+        if self._situacao != SituacaoTarefa.FINALIZADA or not self._data_finalizacao:
+            return None
+        return max(0.0, (self._data_finalizacao - self._data_criacao).total_seconds())
+    
     @property
     def esta_pendente(self) -> bool:
         """Verifica se a tarefa está pendente."""
@@ -267,14 +285,7 @@ class AtividadeDomestica:
         Returns:
             int: Pontos que a atividade vale
         """
-        pontos_categoria = {
-            CategoriaAtividade.COZINHA: 15,      # Tarefas de cozinha valem mais
-            CategoriaAtividade.LIMPEZA: 10,      # Limpeza padrão
-            CategoriaAtividade.JARDIM: 12,       # Jardim vale um pouco mais
-            CategoriaAtividade.ROUPAS: 8,        # Roupas valor médio
-            CategoriaAtividade.MANUTENCAO: 20    # Manutenção vale mais
-        }
-        return pontos_categoria.get(self._categoria, 10)
+        return PONTOS_POR_CATEGORIA.get(self._categoria, 10)
     
     def _formatar_tempo_decorrido(self, tempo_delta) -> str:
         """
@@ -330,29 +341,33 @@ class AtividadeDomestica:
         """
         # Obter enums pelos nomes
         categoria = CategoriaAtividade[dados['categoria']]
+        nome_tarefa = dados['nome_tarefa']
+        descricao = dados.get('descricao', '')
         
-        # Criar atividade
-        atividade = cls(
-            categoria=categoria,
-            nome_tarefa=dados['nome_tarefa'],
-            descricao=dados.get('descricao', ''),
-            responsavel_id=dados.get('responsavel_id')
-        )
+        # Criar atividade sem passar pelo __init__ (o ID seria descartado)
+        atividade = cls.__new__(cls)
+        atividade._validar_parametros(categoria, nome_tarefa)
         
         # Restaurar ID original
         atividade._id_atividade = dados['id_atividade']
+        atividade._categoria = categoria
+        atividade._nome_tarefa = nome_tarefa.strip()
+        atividade._descricao = descricao.strip() if descricao else ""
+        atividade._responsavel_id = dados.get('responsavel_id')
         
         # Restaurar situação
         atividade._situacao = SituacaoTarefa[dados['situacao']]
         
         # Restaurar datas
         atividade._data_criacao = datetime.fromisoformat(dados['data_criacao'])
+        atividade._data_finalizacao = None
         if dados.get('data_finalizacao'):
             atividade._data_finalizacao = datetime.fromisoformat(dados['data_finalizacao'])
         
         # Restaurar pontos (pode ter sido customizado)
-        atividade._pontos_tarefa = dados.get('pontos_tarefa', 
-                                           atividade._calcular_pontos_por_categoria())
+        pontos = dados.get('pontos_tarefa')
+        atividade._pontos_tarefa = (pontos if pontos is not None
+                                    else atividade._calcular_pontos_por_categoria())
         
         return atividade
     
@@ -9,9 +9,10 @@ Esta é a entidade principal que agrega moradores da casa.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 import uuid
 from .morador import Morador
+from ..utils.selecao_top import AcumuladorTopK
 
 
 class Residencia:
@@ -30,6 +31,7 @@ class Residencia:
         _id (str): Identificador único da residência
         _nome_casa (str): Nome/apelido da casa
         _moradores (List[Morador]): Lista de moradores da casa
+        _indice_moradores (Dict[str, Morador]): Moradores por ID (busca O(1))
         _data_criacao (datetime): Data de criação da residência
     """
     
@@ -48,6 +50,7 @@ class Residencia:
         self._id = self._gerar_id()
         self._nome_casa = nome_casa.strip()
         self._moradores = []  # Composição: lista de moradores pertence à residência
+        self._indice_moradores: Dict[str, Morador] = {}
         self._data_criacao = datetime.now()
     
     @property
@@ -121,6 +124,7 @@ class Residencia:
             return False  # Já existe morador com este nome
         
         self._moradores.append(morador)
+        self._indice_moradores[morador.id] = morador
         return True
     
     def remover_morador(self, morador_id: str) -> bool:
@@ -133,7 +137,7 @@ class Residencia:
         Returns:
             bool: True se removido com sucesso, False caso contrário
         """
-        morador = self.obter_morador_por_id(morador_id)
+        morador = self._indice_moradores.pop(morador_id, None)
         if morador:
             self._moradores.remove(morador)
             return True
@@ -149,10 +153,7 @@ class Residencia:
         Returns:
             Optional[Morador]: Morador encontrado ou None
         """
-        for morador in self._moradores:
-            if morador.id == morador_id:
-                return morador
-        return None
+        return self._indice_moradores.get(morador_id)
     
     def obter_morador_por_nome(self, nome: str) -> Optional[Morador]:
         """
@@ -193,14 +194,24 @@ class Residencia:
                      key=lambda m: m.pontos_realizadas, 
                      reverse=decrescente)
     
-    def obter_ranking_moradores(self) -> List[dict]:
+    def obter_ranking_moradores(self, limite: Optional[int] = None) -> List[dict]:
         """
         Obtém ranking dos moradores com posição.
         
+        Args:
+            limite (int): Número máximo de moradores (None para todos)
+        
         Returns:
             List[dict]: Lista com ranking dos moradores
         """
-        moradores_ordenados = self.listar_moradores_ordenados_por_pontos()
+        if limite is None or limite < 0:
+            # Limite negativo mantém a semântica de fatia da lista ordenada
+            moradores_ordenados = self.listar_moradores_ordenados_por_pontos()[:limite]
+        else:
+            # Seleção por heap: O(n log k) em vez de ordenar todos
+            top = AcumuladorTopK(limite, chave=lambda m: m.pontos_realizadas)
+            top.adicionar_varios(self._moradores)
+            moradores_ordenados = top.resultado()
         ranking = []
         
         for posicao, morador in enumerate(moradores_ordenados, 1):
@@ -349,6 +360,7 @@ class Residencia:
         for dados_morador in dados.get('moradores', []):
             morador = Morador.from_dict(dados_morador)
             residencia._moradores.append(morador)
+            residencia._indice_moradores[morador.id] = morador
         
         return residencia
     
@@ -393,7 +405,7 @@ class Residencia:
         if isinstance(item, Morador):
             return item in self._moradores
         elif isinstance(item, str):
-            return self.obter_morador_por_id(item) is not None
+            return item in self._indice_moradores
         return False
     
     def __iter__(self):
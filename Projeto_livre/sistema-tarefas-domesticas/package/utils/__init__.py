@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utilitários do Sistema
+=====================
+
+Estruturas de dados auxiliares usadas pelos controladores e relatórios:
+- EsbocoQuantis (quantis aproximados em fluxo, mescláveis)
+- AcumuladorTopK e AmostraLimitada (seleção com memória limitada)
+- IndiceBusca (busca incremental sem acentos/maiúsculas)
+- RegistroMetricas e Instrumentacao (métricas opcionais dos caminhos críticos)
+- PerfiladorDeterministico e PerfiladorAmostragem (perfil de sessões e ações)
+"""
+
+from .._exportacao_preguicosa import exportacoes_preguicosas
+
+# Cada exportação e o módulo que a define, importado só no primeiro acesso
+# (ver _exportacao_preguicosa): os modelos usam o EsbocoQuantis sem carregar o
+# cProfile do perfilador nem a instrumentação de métricas.
+_EXPORTACOES = {
+    'EsbocoQuantis': 'esboco_quantis',
+    'AcumuladorTopK': 'selecao_top',
+    'AmostraLimitada': 'selecao_top',
+    'mais_comuns': 'selecao_top',
+    'IndiceBusca': 'indice_busca',
+    'normalizar': 'indice_busca',
+    'RegistroMetricas': 'metricas',
+    'Instrumentacao': 'metricas',
+    'PerfiladorDeterministico': 'perfilador',
+    'PerfiladorAmostragem': 'perfilador',
+    'criar_perfilador': 'perfilador'
+}
+
+# Definir exportações
+__getattr__, __dir__, __all__ = exportacoes_preguicosas(globals(), _EXPORTACOES)
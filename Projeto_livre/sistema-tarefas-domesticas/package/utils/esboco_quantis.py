@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe EsbocoQuantis
+====================
+
+Implementa um esboço (sketch) de quantis em fluxo, no estilo DDSketch.
+Permite calcular p50, p90, p99, média e histogramas sem guardar nem
+ordenar todos os valores observados.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class EsbocoQuantis:
+    """
+    Esboço de quantis com erro relativo garantido e mesclável.
+
+    Cada valor é mapeado para um balde logarítmico; o balde guarda apenas
+    a contagem. Com precisão relativa de 1%, durações de 1 segundo a
+    vários anos ocupam menos de mil baldes, independente de quantos
+    valores foram adicionados.
+
+    Características:
+    - Inserção e remoção em O(1)
+    - Quantil em O(b log b), com b = número de baldes ocupados
+    - Dois esboços com a mesma precisão podem ser mesclados
+
+    Attributes:
+        _precisao (float): Erro relativo máximo dos quantis
+        _gama (float): Razão entre limites de baldes consecutivos
+        _baldes (Dict[int, int]): Contagem por índice de balde
+        _contagem_zero (int): Valores pequenos demais para o log
+        _contagem (int): Total de valores no esboço
+        _soma (float): Soma dos valores (para a média exata)
+    """
+
+    VALOR_MINIMO = 1e-9
+
+    def __init__(self, precisao: float = 0.01):
+        """
+        Inicializa um esboço vazio.
+
+        Args:
+            precisao (float): Erro relativo máximo (entre 0 e 1)
+
+        Raises:
+            ValueError: Se a precisão for inválida
+        """
+        if not 0 < precisao < 1:
+            raise ValueError("Precisão deve estar entre 0 e 1")
+
+        self._precisao = precisao
+        self._gama = (1 + precisao) / (1 - precisao)
+        self._log_gama = math.log(self._gama)
+        self._baldes = {}
+        self._contagem_zero = 0
+        self._contagem = 0
+        self._soma = 0.0
+
+    @property
+    def precisao(self) -> float:
+        """Retorna o erro relativo máximo do esboço."""
+        return self._precisao
+
+    @property
+    def contagem(self) -> int:
+        """Retorna o total de valores no esboço."""
+        return self._contagem
+
+    @property
+    def soma(self) -> float:
+        """Retorna a soma dos valores."""
+        return self._soma
+
+    @property
+    def media(self) -> float:
+        """Retorna a média exata dos valores (0 se vazio)."""
+        return self._soma / self._contagem if self._contagem else 0.0
+
+    @property
+    def vazio(self) -> bool:
+        """Verifica se o esboço está vazio."""
+        return self._contagem == 0
+
+    def adicionar(self, valor: float, quantidade: int = 1):
+        """
+        Adiciona um valor ao esboço.
+
+        Args:
+            valor (float): Valor não negativo
+            quantidade (int): Quantas vezes o valor foi observado
+
+        Raises:
+            ValueError: Se o valor for negativo
+        """
+        if valor < 0:
+            raise ValueError("Esboço aceita apenas valores não negativos")
+
+        if valor <= self.VALOR_MINIMO:
+            self._contagem_zero += quantidade
+        else:
+            indice = self._indice(valor)
+            self._baldes[indice] = self._baldes.get(indice, 0) + quantidade
+
+        self._contagem += quantidade
+        self._soma += valor * quantidade
+
+    def remover(self, valor: float) -> bool:
+        """
+        Remove um valor adicionado anteriormente.
+
+        Args:
+            valor (float): Valor a remover
+
+        Returns:
+            bool: True se havia um valor no balde correspondente
+        """
+        if valor <= self.VALOR_MINIMO:
+            if self._contagem_zero == 0:
+                return False
+            self._contagem_zero -= 1
+        else:
+            indice = self._indice(valor)
+            atual = self._baldes.get(indice, 0)
+            if atual == 0:
+                return False
+            if atual == 1:
+                del self._baldes[indice]
+            else:
+                self._baldes[indice] = atual - 1
+
+        self._contagem -= 1
+        self._soma -= valor
+        if self._contagem == 0:
+            self._soma = 0.0
+        return True
+
+    def mesclar(self, outro: 'EsbocoQuantis'):
+        """
+        Mescla outro esboço neste (soma das distribuições).
+
+        Args:
+            outro (EsbocoQuantis): Esboço com a mesma precisão
+
+        Raises:
+            ValueError: Se as precisões forem diferentes
+        """
+        if not isinstance(outro, EsbocoQuantis):
+            raise ValueError("Só é possível mesclar com outro EsbocoQuantis")
+        if outro._precisao != self._precisao:
+            raise ValueError("Esboços com precisões diferentes não podem ser mesclados")
+
+        for indice, quantidade in outro._baldes.items():
+            self._baldes[indice] = self._baldes.get(indice, 0) + quantidade
+        self._contagem_zero += outro._contagem_zero
+        self._contagem += outro._contagem
+        self._soma += outro._soma
+
+    def quantil(self, q: float) -> Optional[float]:
+        """
+        Estima o quantil q da distribuição.
+
+        Args:
+            q (float): Quantil desejado (0 a 1)
+
+        Returns:
+            Optional[float]: Valor estimado ou None se vazio
+        """
+        return self.quantis([q])[0]
+
+    def quantis(self, qs: List[float]) -> List[Optional[float]]:
+        """
+        Estima vários quantis em uma única passada pelos baldes.
+
+        Args:
+            qs (List[float]): Quantis desejados (0 a 1)
+
+        Returns:
+            List[Optional[float]]: Valores estimados na mesma ordem
+        """
+        if self._contagem == 0:
+            return [None for _ in qs]
+
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Quantil deve estar entre 0 e 1")
+
+        # Posições (rank) desejadas em ordem crescente
+        pedidos = sorted((q * (self._contagem - 1), i) for i, q in enumerate(qs))
+        resultado = [None] * len(qs)
+
+        acumulado = self._contagem_zero
+        baldes = self._baldes_ordenados()
+        posicao_balde = 0
+
+        for rank, i in pedidos:
+            if rank < acumulado:
+                resultado[i] = 0.0
+                continue
+            while posicao_balde < len(baldes):
+                indice, quantidade = baldes[posicao_balde]
+                if rank < acumulado + quantidade:
+                    break
+                acumulado += quantidade
+                posicao_balde += 1
+            posicao_balde = min(posicao_balde, len(baldes) - 1)
+            resultado[i] = self._valor_balde(baldes[posicao_balde][0])
+
+        return resultado
+
+    def histograma(self, limites: List[float]) -> List[int]:
+        """
+        Conta valores por faixa a partir dos baldes do esboço.
+
+        As faixas são [0, l1), [l1, l2), ..., [ln, infinito). Valores perto
+        dos limites podem cair na faixa vizinha, dentro da precisão.
+
+        Args:
+            limites (List[float]): Limites crescentes das faixas
+
+        Returns:
+            List[int]: Contagem de cada faixa (len(limites) + 1 itens)
+        """
+        contagens = [0] * (len(limites) + 1)
+        contagens[0] = self._contagem_zero
+
+        faixa = 0
+        for indice, quantidade in self._baldes_ordenados():
+            valor = self._valor_balde(indice)
+            while faixa < len(limites) and valor >= limites[faixa]:
+                faixa += 1
+            contagens[faixa] += quantidade
+
+        return contagens
+
+    def _indice(self, valor: float) -> int:
+        """Calcula o índice do balde logarítmico de um valor."""
+        return math.ceil(math.log(valor) / self._log_gama)
+
+    def _valor_balde(self, indice: int) -> float:
+        """Retorna o valor representativo de um balde."""
+        return 2 * self._gama ** indice / (self._gama + 1)
+
+    def _baldes_ordenados(self) -> List[Tuple[int, int]]:
+        """Retorna os baldes ocupados em ordem crescente de índice."""
+        return sorted(self._baldes.items())
+
+    def to_dict(self) -> dict:
+        """
+        Converte o esboço para dicionário (para serialização JSON).
+
+        Returns:
+            dict: Dados do esboço em formato dicionário
+        """
+        return {
+            'precisao': self._precisao,
+            'baldes': {str(indice): qtd for indice, qtd in self._baldes.items()},
+            'contagem_zero': self._contagem_zero,
+            'contagem': self._contagem,
+            'soma': self._soma
+        }
+
+    @classmethod
+    def from_dict(cls, dados: dict):
+        """
+        Cria um esboço a partir de um dicionário.
+
+        Args:
+            dados (dict): Dicionário gerado por to_dict()
+
+        Returns:
+            EsbocoQuantis: Nova instância do esboço
+        """
+        esboco = cls(dados.get('precisao', 0.01))
+        esboco._baldes = {int(indice): qtd for indice, qtd in dados.get('baldes', {}).items()}
+        esboco._contagem_zero = dados.get('contagem_zero', 0)
+        esboco._contagem = dados.get('contagem', 0)
+        esboco._soma = dados.get('soma', 0.0)
+        return esboco
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de valores no esboço.
+
+        Returns:
+            int: Total de valores
+        """
+        return self._contagem
+
+    def __repr__(self) -> str:
+        """
+        Representação técnica do esboço.
+
+        Returns:
+            str: Representação técnica detalhada
+        """
+        return (f"EsbocoQuantis(precisao={self._precisao}, "
+                f"contagem={self._contagem}, baldes={len(self._baldes)})")
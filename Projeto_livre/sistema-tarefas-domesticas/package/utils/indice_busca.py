@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe IndiceBusca
+==================
+
+Índice invertido para a busca incremental de atividades. Os textos são
+normalizados sem acentos e sem diferença de maiúsculas ("Lavar LOUÇA" e
+"lavar louca" são iguais), e cada palavra da consulta casa com qualquer
+trecho de uma palavra do texto ou com o rótulo de uma faceta (categoria,
+situação, responsável).
+
+Consultas que só acrescentam caracteres à anterior filtram o resultado
+anterior em vez de consultar o índice de novo.
+
+O índice tem uma trava própria: a interface busca em uma thread de
+trabalho enquanto a thread principal continua alterando as atividades.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Palavras menores que isso são buscadas varrendo os textos
+TAMANHO_MINIMO_INDICE = 3
+
+# Quantidade de consultas recentes mantidas para reaproveitamento
+TAMANHO_CACHE = 16
+
+# Separa o texto indexado dos rótulos das facetas em _completos. Os textos
+# guardam só palavras (sem emojis), então continuam ASCII na maioria dos
+# casos e a comparação com 'in' não precisa converter a consulta
+SEPARADOR = '\x00'
+
+_PALAVRA = re.compile(r'\w+')
+
+
+def normalizar(texto: str) -> str:
+    """
+    Remove acentos e diferenças de maiúsculas/minúsculas.
+
+    Args:
+        texto (str): Texto original
+
+    Returns:
+        str: Texto normalizado ("Limpeza Rápida" -> "limpeza rapida")
+    """
+    texto = texto.casefold()
+    if texto.isascii():
+        return texto
+    return ''.join(c for c in unicodedata.normalize('NFKD', texto)
+                   if not unicodedata.combining(c))
+
+
+def tokenizar(texto: str) -> List[str]:
+    """
+    Divide um texto em palavras normalizadas.
+
+    Args:
+        texto (str): Texto original
+
+    Returns:
+        List[str]: Palavras sem acentos e em minúsculas
+    """
+    return _PALAVRA.findall(normalizar(texto))
+
+
+class IndiceBusca:
+    """
+    Índice invertido por palavra com facetas e cache de consultas.
+
+    - _postings liga cada palavra normalizada aos documentos que a contêm;
+      uma palavra da consulta é procurada no vocabulário (trecho de palavra)
+      e os documentos das palavras encontradas são unidos
+    - _facetas liga cada valor de faceta aos documentos; o rótulo do valor
+      é comparado com a palavra da consulta
+    - _completos guarda, por documento, o texto normalizado mais os rótulos
+      das facetas, usado para filtrar candidatos já conhecidos
+    - Os resultados saem na ordem de inserção dos documentos
+
+    Qualquer alteração no índice limpa o cache de consultas. Os métodos
+    públicos seguram _trava, então buscas e alterações podem vir de
+    threads diferentes.
+
+    Attributes:
+        _completos (Dict[str, str]): Texto pesquisável de cada documento
+        _postings (Dict[str, Set[str]]): Palavra -> documentos
+        _facetas (Dict[str, Dict[str, Set[str]]]): Faceta -> valor -> documentos
+        _valores (Dict[str, Dict[str, str]]): Documento -> faceta -> valor
+        _rotulos (Dict[str, Dict[str, str]]): Faceta -> valor -> rótulo normalizado
+        _sequencia (Dict[str, int]): Ordem de inserção de cada documento
+        _cache (OrderedDict): Consultas recentes -> (IDs, pares (id, texto))
+        _trava (threading.RLock): Serializa buscas e alterações
+    """
+
+    def __init__(self):
+        """Inicializa um índice vazio."""
+        self._completos: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._facetas: Dict[str, Dict[str, Set[str]]] = {}
+        self._valores: Dict[str, Dict[str, str]] = {}
+        self._rotulos: Dict[str, Dict[str, str]] = {}
+        self._sequencia: Dict[str, int] = {}
+        self._contador = 0
+        self._cache: 'OrderedDict[Tuple[str, ...], Tuple[List[str], list]]' = OrderedDict()
+        self._trava = threading.RLock()
+
+    def __getstate__(self) -> dict:
+        """Estado para o pickle (cache de inicialização), sem a trava e sem consultas recentes."""
+        with self._trava:
+            estado = self.__dict__.copy()
+        del estado['_trava']
+        estado['_cache'] = OrderedDict()
+        return estado
+
+    def __setstate__(self, estado: dict):
+        """Restaura o índice do pickle com uma trava nova."""
+        self.__dict__.update(estado)
+        self._trava = threading.RLock()
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de documentos indexados."""
+        return len(self._completos)
+
+    def __contains__(self, id_documento: str) -> bool:
+        """Verifica se um documento está indexado."""
+        return id_documento in self._completos
+
+    def adicionar(self, id_documento: str, textos: Iterable[str],
+                  facetas: Optional[Dict[str, str]] = None):
+        """
+        Indexa um documento (substitui o anterior com o mesmo ID).
+
+        Args:
+            id_documento (str): ID do documento
+            textos (Iterable[str]): Textos pesquisáveis (ex.: nome, descrição)
+            facetas (Dict[str, str]): Valor de cada faceta do documento
+        """
+        with self._trava:
+            if id_documento in self._completos:
+                self.remover(id_documento)
+
+            palavras = []
+            for texto in textos:
+                if texto:
+                    palavras.extend(tokenizar(texto))
+            for palavra in set(palavras):
+                self._postings.setdefault(palavra, set()).add(id_documento)
+
+            self._valores[id_documento] = {}
+            self._completos[id_documento] = ' '.join(palavras)
+            self._sequencia[id_documento] = self._contador
+            self._contador += 1
+
+            for faceta, valor in (facetas or {}).items():
+                self._ligar_faceta(id_documento, faceta, valor)
+            self._recompor(id_documento)
+            self._cache.clear()
+
+    def remover(self, id_documento: str) -> bool:
+        """
+        Remove um documento do índice.
+
+        Args:
+            id_documento (str): ID do documento
+
+        Returns:
+            bool: True se o documento estava indexado
+        """
+        with self._trava:
+            completo = self._completos.pop(id_documento, None)
+            if completo is None:
+                return False
+
+            for palavra in set(completo.split(SEPARADOR, 1)[0].split()):
+                documentos = self._postings.get(palavra)
+                if documentos is not None:
+                    documentos.discard(id_documento)
+                    if not documentos:
+                        del self._postings[palavra]
+
+            for faceta in list(self._valores[id_documento]):
+                self._desligar_faceta(id_documento, faceta)
+            del self._valores[id_documento]
+            del self._sequencia[id_documento]
+            self._cache.clear()
+            return True
+
+    def definir_faceta(self, id_documento: str, faceta: str, valor: str):
+        """
+        Altera o valor de uma faceta de um documento já indexado.
+
+        Args:
+            id_documento (str): ID do documento
+            faceta (str): Nome da faceta (ex.: 'situacao')
+            valor (str): Novo valor
+        """
+        with self._trava:
+            if id_documento not in self._completos:
+                return
+            if self._valores[id_documento].get(faceta) == valor:
+                return
+            self._desligar_faceta(id_documento, faceta)
+            self._ligar_faceta(id_documento, faceta, valor)
+            self._recompor(id_documento)
+            self._cache.clear()
+
+    def definir_rotulo(self, faceta: str, valor: str, rotulo: str):
+        """
+        Define o texto pesquisável de um valor de faceta.
+
+        Útil quando o valor é um ID (ex.: o responsável é guardado pelo ID
+        do morador, mas a busca deve casar com o nome).
+
+        Args:
+            faceta (str): Nome da faceta
+            valor (str): Valor da faceta
+            rotulo (str): Texto pesquisável do valor
+        """
+        with self._trava:
+            rotulo = ' '.join(tokenizar(rotulo))
+            rotulos = self._rotulos.setdefault(faceta, {})
+            if rotulos.get(valor) == rotulo:
+                return
+            rotulos[valor] = rotulo
+            for id_documento in self._facetas.get(faceta, {}).get(valor, ()):
+                self._recompor(id_documento)
+            self._cache.clear()
+
+    def estruturas_memoria(self) -> Dict[str, list]:
+        """
+        Retorna as estruturas do índice agrupadas para a contagem de memória.
+
+        Returns:
+            Dict[str, list]: Categoria -> objetos raiz (o cache vem antes do
+            índice para ser contado separadamente)
+        """
+        return {'caches': [self._cache], 'indice_busca': [self]}
+
+    def buscar(self, consulta: str) -> List[str]:
+        """
+        Retorna os documentos que casam com todas as palavras da consulta.
+
+        A lista devolvida fica no cache de consultas e não deve ser alterada.
+
+        Args:
+            consulta (str): Texto digitado (vazio = todos os documentos)
+
+        Returns:
+            List[str]: IDs na ordem de inserção
+        """
+        with self._trava:
+            palavras = tuple(sorted(set(tokenizar(consulta))))
+            if not palavras:
+                return list(self._completos)
+
+            em_cache = self._cache.get(palavras)
+            if em_cache is not None:
+                self._cache.move_to_end(palavras)
+                return em_cache[0]
+
+            # A palavra mais longa é a mais seletiva: ela escolhe os candidatos
+            # e as demais só filtram
+            palavras_ordenadas = sorted(palavras, key=len, reverse=True)
+            anteriores, base = self._resultado_anterior(palavras)
+            if base is not None:
+                pares = self._filtrar(base, [p for p in palavras_ordenadas if p not in anteriores])
+            elif len(palavras_ordenadas[0]) < TAMANHO_MINIMO_INDICE:
+                pares = self._filtrar(self._completos.items(), palavras_ordenadas)
+            else:
+                candidatos = self._documentos_com(palavras_ordenadas[0])
+                pares = self._filtrar(self._ordenar(candidatos), palavras_ordenadas[1:])
+
+            ids = [id_documento for id_documento, _ in pares]
+            self._cache[palavras] = (ids, pares)
+            if len(self._cache) > TAMANHO_CACHE:
+                self._cache.popitem(last=False)
+            return ids
+
+    def _resultado_anterior(self, palavras: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Optional[list]]:
+        """
+        Procura no cache o menor resultado que contém o da nova consulta.
+
+        Uma consulta anterior serve de base quando cada palavra dela é trecho
+        de alguma palavra nova, ou seja, a nova consulta só restringe.
+
+        Returns:
+            Tuple: (palavras da consulta anterior, pares (id, texto)) ou ((), None)
+        """
+        melhor, melhores_palavras = None, ()
+        for anteriores, (_, pares) in self._cache.items():
+            if melhor is not None and len(pares) >= len(melhor):
+                continue
+            if all(any(antiga in nova for nova in palavras) for antiga in anteriores):
+                melhor, melhores_palavras = pares, anteriores
+        return melhores_palavras, melhor
+
+    @staticmethod
+    def _filtrar(pares: Iterable[Tuple[str, str]], palavras: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Mantém, na mesma ordem, os pares (id, texto) que contêm todas as palavras.
+
+        Os textos andam junto com os IDs para evitar uma consulta ao
+        dicionário por documento, que domina o tempo em listas grandes.
+        """
+        pares = list(pares)
+        for palavra in palavras:
+            pares = [par for par in pares if palavra in par[1]]
+        return pares
+
+    def _documentos_com(self, palavra: str) -> Set[str]:
+        """Documentos com a palavra no texto ou no rótulo de uma faceta (via índice)."""
+        encontrados = set()
+        for termo, documentos in self._postings.items():
+            if palavra in termo:
+                encontrados |= documentos
+        for faceta, valores in self._facetas.items():
+            rotulos = self._rotulos.get(faceta, {})
+            for valor, documentos in valores.items():
+                if palavra in rotulos.get(valor, ''):
+                    encontrados |= documentos
+        return encontrados
+
+    def _ordenar(self, documentos: Set[str]) -> List[Tuple[str, str]]:
+        """Coloca os documentos na ordem de inserção, como pares (id, texto)."""
+        completos = self._completos
+        if len(documentos) * 8 > len(completos):
+            return [par for par in completos.items() if par[0] in documentos]
+        return [(id_documento, completos[id_documento])
+                for id_documento in sorted(documentos, key=self._sequencia.__getitem__)]
+
+    def _ligar_faceta(self, id_documento: str, faceta: str, valor: str):
+        """Registra o valor de uma faceta do documento."""
+        self._valores[id_documento][faceta] = valor
+        self._facetas.setdefault(faceta, {}).setdefault(valor, set()).add(id_documento)
+        rotulos = self._rotulos.setdefault(faceta, {})
+        if valor not in rotulos:
+            rotulos[valor] = ' '.join(tokenizar(valor))
+
+    def _desligar_faceta(self, id_documento: str, faceta: str):
+        """Remove o valor atual de uma faceta do documento."""
+        valor = self._valores[id_documento].pop(faceta, None)
+        if valor is None:
+            return
+        documentos = self._facetas[faceta][valor]
+        documentos.discard(id_documento)
+        if not documentos:
+            del self._facetas[faceta][valor]
+
+    def _recompor(self, id_documento: str):
+        """Refaz o texto pesquisável (texto + rótulos das facetas) do documento."""
+        texto = self._completos[id_documento].split(SEPARADOR, 1)[0]
+        rotulos = [self._rotulos[faceta][valor]
+                   for faceta, valor in self._valores[id_documento].items()]
+        self._completos[id_documento] = SEPARADOR.join([texto] + rotulos)
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas de Desempenho
+======================
+
+Registro de métricas em memória (chamadas, erros, latências e bytes lidos
+ou gravados) e instrumentação opcional dos caminhos críticos do sistema.
+
+A instrumentação troca os métodos das classes por versões cronometradas
+só enquanto está ativa; desativada, as classes ficam intactas e o custo
+é zero. O registro pode ser exportado em JSON ou no formato de texto do
+Prometheus.
+"""
+
+import fnmatch
+import functools
+import importlib
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .esboco_quantis import EsbocoQuantis
+
+# Limites (em segundos) das faixas do histograma exportado
+LIMITES_LATENCIA = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# Prefixo dos nomes de métricas no formato Prometheus
+PREFIXO_PROMETHEUS = 'tarefas'
+
+
+class _Operacao:
+    """Métricas acumuladas de um ponto instrumentado."""
+
+    __slots__ = ('chamadas', 'erros', 'maximo', 'latencias', 'bytes')
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.maximo = 0.0
+        self.latencias = EsbocoQuantis()
+        self.bytes: Dict[str, int] = {}
+
+
+class RegistroMetricas:
+    """
+    Registro de métricas do processo, seguro para várias threads.
+
+    As latências de cada operação ficam em um EsbocoQuantis, então a
+    memória não cresce com o número de chamadas e os percentis saem com
+    erro relativo de 1%.
+
+    Attributes:
+        _operacoes (Dict[str, _Operacao]): Métricas por nome de operação
+        _trava (threading.Lock): Protege as atualizações
+        _inicio (datetime): Quando o registro começou (ou foi limpo)
+    """
+
+    def __init__(self):
+        """Inicializa um registro vazio."""
+        self._operacoes: Dict[str, _Operacao] = {}
+        self._trava = threading.Lock()
+        self._inicio = datetime.now()
+
+    def registrar_chamada(self, nome: str, segundos: float, erro: bool = False):
+        """
+        Registra uma chamada de uma operação.
+
+        Args:
+            nome (str): Nome da operação (ex.: "GerenciadorTarefas.salvar_dados")
+            segundos (float): Duração da chamada
+            erro (bool): Se a chamada terminou com exceção
+        """
+        with self._trava:
+            operacao = self._operacoes.get(nome)
+            if operacao is None:
+                operacao = self._operacoes[nome] = _Operacao()
+            operacao.chamadas += 1
+            operacao.erros += erro
+            operacao.latencias.adicionar(max(0.0, segundos))
+            if segundos > operacao.maximo:
+                operacao.maximo = segundos
+
+    def registrar_bytes(self, nome: str, direcao: str, quantidade: int):
+        """
+        Soma bytes lidos ou gravados por uma operação.
+
+        Args:
+            nome (str): Nome da operação
+            direcao (str): "leitura" ou "escrita"
+            quantidade (int): Bytes transferidos
+        """
+        with self._trava:
+            operacao = self._operacoes.get(nome)
+            if operacao is None:
+                operacao = self._operacoes[nome] = _Operacao()
+            operacao.bytes[direcao] = operacao.bytes.get(direcao, 0) + quantidade
+
+    def limpar(self):
+        """Descarta todas as métricas."""
+        with self._trava:
+            self._operacoes.clear()
+            self._inicio = datetime.now()
+
+    def para_json(self) -> Dict[str, Any]:
+        """
+        Exporta as métricas como dicionário serializável em JSON.
+
+        Returns:
+            Dict[str, Any]: Métricas por operação, com percentis e histograma
+        """
+        with self._trava:
+            operacoes = {}
+            for nome in sorted(self._operacoes):
+                operacao = self._operacoes[nome]
+                p50, p95, p99 = operacao.latencias.quantis([0.5, 0.95, 0.99])
+                operacoes[nome] = {
+                    'chamadas': operacao.chamadas,
+                    'erros': operacao.erros,
+                    'soma_segundos': operacao.latencias.soma,
+                    'media_segundos': operacao.latencias.media,
+                    'p50_segundos': p50,
+                    'p95_segundos': p95,
+                    'p99_segundos': p99,
+                    'maximo_segundos': operacao.maximo,
+                    'histograma': self._histograma_acumulado(operacao),
+                    'bytes': dict(operacao.bytes)
+                }
+            return {
+                'inicio': self._inicio.isoformat(),
+                'data_geracao': datetime.now().isoformat(),
+                'operacoes': operacoes
+            }
+
+    def para_prometheus(self) -> str:
+        """
+        Exporta as métricas no formato de texto do Prometheus.
+
+        Returns:
+            str: Contadores de chamadas, erros e bytes e o histograma de latência
+        """
+        chamadas = f'{PREFIXO_PROMETHEUS}_chamadas_total'
+        erros = f'{PREFIXO_PROMETHEUS}_erros_total'
+        latencia = f'{PREFIXO_PROMETHEUS}_latencia_segundos'
+        transferidos = f'{PREFIXO_PROMETHEUS}_bytes_total'
+
+        linhas = {
+            chamadas: [f'# HELP {chamadas} Chamadas por operação instrumentada.',
+                       f'# TYPE {chamadas} counter'],
+            erros: [f'# HELP {erros} Chamadas que terminaram com exceção.',
+                    f'# TYPE {erros} counter'],
+            latencia: [f'# HELP {latencia} Duração das chamadas.',
+                       f'# TYPE {latencia} histogram'],
+            transferidos: [f'# HELP {transferidos} Bytes lidos ou gravados.',
+                           f'# TYPE {transferidos} counter'],
+        }
+
+        with self._trava:
+            for nome in sorted(self._operacoes):
+                operacao = self._operacoes[nome]
+                rotulo = f'operacao="{_escapar_rotulo(nome)}"'
+                linhas[chamadas].append(f'{chamadas}{{{rotulo}}} {operacao.chamadas}')
+                linhas[erros].append(f'{erros}{{{rotulo}}} {operacao.erros}')
+                for limite, quantidade in self._histograma_acumulado(operacao).items():
+                    linhas[latencia].append(f'{latencia}_bucket{{{rotulo},le="{limite}"}} {quantidade}')
+                linhas[latencia].append(f'{latencia}_sum{{{rotulo}}} {operacao.latencias.soma!r}')
+                linhas[latencia].append(f'{latencia}_count{{{rotulo}}} {operacao.chamadas}')
+                for direcao, quantidade in sorted(operacao.bytes.items()):
+                    linhas[transferidos].append(
+                        f'{transferidos}{{{rotulo},direcao="{_escapar_rotulo(direcao)}"}} {quantidade}')
+
+        return '\n'.join(linha for grupo in linhas.values() for linha in grupo) + '\n'
+
+    def salvar(self, caminho: str) -> bool:
+        """
+        Grava as métricas em arquivo (JSON se terminar em .json, senão Prometheus).
+
+        Args:
+            caminho (str): Arquivo de destino
+
+        Returns:
+            bool: True se gravou com sucesso
+        """
+        try:
+            diretorio = os.path.dirname(caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                if caminho.lower().endswith('.json'):
+                    json.dump(self.para_json(), arquivo, indent=2, ensure_ascii=False)
+                else:
+                    arquivo.write(self.para_prometheus())
+            return True
+        except OSError as e:
+            print(f"❌ Erro ao salvar métricas: {e}")
+            return False
+
+    @staticmethod
+    def _histograma_acumulado(operacao: _Operacao) -> Dict[str, int]:
+        """Contagens acumuladas por limite superior, como nos buckets do Prometheus."""
+        contagens = operacao.latencias.histograma(LIMITES_LATENCIA)
+        acumulado = 0
+        resultado = {}
+        for limite, quantidade in zip(LIMITES_LATENCIA + [math.inf], contagens):
+            acumulado += quantidade
+            resultado['+Inf' if limite == math.inf else repr(limite)] = acumulado
+        return resultado
+
+
+def _escapar_rotulo(valor: str) -> str:
+    """Escapa um valor de rótulo do formato Prometheus."""
+    return valor.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class PontoInstrumentado(NamedTuple):
+    """
+    Métodos de uma classe que serão cronometrados.
+
+    Attributes:
+        modulo (str): Módulo da classe, relativo ao pacote principal
+        classe (str): Nome da classe
+        metodos (Tuple[str, ...]): Nomes ou padrões (fnmatch) dos métodos
+        bytes (str): "leitura"/"escrita" para somar o tamanho do arquivo
+            (atributo arquivo_json da instância) após cada chamada bem-sucedida
+    """
+    modulo: str
+    classe: str
+    metodos: Tuple[str, ...]
+    bytes: Optional[str] = None
+
+
+PONTOS_INSTRUMENTADOS = [
+    PontoInstrumentado('.controllers.gerenciador_tarefas', 'GerenciadorTarefas',
+                       ('salvar_dados', 'gravar_dados', 'carregar_dados', 'ler_dados',
+                        'aplicar_dados', 'finalizar_atividade', 'finalizar_atividades')),
+    PontoInstrumentado('.controllers.armazenamento_dados', 'ArmazenamentoDados',
+                       ('salvar_em_json',), bytes='escrita'),
+    PontoInstrumentado('.controllers.armazenamento_dados', 'ArmazenamentoDados',
+                       ('carregar_do_json',), bytes='leitura'),
+    PontoInstrumentado('.mixins.gerar_relatorios', 'GerarRelatorios', ('[!_]*',)),
+    PontoInstrumentado('.views.interface_visual', 'InterfaceVisual', ('_atualizar_*',)),
+]
+
+
+def substituir_metodos(classe: type, padroes: Iterable[str],
+                       envolver: Callable[[Callable, str], Callable]) -> List[Tuple[type, str, Any]]:
+    """
+    Troca os métodos definidos na classe cujos nomes casam com os padrões.
+
+    Só funções definidas na própria classe são trocadas (métodos herdados
+    devem ser instrumentados na classe que os define).
+
+    Args:
+        classe (type): Classe alterada
+        padroes (Iterable[str]): Nomes ou padrões fnmatch dos métodos
+        envolver (Callable): (método original, nome qualificado) -> substituto
+
+    Returns:
+        List[Tuple[type, str, Any]]: (classe, nome, original) para restaurar_metodos()
+    """
+    padroes = tuple(padroes)
+    originais = []
+    for nome, funcao in list(vars(classe).items()):
+        if not inspect.isfunction(funcao):
+            continue
+        if not any(fnmatch.fnmatchcase(nome, padrao) for padrao in padroes):
+            continue
+        originais.append((classe, nome, funcao))
+        setattr(classe, nome, envolver(funcao, f'{classe.__name__}.{nome}'))
+    return originais
+
+
+def restaurar_metodos(originais: List[Tuple[type, str, Any]]):
+    """
+    Desfaz substituir_metodos(), na ordem inversa da troca.
+
+    Args:
+        originais (List[Tuple]): Lista devolvida por substituir_metodos() (é esvaziada)
+    """
+    while originais:
+        classe, nome, original = originais.pop()
+        setattr(classe, nome, original)
+
+
+class Instrumentacao:
+    """
+    Liga e desliga a cronometragem dos pontos instrumentados.
+
+    Uso:
+        instrumentacao = Instrumentacao(RegistroMetricas()).ativar()
+        ...
+        instrumentacao.desativar()
+        instrumentacao.registro.salvar("metricas.prom")
+
+    Attributes:
+        registro (RegistroMetricas): Onde as chamadas são registradas
+        _pontos (List[PontoInstrumentado]): O que instrumentar
+        _originais (List[Tuple]): (classe, nome, método original) para restaurar
+    """
+
+    def __init__(self, registro: RegistroMetricas,
+                 pontos: Optional[List[PontoInstrumentado]] = None):
+        """
+        Inicializa sem alterar nenhuma classe.
+
+        Args:
+            registro (RegistroMetricas): Registro que recebe as métricas
+            pontos (List[PontoInstrumentado]): Padrão: PONTOS_INSTRUMENTADOS
+        """
+        self.registro = registro
+        self._pontos = PONTOS_INSTRUMENTADOS if pontos is None else pontos
+        self._originais: List[Tuple[type, str, Any]] = []
+
+    @property
+    def ativa(self) -> bool:
+        """Verifica se a instrumentação está ligada."""
+        return bool(self._originais)
+
+    def ativar(self) -> 'Instrumentacao':
+        """
+        Substitui os métodos dos pontos por versões cronometradas.
+
+        Módulos que não puderem ser importados (ex.: interface sem tkinter)
+        são ignorados.
+
+        Returns:
+            Instrumentacao: A própria instância
+        """
+        if self.ativa:
+            return self
+
+        pacote = __package__.rpartition('.')[0]
+        for ponto in self._pontos:
+            try:
+                classe = getattr(importlib.import_module(ponto.modulo, pacote), ponto.classe)
+            except (ImportError, AttributeError) as e:
+                print(f"⚠️ Métricas: {ponto.classe} não instrumentada ({e})")
+                continue
+
+            self._originais += substituir_metodos(
+                classe, ponto.metodos,
+                lambda funcao, nome, ponto=ponto: self._envolver(funcao, nome, ponto.bytes))
+
+        return self
+
+    def desativar(self):
+        """Restaura os métodos originais."""
+        restaurar_metodos(self._originais)
+
+    def _envolver(self, funcao: Callable, nome: str, direcao: Optional[str]) -> Callable:
+        """Cria a versão cronometrada de um método."""
+        registro = self.registro
+        relogio = time.perf_counter
+
+        @functools.wraps(funcao)
+        def cronometrado(instancia, *args, **kwargs):
+            inicio = relogio()
+            try:
+                resultado = funcao(instancia, *args, **kwargs)
+            except BaseException:
+                registro.registrar_chamada(nome, relogio() - inicio, erro=True)
+                raise
+            registro.registrar_chamada(nome, relogio() - inicio)
+
+            if direcao and resultado not in (None, False):
+                try:
+                    registro.registrar_bytes(nome, direcao, os.path.getsize(instancia.arquivo_json))
+                except (OSError, AttributeError):
+                    pass
+            return resultado
+
+        return cronometrado
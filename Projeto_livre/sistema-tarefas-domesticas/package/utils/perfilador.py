@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perfiladores
+============
+
+Perfilamento de sessões do sistema para diagnosticar lentidão:
+- PerfiladorDeterministico (cProfile: toda chamada, tempos exatos)
+- PerfiladorAmostragem (pilhas lidas por uma thread a cada intervalo,
+  com sys._current_frames; custo baixo e independente do número de chamadas)
+
+O perfilamento vale por thread e pode ser restrito a métodos (ex.: um
+clique da interface). Trabalhos que um método perfilado envia para outra
+thread (ExecutorTarefas.executar) também entram no perfil com
+propagar_em().
+
+No Python 3.12 ou mais novo, o cProfile usa sys.monitoring, que aceita
+um único perfilador ativo por interpretador e observa todas as threads.
+Nesse caso o PerfiladorDeterministico usa um só cProfile.Profile, ligado
+enquanto alguma thread estiver no escopo: o que outras threads executam
+nesse intervalo também entra no perfil.
+"""
+
+import contextlib
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .metricas import restaurar_metodos, substituir_metodos
+
+# cProfile sobre sys.monitoring: um perfilador por interpretador, todas as threads
+CPROFILE_GLOBAL = sys.version_info >= (3, 12)
+
+
+class Perfilador(ABC):
+    """
+    Base dos perfiladores: controla o escopo de cada thread.
+
+    Uma thread está no escopo entre entrar() e o sair() correspondente
+    (as chamadas podem ser aninhadas). As subclasses ligam e desligam a
+    coleta quando uma thread entra ou sai do escopo.
+
+    Attributes:
+        _profundidades (Dict[int, int]): Thread -> aninhamento de entrar()
+        _trava (threading.Lock): Protege _profundidades
+        _originais (List[Tuple]): Métodos trocados, para remover_ganchos()
+    """
+
+    def __init__(self):
+        """Inicializa sem nenhuma thread no escopo."""
+        self._profundidades: Dict[int, int] = {}
+        self._trava = threading.Lock()
+        self._originais: List[Tuple] = []
+
+    @property
+    def ativo(self) -> bool:
+        """Verifica se alguma thread está sendo perfilada."""
+        return bool(self._profundidades)
+
+    def entrar(self):
+        """Coloca a thread atual no escopo do perfil."""
+        ident = threading.get_ident()
+        with self._trava:
+            profundidade = self._profundidades.get(ident, 0)
+            self._profundidades[ident] = profundidade + 1
+        if profundidade == 0:
+            self._ligar_thread(ident)
+
+    def sair(self):
+        """Tira a thread atual do escopo (ao fechar o entrar() mais externo)."""
+        ident = threading.get_ident()
+        with self._trava:
+            profundidade = self._profundidades.get(ident, 0) - 1
+            if profundidade > 0:
+                self._profundidades[ident] = profundidade
+                return
+            self._profundidades.pop(ident, None)
+        if profundidade == 0:
+            self._desligar_thread(ident)
+
+    def no_escopo(self) -> bool:
+        """Verifica se a thread atual está sendo perfilada."""
+        return threading.get_ident() in self._profundidades
+
+    @contextlib.contextmanager
+    def escopo(self):
+        """Perfila o bloco with na thread atual."""
+        self.entrar()
+        try:
+            yield self
+        finally:
+            self.sair()
+
+    def envolver(self, funcao: Callable) -> Callable:
+        """
+        Cria uma versão da função que roda no escopo do perfil.
+
+        Args:
+            funcao (Callable): Função original
+
+        Returns:
+            Callable: Função que chama entrar()/sair() em volta da original
+        """
+        @functools.wraps(funcao)
+        def perfilado(*args, **kwargs):
+            self.entrar()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                self.sair()
+
+        return perfilado
+
+    def restringir_a(self, classe: type, padroes: Iterable[str]) -> List[str]:
+        """
+        Perfila só as chamadas dos métodos indicados (ex.: ações da interface).
+
+        Deve ser chamado antes de criar os objetos cujos métodos são usados
+        como callbacks (o Tk guarda o método no momento em que o botão é criado).
+
+        Args:
+            classe (type): Classe dos métodos
+            padroes (Iterable[str]): Nomes ou padrões fnmatch
+
+        Returns:
+            List[str]: Métodos que passaram a ser perfilados
+        """
+        trocados = substituir_metodos(classe, padroes, lambda funcao, _: self.envolver(funcao))
+        self._originais += trocados
+        return [nome for _, nome, _ in trocados]
+
+    def propagar_em(self, classe: type, metodo: str):
+        """
+        Leva o escopo para as funções entregues a um método (ex.: trabalhos
+        enviados a uma thread), quando ele é chamado de dentro do escopo.
+
+        Args:
+            classe (type): Classe do método
+            metodo (str): Nome do método que recebe funções como argumento
+        """
+        def envolver(funcao, _):
+            @functools.wraps(funcao)
+            def propagado(instancia, *args, **kwargs):
+                if self.no_escopo():
+                    args = [self.envolver(a) if callable(a) else a for a in args]
+                    kwargs = {k: self.envolver(v) if callable(v) else v for k, v in kwargs.items()}
+                return funcao(instancia, *args, **kwargs)
+            return propagado
+
+        self._originais += substituir_metodos(classe, [metodo], envolver)
+
+    def remover_ganchos(self):
+        """Restaura os métodos trocados por restringir_a() e propagar_em()."""
+        restaurar_metodos(self._originais)
+
+    def parar(self):
+        """Encerra o perfil: remove os ganchos e tira a thread atual do escopo."""
+        self.remover_ganchos()
+        while self.no_escopo():
+            self.sair()
+
+    @abstractmethod
+    def salvar(self, prefixo: str) -> List[str]:
+        """
+        Grava os arquivos do perfil.
+
+        Args:
+            prefixo (str): Caminho sem extensão (ex.: "dados/perfil_20250101")
+
+        Returns:
+            List[str]: Arquivos criados
+        """
+
+    @abstractmethod
+    def resumo(self, limite: int = 20) -> str:
+        """
+        Monta um resumo com as funções mais quentes.
+
+        Args:
+            limite (int): Quantidade de funções listadas
+
+        Returns:
+            str: Texto do resumo
+        """
+
+    def _ligar_thread(self, ident: int):
+        """Chamado na própria thread quando ela entra no escopo."""
+
+    def _desligar_thread(self, ident: int):
+        """Chamado na própria thread quando ela sai do escopo."""
+
+    @staticmethod
+    def _criar_diretorio(prefixo: str):
+        """Garante que o diretório dos arquivos de saída existe."""
+        diretorio = os.path.dirname(prefixo)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+
+class PerfiladorDeterministico(Perfilador):
+    """
+    Perfilador baseado em cProfile.
+
+    Até o Python 3.11, o cProfile só observa a thread que chamou enable(),
+    então cada thread no escopo tem seu próprio cProfile.Profile; os
+    perfis são somados no fim com pstats. A partir do 3.12 um segundo
+    enable() simultâneo falha ("Another profiling tool is already active"),
+    então há um só perfil, ligado pela primeira thread que entra no escopo
+    e desligado pela última que sai.
+
+    Attributes:
+        _perfis (Dict[int, cProfile.Profile]): Perfil de cada thread (até o
+            3.11) ou o perfil único, na chave 0 (3.12+)
+        _threads (set): Threads que passaram pelo escopo
+        _ligadas (int): Threads no escopo agora (perfil único)
+        _trava_perfil (threading.Lock): Protege _ligadas e o perfil único
+    """
+
+    def __init__(self):
+        """Inicializa sem perfis."""
+        super().__init__()
+        self._perfis: Dict[int, cProfile.Profile] = {}
+        self._threads = set()
+        self._ligadas = 0
+        self._trava_perfil = threading.Lock()
+
+    def _ligar_thread(self, ident: int):
+        self._threads.add(ident)
+        if CPROFILE_GLOBAL:
+            with self._trava_perfil:
+                self._ligadas += 1
+                if self._ligadas == 1:
+                    self._perfis.setdefault(0, cProfile.Profile()).enable()
+            return
+
+        perfil = self._perfis.get(ident)
+        if perfil is None:
+            perfil = self._perfis[ident] = cProfile.Profile()
+        perfil.enable()
+
+    def _desligar_thread(self, ident: int):
+        if CPROFILE_GLOBAL:
+            with self._trava_perfil:
+                self._ligadas -= 1
+                if self._ligadas == 0:
+                    self._perfis[0].disable()
+            return
+
+        self._perfis[ident].disable()
+
+    def _estatisticas(self, saida=None) -> Optional[pstats.Stats]:
+        """Soma os perfis de todas as threads (os vazios são ignorados)."""
+        estatisticas = None
+        for perfil in list(self._perfis.values()):
+            try:
+                if estatisticas is None:
+                    estatisticas = pstats.Stats(perfil, stream=saida)
+                else:
+                    estatisticas.add(perfil)
+            except TypeError:
+                # Perfil sem nenhuma chamada registrada
+                continue
+        return estatisticas
+
+    def salvar(self, prefixo: str) -> List[str]:
+        """Grava <prefixo>.prof (pstats/snakeviz) e <prefixo>.txt (resumo)."""
+        estatisticas = self._estatisticas()
+        if estatisticas is None:
+            return []
+
+        self._criar_diretorio(prefixo)
+        estatisticas.dump_stats(prefixo + '.prof')
+        with open(prefixo + '.txt', 'w', encoding='utf-8') as arquivo:
+            arquivo.write(self.resumo(50))
+        return [prefixo + '.prof', prefixo + '.txt']
+
+    def resumo(self, limite: int = 20) -> str:
+        """Funções com mais tempo próprio e com mais tempo acumulado."""
+        saida = io.StringIO()
+        estatisticas = self._estatisticas(saida)
+        if estatisticas is None:
+            return "📭 Nenhuma chamada perfilada.\n"
+
+        estatisticas.strip_dirs()
+        saida.write(f"🔥 FUNÇÕES MAIS QUENTES (tempo próprio, {len(self._threads)} thread(s))\n")
+        estatisticas.sort_stats('tottime').print_stats(limite)
+        saida.write("📚 MAIOR TEMPO ACUMULADO\n")
+        estatisticas.sort_stats('cumulative').print_stats(limite)
+        return saida.getvalue()
+
+
+class PerfiladorAmostragem(Perfilador):
+    """
+    Perfilador por amostragem.
+
+    Uma thread de fundo acorda a cada intervalo, lê as pilhas das threads
+    no escopo com sys._current_frames() e conta cada pilha. O custo não
+    depende de quantas funções são chamadas, então serve para sessões
+    longas; a precisão é estatística (funções mais curtas que o intervalo
+    só aparecem se forem chamadas muitas vezes). A thread de amostragem
+    precisa do GIL, então com código Python ocupando a CPU o intervalo real
+    se aproxima de sys.getswitchinterval() (5 ms por padrão).
+
+    Attributes:
+        _intervalo (float): Segundos entre amostras
+        _pilhas (Counter): Pilha (tupla de code objects, raiz -> topo) -> amostras
+        _amostras (int): Total de pilhas contadas
+        _thread (threading.Thread): Thread de amostragem (criada sob demanda)
+        _parar (threading.Event): Sinal para a thread de amostragem terminar
+    """
+
+    def __init__(self, intervalo: float = 0.005):
+        """
+        Inicializa o perfilador.
+
+        Args:
+            intervalo (float): Segundos entre amostras
+
+        Raises:
+            ValueError: Se o intervalo não for positivo
+        """
+        if intervalo <= 0:
+            raise ValueError("Intervalo de amostragem deve ser positivo")
+
+        super().__init__()
+        self._intervalo = intervalo
+        self._pilhas: Counter = Counter()
+        self._amostras = 0
+        self._thread: Optional[threading.Thread] = None
+        self._parar = threading.Event()
+
+    @property
+    def amostras(self) -> int:
+        """Retorna o total de amostras coletadas."""
+        return self._amostras
+
+    def _ligar_thread(self, ident: int):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._amostrar, name='PerfiladorAmostragem',
+                                            daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        """Encerra o perfil e a thread de amostragem."""
+        super().parar()
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _amostrar(self):
+        """Laço da thread de amostragem."""
+        proprio = threading.get_ident()
+        while not self._parar.wait(self._intervalo):
+            with self._trava:
+                alvos = [ident for ident in self._profundidades if ident != proprio]
+            if not alvos:
+                continue
+
+            quadros = sys._current_frames()
+            for ident in alvos:
+                quadro = quadros.get(ident)
+                if quadro is None:
+                    continue
+                pilha = []
+                while quadro is not None:
+                    codigo = quadro.f_code
+                    # Os invólucros deste módulo não interessam a quem lê o perfil
+                    if codigo.co_filename != __file__:
+                        pilha.append(codigo)
+                    quadro = quadro.f_back
+                pilha.reverse()
+                self._pilhas[tuple(pilha)] += 1
+                self._amostras += 1
+            del quadros
+
+    @staticmethod
+    def _rotulo(codigo) -> str:
+        """Nome legível de uma função: nome qualificado (arquivo:linha)."""
+        nome = getattr(codigo, 'co_qualname', codigo.co_name)
+        return f"{nome} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})"
+
+    def _totais(self) -> Tuple[Counter, Counter]:
+        """Amostras por função: no topo da pilha (próprio) e em qualquer posição."""
+        proprio, acumulado = Counter(), Counter()
+        for pilha, quantidade in list(self._pilhas.items()):
+            if not pilha:
+                continue
+            proprio[pilha[-1]] += quantidade
+            for codigo in set(pilha):
+                acumulado[codigo] += quantidade
+        return proprio, acumulado
+
+    def salvar(self, prefixo: str) -> List[str]:
+        """
+        Grava <prefixo>.folded (pilhas no formato de flame graph, aceito
+        pelo speedscope e pelo flamegraph.pl) e <prefixo>.txt (resumo).
+        """
+        if not self._pilhas:
+            return []
+
+        self._criar_diretorio(prefixo)
+        with open(prefixo + '.folded', 'w', encoding='utf-8') as arquivo:
+            for pilha, quantidade in sorted(self._pilhas.items(), key=lambda item: -item[1]):
+                arquivo.write(';'.join(map(self._rotulo, pilha)) + f" {quantidade}\n")
+        with open(prefixo + '.txt', 'w', encoding='utf-8') as arquivo:
+            arquivo.write(self.resumo(50))
+        return [prefixo + '.folded', prefixo + '.txt']
+
+    def resumo(self, limite: int = 20) -> str:
+        """Funções que mais aparecem no topo das pilhas e em qualquer posição."""
+        if not self._amostras:
+            return "📭 Nenhuma amostra coletada.\n"
+
+        proprio, acumulado = self._totais()
+        total = self._amostras
+        linhas = [f"🔥 FUNÇÕES MAIS QUENTES ({total} amostras, intervalo de "
+                  f"{self._intervalo * 1000:g} ms)",
+                  f"{'próprio':>9} {'acumulado':>10}  função"]
+        for codigo, quantidade in proprio.most_common(limite):
+            linhas.append(f"{quantidade / total:>8.1%} {acumulado[codigo] / total:>10.1%}  "
+                          f"{self._rotulo(codigo)}")
+
+        linhas.append("")
+        linhas.append("📚 MAIOR TEMPO ACUMULADO")
+        for codigo, quantidade in acumulado.most_common(limite):
+            linhas.append(f"{quantidade / total:>8.1%}  {self._rotulo(codigo)}")
+        return '\n'.join(linhas) + '\n'
+
+
+# Modos de perfilamento aceitos por criar_perfilador()
+MODOS = {
+    'cprofile': PerfiladorDeterministico,
+    'amostragem': PerfiladorAmostragem,
+}
+
+
+def criar_perfilador(modo: str, intervalo: float = 0.005) -> Perfilador:
+    """
+    Cria um perfilador pelo nome do modo.
+
+    Args:
+        modo (str): "cprofile" ou "amostragem"
+        intervalo (float): Segundos entre amostras (só amostragem)
+
+    Returns:
+        Perfilador: Perfilador pronto, ainda sem thread no escopo
+
+    Raises:
+        ValueError: Se o modo for desconhecido
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo de perfilamento desconhecido: {modo}")
+    if modo == 'amostragem':
+        return PerfiladorAmostragem(intervalo)
+    return MODOS[modo]()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seleção Top-K e Amostras Limitadas
+=================================
+
+Acumuladores de memória limitada usados pelos relatórios:
+- AcumuladorTopK (os k maiores itens, via heap)
+- AmostraLimitada (os primeiros k itens observados)
+"""
+
+import heapq
+from collections import Counter
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+class AcumuladorTopK:
+    """
+    Mantém os k maiores itens de um fluxo em O(n log k) e memória O(k).
+
+    Empates são resolvidos a favor do item visto primeiro, exatamente
+    como em sorted(..., reverse=True)[:k] e Counter.most_common(k).
+
+    Attributes:
+        _k (int): Quantidade máxima de itens mantidos
+        _chave (Callable): Função que extrai o valor de ordenação
+        _heap (list): Heap mínimo com (valor, -sequência, item)
+        _sequencia (int): Contador de itens observados
+    """
+
+    def __init__(self, k: int, chave: Optional[Callable[[Any], Any]] = None):
+        """
+        Inicializa o acumulador.
+
+        Args:
+            k (int): Quantidade de itens a manter
+            chave (Callable): Extrai o valor comparável de cada item
+
+        Raises:
+            ValueError: Se k for negativo
+        """
+        if not isinstance(k, int) or k < 0:
+            raise ValueError("k deve ser um número inteiro não negativo")
+
+        self._k = k
+        self._chave = chave or (lambda item: item)
+        self._heap = []
+        self._sequencia = 0
+
+    @property
+    def total_observado(self) -> int:
+        """Retorna quantos itens passaram pelo acumulador."""
+        return self._sequencia
+
+    def adicionar(self, item: Any):
+        """
+        Oferece um item ao acumulador.
+
+        Args:
+            item: Item observado
+        """
+        if self._k > 0:
+            entrada = (self._chave(item), -self._sequencia, item)
+            if len(self._heap) < self._k:
+                heapq.heappush(self._heap, entrada)
+            elif entrada[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, entrada)
+        self._sequencia += 1
+
+    def adicionar_varios(self, itens: Iterable[Any]):
+        """
+        Oferece vários itens ao acumulador.
+
+        Args:
+            itens (Iterable): Itens observados
+        """
+        for item in itens:
+            self.adicionar(item)
+
+    def resultado(self) -> List[Any]:
+        """
+        Retorna os itens mantidos, do maior para o menor.
+
+        Returns:
+            List: Até k itens ordenados
+        """
+        ordenados = sorted(self._heap, key=lambda entrada: entrada[:2], reverse=True)
+        return [item for _, _, item in ordenados]
+
+    def __len__(self) -> int:
+        """
+        Retorna quantos itens estão mantidos.
+
+        Returns:
+            int: Número de itens (no máximo k)
+        """
+        return len(self._heap)
+
+
+class AmostraLimitada:
+    """
+    Guarda apenas os primeiros k itens de um fluxo, contando o total.
+
+    Attributes:
+        _k (int): Tamanho máximo da amostra
+        _itens (list): Itens guardados
+        _total (int): Total de itens observados
+    """
+
+    def __init__(self, k: int):
+        """
+        Inicializa a amostra.
+
+        Args:
+            k (int): Tamanho máximo da amostra
+
+        Raises:
+            ValueError: Se k for negativo
+        """
+        if not isinstance(k, int) or k < 0:
+            raise ValueError("k deve ser um número inteiro não negativo")
+
+        self._k = k
+        self._itens = []
+        self._total = 0
+
+    @property
+    def total_observado(self) -> int:
+        """Retorna quantos itens passaram pela amostra."""
+        return self._total
+
+    def adicionar(self, item: Any):
+        """
+        Oferece um item à amostra.
+
+        Args:
+            item: Item observado
+        """
+        if len(self._itens) < self._k:
+            self._itens.append(item)
+        self._total += 1
+
+    def resultado(self) -> List[Any]:
+        """
+        Retorna uma cópia dos itens guardados.
+
+        Returns:
+            List: Até k itens, na ordem em que foram vistos
+        """
+        return self._itens.copy()
+
+    def __len__(self) -> int:
+        """
+        Retorna o tamanho atual da amostra.
+
+        Returns:
+            int: Número de itens guardados
+        """
+        return len(self._itens)
+
+
+def mais_comuns(valores: Iterable[Any], k: int) -> List[Tuple[Any, int]]:
+    """
+    Conta valores de um fluxo e retorna os k mais frequentes.
+
+    A memória é proporcional ao número de valores distintos, não ao
+    tamanho do fluxo; a seleção final custa O(d log k).
+
+    Args:
+        valores (Iterable): Valores observados
+        k (int): Quantidade de valores a retornar
+
+    Returns:
+        List[Tuple]: Pares (valor, contagem) do mais ao menos frequente
+    """
+    contador = Counter(valores)
+    top = AcumuladorTopK(k, chave=lambda par: par[1])
+    top.adicionar_varios(contador.items())
+    return top.resultado()
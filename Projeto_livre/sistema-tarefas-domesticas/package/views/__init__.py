@@ -6,14 +6,35 @@ Views do Sistema
 
 Interfaces visuais do sistema:
 - InterfaceVisual (GUI principal usando Tkinter)
+- ReconciliadorTreeview (atualização das listas por diferença)
+- ListaVirtual (rolagem virtual para listas grandes)
+- ExecutorTarefas (operações demoradas fora da thread da interface)
+- AgendadorAtualizacao (atualização agrupada dos painéis)
+- OrdenacaoColunas (ordenação por coluna com chaves em cache)
+- InterfaceLinhaComando (linha de comando sem tkinter, `python -m package`)
+- ServidorTarefas (API JSON via HTTP, `python servidor.py`)
 
 As views implementam a camada de apresentação do padrão MVC.
 """
 
-# Importar views
-from .interface_visual import InterfaceVisual
+from .._exportacao_preguicosa import exportacoes_preguicosas
+
+# Cada exportação e o módulo que a define. Os módulos só são importados no
+# primeiro acesso (ver _exportacao_preguicosa): importar package.views.executor_tarefas,
+# por exemplo, não carrega o tkinter nem a InterfaceVisual.
+_EXPORTACOES = {
+    'InterfaceVisual': 'interface_visual',
+    'ReconciliadorTreeview': 'reconciliador_treeview',
+    'ListaVirtual': 'lista_virtual',
+    'ExecutorTarefas': 'executor_tarefas',
+    'TokenCancelamento': 'executor_tarefas',
+    'OperacaoCancelada': 'executor_tarefas',
+    'AgendadorAtualizacao': 'agendador_atualizacao',
+    'OrdenacaoColunas': 'ordenacao_colunas',
+    'InterfaceLinhaComando': 'linha_comando',
+    'ServidorTarefas': 'servidor_http',
+    'ApiTarefas': 'servidor_http'
+}
 
 # Definir exportações
-__all__ = [
-    'InterfaceVisual'
-]
\ No newline at end of file
+__getattr__, __dir__, __all__ = exportacoes_preguicosas(globals(), _EXPORTACOES)
\ No newline at end of file
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe AgendadorAtualizacao
+===========================
+
+Agrupa pedidos de atualização da interface. Os handlers só marcam quais
+painéis ficaram desatualizados; a atualização real acontece uma única vez,
+no próximo ciclo ocioso do Tk (after_idle), e só para os painéis marcados.
+"""
+
+from typing import Callable, Dict, FrozenSet
+import traceback
+
+
+class AgendadorAtualizacao:
+    """
+    Marca painéis desatualizados e os atualiza uma vez por ciclo ocioso.
+
+    Marcações repetidas do mesmo painel antes da atualização são
+    descartadas, então várias alterações em sequência custam uma única
+    atualização por painel.
+
+    Attributes:
+        _root (tk.Tk): Janela cujo loop de eventos executa as atualizações
+        _paineis (Dict[str, Callable]): Função de atualização de cada painel
+        _pendentes (set): Painéis marcados desde a última atualização
+        _agendado (str): ID do after_idle agendado (ou None)
+    """
+
+    def __init__(self, root, paineis: Dict[str, Callable[[], None]]):
+        """
+        Inicializa o agendador.
+
+        Args:
+            root (tk.Tk): Janela principal
+            paineis (Dict[str, Callable]): Painéis na ordem em que devem ser
+                atualizados, com a função que atualiza cada um
+        """
+        self._root = root
+        self._paineis = dict(paineis)
+        self._pendentes = set()
+        self._agendado = None
+        self._estatisticas = {'marcacoes': 0, 'descartadas': 0, 'atualizacoes': 0}
+
+    @property
+    def pendentes(self) -> FrozenSet[str]:
+        """Retorna os painéis aguardando atualização."""
+        return frozenset(self._pendentes)
+
+    @property
+    def estatisticas(self) -> Dict[str, int]:
+        """Retorna quantas marcações foram feitas, descartadas e atualizadas."""
+        return self._estatisticas.copy()
+
+    def marcar(self, *paineis: str):
+        """
+        Marca painéis como desatualizados e agenda a atualização.
+
+        Args:
+            *paineis (str): Nomes dos painéis (nenhum = todos)
+
+        Raises:
+            ValueError: Se algum painel não estiver registrado
+        """
+        nomes = paineis or tuple(self._paineis)
+        desconhecidos = [nome for nome in nomes if nome not in self._paineis]
+        if desconhecidos:
+            raise ValueError(f"Painéis desconhecidos: {', '.join(desconhecidos)}")
+
+        for nome in nomes:
+            self._estatisticas['marcacoes'] += 1
+            if nome in self._pendentes:
+                self._estatisticas['descartadas'] += 1
+            self._pendentes.add(nome)
+
+        if self._agendado is None:
+            self._agendado = self._root.after_idle(self.descarregar)
+
+    def descarregar(self):
+        """Atualiza agora os painéis marcados (chamado pelo after_idle)."""
+        if self._agendado is not None:
+            self._root.after_cancel(self._agendado)
+            self._agendado = None
+
+        pendentes, self._pendentes = self._pendentes, set()
+        for nome, atualizar in self._paineis.items():
+            if nome not in pendentes:
+                continue
+            try:
+                atualizar()
+                self._estatisticas['atualizacoes'] += 1
+            except Exception as e:
+                print(f"❌ Erro ao atualizar painel '{nome}': {e}")
+                traceback.print_exc()
+
+    def cancelar(self):
+        """Descarta as marcações pendentes sem atualizar."""
+        if self._agendado is not None:
+            self._root.after_cancel(self._agendado)
+            self._agendado = None
+        self._pendentes.clear()
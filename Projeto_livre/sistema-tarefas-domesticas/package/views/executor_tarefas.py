@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe ExecutorTarefas
+======================
+
+Executa operações demoradas da interface em threads de trabalho. Os
+resultados voltam por uma fila thread-safe, lida pela thread principal com
+root.after(), então os callbacks que mexem no Tk sempre rodam na thread
+principal.
+"""
+
+import itertools
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class OperacaoCancelada(Exception):
+    """Lançada dentro de uma operação quando ela foi cancelada."""
+
+
+class TokenCancelamento:
+    """
+    Sinal de cancelamento compartilhado entre a interface e o worker.
+
+    A operação deve chamar verificar() entre etapas para parar cedo.
+    """
+
+    def __init__(self):
+        """Inicializa o token (não cancelado)."""
+        self._evento = threading.Event()
+
+    @property
+    def cancelado(self) -> bool:
+        """Verifica se o cancelamento foi pedido."""
+        return self._evento.is_set()
+
+    def cancelar(self):
+        """Pede o cancelamento da operação."""
+        self._evento.set()
+
+    def verificar(self):
+        """
+        Interrompe a operação se o cancelamento foi pedido.
+
+        Raises:
+            OperacaoCancelada: Se a operação foi cancelada
+        """
+        if self._evento.is_set():
+            raise OperacaoCancelada()
+
+
+class ExecutorTarefas:
+    """
+    Pool de threads integrado ao loop de eventos do Tkinter.
+
+    - executar() envia a função para um worker e devolve um TokenCancelamento
+    - Os workers nunca tocam no Tk: colocam o resultado em uma fila
+    - A thread principal lê a fila com root.after() enquanto houver
+      operações pendentes e chama ao_concluir / ao_falhar
+    - Operações canceladas têm o resultado descartado
+
+    Attributes:
+        _root (tk.Tk): Janela cujo loop de eventos recebe os resultados
+        _pool (ThreadPoolExecutor): Threads de trabalho
+        _fila (queue.Queue): Resultados (id, situação, valor) dos workers
+        _pendentes (Dict[int, Tuple]): Operações ainda sem resultado entregue
+    """
+
+    def __init__(self, root, max_workers: int = 1, intervalo_ms: int = 50,
+                 ao_mudar_estado: Optional[Callable[[bool, str], None]] = None):
+        """
+        Inicializa o executor.
+
+        Args:
+            root (tk.Tk): Janela principal
+            max_workers (int): Número de threads (1 executa em ordem de envio)
+            intervalo_ms (int): Intervalo de leitura da fila de resultados
+            ao_mudar_estado (Callable): Chamado na thread principal com
+                (ocupado, descrição) quando o executor fica ocupado ou livre
+        """
+        self._root = root
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='executor-ui')
+        self._fila = queue.Queue()
+        self._intervalo_ms = intervalo_ms
+        self._ao_mudar_estado = ao_mudar_estado
+        self._pendentes: Dict[int, Tuple[TokenCancelamento, Optional[Callable],
+                                         Optional[Callable], str, bool]] = {}
+        self._contador = itertools.count(1)
+        self._verificacao_agendada = None
+
+    @property
+    def ocupado(self) -> bool:
+        """Verifica se há operações pendentes."""
+        return bool(self._pendentes)
+
+    @property
+    def descricao(self) -> str:
+        """Retorna a descrição da operação pendente mais antiga."""
+        for _, _, _, descricao, _ in self._pendentes.values():
+            return descricao
+        return ""
+
+    def executar(self, funcao: Callable[[TokenCancelamento], Any],
+                 ao_concluir: Optional[Callable[[Any], None]] = None,
+                 ao_falhar: Optional[Callable[[Exception], None]] = None,
+                 descricao: str = "", cancelavel: bool = True) -> TokenCancelamento:
+        """
+        Executa uma função em uma thread de trabalho.
+
+        A função recebe o TokenCancelamento e não deve acessar widgets.
+
+        Args:
+            funcao (Callable): Trabalho pesado, chamado como funcao(token)
+            ao_concluir (Callable): Recebe o resultado, na thread principal
+            ao_falhar (Callable): Recebe a exceção, na thread principal
+            descricao (str): Texto exibido enquanto a operação roda
+            cancelavel (bool): Se False, cancelar_todas() não afeta a operação
+
+        Returns:
+            TokenCancelamento: Token para cancelar esta operação
+        """
+        token = TokenCancelamento()
+        operacao_id = next(self._contador)
+        estava_livre = not self._pendentes
+
+        self._pendentes[operacao_id] = (token, ao_concluir, ao_falhar, descricao, cancelavel)
+        self._pool.submit(self._rodar, operacao_id, funcao, token)
+        self._agendar_verificacao()
+
+        if estava_livre:
+            self._notificar_estado()
+        return token
+
+    def cancelar_todas(self):
+        """Cancela todas as operações pendentes que podem ser canceladas."""
+        for token, _, _, _, cancelavel in self._pendentes.values():
+            if cancelavel:
+                token.cancelar()
+
+    def encerrar(self, cancelar: bool = False):
+        """
+        Encerra as threads de trabalho, esperando as operações em andamento.
+
+        Args:
+            cancelar (bool): Se True, cancela as pendentes antes de esperar
+        """
+        if cancelar:
+            self.cancelar_todas()
+        self._pool.shutdown(wait=True)
+        if self._verificacao_agendada is not None:
+            self._root.after_cancel(self._verificacao_agendada)
+            self._verificacao_agendada = None
+
+    def _rodar(self, operacao_id: int, funcao: Callable, token: TokenCancelamento):
+        """Executa a função no worker e coloca o resultado na fila."""
+        if token.cancelado:
+            self._fila.put((operacao_id, 'cancelada', None))
+            return
+        try:
+            self._fila.put((operacao_id, 'sucesso', funcao(token)))
+        except OperacaoCancelada:
+            self._fila.put((operacao_id, 'cancelada', None))
+        except Exception as e:
+            self._fila.put((operacao_id, 'erro', e))
+
+    def _agendar_verificacao(self):
+        """Agenda a próxima leitura da fila, se ainda não houver uma."""
+        if self._verificacao_agendada is None:
+            self._verificacao_agendada = self._root.after(self._intervalo_ms, self._verificar_fila)
+
+    def _verificar_fila(self):
+        """Entrega os resultados prontos (thread principal)."""
+        self._verificacao_agendada = None
+        entregues = 0
+
+        while True:
+            try:
+                operacao_id, situacao, valor = self._fila.get_nowait()
+            except queue.Empty:
+                break
+
+            token, ao_concluir, ao_falhar, descricao, _ = self._pendentes.pop(operacao_id)
+            entregues += 1
+            try:
+                if situacao == 'cancelada' or token.cancelado:
+                    print(f"🛑 Operação cancelada: {descricao}")
+                elif situacao == 'sucesso':
+                    if ao_concluir:
+                        ao_concluir(valor)
+                elif ao_falhar:
+                    ao_falhar(valor)
+                else:
+                    print(f"❌ Erro em '{descricao}': {valor}")
+            except Exception as e:
+                print(f"❌ Erro no retorno de '{descricao}': {e}")
+                traceback.print_exc()
+
+        if self._pendentes:
+            self._agendar_verificacao()
+        if entregues:
+            self._notificar_estado()
+
+    def _notificar_estado(self):
+        """Avisa a interface que o executor ficou ocupado ou livre."""
+        if self._ao_mudar_estado:
+            self._ao_mudar_estado(self.ocupado, self.descricao)
@@ -12,11 +12,22 @@ Matéria: Orientação a Objetos - UnB 2025.1
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
 from typing import Optional
+import heapq
 import traceback
 import sys
 from ..models.enums import CategoriaAtividade, SituacaoTarefa
+from ..controllers.exportador_relatorios import ExportadorRelatorios
+from ..utils import normalizar
+from .reconciliador_treeview import ReconciliadorTreeview
+from .lista_virtual import ListaVirtual
+from .executor_tarefas import ExecutorTarefas
+from .agendador_atualizacao import AgendadorAtualizacao
+from .ordenacao_colunas import OrdenacaoColunas
+
+# Ordem das situações ao ordenar pela coluna Status (a da enumeração)
+ORDEM_SITUACAO = {situacao: i for i, situacao in enumerate(SituacaoTarefa)}
 
 
 class InterfaceVisual:
@@ -32,6 +43,25 @@ class InterfaceVisual:
         """
         self.root = root
         self.gerenciador = gerenciador
+        self._ultimo_relatorio = None  # (nome, dados) do último relatório exibido
+        self._dados_carregados = True  # False enquanto um carregamento está em andamento
+        self._resultado_busca = None   # IDs filtrados pela busca (None = sem filtro)
+        self._busca_agendada = None    # after() pendente da busca
+        self._busca_ordenada = None    # (resultado da busca, versão da ordem, resultado ordenado)
+        
+        # Ordenação por coluna com chaves em cache; moradores começam por pontos
+        self._ordenacao_tarefas = OrdenacaoColunas(self._chave_tarefa)
+        self._ordenacao_moradores = OrdenacaoColunas(self._chave_morador)
+        self._ordenacao_moradores.ordenar('Pontos', True, ())
+        self._valores_moradores = {}   # iid -> valores exibidos na última atualização
+        
+        # Operações demoradas rodam em threads; os resultados voltam por root.after()
+        self._executor = ExecutorTarefas(root, ao_mudar_estado=self._mostrar_ocupado)
+        self._executor_salvamento = ExecutorTarefas(root)  # um worker: salvamentos em ordem
+        self._token_relatorio = None  # relatório em geração (substituído pelo próximo)
+        self._executor_busca = ExecutorTarefas(root)  # buscas fora da thread da interface
+        self._token_busca = None      # busca em andamento (obsoleta quando o texto muda)
+        self._ao_terminar_busca = []  # retornos das buscas substituídas pela em andamento
         
         # Configurar captura de erros
         self._configurar_captura_erros()
@@ -53,7 +83,22 @@ class InterfaceVisual:
         
         # Criar interface
         self._criar_interface()
-        self._atualizar_dados()
+        
+        # Painéis atualizados uma vez por ciclo ocioso, só quando marcados
+        # (e só se a aba do painel já foi construída)
+        self._atualizador = AgendadorAtualizacao(root, {
+            'tarefas': self._painel('tarefas', self._atualizar_lista_tarefas),
+            'moradores': self._painel('moradores', self._atualizar_lista_moradores),
+            'recentes': self._painel('dashboard', self._atualizar_atividades_recentes),
+            'dashboard': self._painel('dashboard', self._atualizar_cards)
+        })
+        
+        # Qualquer alteração nos dados atualiza os cards do dashboard
+        self.gerenciador.adicionar_observador(self._ao_alterar_dados)
+        
+        # Primeira aba construída já; as outras quando forem selecionadas
+        self._construir_aba_atual()
+        self.notebook.bind('<<NotebookTabChanged>>', self._ao_trocar_aba)
         
         print("✅ Interface inicializada com sucesso!")
     
@@ -154,11 +199,18 @@ class InterfaceVisual:
             self.notebook = ttk.Notebook(main_container, style='Custom.TNotebook')
             self.notebook.pack(fill='both', expand=True, pady=5)
             
-            # Criar abas
-            self._criar_aba_dashboard()
-            self._criar_aba_tarefas()
-            self._criar_aba_moradores()
-            self._criar_aba_relatorios()
+            # Criar abas vazias; o conteúdo é construído na primeira seleção
+            self._abas = {}
+            self._abas_construidas = set()
+            for nome, texto, construtor in [
+                ('dashboard', "📊 Dashboard", self._criar_aba_dashboard),
+                ('tarefas', "📋 Atividade", self._criar_aba_tarefas),
+                ('moradores', "👥 Moradores", self._criar_aba_moradores),
+                ('relatorios', "📊 Relatórios", self._criar_aba_relatorios)
+            ]:
+                frame = ttk.Frame(self.notebook)
+                self.notebook.add(frame, text=texto)
+                self._abas[str(frame)] = (nome, frame, construtor)
             
             # Footer
             self._criar_footer()
@@ -169,6 +221,51 @@ class InterfaceVisual:
             print(f"❌ Erro ao criar interface: {e}")
             traceback.print_exc()
     
+    # Espera após a última tecla antes de filtrar a lista de tarefas
+    ATRASO_BUSCA_MS = 150
+    
+    # Painéis de cada aba (marcados como desatualizados ao construir a aba)
+    PAINEIS_ABA = {
+        'dashboard': ('dashboard', 'recentes'),
+        'tarefas': ('tarefas',),
+        'moradores': ('moradores',),
+        'relatorios': ()
+    }
+    
+    def _ao_trocar_aba(self, event=None):
+        """Constrói a aba selecionada na primeira vez em que aparece."""
+        self._construir_aba_atual()
+    
+    def _construir_aba_atual(self):
+        """Constrói o conteúdo da aba selecionada, se ainda não existir."""
+        try:
+            selecionada = self.notebook.select()
+            if not selecionada or selecionada not in self._abas:
+                return
+            
+            nome, frame, construtor = self._abas[selecionada]
+            if nome in self._abas_construidas:
+                return
+            
+            print(f"🔨 Construindo aba '{nome}'...")
+            construtor(frame)
+            self._abas_construidas.add(nome)
+            
+            paineis = self.PAINEIS_ABA[nome]
+            if paineis:
+                self._atualizar_dados(*paineis)
+                
+        except Exception as e:
+            print(f"❌ Erro ao construir aba: {e}")
+            traceback.print_exc()
+    
+    def _painel(self, aba, atualizar):
+        """Envolve a atualização de um painel para ignorá-la se a aba não existe ainda."""
+        def atualizar_se_construida():
+            if aba in self._abas_construidas:
+                atualizar()
+        return atualizar_se_construida
+    
     def _criar_header(self):
         """Cria header elegante."""
         header = tk.Frame(self.root, bg=self.cores['primaria'], height=90)
@@ -212,13 +309,23 @@ class InterfaceVisual:
                               font=('Arial', 9),
                               bg=self.cores['primaria'],
                               fg=self.cores['branco'])
-        footer_text.pack(pady=8)
+        footer_text.pack(side='left', padx=15, pady=8)
+        
+        # Indicador de operação em andamento (visível só enquanto ocupado)
+        self.frame_ocupado = tk.Frame(footer, bg=self.cores['primaria'])
+        self.label_ocupado = tk.Label(self.frame_ocupado, text="", font=('Arial', 9, 'bold'),
+                                      bg=self.cores['primaria'], fg=self.cores['branco'])
+        self.label_ocupado.pack(side='left', padx=5)
+        self.progresso_ocupado = ttk.Progressbar(self.frame_ocupado, mode='indeterminate', length=120)
+        self.progresso_ocupado.pack(side='left', padx=5)
+        btn_cancelar = tk.Button(self.frame_ocupado, text="✖ Cancelar", command=self._executor.cancelar_todas,
+                                 bg=self.cores['perigo'], fg=self.cores['branco'],
+                                 font=('Arial', 8, 'bold'), relief='flat', borderwidth=0,
+                                 padx=8, cursor='hand2')
+        btn_cancelar.pack(side='left', padx=5)
     
-    def _criar_aba_dashboard(self):
+    def _criar_aba_dashboard(self, frame_dash):
         """Cria aba dashboard com resumo."""
-        frame_dash = ttk.Frame(self.notebook)
-        self.notebook.add(frame_dash, text="📊 Dashboard")
-        
         # Toolbar do dashboard
         toolbar_dash = tk.Frame(frame_dash, bg=self.cores['branco'], height=60, relief='solid', borderwidth=1)
         toolbar_dash.pack(fill='x', padx=10, pady=10)
@@ -229,7 +336,7 @@ class InterfaceVisual:
         btn_atualizar_dash.pack(side='left', padx=8, pady=10)
         
         # Texto informativo
-        info_label = tk.Label(toolbar_dash, text="Clique em 'Atualizar Dashboard' para ver as mudanças mais recentes",
+        info_label = tk.Label(toolbar_dash, text="O dashboard é atualizado automaticamente após cada alteração",
                              font=('Arial', 10), bg=self.cores['branco'], fg=self.cores['texto'])
         info_label.pack(side='left', padx=15, pady=10)
         
@@ -244,21 +351,24 @@ class InterfaceVisual:
         self._criar_area_atividades_recentes(frame_dash)
     
     def _criar_cards_estatisticas(self, parent):
-        """Cria cards de estatísticas."""
+        """Cria cards de estatísticas (uma única vez; os valores ficam em StringVars)."""
         try:
-            resumo = self.gerenciador.obter_resumo_sistema()
-            
             cards_data = [
-                ("👥", "Moradores", resumo['total_moradores'], self.cores['primaria']),
-                ("📋", "Tarefas Total", resumo['total_atividades'], self.cores['secundaria']),
-                ("⏳", "Pendentes", resumo['atividades_pendentes'], self.cores['aviso']),
-                ("✅", "Finalizadas", resumo['atividades_finalizadas'], self.cores['sucesso'])
+                ("👥", "Moradores", 'total_moradores', self.cores['primaria']),
+                ("📋", "Tarefas Total", 'total_atividades', self.cores['secundaria']),
+                ("⏳", "Pendentes", 'atividades_pendentes', self.cores['aviso']),
+                ("✅", "Finalizadas", 'atividades_finalizadas', self.cores['sucesso'])
             ]
             
-            for i, (emoji, titulo, valor, cor) in enumerate(cards_data):
-                card = self._criar_card(parent, emoji, titulo, valor, cor)
+            # Chave do resumo -> variável exibida no card
+            self._valores_cards = {}
+            for i, (emoji, titulo, chave, cor) in enumerate(cards_data):
+                self._valores_cards[chave] = tk.StringVar(value="0")
+                card = self._criar_card(parent, emoji, titulo, self._valores_cards[chave], cor)
                 card.grid(row=0, column=i, padx=15, pady=10, sticky='ew')
             
+            self._atualizar_cards()
+            
             # Configurar colunas para serem responsivas
             for i in range(4):
                 parent.grid_columnconfigure(i, weight=1)
@@ -266,8 +376,8 @@ class InterfaceVisual:
         except Exception as e:
             print(f"❌ Erro ao criar cards: {e}")
     
-    def _criar_card(self, parent, emoji, titulo, valor, cor):
-        """Cria um card individual."""
+    def _criar_card(self, parent, emoji, titulo, variavel, cor):
+        """Cria um card individual, com o valor ligado a uma StringVar."""
         card_frame = tk.Frame(parent, bg=self.cores['branco'], relief='solid', 
                              borderwidth=2, padx=10, pady=10)
         card_frame.configure(highlightbackground=cor, highlightcolor=cor, highlightthickness=2)
@@ -278,7 +388,7 @@ class InterfaceVisual:
         emoji_label.pack(pady=(10, 5))
         
         # Valor
-        valor_label = tk.Label(card_frame, text=str(valor), font=('Arial', 22, 'bold'),
+        valor_label = tk.Label(card_frame, textvariable=variavel, font=('Arial', 22, 'bold'),
                               bg=self.cores['branco'], fg=cor)
         valor_label.pack()
         
@@ -310,11 +420,8 @@ class InterfaceVisual:
         self.lista_recentes.pack(side='left', fill='both', expand=True, padx=10, pady=10)
         scrollbar_recentes.pack(side='right', fill='y', pady=10)
     
-    def _criar_aba_tarefas(self):
+    def _criar_aba_tarefas(self, frame_tarefas):
         """Cria aba de tarefas melhorada."""
-        frame_tarefas = ttk.Frame(self.notebook)
-        self.notebook.add(frame_tarefas, text="📋 Atividade")
-        
         # Toolbar superior elegante
         toolbar = tk.Frame(frame_tarefas, bg=self.cores['branco'], height=70, relief='solid', borderwidth=1)
         toolbar.pack(fill='x', padx=10, pady=10)
@@ -337,10 +444,28 @@ class InterfaceVisual:
                                               '#795548')
         btn_excluir.pack(side='left', padx=8, pady=15)
         
+        btn_reatribuir = self._criar_botao_moderno(toolbar, "👤 Reatribuir", self._reatribuir_tarefas_selecionadas,
+                                                 self.cores['secundaria'])
+        btn_reatribuir.pack(side='left', padx=8, pady=15)
+        
         btn_atualizar = self._criar_botao_moderno(toolbar, "🔄 Atualizar", self._atualizar_lista_tarefas,
                                                 self.cores['aviso'])
         btn_atualizar.pack(side='left', padx=8, pady=15)
         
+        # Busca incremental (nome, descrição, categoria, status, responsável)
+        self.var_busca = tk.StringVar()
+        self.entry_busca = tk.Entry(toolbar, textvariable=self.var_busca, font=('Arial', 12),
+                                    width=30, relief='solid', borderwidth=1)
+        self.entry_busca.pack(side='right', padx=(4, 12), pady=20)
+        self.entry_busca.bind('<Escape>', lambda e: self.var_busca.set(''))
+        tk.Label(toolbar, text="🔍", font=('Arial', 14),
+                 bg=self.cores['branco']).pack(side='right', pady=15)
+        
+        self.label_busca = tk.Label(toolbar, text="", font=('Arial', 10),
+                                    bg=self.cores['branco'], fg='#7f8c8d')
+        self.label_busca.pack(side='right', padx=8, pady=15)
+        self.var_busca.trace_add('write', self._ao_digitar_busca)
+        
         # Container para lista
         lista_container = tk.Frame(frame_tarefas, bg=self.cores['fundo'], relief='solid', borderwidth=1)
         lista_container.pack(fill='both', expand=True, padx=10, pady=5)
@@ -348,19 +473,19 @@ class InterfaceVisual:
         # Lista de tarefas melhorada
         colunas = ('ID', 'Categoria', 'Nome da Tarefa', 'Status', 'Responsável', 'Pontos')
         self.tree_tarefas = ttk.Treeview(lista_container, columns=colunas, show='headings',
-                                        style='Custom.Treeview', height=15)
+                                        style='Custom.Treeview', height=15, selectmode='extended')
         
         # Configurar colunas
         larguras = [120, 150, 350, 120, 180, 80]
         for i, (col, largura) in enumerate(zip(colunas, larguras)):
-            self.tree_tarefas.heading(col, text=col)
+            self.tree_tarefas.heading(col, text=col, command=lambda c=col: self._ordenar_tarefas(c))
             anchor = 'w' if col == 'Nome da Tarefa' else 'center'
             self.tree_tarefas.column(col, width=largura, anchor=anchor, minwidth=80)
         
-        # Scrollbars
-        scrollbar_v = ttk.Scrollbar(lista_container, orient='vertical', command=self.tree_tarefas.yview)
+        # Scrollbars (a vertical é controlada pela lista virtual)
+        scrollbar_v = ttk.Scrollbar(lista_container, orient='vertical')
         scrollbar_h = ttk.Scrollbar(lista_container, orient='horizontal', command=self.tree_tarefas.xview)
-        self.tree_tarefas.configure(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
+        self.tree_tarefas.configure(xscrollcommand=scrollbar_h.set)
         
         # Grid layout
         self.tree_tarefas.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
@@ -369,12 +494,24 @@ class InterfaceVisual:
         
         lista_container.grid_rowconfigure(0, weight=1)
         lista_container.grid_columnconfigure(0, weight=1)
+        
+        # Configurar cores das tags (uma única vez)
+        self.tree_tarefas.tag_configure('finalizada', background='#d5f5d5', foreground='#2e7d32')
+        self.tree_tarefas.tag_configure('cancelada', background='#f5d5d5', foreground='#c62828')
+        self.tree_tarefas.tag_configure('pendente', background='#fff3cd', foreground='#f57c00')
+        
+        # Rolagem virtual: só as linhas visíveis ficam na Treeview,
+        # identificadas pelo ID completo da atividade
+        self.lista_tarefas = ListaVirtual(self.tree_tarefas, scrollbar_v,
+                                          contar=self._contar_tarefas,
+                                          buscar=self._buscar_linhas_tarefas,
+                                          linhas_visiveis=15)
+        
+        # Ctrl+A seleciona todas as tarefas exibidas (com busca/ordenação)
+        self.tree_tarefas.bind('<Control-a>', self._selecionar_todas_tarefas)
     
-    def _criar_aba_moradores(self):
+    def _criar_aba_moradores(self, frame_moradores):
         """Cria aba de moradores melhorada."""
-        frame_moradores = ttk.Frame(self.notebook)
-        self.notebook.add(frame_moradores, text="👥 Moradores")
-        
         # Toolbar
         toolbar_mor = tk.Frame(frame_moradores, bg=self.cores['branco'], height=70, relief='solid', borderwidth=1)
         toolbar_mor.pack(fill='x', padx=10, pady=10)
@@ -406,7 +543,7 @@ class InterfaceVisual:
         
         larguras_mor = [250, 120, 180, 200, 150]
         for col, largura in zip(colunas_mor, larguras_mor):
-            self.tree_moradores.heading(col, text=col)
+            self.tree_moradores.heading(col, text=col, command=lambda c=col: self._ordenar_moradores(c))
             self.tree_moradores.column(col, width=largura, anchor='center', minwidth=100)
         
         scrollbar_mor_v = ttk.Scrollbar(lista_container_mor, orient='vertical', command=self.tree_moradores.yview)
@@ -417,12 +554,13 @@ class InterfaceVisual:
         
         lista_container_mor.grid_rowconfigure(0, weight=1)
         lista_container_mor.grid_columnconfigure(0, weight=1)
+        
+        # Linhas identificadas pelo ID completo do morador
+        self._reconciliador_moradores = ReconciliadorTreeview(self.tree_moradores)
+        self._mostrar_ordenacao(self.tree_moradores, self._ordenacao_moradores)
     
-    def _criar_aba_relatorios(self):
+    def _criar_aba_relatorios(self, frame_relatorios):
         """Cria aba de relatórios melhorada."""
-        frame_relatorios = ttk.Frame(self.notebook)
-        self.notebook.add(frame_relatorios, text="📊 Relatórios")
-        
         # Toolbar de relatórios
         toolbar_rel = tk.Frame(frame_relatorios, bg=self.cores['branco'], height=70, relief='solid', borderwidth=1)
         toolbar_rel.pack(fill='x', padx=10, pady=10)
@@ -437,6 +575,12 @@ class InterfaceVisual:
         btn_performance = self._criar_botao_moderno(toolbar_rel, "📈 Performance", self._gerar_relatorio_performance, '#FF5722')
         btn_performance.pack(side='left', padx=8, pady=15)
         
+        btn_tempo = self._criar_botao_moderno(toolbar_rel, "⏱️ Tempo de Realização", self._gerar_relatorio_tempo_realizacao, '#009688')
+        btn_tempo.pack(side='left', padx=8, pady=15)
+        
+        btn_exportar = self._criar_botao_moderno(toolbar_rel, "💾 Exportar", self._exportar_relatorio, '#607D8B')
+        btn_exportar.pack(side='right', padx=8, pady=15)
+        
         # Área de texto para relatórios
         texto_container = tk.Frame(frame_relatorios, bg=self.cores['fundo'], relief='solid', borderwidth=1)
         texto_container.pack(fill='both', expand=True, padx=10, pady=5)
@@ -490,14 +634,17 @@ class InterfaceVisual:
     def _nova_tarefa(self):
         """Abre diálogo para criar nova tarefa."""
         try:
+            if self._aguardando_operacao():
+                return
+            
             print("🔄 Abrindo diálogo para nova tarefa...")
             dialog = NovaAtividadeDialog(self.root, self.gerenciador)
             self.root.wait_window(dialog.dialog)
             
             if dialog.resultado:
                 print(f"✅ Tarefa criada: {dialog.resultado.nome_tarefa}")
-                self._atualizar_dados()
-                self.gerenciador.salvar_dados()
+                self._atualizar_dados('tarefas', 'recentes')
+                self._salvar_dados()
                 messagebox.showinfo("Sucesso!", f"Tarefa '{dialog.resultado.nome_tarefa}' criada com sucesso! 🎉")
                 
         except Exception as e:
@@ -508,6 +655,9 @@ class InterfaceVisual:
     def _novo_morador(self):
         """Abre diálogo para novo morador."""
         try:
+            if self._aguardando_operacao():
+                return
+            
             print("🔄 Abrindo diálogo para novo morador...")
             nome = simpledialog.askstring("Novo Morador", 
                                          "Digite o nome do morador:",
@@ -517,8 +667,8 @@ class InterfaceVisual:
                 if self.gerenciador.adicionar_morador(nome.strip()):
                     print(f"✅ Morador adicionado: {nome}")
                     messagebox.showinfo("Sucesso!", f"Morador '{nome}' adicionado com sucesso! 👥")
-                    self._atualizar_dados()
-                    self.gerenciador.salvar_dados()
+                    self._atualizar_dados('moradores')
+                    self._salvar_dados()
                 else:
                     print(f"❌ Falha ao adicionar morador: {nome}")
                     messagebox.showerror("Erro", "Não foi possível adicionar o morador.\nVerifique se o nome já não existe.")
@@ -529,52 +679,43 @@ class InterfaceVisual:
             messagebox.showerror("Erro", f"Erro ao adicionar morador: {str(e)}")
     
     def _finalizar_tarefa_selecionada(self):
-        """Finaliza tarefa selecionada."""
+        """Finaliza as tarefas selecionadas (uma confirmação e um salvamento)."""
         try:
-            selecao = self.tree_tarefas.selection()
-            if not selecao:
-                messagebox.showwarning("Aviso", "Por favor, selecione uma tarefa para finalizar.")
+            if self._aguardando_operacao():
                 return
             
-            item = self.tree_tarefas.item(selecao[0])
-            valores = item['values']
-            tarefa_id_curto = valores[0]
-            nome_tarefa = valores[2]
-            
-            print(f"🔄 Tentando finalizar tarefa: {tarefa_id_curto} - {nome_tarefa}")
-            
-            # Buscar a atividade completa pelo ID
-            atividade_encontrada = None
-            for atividade in self.gerenciador.atividades:
-                if atividade.id_atividade.startswith(tarefa_id_curto.replace("...", "")):
-                    atividade_encontrada = atividade
-                    break
-            
-            if not atividade_encontrada:
-                print(f"❌ Atividade não encontrada para ID: {tarefa_id_curto}")
-                messagebox.showerror("Erro", "Tarefa não encontrada no sistema.")
+            atividades = self._tarefas_selecionadas("finalizar")
+            if not atividades:
                 return
             
-            # Verificar se já está finalizada
-            if atividade_encontrada.esta_finalizada:
-                messagebox.showwarning("Aviso", "Esta tarefa já foi finalizada!")
+            # Só tarefas pendentes podem ser finalizadas
+            pendentes = [a for a in atividades if a.esta_pendente]
+            if not pendentes:
+                if len(atividades) == 1 and atividades[0].esta_finalizada:
+                    messagebox.showwarning("Aviso", "Esta tarefa já foi finalizada!")
+                else:
+                    messagebox.showwarning("Aviso", "Nenhuma das tarefas selecionadas está pendente!")
                 return
             
+            print(f"🔄 Tentando finalizar {len(pendentes)} tarefa(s)")
+            
             # Confirmar ação
             resposta = messagebox.askyesno("Confirmar", 
-                                          f"Deseja finalizar a tarefa:\n'{nome_tarefa}'?",
+                                          f"Deseja finalizar {self._descrever_tarefas(pendentes)}?"
+                                          f"{self._aviso_ignoradas(atividades, pendentes)}",
                                           icon='question')
             
             if resposta:
-                sucesso = self.gerenciador.finalizar_atividade(atividade_encontrada.id_atividade)
-                if sucesso:
-                    print(f"✅ Tarefa finalizada com sucesso: {nome_tarefa}")
-                    messagebox.showinfo("Sucesso!", f"Tarefa '{nome_tarefa}' finalizada! ✅\nPontos adicionados ao responsável!")
-                    self._atualizar_dados()
-                    self.gerenciador.salvar_dados()
+                finalizadas = self.gerenciador.finalizar_atividades([a.id_atividade for a in pendentes])
+                if finalizadas:
+                    print(f"✅ {len(finalizadas)} tarefa(s) finalizada(s)")
+                    messagebox.showinfo("Sucesso!", f"{self._contar_texto(finalizadas, 'finalizada')}! ✅\n"
+                                                    f"Pontos adicionados aos responsáveis!")
+                    self._atualizar_dados('tarefas', 'moradores', 'recentes')
+                    self._salvar_dados()
                 else:
-                    print(f"❌ Falha ao finalizar tarefa: {nome_tarefa}")
-                    messagebox.showerror("Erro", "Não foi possível finalizar a tarefa.\nVerifique se ela ainda está pendente.")
+                    print("❌ Falha ao finalizar tarefas")
+                    messagebox.showerror("Erro", "Não foi possível finalizar as tarefas.\nVerifique se elas ainda estão pendentes.")
                     
         except Exception as e:
             print(f"❌ Erro ao finalizar tarefa: {e}")
@@ -582,91 +723,188 @@ class InterfaceVisual:
             messagebox.showerror("Erro", f"Erro ao finalizar tarefa: {str(e)}")
     
     def _cancelar_tarefa_selecionada(self):
-        """Cancela tarefa selecionada."""
+        """Cancela as tarefas selecionadas (uma confirmação e um salvamento)."""
         try:
-            selecao = self.tree_tarefas.selection()
-            if not selecao:
-                messagebox.showwarning("Aviso", "Por favor, selecione uma tarefa para cancelar.")
+            if self._aguardando_operacao():
                 return
             
-            item = self.tree_tarefas.item(selecao[0])
-            valores = item['values']
-            tarefa_id_curto = valores[0]
-            nome_tarefa = valores[2]
-            
-            print(f"🔄 Tentando cancelar tarefa: {tarefa_id_curto} - {nome_tarefa}")
-            
-            # Buscar a atividade completa pelo ID
-            atividade_encontrada = None
-            for atividade in self.gerenciador.atividades:
-                if atividade.id_atividade.startswith(tarefa_id_curto.replace("...", "")):
-                    atividade_encontrada = atividade
-                    break
-            
-            if not atividade_encontrada:
-                print(f"❌ Atividade não encontrada para ID: {tarefa_id_curto}")
-                messagebox.showerror("Erro", "Tarefa não encontrada no sistema.")
+            atividades = self._tarefas_selecionadas("cancelar")
+            if not atividades:
                 return
             
-            # Verificar se já está cancelada
-            if atividade_encontrada.esta_cancelada:
-                messagebox.showwarning("Aviso", "Esta tarefa já foi cancelada!")
+            # Só tarefas pendentes podem ser canceladas
+            pendentes = [a for a in atividades if a.esta_pendente]
+            if not pendentes:
+                if len(atividades) == 1 and atividades[0].esta_cancelada:
+                    messagebox.showwarning("Aviso", "Esta tarefa já foi cancelada!")
+                else:
+                    messagebox.showwarning("Aviso", "Só é possível cancelar tarefas pendentes!")
                 return
             
-            # Verificar se não está pendente
-            if not atividade_encontrada.esta_pendente:
-                messagebox.showwarning("Aviso", "Só é possível cancelar tarefas pendentes!")
-                return
+            print(f"🔄 Tentando cancelar {len(pendentes)} tarefa(s)")
             
             # Confirmar ação
             resposta = messagebox.askyesno("Confirmar Cancelamento", 
-                                          f"Deseja cancelar a tarefa:\n'{nome_tarefa}'?",
+                                          f"Deseja cancelar {self._descrever_tarefas(pendentes)}?"
+                                          f"{self._aviso_ignoradas(atividades, pendentes)}",
                                           icon='warning')
             
             if resposta:
-                sucesso = self.gerenciador.cancelar_atividade(atividade_encontrada.id_atividade)
-                if sucesso:
-                    print(f"✅ Tarefa cancelada com sucesso: {nome_tarefa}")
-                    messagebox.showinfo("Tarefa Cancelada", f"Tarefa '{nome_tarefa}' foi cancelada. ❌")
-                    self._atualizar_dados()
-                    self.gerenciador.salvar_dados()
+                canceladas = self.gerenciador.cancelar_atividades([a.id_atividade for a in pendentes])
+                if canceladas:
+                    print(f"✅ {len(canceladas)} tarefa(s) cancelada(s)")
+                    messagebox.showinfo("Tarefa Cancelada", f"{self._contar_texto(canceladas, 'cancelada')}. ❌")
+                    self._atualizar_dados('tarefas', 'recentes')
+                    self._salvar_dados()
                 else:
-                    print(f"❌ Falha ao cancelar tarefa: {nome_tarefa}")
-                    messagebox.showerror("Erro", "Não foi possível cancelar a tarefa.")
+                    print("❌ Falha ao cancelar tarefas")
+                    messagebox.showerror("Erro", "Não foi possível cancelar as tarefas.")
                     
         except Exception as e:
             print(f"❌ Erro ao cancelar tarefa: {e}")
             traceback.print_exc()
             messagebox.showerror("Erro", f"Erro ao cancelar tarefa: {str(e)}")
     
-    def _atualizar_dados(self):
-        """Atualiza todos os dados da interface."""
+    def _reatribuir_tarefas_selecionadas(self):
+        """Troca o responsável das tarefas selecionadas de uma só vez."""
         try:
-            print("🔄 Atualizando dados da interface...")
-            self._atualizar_lista_tarefas()
-            self._atualizar_lista_moradores()
-            self._atualizar_atividades_recentes()
-            # Remover auto-atualização de cards do dashboard
-            print("✅ Dados atualizados com sucesso!")
+            if self._aguardando_operacao():
+                return
+            
+            atividades = self._tarefas_selecionadas("reatribuir")
+            if not atividades:
+                return
+            
+            moradores = self.gerenciador.obter_moradores()
+            if not moradores:
+                messagebox.showwarning("Aviso", "Cadastre um morador antes de reatribuir tarefas.")
+                return
+            
+            # O diálogo é a confirmação da operação
+            dialog = ReatribuirTarefasDialog(self.root, moradores, self._descrever_tarefas(atividades))
+            self.root.wait_window(dialog.dialog)
+            if not dialog.morador_id:
+                return
+            
+            alteradas = self.gerenciador.atribuir_responsavel_em_lote(
+                [a.id_atividade for a in atividades], dialog.morador_id)
+            if alteradas:
+                morador = self.gerenciador.obter_morador_por_id(dialog.morador_id)
+                print(f"✅ {len(alteradas)} tarefa(s) reatribuída(s) para {morador.nome}")
+                messagebox.showinfo("Sucesso!", f"{self._contar_texto(alteradas, 'reatribuída')} "
+                                                f"para {morador.nome}! 👤")
+                self._atualizar_dados('tarefas', 'recentes')
+                self._salvar_dados()
             
         except Exception as e:
-            print(f"❌ Erro ao atualizar dados: {e}")
+            print(f"❌ Erro ao reatribuir tarefas: {e}")
             traceback.print_exc()
+            messagebox.showerror("Erro", f"Erro ao reatribuir tarefas: {str(e)}")
+    
+    def _tarefas_selecionadas(self, acao):
+        """
+        Retorna as atividades selecionadas, inclusive as que rolaram para fora.
+        
+        Args:
+            acao (str): Verbo usado no aviso quando nada está selecionado
+        """
+        ids = self.lista_tarefas.selecao()
+        if not ids:
+            messagebox.showwarning("Aviso", f"Por favor, selecione uma ou mais tarefas para {acao}.")
+            return []
+        
+        # Os iids das linhas são os IDs completos das atividades
+        atividades = [a for a in map(self.gerenciador.obter_atividade_por_id, ids) if a]
+        if not atividades:
+            print(f"❌ Atividades não encontradas para IDs: {ids[:5]}")
+            messagebox.showerror("Erro", "Tarefa não encontrada no sistema.")
+        return atividades
+    
+    def _selecionar_todas_tarefas(self, event=None):
+        """Seleciona todas as tarefas exibidas (respeitando a busca)."""
+        if self._resultado_busca is not None:
+            ids = self._resultado_busca
+        else:
+            ids = self._ids_tarefas()
+        self.lista_tarefas.selecionar(ids)
+        return 'break'
+    
+    @staticmethod
+    def _descrever_tarefas(atividades, limite=5):
+        """Texto das confirmações: o nome de uma tarefa ou a lista resumida."""
+        if len(atividades) == 1:
+            return f"a tarefa:\n'{atividades[0].nome_tarefa}'"
+        nomes = "\n".join(f"• {a.nome_tarefa}" for a in atividades[:limite])
+        if len(atividades) > limite:
+            nomes += f"\n... e mais {len(atividades) - limite}"
+        return f"as {len(atividades)} tarefas:\n{nomes}"
+    
+    @staticmethod
+    def _aviso_ignoradas(selecionadas, aplicaveis):
+        """Aviso sobre tarefas selecionadas que a ação vai ignorar."""
+        ignoradas = len(selecionadas) - len(aplicaveis)
+        if not ignoradas:
+            return ""
+        return f"\n\n({ignoradas} tarefa(s) que não estão pendentes serão ignoradas)"
+    
+    @staticmethod
+    def _contar_texto(ids, participio):
+        """'Tarefa finalizada' ou 'N tarefas finalizadas'."""
+        if len(ids) == 1:
+            return f"Tarefa {participio}"
+        return f"{len(ids)} tarefas {participio}s"
+    
+    def _atualizar_dados(self, *paineis):
+        """
+        Marca painéis como desatualizados ('tarefas', 'moradores', 'recentes',
+        'dashboard'; nenhum = todos).
+        
+        A atualização acontece uma única vez, no próximo ciclo ocioso, mesmo
+        que vários handlers marquem os mesmos painéis.
+        """
+        self._atualizador.marcar(*paineis)
+    
+    def _atualizar_cards(self):
+        """Atualiza os valores dos cards no lugar (sem recriar widgets)."""
+        resumo = self.gerenciador.obter_resumo_sistema()
+        for chave, variavel in self._valores_cards.items():
+            valor = str(resumo[chave])
+            if variavel.get() != valor:
+                variavel.set(valor)
+    
+    def _ao_alterar_dados(self, evento, ids=()):
+        """Observador do gerenciador: marca o dashboard e mantém a ordenação das tarefas."""
+        self._sincronizar_ordenacao_tarefas(evento, ids)
+        self._atualizar_dados('dashboard')
+    
+    def _sincronizar_ordenacao_tarefas(self, evento, ids):
+        """Reposiciona só as tarefas afetadas por um evento do gerenciador."""
+        ordenacao = self._ordenacao_tarefas
+        if evento == 'atividade_criada':
+            for atividade_id in ids:
+                ordenacao.adicionar(atividade_id)
+        elif evento == 'atividade_excluida':
+            for atividade_id in ids:
+                ordenacao.remover(atividade_id)
+        elif evento in ('atividade_finalizada', 'atividade_cancelada', 'responsavel_atribuido'):
+            ordenacao.invalidar(*ids)
+        elif evento in ('morador_editado', 'morador_removido'):
+            # O nome exibido como responsável mudou em várias tarefas
+            ordenacao.invalidar_coluna('Responsável')
+        elif evento == 'dados_carregados':
+            # Todas as chaves podem ter mudado
+            self._ordenacao_tarefas = OrdenacaoColunas(self._chave_tarefa)
+            if ordenacao.ativa:
+                self._ordenacao_tarefas.ordenar(ordenacao.coluna, ordenacao.decrescente,
+                                                self._ids_tarefas())
     
     def _atualizar_dashboard_completo(self):
         """Atualiza completamente o dashboard."""
         try:
             print("🔄 Atualizando dashboard completo...")
             
-            # Limpar cards existentes
-            for widget in self.cards_container.winfo_children():
-                widget.destroy()
-            
-            # Recriar cards com dados atualizados
-            self._criar_cards_estatisticas(self.cards_container)
-            
-            # Atualizar atividades recentes
-            self._atualizar_atividades_recentes()
+            self._atualizar_dados('dashboard', 'recentes')
+            self._atualizador.descarregar()
             
             print("✅ Dashboard atualizado com sucesso!")
             messagebox.showinfo("Dashboard Atualizado", "Dashboard atualizado com os dados mais recentes! 📊")
@@ -676,47 +914,33 @@ class InterfaceVisual:
             traceback.print_exc()
     
     def _excluir_tarefa_selecionada(self):
-        """Exclui tarefa selecionada permanentemente."""
+        """Exclui as tarefas selecionadas permanentemente (uma confirmação e um salvamento)."""
         try:
-            selecao = self.tree_tarefas.selection()
-            if not selecao:
-                messagebox.showwarning("Aviso", "Por favor, selecione uma tarefa para excluir.")
+            if self._aguardando_operacao():
                 return
             
-            item = self.tree_tarefas.item(selecao[0])
-            valores = item['values']
-            tarefa_id_curto = valores[0]
-            nome_tarefa = valores[2]
-            
-            print(f"🔄 Tentando excluir tarefa: {tarefa_id_curto} - {nome_tarefa}")
-            
-            # Buscar a atividade completa pelo ID
-            atividade_encontrada = None
-            for atividade in self.gerenciador.atividades:
-                if atividade.id_atividade.startswith(tarefa_id_curto.replace("...", "")):
-                    atividade_encontrada = atividade
-                    break
-            
-            if not atividade_encontrada:
-                print(f"❌ Atividade não encontrada para ID: {tarefa_id_curto}")
-                messagebox.showerror("Erro", "Tarefa não encontrada no sistema.")
+            atividades = self._tarefas_selecionadas("excluir")
+            if not atividades:
                 return
             
+            print(f"🔄 Tentando excluir {len(atividades)} tarefa(s)")
+            
             # Confirmar exclusão
             resposta = messagebox.askyesno("Confirmar Exclusão", 
                                           f"⚠️ ATENÇÃO: Esta ação é irreversível!\n\n"
-                                          f"Deseja excluir permanentemente a tarefa:\n'{nome_tarefa}'?\n\n"
-                                          f"Esta tarefa será completamente removida do sistema.",
+                                          f"Deseja excluir permanentemente {self._descrever_tarefas(atividades)}?\n\n"
+                                          f"As tarefas serão completamente removidas do sistema.",
                                           icon='warning')
             
             if resposta:
-                # Remover da lista de atividades
-                self.gerenciador._lista_atividades.remove(atividade_encontrada)
+                excluidas = self.gerenciador.excluir_atividades([a.id_atividade for a in atividades])
+                self.lista_tarefas.limpar_selecao()
                 
-                print(f"✅ Tarefa excluída com sucesso: {nome_tarefa}")
-                messagebox.showinfo("Tarefa Excluída", f"Tarefa '{nome_tarefa}' foi excluída permanentemente. 🗑️")
-                self._atualizar_dados()
-                self.gerenciador.salvar_dados()
+                print(f"✅ {len(excluidas)} tarefa(s) excluída(s)")
+                messagebox.showinfo("Tarefa Excluída", f"{self._contar_texto(excluidas, 'excluída')} "
+                                                       f"permanentemente. 🗑️")
+                self._atualizar_dados('tarefas', 'recentes')
+                self._salvar_dados()
                 
         except Exception as e:
             print(f"❌ Erro ao excluir tarefa: {e}")
@@ -726,35 +950,31 @@ class InterfaceVisual:
     def _editar_morador_selecionado(self):
         """Edita o morador selecionado."""
         try:
+            if self._aguardando_operacao():
+                return
+            
             selecao = self.tree_moradores.selection()
             if not selecao:
                 messagebox.showwarning("Aviso", "Por favor, selecione um morador para editar.")
                 return
             
-            item = self.tree_moradores.item(selecao[0])
-            nome_morador = item['values'][0].replace("🥇 ", "").replace("🥈 ", "").replace("🥉 ", "")
-            
-            print(f"🔄 Editando morador: {nome_morador}")
-            
-            # Buscar morador
-            morador_encontrado = None
-            for morador in self.gerenciador.obter_moradores():
-                if morador.nome == nome_morador:
-                    morador_encontrado = morador
-                    break
+            # O iid da linha é o ID do morador
+            morador_encontrado = self.gerenciador.obter_morador_por_id(selecao[0])
             
             if not morador_encontrado:
                 messagebox.showerror("Erro", "Morador não encontrado no sistema.")
                 return
             
+            print(f"🔄 Editando morador: {morador_encontrado.nome}")
+            
             # Abrir diálogo de edição
-            dialog = EditarMoradorDialog(self.root, morador_encontrado)
+            dialog = EditarMoradorDialog(self.root, morador_encontrado, self.gerenciador)
             self.root.wait_window(dialog.dialog)
             
             if dialog.resultado:
                 print(f"✅ Morador editado: {morador_encontrado.nome}")
-                self._atualizar_dados()
-                self.gerenciador.salvar_dados()
+                self._atualizar_dados('moradores', 'tarefas')
+                self._salvar_dados()
                 messagebox.showinfo("Sucesso!", f"Morador '{morador_encontrado.nome}' editado com sucesso! ✏️")
                 
         except Exception as e:
@@ -765,29 +985,26 @@ class InterfaceVisual:
     def _excluir_morador_selecionado(self):
         """Exclui o morador selecionado."""
         try:
+            if self._aguardando_operacao():
+                return
+            
             selecao = self.tree_moradores.selection()
             if not selecao:
                 messagebox.showwarning("Aviso", "Por favor, selecione um morador para excluir.")
                 return
             
-            item = self.tree_moradores.item(selecao[0])
-            nome_morador = item['values'][0].replace("🥇 ", "").replace("🥈 ", "").replace("🥉 ", "")
-            
-            print(f"🔄 Tentando excluir morador: {nome_morador}")
-            
-            # Buscar morador
-            morador_encontrado = None
-            for morador in self.gerenciador.obter_moradores():
-                if morador.nome == nome_morador:
-                    morador_encontrado = morador
-                    break
+            # O iid da linha é o ID do morador
+            morador_encontrado = self.gerenciador.obter_morador_por_id(selecao[0])
             
             if not morador_encontrado:
                 messagebox.showerror("Erro", "Morador não encontrado no sistema.")
                 return
             
+            nome_morador = morador_encontrado.nome
+            print(f"🔄 Tentando excluir morador: {nome_morador}")
+            
             # Verificar se tem tarefas atribuídas
-            tarefas_atribuidas = [a for a in self.gerenciador.atividades if a.responsavel_id == morador_encontrado.id]
+            tarefas_atribuidas = self.gerenciador.listar_atividades_por_responsavel(morador_encontrado.id)
             
             mensagem_confirmacao = f"⚠️ ATENÇÃO: Esta ação é irreversível!\n\n"
             mensagem_confirmacao += f"Deseja excluir permanentemente o morador:\n'{nome_morador}'?\n\n"
@@ -802,18 +1019,14 @@ class InterfaceVisual:
             resposta = messagebox.askyesno("Confirmar Exclusão", mensagem_confirmacao, icon='warning')
             
             if resposta:
-                # Remover atribuições das tarefas
-                for atividade in tarefas_atribuidas:
-                    atividade.responsavel_id = None
-                
-                # Remover morador
+                # Remover morador (o gerenciador deixa as tarefas sem responsável)
                 sucesso = self.gerenciador.remover_morador(morador_encontrado.id)
                 
                 if sucesso:
                     print(f"✅ Morador excluído com sucesso: {nome_morador}")
                     messagebox.showinfo("Morador Excluído", f"Morador '{nome_morador}' foi excluído permanentemente. 🗑️")
-                    self._atualizar_dados()
-                    self.gerenciador.salvar_dados()
+                    self._atualizar_dados('tarefas', 'moradores')
+                    self._salvar_dados()
                 else:
                     messagebox.showerror("Erro", "Não foi possível excluir o morador.")
                 
@@ -828,7 +1041,8 @@ class InterfaceVisual:
             if hasattr(self, 'lista_recentes'):
                 self.lista_recentes.delete(0, tk.END)
                 
-                atividades = self.gerenciador.atividades[-10:]  # Últimas 10
+                total = self.gerenciador.contar_atividades()
+                atividades = self.gerenciador.consultar_atividades(max(0, total - 10))  # Últimas 10
                 if not atividades:
                     self.lista_recentes.insert(tk.END, "📝 Nenhuma atividade cadastrada ainda")
                 else:
@@ -841,202 +1055,569 @@ class InterfaceVisual:
             print(f"❌ Erro ao atualizar atividades recentes: {e}")
     
     def _atualizar_lista_tarefas(self):
-        """Atualiza lista de tarefas."""
+        """Atualiza lista de tarefas (apenas a janela visível)."""
         try:
-            # Limpar lista
-            for item in self.tree_tarefas.get_children():
-                self.tree_tarefas.delete(item)
-            
-            print(f"📋 Carregando {len(self.gerenciador.atividades)} atividades...")
-            
-            for atividade in self.gerenciador.atividades:
-                responsavel = "Não atribuído"
-                if atividade.responsavel_id:
-                    morador = self.gerenciador.obter_morador_por_id(atividade.responsavel_id)
-                    if morador:
-                        responsavel = morador.nome
-                
-                # Cores por status
-                tags = []
-                if atividade.esta_finalizada:
-                    tags = ['finalizada']
-                elif atividade.esta_cancelada:
-                    tags = ['cancelada']
-                else:
-                    tags = ['pendente']
-                
-                # ID mais curto para exibição
-                id_display = atividade.id_atividade[:8] + "..."
-                
-                self.tree_tarefas.insert('', 'end', values=(
-                    id_display,
-                    atividade.categoria.value,
-                    atividade.nome_tarefa,
-                    atividade.situacao.value,
-                    responsavel,
-                    atividade.pontos_tarefa
-                ), tags=tags)
-            
-            # Configurar cores das tags
-            self.tree_tarefas.tag_configure('finalizada', background='#d5f5d5', foreground='#2e7d32')
-            self.tree_tarefas.tag_configure('cancelada', background='#f5d5d5', foreground='#c62828')
-            self.tree_tarefas.tag_configure('pendente', background='#fff3cd', foreground='#f57c00')
-            
-            print(f"✅ Lista de tarefas atualizada com {len(self.gerenciador.atividades)} itens")
-            
+            self._filtrar_tarefas(ao_terminar=self._redesenhar_lista_tarefas)
         except Exception as e:
             print(f"❌ Erro ao atualizar lista de tarefas: {e}")
             traceback.print_exc()
     
-    def _atualizar_lista_moradores(self):
-        """Atualiza lista de moradores."""
+    def _redesenhar_lista_tarefas(self):
+        """Redesenha a janela visível da lista de tarefas."""
+        alteracoes = self.lista_tarefas.atualizar()
+        print(f"✅ Lista de tarefas atualizada: {self.lista_tarefas.total} itens, "
+              f"exibindo a partir de {self.lista_tarefas.inicio} {alteracoes}")
+    
+    def _ao_digitar_busca(self, *args):
+        """Reinicia a espera a cada tecla; a busca só roda após uma pausa."""
+        if self._busca_agendada is not None:
+            self.root.after_cancel(self._busca_agendada)
+        self._busca_agendada = self.root.after(self.ATRASO_BUSCA_MS, self._aplicar_busca)
+    
+    def _aplicar_busca(self):
+        """Filtra a lista de tarefas pelo texto digitado e volta ao topo."""
+        self._busca_agendada = None
+        try:
+            self._filtrar_tarefas(ao_terminar=lambda: self.lista_tarefas.ir_para(0))
+        except Exception as e:
+            print(f"❌ Erro na busca: {e}")
+            traceback.print_exc()
+    
+    def _filtrar_tarefas(self, ao_terminar):
+        """
+        Atualiza o resultado da busca.
+        
+        A consulta ao índice roda em uma thread de trabalho: consultas curtas
+        ou por faceta ("l", "pendente") casam com quase todas as atividades
+        e passam do orçamento de um quadro em listas grandes. Enquanto isso,
+        a lista continua exibindo o resultado anterior. Uma busca nova torna
+        a anterior obsoleta, e o resultado dela é descartado.
+        
+        O índice do controller guarda as consultas recentes, então repetir
+        a mesma busca sem alterações nos dados não custa nada, e uma busca
+        que só completa a anterior filtra o resultado anterior.
+        
+        Args:
+            ao_terminar (Callable): Chamado na thread principal quando o
+                resultado novo estiver aplicado (na hora, se a busca estiver
+                vazia). Se a busca for substituída por outra, é chamado ao
+                fim da nova, para que nenhum retorno (ex.: voltar ao topo) se perca
+        """
+        if self._token_busca is not None:
+            self._token_busca.cancelar()
+            self._token_busca = None
+        self._ao_terminar_busca.append(ao_terminar)
+        
+        def terminar():
+            retornos, self._ao_terminar_busca = self._ao_terminar_busca, []
+            for retorno in retornos:
+                retorno()
+        
+        consulta = self.var_busca.get().strip()
+        if not consulta:
+            self._resultado_busca = None
+            self.label_busca.config(text="")
+            terminar()
+            return
+        
+        def concluir(resultado):
+            self._token_busca = None
+            self._aplicar_resultado_busca(resultado)
+            terminar()
+        
+        def falhar(erro):
+            self._token_busca = None
+            self._ao_terminar_busca = []
+            print(f"❌ Erro na busca: {erro}")
+            traceback.print_exception(type(erro), erro, erro.__traceback__)
+        
+        self.label_busca.config(text="🔎 buscando...")
+        self._token_busca = self._executor_busca.executar(
+            lambda token: self.gerenciador.buscar_atividades(consulta),
+            ao_concluir=concluir, ao_falhar=falhar, descricao=f"🔎 Buscando '{consulta}'...")
+    
+    def _aplicar_resultado_busca(self, resultado):
+        """Coloca o resultado da busca na ordem exibida e mostra a contagem."""
+        ordenacao = self._ordenacao_tarefas
+        if ordenacao.ativa:
+            memo = self._busca_ordenada
+            if memo and memo[0] is resultado and memo[1] == ordenacao.versao:
+                ordenado = memo[2]
+            else:
+                ordenado = ordenacao.filtrar(resultado)
+                self._busca_ordenada = (resultado, ordenacao.versao, ordenado)
+            resultado = ordenado
+        
+        self._resultado_busca = resultado
+        self.label_busca.config(text=f"{len(self._resultado_busca)} de "
+                                     f"{self.gerenciador.contar_atividades()}")
+    
+    def _contar_tarefas(self):
+        """Total de linhas da lista de tarefas (com a busca aplicada)."""
+        if self._resultado_busca is not None:
+            return len(self._resultado_busca)
+        if self._ordenacao_tarefas.ativa:
+            return len(self._ordenacao_tarefas)
+        return self.gerenciador.contar_atividades()
+    
+    def _buscar_linhas_tarefas(self, inicio, limite):
+        """Busca no controller as linhas de uma janela da lista de tarefas."""
+        nomes_moradores = {m.id: m.nome for m in self.gerenciador.obter_moradores()}
+        if self._resultado_busca is not None:
+            ids = self._resultado_busca[max(0, inicio):max(0, inicio) + limite]
+        elif self._ordenacao_tarefas.ativa:
+            ids = self._ordenacao_tarefas.janela(inicio, limite)
+        else:
+            ids = None
+        
+        if ids is None:
+            atividades = self.gerenciador.consultar_atividades(inicio, limite)
+        else:
+            atividades = filter(None, map(self.gerenciador.obter_atividade_por_id, ids))
+        return [self._linha_tarefa(atividade, nomes_moradores) for atividade in atividades]
+    
+    def _ids_tarefas(self):
+        """Retorna os IDs de todas as atividades, na ordem de criação."""
+        return [atividade.id_atividade for atividade in self.gerenciador.consultar_atividades()]
+    
+    def _ordenar_tarefas(self, coluna):
+        """Clique no cabeçalho: ordena por outra coluna ou inverte a direção."""
         try:
-            # Limpar lista
-            for item in self.tree_moradores.get_children():
-                self.tree_moradores.delete(item)
+            ordenacao = self._ordenacao_tarefas
+            if ordenacao.coluna == coluna:
+                ordenacao.inverter()
+            else:
+                ordenacao.ordenar(coluna, False, self._ids_tarefas())
             
+            self._mostrar_ordenacao(self.tree_tarefas, ordenacao)
+            self._filtrar_tarefas(ao_terminar=lambda: self.lista_tarefas.ir_para(0))
+            
+        except Exception as e:
+            print(f"❌ Erro ao ordenar tarefas: {e}")
+            traceback.print_exc()
+    
+    def _chave_tarefa(self, coluna, atividade_id):
+        """Chave de ordenação de uma tarefa (calculada uma vez e guardada em cache)."""
+        atividade = self.gerenciador.obter_atividade_por_id(atividade_id)
+        if atividade is None:
+            return ()
+        if coluna == 'Categoria':
+            return (normalizar(atividade.categoria.name),)
+        if coluna == 'Nome da Tarefa':
+            return (normalizar(atividade.nome_tarefa),)
+        if coluna == 'Status':
+            return (ORDEM_SITUACAO[atividade.situacao],)
+        if coluna == 'Responsável':
+            morador = self.gerenciador.obter_morador_por_id(atividade.responsavel_id or '')
+            return (0, normalizar(morador.nome)) if morador else (1, '')
+        if coluna == 'Pontos':
+            return (atividade.pontos_tarefa,)
+        return (atividade_id,)
+    
+    def _mostrar_ordenacao(self, tree, ordenacao):
+        """Mostra ▲/▼ no cabeçalho da coluna ordenada."""
+        for coluna in tree['columns']:
+            texto = coluna
+            if coluna == ordenacao.coluna:
+                texto += " ▼" if ordenacao.decrescente else " ▲"
+            tree.heading(coluna, text=texto)
+    
+    def _linha_tarefa(self, atividade, nomes_moradores):
+        """Monta a linha (iid, valores, tags) de uma atividade."""
+        responsavel = "Não atribuído"
+        if atividade.responsavel_id:
+            responsavel = nomes_moradores.get(atividade.responsavel_id, responsavel)
+        
+        # Cores por status
+        if atividade.esta_finalizada:
+            tags = ('finalizada',)
+        elif atividade.esta_cancelada:
+            tags = ('cancelada',)
+        else:
+            tags = ('pendente',)
+        
+        # ID mais curto para exibição
+        id_display = atividade.id_atividade[:8] + "..."
+        
+        valores = (
+            id_display,
+            atividade.categoria.value,
+            atividade.nome_tarefa,
+            atividade.situacao.value,
+            responsavel,
+            atividade.pontos_tarefa
+        )
+        return atividade.id_atividade, valores, tags
+    
+    def _atualizar_lista_moradores(self):
+        """Atualiza lista de moradores (apenas as linhas que mudaram)."""
+        try:
             moradores = self.gerenciador.obter_moradores()
-            moradores_ordenados = sorted(moradores, key=lambda m: m.pontos_realizadas, reverse=True)
             
-            print(f"👥 Carregando {len(moradores_ordenados)} moradores...")
+            print(f"👥 Carregando {len(moradores)} moradores...")
+            
+            # Emoji de posição para os três primeiros em pontos
+            pontuadores = (m for m in moradores if m.pontos_realizadas > 0)
+            podio = heapq.nlargest(3, pontuadores, key=lambda m: m.pontos_realizadas)
+            medalhas = {m.id: emoji for m, emoji in zip(podio, ("🥇 ", "🥈 ", "🥉 "))}
             
-            for i, morador in enumerate(moradores_ordenados):
+            valores = {}
+            for morador in moradores:
                 status = "🟢 Disponível" if morador.disponivel else "🔴 Indisponível"
-                
-                # Emoji de posição
-                posicao_emoji = ""
-                if i == 0 and morador.pontos_realizadas > 0:
-                    posicao_emoji = "🥇 "
-                elif i == 1 and morador.pontos_realizadas > 0:
-                    posicao_emoji = "🥈 "
-                elif i == 2 and morador.pontos_realizadas > 0:
-                    posicao_emoji = "🥉 "
-                
-                self.tree_moradores.insert('', 'end', values=(
-                    posicao_emoji + morador.nome,
+                valores[morador.id] = (
+                    medalhas.get(morador.id, "") + morador.nome,
                     morador.pontos_realizadas,
                     morador.total_tarefas_realizadas,
                     morador.nivel_performance,
                     status
-                ))
-            
-            print(f"✅ Lista de moradores atualizada com {len(moradores_ordenados)} itens")
+                )
+            
+            # Só as linhas novas ou alteradas são (re)posicionadas na ordenação
+            ordenacao = self._ordenacao_moradores
+            anteriores = self._valores_moradores
+            for morador_id in anteriores.keys() - valores.keys():
+                ordenacao.remover(morador_id)
+            for morador_id, linha in valores.items():
+                if morador_id not in anteriores:
+                    ordenacao.adicionar(morador_id)
+                elif anteriores[morador_id] != linha:
+                    ordenacao.invalidar(morador_id)
+            self._valores_moradores = valores
+            
+            linhas = [(morador_id, valores[morador_id], ())
+                      for morador_id in ordenacao.janela(0, len(ordenacao))]
+            alteracoes = self._reconciliador_moradores.reconciliar(linhas)
+            
+            print(f"✅ Lista de moradores atualizada com {len(linhas)} itens {alteracoes}")
             
         except Exception as e:
             print(f"❌ Erro ao atualizar lista de moradores: {e}")
             traceback.print_exc()
     
+    def _ordenar_moradores(self, coluna):
+        """Clique no cabeçalho: ordena por outra coluna ou inverte a direção."""
+        ordenacao = self._ordenacao_moradores
+        if ordenacao.coluna == coluna:
+            ordenacao.inverter()
+        else:
+            ordenacao.ordenar(coluna, False, self._valores_moradores)
+        self._mostrar_ordenacao(self.tree_moradores, ordenacao)
+        self._atualizar_dados('moradores')
+    
+    def _chave_morador(self, coluna, morador_id):
+        """Chave de ordenação de um morador (calculada uma vez e guardada em cache)."""
+        morador = self.gerenciador.obter_morador_por_id(morador_id)
+        if morador is None:
+            return ()
+        if coluna == 'Nome':
+            return (normalizar(morador.nome),)
+        if coluna == 'Pontos':
+            return (morador.pontos_realizadas,)
+        if coluna == 'Tarefas Realizadas':
+            return (morador.total_tarefas_realizadas,)
+        if coluna == 'Nível':
+            return (normalizar(morador.nivel_performance),)
+        return (morador.disponivel,)
+    
     def _gerar_ranking(self):
         """Gera relatório de ranking."""
-        try:
-            print("🔄 Gerando relatório de ranking...")
-            ranking = self.gerenciador.ranking_melhores_moradores()
-            
-            texto = "🏆 RANKING DOS MORADORES\n"
-            texto += "=" * 60 + "\n\n"
-            
-            if not ranking:
-                texto += "😔 Nenhum morador cadastrado ainda.\n"
-                texto += "Adicione moradores na aba 'Moradores'!\n"
-            else:
-                for item in ranking:
-                    texto += f"{item['emoji']} {item['nome']}\n"
-                    texto += f"   🏆 Pontos: {item['pontos']}\n"
-                    texto += f"   📋 Tarefas realizadas: {item['tarefas']}\n"
-                    texto += f"   ⭐ Nível: {item['nivel']}\n"
-                    texto += "-" * 40 + "\n\n"
-            
-            self.texto_relatorio.delete(1.0, tk.END)
-            self.texto_relatorio.insert(1.0, texto)
-            print("✅ Relatório de ranking gerado")
-            
-        except Exception as e:
-            print(f"❌ Erro ao gerar ranking: {e}")
-            traceback.print_exc()
-            messagebox.showerror("Erro", f"Erro ao gerar ranking: {str(e)}")
+        self._gerar_relatorio_em_segundo_plano('ranking', "🏆 Gerando ranking...",
+                                               self.gerenciador.ranking_melhores_moradores,
+                                               self._texto_ranking)
+    
+    def _texto_ranking(self, ranking):
+        """Monta o texto do relatório de ranking."""
+        texto = "🏆 RANKING DOS MORADORES\n"
+        texto += "=" * 60 + "\n\n"
+        
+        if not ranking:
+            texto += "😔 Nenhum morador cadastrado ainda.\n"
+            texto += "Adicione moradores na aba 'Moradores'!\n"
+        else:
+            for item in ranking:
+                texto += f"{item['emoji']} {item['nome']}\n"
+                texto += f"   🏆 Pontos: {item['pontos']}\n"
+                texto += f"   📋 Tarefas realizadas: {item['tarefas']}\n"
+                texto += f"   ⭐ Nível: {item['nivel']}\n"
+                texto += "-" * 40 + "\n\n"
+        return texto
     
     def _gerar_estatisticas_categoria(self):
         """Gera estatísticas por categoria."""
-        try:
-            print("🔄 Gerando estatísticas por categoria...")
-            stats = self.gerenciador.estatisticas_por_categoria()
-            
-            if 'erro' in stats:
-                texto = "❌ ESTATÍSTICAS POR CATEGORIA\n"
-                texto += "=" * 60 + "\n\n"
-                texto += "😔 Nenhuma atividade encontrada.\n"
-                texto += "Crie algumas tarefas na aba 'Tarefas'!\n"
-            else:
-                texto = "📊 ESTATÍSTICAS POR CATEGORIA\n"
-                texto += "=" * 60 + "\n\n"
-                
-                for categoria, dados in stats['categorias'].items():
-                    texto += f"📂 {categoria}\n"
-                    texto += f"   📊 Total de atividades: {dados['total_atividades']}\n"
-                    texto += f"   ✅ Finalizadas: {dados['finalizadas']}\n"
-                    texto += f"   ⏳ Pendentes: {dados['pendentes']}\n"
-                    texto += f"   ❌ Canceladas: {dados['canceladas']}\n"
-                    texto += f"   📈 Taxa de conclusão: {dados['porcentagem_conclusao']}%\n"
-                    texto += f"   🏆 Pontos total: {dados['pontos_total']}\n"
-                    texto += f"   ⭐ Pontos médio: {dados['pontos_medio']}\n"
-                    texto += "-" * 40 + "\n\n"
-            
-            self.texto_relatorio.delete(1.0, tk.END)
-            self.texto_relatorio.insert(1.0, texto)
-            print("✅ Estatísticas por categoria geradas")
+        self._gerar_relatorio_em_segundo_plano('categorias', "📊 Gerando estatísticas por categoria...",
+                                               self.gerenciador.estatisticas_por_categoria,
+                                               self._texto_estatisticas_categoria)
+    
+    def _texto_estatisticas_categoria(self, stats):
+        """Monta o texto das estatísticas por categoria."""
+        if 'erro' in stats:
+            texto = "❌ ESTATÍSTICAS POR CATEGORIA\n"
+            texto += "=" * 60 + "\n\n"
+            texto += "😔 Nenhuma atividade encontrada.\n"
+            texto += "Crie algumas tarefas na aba 'Tarefas'!\n"
+        else:
+            texto = "📊 ESTATÍSTICAS POR CATEGORIA\n"
+            texto += "=" * 60 + "\n\n"
             
-        except Exception as e:
-            print(f"❌ Erro ao gerar estatísticas: {e}")
-            traceback.print_exc()
-            messagebox.showerror("Erro", f"Erro ao gerar estatísticas: {str(e)}")
+            for categoria, dados in stats['categorias'].items():
+                texto += f"📂 {categoria}\n"
+                texto += f"   📊 Total de atividades: {dados['total_atividades']}\n"
+                texto += f"   ✅ Finalizadas: {dados['finalizadas']}\n"
+                texto += f"   ⏳ Pendentes: {dados['pendentes']}\n"
+                texto += f"   ❌ Canceladas: {dados['canceladas']}\n"
+                texto += f"   📈 Taxa de conclusão: {dados['porcentagem_conclusao']}%\n"
+                texto += f"   🏆 Pontos total: {dados['pontos_total']}\n"
+                texto += f"   ⭐ Pontos médio: {dados['pontos_medio']}\n"
+                texto += "-" * 40 + "\n\n"
+        return texto
     
     def _gerar_relatorio_performance(self):
         """Gera relatório de performance detalhado."""
-        try:
-            print("🔄 Gerando relatório de performance...")
-            relatorio = self.gerenciador.relatorio_performance_moradores()
-            
-            if 'erro' in relatorio:
-                texto = "❌ RELATÓRIO DE PERFORMANCE\n"
-                texto += "=" * 60 + "\n\n"
-                texto += "😔 Nenhum morador cadastrado ainda.\n"
-            else:
-                texto = "📈 RELATÓRIO DE PERFORMANCE DETALHADO\n"
-                texto += "=" * 60 + "\n"
-                texto += f"📅 Gerado em: {relatorio['data_geracao']}\n"
-                texto += f"👥 Total de moradores: {relatorio['total_moradores']}\n\n"
-                
-                stats_gerais = relatorio['estatisticas_gerais']
-                texto += "📊 ESTATÍSTICAS GERAIS:\n"
-                texto += f"   🏆 Total de pontos na casa: {stats_gerais['total_pontos']}\n"
-                texto += f"   📋 Total de tarefas realizadas: {stats_gerais['total_tarefas']}\n"
-                texto += f"   📈 Média de pontos por morador: {stats_gerais['media_pontos']}\n"
-                texto += f"   🟢 Moradores disponíveis: {stats_gerais['moradores_disponiveis']}\n\n"
+        self._gerar_relatorio_em_segundo_plano('performance', "📈 Gerando relatório de performance...",
+                                               self.gerenciador.relatorio_performance_moradores,
+                                               self._texto_performance)
+    
+    def _texto_performance(self, relatorio):
+        """Monta o texto do relatório de performance."""
+        if 'erro' in relatorio:
+            texto = "❌ RELATÓRIO DE PERFORMANCE\n"
+            texto += "=" * 60 + "\n\n"
+            texto += "😔 Nenhum morador cadastrado ainda.\n"
+        else:
+            texto = "📈 RELATÓRIO DE PERFORMANCE DETALHADO\n"
+            texto += "=" * 60 + "\n"
+            texto += f"📅 Gerado em: {relatorio['data_geracao']}\n"
+            texto += f"👥 Total de moradores: {relatorio['total_moradores']}\n\n"
+            
+            stats_gerais = relatorio['estatisticas_gerais']
+            texto += "📊 ESTATÍSTICAS GERAIS:\n"
+            texto += f"   🏆 Total de pontos na casa: {stats_gerais['total_pontos']}\n"
+            texto += f"   📋 Total de tarefas realizadas: {stats_gerais['total_tarefas']}\n"
+            texto += f"   📈 Média de pontos por morador: {stats_gerais['media_pontos']}\n"
+            texto += f"   🟢 Moradores disponíveis: {stats_gerais['moradores_disponiveis']}\n\n"
+            
+            texto += "👤 DETALHES POR MORADOR:\n"
+            texto += "=" * 60 + "\n"
+            
+            for dados in relatorio['moradores']:
+                texto += f"\n🏠 {dados['nome']}\n"
+                texto += f"   🏆 Pontos: {dados['pontos_total']}\n"
+                texto += f"   📋 Tarefas realizadas: {dados['tarefas_realizadas']}\n"
+                texto += f"   ⭐ Nível: {dados['nivel_performance']}\n"
+                texto += f"   📅 Cadastrado há: {dados['tempo_cadastrado']}\n"
+                texto += f"   🎯 Status: {'🟢 Disponível' if dados['disponivel'] else '🔴 Indisponível'}\n"
                 
-                texto += "👤 DETALHES POR MORADOR:\n"
-                texto += "=" * 60 + "\n"
+                if dados['categorias_favoritas']:
+                    texto += f"   ❤️ Categorias favoritas: {', '.join(dados['categorias_favoritas'])}\n"
                 
-                for dados in relatorio['moradores']:
-                    texto += f"\n🏠 {dados['nome']}\n"
-                    texto += f"   🏆 Pontos: {dados['pontos_total']}\n"
-                    texto += f"   📋 Tarefas realizadas: {dados['tarefas_realizadas']}\n"
-                    texto += f"   ⭐ Nível: {dados['nivel_performance']}\n"
-                    texto += f"   📅 Cadastrado há: {dados['tempo_cadastrado']}\n"
-                    texto += f"   🎯 Status: {'🟢 Disponível' if dados['disponivel'] else '🔴 Indisponível'}\n"
-                    
-                    if dados['categorias_favoritas']:
-                        texto += f"   ❤️ Categorias favoritas: {', '.join(dados['categorias_favoritas'])}\n"
-                    
-                    texto += "-" * 40 + "\n"
-            
+                texto += "-" * 40 + "\n"
+        return texto
+    
+    def _gerar_relatorio_tempo_realizacao(self):
+        """Gera relatório de distribuição do tempo de realização."""
+        self._gerar_relatorio_em_segundo_plano('tempo_realizacao', "⏱️ Gerando relatório de tempo de realização...",
+                                               self.gerenciador.relatorio_tempo_realizacao,
+                                               self._texto_tempo_realizacao)
+    
+    def _texto_tempo_realizacao(self, relatorio):
+        """Monta o texto do relatório de tempo de realização."""
+        if 'erro' in relatorio:
+            texto = "❌ TEMPO DE REALIZAÇÃO\n"
+            texto += "=" * 60 + "\n\n"
+            texto += "😔 Nenhuma tarefa finalizada ainda.\n"
+        else:
+            texto = "⏱️ TEMPO DE REALIZAÇÃO DAS TAREFAS\n"
+            texto += "=" * 60 + "\n"
+            texto += f"📅 Gerado em: {relatorio['data_geracao']}\n"
+            texto += f"✅ Tarefas finalizadas: {relatorio['total_finalizadas']}\n\n"
+            
+            texto += "📊 GERAL:\n"
+            texto += self._formatar_distribuicao(relatorio['geral'])
+            
+            texto += "\n📂 POR CATEGORIA:\n"
+            texto += "=" * 60 + "\n"
+            for categoria, dados in relatorio['por_categoria'].items():
+                texto += f"\n{categoria}\n"
+                texto += self._formatar_distribuicao(dados)
+                texto += "-" * 40 + "\n"
+            
+            texto += "\n👤 POR MORADOR:\n"
+            texto += "=" * 60 + "\n"
+            for nome, dados in relatorio['por_morador'].items():
+                texto += f"\n🏠 {nome}\n"
+                texto += self._formatar_distribuicao(dados)
+                texto += "-" * 40 + "\n"
+        return texto
+    
+    def _gerar_relatorio_em_segundo_plano(self, nome, descricao, gerar, formatar):
+        """
+        Gera um relatório em uma thread de trabalho e exibe o texto ao terminar.
+        
+        Args:
+            nome (str): Nome curto do relatório (usado na exportação)
+            descricao (str): Texto exibido enquanto o relatório é gerado
+            gerar (Callable): Método do gerenciador que produz os dados
+            formatar (Callable): Converte os dados em texto (sem tocar no Tk)
+        """
+        if not self._dados_carregados:
+            messagebox.showwarning("Aguarde", "Os dados ainda estão sendo carregados.")
+            return
+        
+        # Um relatório novo substitui o que ainda estiver sendo gerado (só ele:
+        # uma exportação na mesma fila continua e mostra seu aviso)
+        if self._token_relatorio is not None:
+            self._token_relatorio.cancelar()
+        print(f"🔄 {descricao}")
+        
+        def trabalho(token):
+            dados = gerar()
+            token.verificar()
+            return dados, formatar(dados)
+        
+        def concluir(resultado):
+            dados, texto = resultado
+            self._ultimo_relatorio = (nome, dados)
             self.texto_relatorio.delete(1.0, tk.END)
             self.texto_relatorio.insert(1.0, texto)
-            print("✅ Relatório de performance gerado")
+            print(f"✅ Relatório '{nome}' gerado")
+        
+        def falhar(erro):
+            print(f"❌ Erro ao gerar relatório '{nome}': {erro}")
+            traceback.print_exception(type(erro), erro, erro.__traceback__)
+            messagebox.showerror("Erro", f"Erro ao gerar relatório: {str(erro)}")
+        
+        self._token_relatorio = self._executor.executar(trabalho, ao_concluir=concluir,
+                                                        ao_falhar=falhar, descricao=descricao)
+    
+    def _exportar_relatorio(self):
+        """Exporta o último relatório gerado para CSV, JSON Lines ou Markdown."""
+        try:
+            if not self._ultimo_relatorio:
+                messagebox.showwarning("Aviso", "Gere um relatório antes de exportar.")
+                return
+            
+            nome, dados = self._ultimo_relatorio
+            caminho = filedialog.asksaveasfilename(
+                parent=self.root,
+                title="💾 Exportar Relatório",
+                initialfile=f"{nome}.csv",
+                defaultextension=".csv",
+                filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Markdown", "*.md")]
+            )
+            if not caminho:
+                return
+            
+            exportador = ExportadorRelatorios.para_arquivo(caminho)
+            
+            def concluir(total):
+                print(f"✅ Relatório '{nome}' exportado: {caminho} ({total} registros)")
+                messagebox.showinfo("Exportado!", f"Relatório exportado com sucesso! 💾\n{caminho}")
+            
+            def falhar(erro):
+                print(f"❌ Erro ao exportar relatório: {erro}")
+                messagebox.showerror("Erro", f"Erro ao exportar relatório: {str(erro)}")
+            
+            # Os dados do relatório já estão prontos; só a escrita vai para o worker.
+            # A escrita não verifica o token, então a exportação não é cancelável:
+            # cancelar só esconderia o aviso de sucesso ou de erro.
+            self._executor.executar(lambda token: exportador.exportar_relatorio(dados, caminho, nome),
+                                    ao_concluir=concluir, ao_falhar=falhar,
+                                    descricao=f"💾 Exportando '{nome}'...", cancelavel=False)
             
         except Exception as e:
-            print(f"❌ Erro ao gerar relatório de performance: {e}")
+            print(f"❌ Erro ao exportar relatório: {e}")
             traceback.print_exc()
-            messagebox.showerror("Erro", f"Erro ao gerar relatório: {str(e)}")
+            messagebox.showerror("Erro", f"Erro ao exportar relatório: {str(e)}")
+    
+    def _salvar_dados(self):
+        """
+        Salva os dados em segundo plano.
+        
+        A cópia dos dados é montada aqui, na thread principal; só a escrita
+        do arquivo vai para o worker. Salvamentos ainda não iniciados ficam
+        obsoletos e são cancelados.
+        """
+        dados = self.gerenciador.montar_dados()
+        self._executor_salvamento.cancelar_todas()
+        self._executor_salvamento.executar(
+            lambda token: self.gerenciador.gravar_dados(dados),
+            ao_concluir=lambda sucesso: print("💾 Dados salvos" if sucesso else "❌ Falha ao salvar dados"),
+            descricao="💾 Salvando dados...")
+    
+    def _aguardando_operacao(self) -> bool:
+        """
+        Impede alterações nos dados enquanto um relatório é gerado.
+        
+        Returns:
+            bool: True se há operação em andamento (o usuário foi avisado)
+        """
+        if not self._executor.ocupado:
+            return False
+        messagebox.showwarning("Aguarde",
+                               f"{self._executor.descricao}\n\n"
+                               "Aguarde a operação terminar ou clique em '✖ Cancelar'.")
+        return True
+    
+    def _mostrar_ocupado(self, ocupado, descricao):
+        """Mostra ou esconde o indicador de operação em andamento."""
+        if ocupado:
+            self.label_ocupado.configure(text=f"⏳ {descricao}")
+            if not self.frame_ocupado.winfo_manager():
+                self.frame_ocupado.pack(side='right', padx=15)
+                self.progresso_ocupado.start(15)
+            self.root.configure(cursor='watch')
+        else:
+            self.progresso_ocupado.stop()
+            self.frame_ocupado.pack_forget()
+            self.root.configure(cursor='')
+    
+    @property
+    def dados_carregados(self) -> bool:
+        """Indica se é seguro salvar (nenhum carregamento em andamento)."""
+        return self._dados_carregados
+    
+    def carregar_dados_em_segundo_plano(self):
+        """
+        Carrega o arquivo de dados em uma thread de trabalho.
+        
+        A leitura e a montagem dos objetos rodam no worker; na thread
+        principal só o estado pronto é aplicado ao gerenciador. Enquanto
+        isso a janela já está visível, com o indicador de ocupado.
+        """
+        self._dados_carregados = False
+        
+        def concluir(estado):
+            if estado is not None:
+                self.gerenciador.aplicar_dados(estado)
+                print(f"📂 Dados carregados: {self.gerenciador.contar_atividades()} atividades")
+            else:
+                print("📝 Iniciando com dados em branco...")
+            self._dados_carregados = True
+            self._atualizar_dados()
+        
+        def falhar(erro):
+            print(f"❌ Erro ao carregar dados: {erro}")
+            self._dados_carregados = True
+            messagebox.showerror("Erro", f"Erro ao carregar dados: {str(erro)}")
+        
+        self._executor.executar(lambda token: self.gerenciador.ler_dados(),
+                                ao_concluir=concluir, ao_falhar=falhar,
+                                descricao="📂 Carregando dados...", cancelavel=False)
+    
+    def encerrar(self):
+        """Cancela relatórios e buscas pendentes e espera os salvamentos em andamento."""
+        self._executor_busca.encerrar(cancelar=True)
+        self._executor.encerrar(cancelar=True)
+        self._executor_salvamento.encerrar()
+    
+    def _formatar_distribuicao(self, dados):
+        """Formata uma distribuição de tempo de realização para o relatório."""
+        texto = f"   📋 Tarefas: {dados['quantidade']}\n"
+        texto += f"   ⏱️ Média: {dados['media']}\n"
+        texto += f"   📈 p50: {dados['p50']} | p90: {dados['p90']} | p99: {dados['p99']}\n"
+        for faixa, quantidade in dados['histograma'].items():
+            texto += f"      {faixa:<15} {quantidade}\n"
+        return texto
 
 
 class NovaAtividadeDialog:
@@ -1137,6 +1718,8 @@ class NovaAtividadeDialog:
             
             # Responsável
             self._criar_campo_label(main_frame, "👤 Responsável:", 6)
+            # IDs na mesma ordem das opções (a posição 0 é "Atribuir depois")
+            self._ids_responsaveis = [None] + [m.id for m in self.gerenciador.obter_moradores()]
             moradores = ["🎯 Atribuir depois"] + [f"👤 {m.nome}" for m in self.gerenciador.obter_moradores()]
             self.combo_responsavel = ttk.Combobox(main_frame, values=moradores,
                                                  font=('Arial', 12), width=45,
@@ -1257,12 +1840,9 @@ class NovaAtividadeDialog:
             
             # Obter responsável
             responsavel_id = None
-            if responsavel_text and not responsavel_text.startswith("🎯"):
-                nome_responsavel = responsavel_text.replace("👤 ", "")
-                for morador in self.gerenciador.obter_moradores():
-                    if morador.nome == nome_responsavel:
-                        responsavel_id = morador.id
-                        break
+            indice_responsavel = self.combo_responsavel.current()
+            if responsavel_text and indice_responsavel > 0:
+                responsavel_id = self._ids_responsaveis[indice_responsavel]
             
             # Criar atividade
             atividade = self.gerenciador.criar_nova_atividade(categoria, nome, descricao, responsavel_id)
@@ -1284,9 +1864,10 @@ class NovaAtividadeDialog:
 class EditarMoradorDialog:
     """Diálogo para editar dados do morador."""
     
-    def __init__(self, parent, morador):
+    def __init__(self, parent, morador, gerenciador):
         self.resultado = False
         self.morador = morador
+        self.gerenciador = gerenciador
         
         print(f"🔄 Iniciando EditarMoradorDialog para: {morador.nome}")
         
@@ -1451,9 +2032,8 @@ class EditarMoradorDialog:
                 self.entry_nome.focus_set()
                 return
             
-            # Aplicar alterações
-            self.morador.nome = novo_nome
-            self.morador.disponivel = nova_disponibilidade
+            # Aplicar alterações pelo gerenciador (avisa os observadores)
+            self.gerenciador.editar_morador(self.morador.id, novo_nome, nova_disponibilidade)
             
             print(f"✅ Morador editado: {novo_nome}, Disponível: {nova_disponibilidade}")
             
@@ -1463,4 +2043,89 @@ class EditarMoradorDialog:
         except Exception as e:
             print(f"❌ Erro ao salvar alterações: {e}")
             traceback.print_exc()
-            messagebox.showerror("Erro", f"Erro ao salvar alterações:\n{str(e)}", parent=self.dialog)
\ No newline at end of file
+            messagebox.showerror("Erro", f"Erro ao salvar alterações:\n{str(e)}", parent=self.dialog)
+
+
+class ReatribuirTarefasDialog:
+    """Diálogo para escolher o novo responsável de várias tarefas."""
+    
+    def __init__(self, parent, moradores, descricao_tarefas):
+        self.morador_id = None
+        self._ids_moradores = [m.id for m in moradores]
+        
+        # Cores do tema
+        self.cores = {
+            'primaria': '#2c3e50',
+            'sucesso': '#27ae60',
+            'perigo': '#e74c3c',
+            'fundo': '#ecf0f1',
+            'branco': '#ffffff',
+            'texto': '#2c3e50'
+        }
+        
+        try:
+            # Criar janela modal
+            self.dialog = tk.Toplevel(parent)
+            self.dialog.title("👤 Reatribuir Tarefas")
+            self.dialog.geometry("450x380")
+            self.dialog.configure(bg=self.cores['fundo'])
+            self.dialog.transient(parent)
+            self.dialog.grab_set()
+            self.dialog.resizable(False, False)
+            
+            # Centralizar diálogo
+            self.dialog.update_idletasks()
+            x = parent.winfo_x() + (parent.winfo_width() // 2) - (450 // 2)
+            y = parent.winfo_y() + (parent.winfo_height() // 2) - (380 // 2)
+            self.dialog.geometry(f"450x380+{x}+{y}")
+            
+            self._criar_interface(moradores, descricao_tarefas)
+            self.combo_responsavel.focus_set()
+            
+        except Exception as e:
+            print(f"❌ Erro ao criar ReatribuirTarefasDialog: {e}")
+            traceback.print_exc()
+    
+    def _criar_interface(self, moradores, descricao_tarefas):
+        """Cria interface do diálogo."""
+        header = tk.Frame(self.dialog, bg=self.cores['primaria'], height=60)
+        header.pack(fill='x')
+        header.pack_propagate(False)
+        
+        tk.Label(header, text="👤 Novo Responsável", font=('Arial', 16, 'bold'),
+                 bg=self.cores['primaria'], fg=self.cores['branco']).pack(pady=15)
+        
+        main_frame = tk.Frame(self.dialog, bg=self.cores['branco'], relief='solid', borderwidth=1)
+        main_frame.pack(fill='both', expand=True, padx=15, pady=15)
+        
+        tk.Label(main_frame, text=f"Reatribuir {descricao_tarefas}", font=('Arial', 10),
+                 bg=self.cores['branco'], fg=self.cores['texto'], justify='left',
+                 wraplength=380).pack(anchor='w', padx=15, pady=(10, 10))
+        
+        self.combo_responsavel = ttk.Combobox(main_frame, values=[m.nome for m in moradores],
+                                              state='readonly', font=('Arial', 12))
+        self.combo_responsavel.pack(fill='x', padx=15, pady=(0, 15))
+        self.combo_responsavel.current(0)
+        
+        botoes_frame = tk.Frame(main_frame, bg=self.cores['branco'])
+        botoes_frame.pack(side='bottom', pady=15)
+        
+        tk.Button(botoes_frame, text="✅ Reatribuir", command=self._confirmar,
+                  bg=self.cores['sucesso'], fg=self.cores['branco'],
+                  font=('Arial', 12, 'bold'), relief='flat', borderwidth=0,
+                  padx=20, pady=10, cursor='hand2').pack(side='left', padx=8)
+        
+        tk.Button(botoes_frame, text="❌ Cancelar", command=self.dialog.destroy,
+                  bg=self.cores['perigo'], fg=self.cores['branco'],
+                  font=('Arial', 12, 'bold'), relief='flat', borderwidth=0,
+                  padx=20, pady=10, cursor='hand2').pack(side='left', padx=8)
+        
+        self.dialog.bind('<Return>', lambda e: self._confirmar())
+        self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
+    
+    def _confirmar(self):
+        """Guarda o morador escolhido e fecha o diálogo."""
+        indice = self.combo_responsavel.current()
+        if indice >= 0:
+            self.morador_id = self._ids_moradores[indice]
+        self.dialog.destroy()
\ No newline at end of file
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Interface de Linha de Comando
+=============================
+
+View sem interface gráfica sobre o mesmo GerenciadorTarefas e
+ArmazenamentoDados da InterfaceVisual (não importa o tkinter). Usada por
+`python -m package`:
+
+    python -m package morador adicionar "Ana Souza"
+    python -m package atividade adicionar cozinha "Lavar louça" -r "Ana Souza"
+    python -m package atividade listar --situacao pendente --json
+    python -m package relatorio ranking
+    python -m package lote < preparar_casa.txt
+
+No modo lote, cada linha é um comando (sem o 'python -m package'); linhas
+vazias e iniciadas por '#' são ignoradas. Os dados são salvos uma única
+vez, no fim, e só se todas as linhas deram certo (ou com --continuar).
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shlex
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..controllers.armazenamento_dados import ArmazenamentoDados
+from ..controllers.exportador_relatorios import ExportadorRelatorios
+from ..controllers.gerenciador_tarefas import GerenciadorTarefas
+from ..controllers.relatorios_paralelos import LIMITES_PARAMETROS, RELATORIOS_DISPONIVEIS, inteiro_entre
+from ..models.atividade_domestica import AtividadeDomestica
+from ..models.enums import CategoriaAtividade, SituacaoTarefa
+from ..models.morador import Morador
+from ..models.residencia import Residencia
+
+ARQUIVO_PADRAO = os.path.join('dados', 'sistema_tarefas.json')
+
+# Referência à última atividade criada na mesma execução (útil no modo lote)
+ULTIMA_ATIVIDADE = '@ultima'
+
+
+class ErroLinhaComando(Exception):
+    """Comando inválido ou que não pôde ser aplicado."""
+
+
+class _Parser(argparse.ArgumentParser):
+    """ArgumentParser que levanta ErroLinhaComando em vez de encerrar o processo."""
+
+    def error(self, message):
+        raise ErroLinhaComando(f"{self.prog}: {message}")
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = _Parser(prog='python -m package',
+                     description="Gerencia moradores, atividades e relatórios sem interface gráfica.")
+    parser.add_argument('-a', '--arquivo', default=ARQUIVO_PADRAO,
+                        help="Arquivo de dados (padrão: %(default)s)")
+    parser.add_argument('--json', action='store_true', help="Saída em JSON")
+    parser.add_argument('--sem-cache', action='store_true',
+                        help="Não usar o cache de inicialização")
+    comandos = parser.add_subparsers(dest='comando', metavar='COMANDO', required=True,
+                                     parser_class=_Parser)
+    # --json também depois do subcomando (sem sobrescrever o global quando ausente)
+    comum = _Parser(add_help=False)
+    comum.add_argument('--json', action='store_true', default=argparse.SUPPRESS, help="Saída em JSON")
+
+    # === MORADORES ===
+    morador = comandos.add_parser('morador', help="Gerenciar moradores")
+    acoes = morador.add_subparsers(dest='acao', metavar='ACAO', required=True, parser_class=_Parser)
+
+    sub = acoes.add_parser('adicionar', parents=[comum], help="Cadastrar morador")
+    sub.add_argument('nome', nargs='+', help="Nome do morador")
+    sub.set_defaults(operacao='morador_adicionar')
+
+    sub = acoes.add_parser('listar', parents=[comum], help="Listar moradores")
+    sub.add_argument('--disponiveis', action='store_true', help="Só os disponíveis")
+    sub.set_defaults(operacao='morador_listar')
+
+    sub = acoes.add_parser('editar', parents=[comum], help="Alterar nome ou disponibilidade")
+    sub.add_argument('morador', help="ID ou nome do morador")
+    sub.add_argument('--nome', help="Novo nome")
+    disponibilidade = sub.add_mutually_exclusive_group()
+    disponibilidade.add_argument('--disponivel', dest='disponivel', action='store_const', const=True)
+    disponibilidade.add_argument('--indisponivel', dest='disponivel', action='store_const', const=False)
+    sub.set_defaults(operacao='morador_editar')
+
+    sub = acoes.add_parser('remover', parents=[comum],
+                           help="Remover morador (as tarefas ficam sem responsável)")
+    sub.add_argument('morador', help="ID ou nome do morador")
+    sub.set_defaults(operacao='morador_remover')
+
+    # === ATIVIDADES ===
+    atividade = comandos.add_parser('atividade', help="Gerenciar atividades")
+    acoes = atividade.add_subparsers(dest='acao', metavar='ACAO', required=True, parser_class=_Parser)
+    categorias = [categoria.name.lower() for categoria in CategoriaAtividade]
+    situacoes = [situacao.name.lower() for situacao in SituacaoTarefa]
+
+    sub = acoes.add_parser('adicionar', parents=[comum], help="Criar atividade")
+    sub.add_argument('categoria', type=str.lower, choices=categorias)
+    sub.add_argument('nome', help="Nome da tarefa")
+    sub.add_argument('-d', '--descricao', default="", help="Descrição")
+    sub.add_argument('-r', '--responsavel', help="ID ou nome do responsável")
+    sub.set_defaults(operacao='atividade_adicionar')
+
+    for acao, ajuda in (('finalizar', "Finalizar atividades pendentes"),
+                        ('cancelar', "Cancelar atividades pendentes"),
+                        ('excluir', "Excluir atividades")):
+        sub = acoes.add_parser(acao, parents=[comum], help=ajuda)
+        sub.add_argument('atividades', nargs='+', metavar='ATIVIDADE',
+                         help=f"IDs das atividades ou {ULTIMA_ATIVIDADE}")
+        sub.set_defaults(operacao=f'atividade_{acao}')
+
+    sub = acoes.add_parser('atribuir', parents=[comum], help="Atribuir responsável")
+    sub.add_argument('morador', help="ID ou nome do responsável")
+    sub.add_argument('atividades', nargs='+', metavar='ATIVIDADE',
+                     help=f"IDs das atividades ou {ULTIMA_ATIVIDADE}")
+    sub.set_defaults(operacao='atividade_atribuir')
+
+    sub = acoes.add_parser('listar', parents=[comum], help="Listar atividades")
+    sub.add_argument('--categoria', type=str.lower, choices=categorias)
+    sub.add_argument('--situacao', type=str.lower, choices=situacoes)
+    sub.add_argument('--responsavel', help="ID ou nome do responsável")
+    sub.add_argument('--busca', help="Texto buscado no nome, descrição e facetas")
+    sub.add_argument('-n', '--limite', type=int, help="Quantidade máxima listada")
+    sub.set_defaults(operacao='atividade_listar')
+
+    # === RELATÓRIOS, IMPORTAÇÃO E EXPORTAÇÃO ===
+    sub = comandos.add_parser('relatorio', parents=[comum], help="Gerar um relatório")
+    sub.add_argument('nome', choices=sorted(RELATORIOS_DISPONIVEIS))
+    sub.add_argument('--mes', type=inteiro_entre('mes'), help="Mês do histórico mensal (1-12)")
+    sub.add_argument('--ano', type=int, help="Ano do histórico mensal")
+    sub.add_argument('--dias', type=inteiro_entre('dias'), default=7,
+                     help=f"Dias da produtividade diária (1-{LIMITES_PARAMETROS['dias'][1]})")
+    sub.add_argument('-o', '--saida', help="Exporta para arquivo (.csv, .jsonl ou .md)")
+    sub.set_defaults(operacao='relatorio')
+
+    sub = comandos.add_parser('exportar', parents=[comum], help="Exportar dados")
+    sub.add_argument('saida', help=".json: cópia completa dos dados; .csv/.jsonl/.md: tabela")
+    sub.add_argument('--moradores', action='store_true',
+                     help="Tabela de moradores em vez de atividades")
+    sub.set_defaults(operacao='exportar')
+
+    sub = comandos.add_parser('importar', parents=[comum],
+                              help="Acrescentar moradores e atividades de outro arquivo")
+    sub.add_argument('entrada', help="Arquivo no formato de sistema_tarefas.json")
+    sub.set_defaults(operacao='importar')
+
+    sub = comandos.add_parser('lote', help="Executar comandos lidos da entrada (um por linha)")
+    sub.add_argument('entrada', nargs='?', default='-', help="Arquivo de comandos (padrão: entrada padrão)")
+    sub.add_argument('--continuar', action='store_true',
+                     help="Seguir após linhas com erro (e salvar o que deu certo)")
+    sub.add_argument('--simular', action='store_true', help="Executar sem salvar")
+    sub.set_defaults(operacao='lote')
+    return parser
+
+
+class InterfaceLinhaComando:
+    """
+    View de linha de comando do sistema.
+
+    Cada operação recebe os argumentos já interpretados, usa o
+    GerenciadorTarefas e retorna True se alterou os dados; quem chama
+    decide quando salvar (a cada comando, ou uma vez no fim do lote).
+    """
+
+    def __init__(self, gerenciador: GerenciadorTarefas, saida_json: bool = False):
+        """
+        Inicializa a interface.
+
+        Args:
+            gerenciador (GerenciadorTarefas): Controlador com os dados carregados
+            saida_json (bool): Se True, as listagens saem em JSON
+        """
+        self.gerenciador = gerenciador
+        self._saida_json = saida_json
+        self._ultima_atividade: Optional[str] = None
+        self._json_comando = False
+        # Resultados vão para a saída padrão; mensagens dos modelos e
+        # controladores são desviadas para stderr durante os comandos
+        self._saida = sys.stdout
+
+    def executar(self, args: argparse.Namespace) -> bool:
+        """
+        Executa um comando interpretado por criar_parser().
+
+        Args:
+            args (Namespace): Argumentos do comando
+
+        Returns:
+            bool: True se os dados foram alterados
+
+        Raises:
+            ErroLinhaComando: Se o comando não puder ser aplicado
+        """
+        if args.operacao == 'lote':
+            raise ErroLinhaComando("'lote' não pode ser usado dentro de um lote")
+        try:
+            self._json_comando = getattr(args, 'json', False)
+            with contextlib.redirect_stdout(sys.stderr):
+                return getattr(self, f'_{args.operacao}')(args)
+        except ValueError as e:
+            # Validações dos modelos (nome curto, caracteres inválidos...)
+            raise ErroLinhaComando(str(e))
+
+    def executar_lote(self, linhas: Iterable[str], continuar: bool = False) -> Dict[str, int]:
+        """
+        Executa vários comandos, sem salvar.
+
+        Args:
+            linhas (Iterable[str]): Um comando por linha
+            continuar (bool): Seguir após linhas com erro
+
+        Returns:
+            Dict[str, int]: Comandos executados, com erro e que alteraram dados
+
+        Raises:
+            ErroLinhaComando: Na primeira linha com erro, se continuar for False
+        """
+        parser = criar_parser()
+        resumo = {'comandos': 0, 'erros': 0, 'alteracoes': 0}
+        for numero, linha in enumerate(linhas, start=1):
+            linha = linha.strip()
+            if not linha or linha.startswith('#'):
+                continue
+            resumo['comandos'] += 1
+            try:
+                alterou = self.executar(parser.parse_args(shlex.split(linha)))
+            except (ErroLinhaComando, ValueError) as e:
+                resumo['erros'] += 1
+                mensagem = f"linha {numero}: {e}"
+                if not continuar:
+                    raise ErroLinhaComando(mensagem)
+                print(f"❌ {mensagem}", file=sys.stderr)
+                continue
+            resumo['alteracoes'] += alterou
+        return resumo
+
+    # === SAÍDA ===
+
+    def _mostrar(self, dados: Any, linhas: Iterable[str]):
+        """Imprime os dados em JSON (--json) ou as linhas de texto."""
+        if self._saida_json or self._json_comando:
+            print(json.dumps(dados, ensure_ascii=False, indent=2, default=str), file=self._saida)
+        else:
+            for linha in linhas:
+                print(linha, file=self._saida)
+
+    def _descrever_atividade(self, atividade: AtividadeDomestica) -> str:
+        """Uma linha de texto por atividade."""
+        responsavel = self.gerenciador.obter_morador_por_id(atividade.responsavel_id or '')
+        nome_responsavel = responsavel.nome if responsavel else "sem responsável"
+        return (f"{atividade.situacao.value[0]} {atividade.id_atividade}  {atividade.categoria.value}"
+                f"  {atividade.nome_tarefa}  ({nome_responsavel})")
+
+    # === REFERÊNCIAS ===
+
+    def _morador(self, referencia: str) -> Morador:
+        """Encontra um morador pelo ID ou pelo nome."""
+        residencia = self.gerenciador.residencia
+        morador = residencia.obter_morador_por_id(referencia) or residencia.obter_morador_por_nome(referencia)
+        if not morador:
+            raise ErroLinhaComando(f"Morador não encontrado: {referencia}")
+        return morador
+
+    def _atividades(self, referencias: List[str]) -> List[str]:
+        """Troca @ultima pelo ID e confere que todas as atividades existem."""
+        ids = []
+        for referencia in referencias:
+            if referencia == ULTIMA_ATIVIDADE:
+                if self._ultima_atividade is None:
+                    raise ErroLinhaComando(f"Nenhuma atividade criada antes de {ULTIMA_ATIVIDADE}")
+                referencia = self._ultima_atividade
+            if not self.gerenciador.obter_atividade_por_id(referencia):
+                raise ErroLinhaComando(f"Atividade não encontrada: {referencia}")
+            ids.append(referencia)
+        return ids
+
+    def _conferir(self, alteradas: List[str], pedidas: List[str], acao: str) -> bool:
+        """Informa o resultado de uma operação em lote do gerenciador."""
+        ignoradas = [i for i in dict.fromkeys(pedidas) if i not in alteradas]
+        if ignoradas:
+            print(f"⚠️ Não foi possível {acao}: {', '.join(ignoradas)}", file=sys.stderr)
+        print(f"✅ {len(alteradas)} atividade(s) - {acao}", file=sys.stderr)
+        return bool(alteradas)
+
+    # === MORADORES ===
+
+    def _morador_adicionar(self, args) -> bool:
+        nome = ' '.join(args.nome)
+        if not self.gerenciador.adicionar_morador(nome):
+            raise ErroLinhaComando(f"Não foi possível adicionar '{nome}' (nome inválido ou já cadastrado)")
+        morador = self.gerenciador.residencia.obter_morador_por_nome(nome)
+        self._mostrar({'id': morador.id, 'nome': morador.nome},
+                      [f"✅ Morador adicionado: {morador.nome} ({morador.id})"])
+        return True
+
+    def _morador_listar(self, args) -> bool:
+        moradores = self.gerenciador.obter_moradores()
+        if args.disponiveis:
+            moradores = [m for m in moradores if m.disponivel]
+        self._mostrar([m.to_dict() for m in moradores],
+                      [f"{'🟢' if m.disponivel else '⚪'} {m.id}  {m.nome}  {m.pontos_realizadas} pts"
+                       for m in moradores])
+        return False
+
+    def _morador_editar(self, args) -> bool:
+        if args.nome is None and args.disponivel is None:
+            raise ErroLinhaComando("Informe --nome, --disponivel ou --indisponivel")
+        morador = self._morador(args.morador)
+        self.gerenciador.editar_morador(morador.id, nome=args.nome, disponivel=args.disponivel)
+        print(f"✅ Morador atualizado: {morador.nome}", file=sys.stderr)
+        return True
+
+    def _morador_remover(self, args) -> bool:
+        morador = self._morador(args.morador)
+        self.gerenciador.remover_morador(morador.id)
+        print(f"✅ Morador removido: {morador.nome}", file=sys.stderr)
+        return True
+
+    # === ATIVIDADES ===
+
+    def _atividade_adicionar(self, args) -> bool:
+        responsavel_id = self._morador(args.responsavel).id if args.responsavel else None
+        atividade = self.gerenciador.criar_nova_atividade(
+            CategoriaAtividade[args.categoria.upper()], args.nome, args.descricao, responsavel_id)
+        if atividade is None:
+            raise ErroLinhaComando(f"Não foi possível criar a atividade '{args.nome}'")
+        self._ultima_atividade = atividade.id_atividade
+        self._mostrar(atividade.to_dict(), [f"✅ Atividade criada: {self._descrever_atividade(atividade)}"])
+        return True
+
+    def _atividade_finalizar(self, args) -> bool:
+        ids = self._atividades(args.atividades)
+        return self._conferir(self.gerenciador.finalizar_atividades(ids), ids, "finalizar")
+
+    def _atividade_cancelar(self, args) -> bool:
+        ids = self._atividades(args.atividades)
+        return self._conferir(self.gerenciador.cancelar_atividades(ids), ids, "cancelar")
+
+    def _atividade_excluir(self, args) -> bool:
+        ids = self._atividades(args.atividades)
+        return self._conferir(self.gerenciador.excluir_atividades(ids), ids, "excluir")
+
+    def _atividade_atribuir(self, args) -> bool:
+        morador = self._morador(args.morador)
+        ids = self._atividades(args.atividades)
+        return self._conferir(self.gerenciador.atribuir_responsavel_em_lote(ids, morador.id),
+                              ids, f"atribuir a {morador.nome}")
+
+    def _atividade_listar(self, args) -> bool:
+        atividades = self.gerenciador.filtrar_atividades(
+            categoria=CategoriaAtividade[args.categoria.upper()] if args.categoria else None,
+            situacao=SituacaoTarefa[args.situacao.upper()] if args.situacao else None,
+            responsavel_id=self._morador(args.responsavel).id if args.responsavel else None,
+            busca=args.busca)
+        if args.limite is not None:
+            atividades = atividades[:args.limite]
+        self._mostrar([a.to_dict() for a in atividades],
+                      [self._descrever_atividade(a) for a in atividades])
+        return False
+
+    # === RELATÓRIOS, IMPORTAÇÃO E EXPORTAÇÃO ===
+
+    def _relatorio(self, args) -> bool:
+        parametros = {
+            'historico_mes': {'mes': args.mes, 'ano': args.ano},
+            'produtividade_diaria': {'dias': args.dias}
+        }.get(args.nome, {})
+        relatorio = getattr(self.gerenciador, RELATORIOS_DISPONIVEIS[args.nome])(**parametros)
+
+        if args.saida:
+            exportador = ExportadorRelatorios.para_arquivo(args.saida)
+            total = exportador.exportar_relatorio(relatorio, args.saida, args.nome)
+            print(f"💾 {total} registro(s) salvos em: {args.saida}", file=sys.stderr)
+        else:
+            print(json.dumps(relatorio, ensure_ascii=False, indent=2, default=str), file=self._saida)
+        return False
+
+    def _exportar(self, args) -> bool:
+        if args.saida.lower().endswith('.json'):
+            if not ArmazenamentoDados(args.saida).salvar_em_json(self.gerenciador.montar_dados()):
+                raise ErroLinhaComando(f"Não foi possível exportar para {args.saida}")
+            total = self.gerenciador.contar_atividades()
+        else:
+            exportador = ExportadorRelatorios.para_arquivo(args.saida)
+            if args.moradores:
+                total = exportador.exportar_moradores(self.gerenciador.obter_moradores(), args.saida)
+            else:
+                total = exportador.exportar_atividades(self.gerenciador.consultar_atividades(), args.saida)
+        print(f"💾 {total} registro(s) exportados para: {args.saida}", file=sys.stderr)
+        return False
+
+    def _importar(self, args) -> bool:
+        if not os.path.exists(args.entrada):
+            raise ErroLinhaComando(f"Arquivo não encontrado: {args.entrada}")
+        dados = ArmazenamentoDados(args.entrada).carregar_do_json()
+        if not dados:
+            raise ErroLinhaComando(f"Não foi possível ler {args.entrada}")
+        importados = self.gerenciador.importar_dados(dados)
+        self._mostrar(importados, [f"✅ Importados: {importados['moradores']} morador(es), "
+                                   f"{importados['atividades']} atividade(s)"])
+        return any(importados.values())
+
+
+def _ler_linhas(entrada: str) -> List[str]:
+    """Lê as linhas do arquivo de comandos ('-' para a entrada padrão)."""
+    if entrada == '-':
+        return sys.stdin.read().splitlines()
+    with open(entrada, 'r', encoding='utf-8') as arquivo:
+        return arquivo.read().splitlines()
+
+
+def main(argv=None) -> int:
+    """
+    Função principal da linha de comando.
+
+    Returns:
+        int: 0 em sucesso, 1 se um comando falhou, 2 em erro de uso
+    """
+    parser = criar_parser()
+    try:
+        args = parser.parse_args(argv)
+    except ErroLinhaComando as e:
+        parser.print_usage(sys.stderr)
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    armazenamento = ArmazenamentoDados(args.arquivo, usar_cache=not args.sem_cache)
+    gerenciador = GerenciadorTarefas(Residencia("Casa Principal"), armazenamento)
+    # Mensagens do carregamento vão para stderr, para não misturar com a saída
+    with contextlib.redirect_stdout(sys.stderr):
+        if not gerenciador.carregar_dados() and os.path.exists(args.arquivo):
+            print(f"❌ Não foi possível carregar {args.arquivo}")
+            return 1
+
+    interface = InterfaceLinhaComando(gerenciador, saida_json=args.json)
+    try:
+        if args.operacao == 'lote':
+            resumo = interface.executar_lote(_ler_linhas(args.entrada), continuar=args.continuar)
+            alterou = resumo['alteracoes'] > 0 and not args.simular
+            print(f"📋 {resumo['comandos']} comando(s), {resumo['erros']} erro(s), "
+                  f"{resumo['alteracoes']} alteração(ões)", file=sys.stderr)
+        else:
+            resumo = None
+            alterou = interface.executar(args)
+    except ErroLinhaComando as e:
+        print(f"❌ {e}", file=sys.stderr)
+        if args.operacao == 'lote':
+            print("🛑 Nada foi salvo.", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if alterou:
+        with contextlib.redirect_stdout(sys.stderr):
+            if not gerenciador.salvar_dados():
+                return 1
+        print(f"💾 Dados salvos em: {args.arquivo}", file=sys.stderr)
+    return 1 if resumo and resumo['erros'] else 0
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe ListaVirtual
+===================
+
+Rolagem virtual para ttk.Treeview: só as linhas que cabem na área visível
+ficam na Treeview. A posição da barra de rolagem vira um deslocamento
+(offset) na consulta do controller, e as linhas são buscadas sob demanda.
+"""
+
+from tkinter import ttk
+from typing import Callable, Iterable, List
+
+from .reconciliador_treeview import ReconciliadorTreeview, Linha
+
+# Linhas roladas por "clique" da roda do mouse
+LINHAS_POR_RODA = 3
+
+# Modificadores em event.state
+MASCARA_SHIFT = 0x0001
+MASCARA_CONTROL = 0x0004
+
+
+class ListaVirtual:
+    """
+    Controla uma Treeview que mostra apenas uma janela dos dados.
+
+    A Treeview nunca guarda mais linhas do que as visíveis, então memória
+    e tempo de atualização não dependem do total de registros. A rolagem
+    (barra, roda do mouse e teclado) é tratada aqui, e a renderização da
+    janela usa ReconciliadorTreeview.
+
+    Attributes:
+        _tree (ttk.Treeview): Treeview controlada
+        _scrollbar (ttk.Scrollbar): Barra de rolagem vertical
+        _contar (Callable): Retorna o total de registros
+        _buscar (Callable): Retorna as linhas (iid, valores, tags) de uma janela
+        _inicio (int): Posição do primeiro registro visível
+        _selecionados (set): iids selecionados, inclusive fora da janela
+    """
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar,
+                 contar: Callable[[], int],
+                 buscar: Callable[[int, int], Iterable[Linha]],
+                 linhas_visiveis: int = 15):
+        """
+        Inicializa a lista virtual.
+
+        Args:
+            tree (ttk.Treeview): Treeview sem yscrollcommand próprio
+            scrollbar (ttk.Scrollbar): Barra vertical associada
+            contar (Callable): Função que retorna o total de registros
+            buscar (Callable): Função (inicio, limite) -> linhas da janela
+            linhas_visiveis (int): Linhas visíveis até o primeiro redimensionamento
+        """
+        self._tree = tree
+        self._scrollbar = scrollbar
+        self._contar = contar
+        self._buscar = buscar
+        self._reconciliador = ReconciliadorTreeview(tree)
+        self._linhas_visiveis = max(1, linhas_visiveis)
+        self._inicio = 0
+        self._total = 0
+        self._selecionados = set()
+
+        scrollbar.configure(command=self.rolar)
+        tree.bind('<Configure>', self._ao_redimensionar, add='+')
+        tree.bind('<<TreeviewSelect>>', self._ao_selecionar, add='+')
+        tree.bind('<Button-1>', self._ao_clicar, add='+')
+        tree.bind('<MouseWheel>', self._ao_girar_roda)
+        tree.bind('<Button-4>', lambda e: self._rolar_linhas(-LINHAS_POR_RODA))
+        tree.bind('<Button-5>', lambda e: self._rolar_linhas(LINHAS_POR_RODA))
+        tree.bind('<Up>', lambda e: self._mover_foco(-1))
+        tree.bind('<Down>', lambda e: self._mover_foco(1))
+        tree.bind('<Prior>', lambda e: self._rolar_linhas(-self._linhas_visiveis))
+        tree.bind('<Next>', lambda e: self._rolar_linhas(self._linhas_visiveis))
+        tree.bind('<Home>', lambda e: self._ir_para(0))
+        tree.bind('<End>', lambda e: self._ir_para(self._total))
+
+    @property
+    def inicio(self) -> int:
+        """Retorna a posição do primeiro registro visível."""
+        return self._inicio
+
+    @property
+    def total(self) -> int:
+        """Retorna o total de registros na última atualização."""
+        return self._total
+
+    def selecao(self) -> List[str]:
+        """Retorna os iids selecionados, inclusive os que rolaram para fora."""
+        visiveis = list(self._tree.selection())
+        fora = [iid for iid in self._selecionados if iid not in self._reconciliador]
+        return visiveis + fora
+
+    def selecionar(self, iids: Iterable[str]):
+        """
+        Seleciona registros, inclusive os que estão fora da janela.
+
+        Args:
+            iids (Iterable[str]): Registros a selecionar
+        """
+        self._selecionados = set(iids)
+        visiveis = tuple(iid for iid in self._reconciliador.iids if iid in self._selecionados)
+        self._tree.selection_set(visiveis)
+
+    def limpar_selecao(self):
+        """Desfaz a seleção, inclusive das linhas fora da janela."""
+        self._selecionados.clear()
+        if self._tree.selection():
+            self._tree.selection_set(())
+
+    def atualizar(self):
+        """
+        Busca a janela atual de novo e aplica as diferenças na Treeview.
+
+        Returns:
+            Dict[str, int]: Estatísticas do ReconciliadorTreeview
+        """
+        self._total = self._contar()
+        maximo = max(0, self._total - self._linhas_visiveis)
+        self._inicio = min(max(0, self._inicio), maximo)
+
+        linhas = list(self._buscar(self._inicio, self._linhas_visiveis))
+        alteracoes = self._reconciliador.reconciliar(linhas)
+
+        # Restaurar a seleção das linhas que voltaram para a janela
+        selecionados = tuple(iid for iid, _, _ in linhas if iid in self._selecionados)
+        if selecionados != self._tree.selection():
+            self._tree.selection_set(selecionados)
+
+        self._atualizar_scrollbar()
+        return alteracoes
+
+    def ir_para(self, inicio: int):
+        """
+        Rola até uma posição e atualiza a janela.
+
+        Args:
+            inicio (int): Posição do primeiro registro visível (limitada ao total)
+        """
+        self._ir_para(inicio)
+
+    def rolar(self, *args):
+        """
+        Comando da barra de rolagem ('moveto' ou 'scroll').
+
+        Args:
+            *args: Argumentos no formato do protocolo yview do Tk
+        """
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._ir_para(int(float(args[1]) * self._total))
+        elif args[0] == 'scroll':
+            passo = self._linhas_visiveis if args[2] == 'pages' else 1
+            self._rolar_linhas(int(args[1]) * passo)
+
+    def _ir_para(self, inicio: int) -> str:
+        """Rola até a posição informada (limitada ao total)."""
+        self._inicio = inicio
+        self.atualizar()
+        return 'break'
+
+    def _rolar_linhas(self, quantidade: int) -> str:
+        """Rola a janela 'quantidade' linhas (negativo para cima)."""
+        return self._ir_para(self._inicio + quantidade)
+
+    def _atualizar_scrollbar(self):
+        """Ajusta a barra de rolagem à janela atual."""
+        if self._total <= 0:
+            self._scrollbar.set(0.0, 1.0)
+            return
+        primeiro = self._inicio / self._total
+        ultimo = min(1.0, (self._inicio + self._linhas_visiveis) / self._total)
+        self._scrollbar.set(primeiro, ultimo)
+
+    def _ao_redimensionar(self, event):
+        """Recalcula quantas linhas cabem na Treeview."""
+        altura_linha = self._altura_linha()
+        filhos = self._reconciliador.iids
+        caixa = self._tree.bbox(filhos[0]) if filhos else None
+        cabecalho = caixa[1] if caixa else altura_linha
+
+        linhas = max(1, (event.height - cabecalho) // altura_linha)
+        if linhas != self._linhas_visiveis:
+            self._linhas_visiveis = linhas
+            self.atualizar()
+
+    def _altura_linha(self) -> int:
+        """Retorna a altura de linha configurada no estilo da Treeview."""
+        estilo = self._tree.cget('style') or 'Treeview'
+        try:
+            return max(1, int(ttk.Style().lookup(estilo, 'rowheight') or 20))
+        except (ValueError, TypeError):
+            return 20
+
+    def _ao_selecionar(self, event=None):
+        """Guarda a seleção visível junto com a que está fora da janela."""
+        visiveis = set(self._tree.selection())
+        fora = {iid for iid in self._selecionados if iid not in self._reconciliador}
+        self._selecionados = fora | visiveis
+
+    def _ao_clicar(self, event):
+        """Clique sem Shift/Ctrl descarta a seleção que está fora da janela."""
+        if not event.state & (MASCARA_SHIFT | MASCARA_CONTROL):
+            self._selecionados &= set(self._reconciliador.iids)
+
+    def _ao_girar_roda(self, event) -> str:
+        """Rolagem pela roda do mouse (Windows e macOS)."""
+        if event.delta:
+            self._rolar_linhas(-LINHAS_POR_RODA if event.delta > 0 else LINHAS_POR_RODA)
+        return 'break'
+
+    def _mover_foco(self, passo: int):
+        """
+        Move o foco com as setas, rolando a janela ao passar das bordas.
+
+        Dentro da janela o comportamento padrão da Treeview é mantido.
+        """
+        filhos = self._reconciliador.iids
+        if not filhos:
+            return 'break'
+
+        foco = self._tree.focus()
+        indice = filhos.index(foco) if foco in self._reconciliador else 0
+        if 0 <= indice + passo < len(filhos):
+            return None
+
+        inicio_anterior = self._inicio
+        self._rolar_linhas(passo)
+        if self._inicio == inicio_anterior:
+            return 'break'
+
+        filhos = self._reconciliador.iids
+        novo = filhos[0] if passo < 0 else filhos[-1]
+        self._selecionados = {novo}
+        self._tree.selection_set((novo,))
+        self._tree.focus(novo)
+        return 'break'
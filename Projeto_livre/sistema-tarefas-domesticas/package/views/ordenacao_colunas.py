@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe OrdenacaoColunas
+=======================
+
+Ordem de exibição de uma Treeview ordenada por coluna. As chaves de
+ordenação são calculadas uma vez por linha e guardadas até a linha mudar;
+uma linha alterada depois da ordenação é reposicionada com bisect, sem
+reordenar a lista inteira.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class OrdenacaoColunas:
+    """
+    Mantém os iids de uma lista ordenados pela coluna escolhida.
+
+    A lista interna fica sempre em ordem crescente de (chave, iid); a ordem
+    decrescente é só uma leitura de trás para frente, então inverter a
+    direção não reordena nada. O iid desempata chaves iguais, o que torna
+    a posição de cada linha única e localizável por bisect.
+
+    Attributes:
+        _chave (Callable): Calcula a chave de (coluna, iid)
+        _cache (Dict[str, Dict[str, Any]]): Coluna -> iid -> chave calculada
+        _entradas (List[Tuple[Any, str]]): (chave, iid) em ordem crescente
+        _coluna (str): Coluna da ordenação ativa (ou None)
+        _decrescente (bool): Direção da ordenação ativa
+        _versao (int): Incrementada a cada mudança na ordem
+    """
+
+    def __init__(self, chave: Callable[[str, str], Any]):
+        """
+        Inicializa sem ordenação ativa.
+
+        Args:
+            chave (Callable): Função (coluna, iid) -> chave comparável
+        """
+        self._chave = chave
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._entradas: List[Tuple[Any, str]] = []
+        self._coluna: Optional[str] = None
+        self._decrescente = False
+        self._versao = 0
+
+    @property
+    def coluna(self) -> Optional[str]:
+        """Retorna a coluna ordenada (None se não houver ordenação)."""
+        return self._coluna
+
+    @property
+    def decrescente(self) -> bool:
+        """Verifica se a ordenação é decrescente."""
+        return self._decrescente
+
+    @property
+    def ativa(self) -> bool:
+        """Verifica se há uma ordenação ativa."""
+        return self._coluna is not None
+
+    @property
+    def versao(self) -> int:
+        """Retorna um número que muda sempre que a ordem muda."""
+        return self._versao
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de linhas ordenadas."""
+        return len(self._entradas)
+
+    def ordenar(self, coluna: str, decrescente: bool, iids: Iterable[str]):
+        """
+        Ordena as linhas por uma coluna (chaves já calculadas são reaproveitadas).
+
+        Args:
+            coluna (str): Coluna da ordenação
+            decrescente (bool): Direção
+            iids (Iterable[str]): Todas as linhas da lista
+        """
+        chaves = self._cache.setdefault(coluna, {})
+        entradas = []
+        for iid in iids:
+            chave = chaves.get(iid)
+            if chave is None:
+                chave = chaves[iid] = self._chave(coluna, iid)
+            entradas.append((chave, iid))
+        entradas.sort()
+
+        self._entradas = entradas
+        self._coluna = coluna
+        self._decrescente = decrescente
+        self._versao += 1
+
+    def inverter(self):
+        """Inverte a direção da ordenação ativa, sem reordenar."""
+        self._decrescente = not self._decrescente
+        self._versao += 1
+
+    def limpar(self):
+        """Desfaz a ordenação (as chaves em cache são mantidas)."""
+        self._entradas = []
+        self._coluna = None
+        self._versao += 1
+
+    def adicionar(self, iid: str):
+        """
+        Insere uma linha nova na posição certa.
+
+        Args:
+            iid (str): Linha adicionada
+        """
+        if self._coluna is None:
+            return
+        insort(self._entradas, (self._obter_chave(iid), iid))
+        self._versao += 1
+
+    def remover(self, iid: str):
+        """
+        Retira uma linha da ordem e descarta suas chaves.
+
+        Args:
+            iid (str): Linha removida
+        """
+        self._retirar(iid)
+        for chaves in self._cache.values():
+            chaves.pop(iid, None)
+
+    def invalidar(self, *iids: str):
+        """
+        Descarta as chaves das linhas alteradas e as reposiciona com bisect.
+
+        Args:
+            *iids (str): Linhas que mudaram
+        """
+        for iid in iids:
+            estava_ordenada = self._retirar(iid)
+            for chaves in self._cache.values():
+                chaves.pop(iid, None)
+            if estava_ordenada:
+                insort(self._entradas, (self._obter_chave(iid), iid))
+
+    def invalidar_coluna(self, coluna: str):
+        """
+        Descarta as chaves de uma coluna inteira (ex.: nomes de responsáveis).
+
+        Se ela for a coluna ordenada, a lista é reordenada.
+
+        Args:
+            coluna (str): Coluna cujas chaves mudaram
+        """
+        self._cache.pop(coluna, None)
+        if coluna == self._coluna:
+            self.ordenar(coluna, self._decrescente, [iid for _, iid in self._entradas])
+
+    def janela(self, inicio: int, limite: int) -> List[str]:
+        """
+        Retorna os iids de uma faixa da ordem de exibição.
+
+        Args:
+            inicio (int): Posição inicial na ordem exibida
+            limite (int): Quantidade máxima
+
+        Returns:
+            List[str]: iids na ordem exibida
+        """
+        inicio = max(0, inicio)
+        limite = max(0, limite)
+        if not self._decrescente:
+            return [iid for _, iid in self._entradas[inicio:inicio + limite]]
+
+        total = len(self._entradas)
+        fim = max(0, total - inicio)
+        comeco = max(0, fim - limite)
+        return [iid for _, iid in reversed(self._entradas[comeco:fim])]
+
+    def filtrar(self, iids: Iterable[str]) -> List[str]:
+        """
+        Coloca um subconjunto das linhas (ex.: resultado de busca) na ordem exibida.
+
+        Args:
+            iids (Iterable[str]): Linhas já ordenadas por esta instância
+
+        Returns:
+            List[str]: Os mesmos iids, na ordem exibida
+        """
+        conjunto = set(iids)
+        if len(conjunto) * 8 > len(self._entradas):
+            ordenados = [iid for _, iid in self._entradas if iid in conjunto]
+        else:
+            ordenados = sorted(conjunto, key=lambda iid: (self._obter_chave(iid), iid))
+        if self._decrescente:
+            ordenados.reverse()
+        return ordenados
+
+    def _obter_chave(self, iid: str) -> Any:
+        """Retorna a chave da linha na coluna ativa, calculando se preciso."""
+        chaves = self._cache.setdefault(self._coluna, {})
+        chave = chaves.get(iid)
+        if chave is None:
+            chave = chaves[iid] = self._chave(self._coluna, iid)
+        return chave
+
+    def _retirar(self, iid: str) -> bool:
+        """Tira a linha da ordem ativa usando a chave em cache para achá-la."""
+        if self._coluna is None:
+            return False
+        chave = self._cache.get(self._coluna, {}).get(iid)
+        if chave is None:
+            return False
+        posicao = bisect_left(self._entradas, (chave, iid))
+        if posicao < len(self._entradas) and self._entradas[posicao] == (chave, iid):
+            del self._entradas[posicao]
+            self._versao += 1
+            return True
+        return False
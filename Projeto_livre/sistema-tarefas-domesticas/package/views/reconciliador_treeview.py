@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classe ReconciliadorTreeview
+============================
+
+Atualiza um ttk.Treeview por diferença: cada linha é identificada pelo ID
+completo da entidade (iid) e só as linhas que mudaram desde a última
+renderização recebem chamadas ao Tk.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Linha da Treeview: (iid, valores, tags)
+Linha = Tuple[str, tuple, tuple]
+
+
+class ReconciliadorTreeview:
+    """
+    Mantém uma cópia do que está renderizado na Treeview e aplica diffs.
+
+    A cada reconciliação:
+    - Linhas que sumiram são removidas em uma única chamada
+    - Linhas com valores ou tags diferentes são atualizadas no lugar
+    - Linhas fora de ordem são movidas (apenas o mínimo necessário)
+    - Linhas novas são inseridas na posição certa
+
+    Attributes:
+        _tree (ttk.Treeview): Treeview controlada
+        _linhas (Dict[str, Tuple]): (valores, tags) renderizados por iid
+        _ordem (List[str]): iids na ordem exibida
+    """
+
+    def __init__(self, tree):
+        """
+        Inicializa o reconciliador.
+
+        Args:
+            tree (ttk.Treeview): Treeview (sem linhas inseridas por fora)
+        """
+        self._tree = tree
+        self._linhas = {}
+        self._ordem = []
+
+    @property
+    def iids(self) -> List[str]:
+        """Retorna os iids na ordem exibida."""
+        return self._ordem.copy()
+
+    def __contains__(self, iid: str) -> bool:
+        """Verifica se uma linha está renderizada."""
+        return iid in self._linhas
+
+    def __len__(self) -> int:
+        """Retorna o número de linhas renderizadas."""
+        return len(self._ordem)
+
+    def reconciliar(self, linhas: Iterable[Linha]) -> Dict[str, int]:
+        """
+        Deixa a Treeview igual à lista de linhas informada.
+
+        Args:
+            linhas (Iterable[Linha]): (iid, valores, tags) na ordem desejada
+
+        Returns:
+            Dict[str, int]: Quantas linhas foram inseridas, atualizadas,
+            movidas e removidas
+        """
+        novas = [(iid, tuple(valores), tuple(tags)) for iid, valores, tags in linhas]
+        novos_iids = [iid for iid, _, _ in novas]
+        conjunto_novo = set(novos_iids)
+        estatisticas = {'inseridas': 0, 'atualizadas': 0, 'movidas': 0, 'removidas': 0}
+
+        # 1. Remover linhas que não existem mais (uma única chamada ao Tk)
+        removidos = [iid for iid in self._ordem if iid not in conjunto_novo]
+        if removidos:
+            self._tree.delete(*removidos)
+            for iid in removidos:
+                del self._linhas[iid]
+            estatisticas['removidas'] = len(removidos)
+
+        # 2. Atualizar no lugar as linhas cujo conteúdo mudou
+        for iid, valores, tags in novas:
+            atual = self._linhas.get(iid)
+            if atual is not None and atual != (valores, tags):
+                self._tree.item(iid, values=valores, tags=tags)
+                estatisticas['atualizadas'] += 1
+
+        # 3. Reordenar as linhas mantidas, se a ordem relativa mudou
+        mantidos_antes = [iid for iid in self._ordem if iid in conjunto_novo]
+        mantidos_depois = [iid for iid in novos_iids if iid in self._linhas]
+        if mantidos_antes != mantidos_depois:
+            estatisticas['movidas'] = self._reordenar(mantidos_antes, mantidos_depois)
+
+        # 4. Inserir linhas novas já na posição final
+        for indice, (iid, valores, tags) in enumerate(novas):
+            if iid not in self._linhas:
+                self._tree.insert('', indice, iid=iid, values=valores, tags=tags)
+                estatisticas['inseridas'] += 1
+
+        self._linhas = {iid: (valores, tags) for iid, valores, tags in novas}
+        self._ordem = novos_iids
+        return estatisticas
+
+    def limpar(self):
+        """Remove todas as linhas renderizadas."""
+        if self._ordem:
+            self._tree.delete(*self._ordem)
+        self._linhas = {}
+        self._ordem = []
+
+    def _reordenar(self, antes: List[str], depois: List[str]) -> int:
+        """
+        Move o mínimo de linhas para que 'antes' vire 'depois'.
+
+        Mantém parada a maior subsequência que já está em ordem e move
+        cada uma das outras para logo depois da linha que a antecede. A
+        linha é desanexada antes do move, para que o índice da anterior
+        não dependa de a linha movida estar acima ou abaixo dela.
+
+        Returns:
+            int: Número de linhas movidas
+        """
+        posicao_antes = {iid: i for i, iid in enumerate(antes)}
+        fixos = _maior_subsequencia_crescente([posicao_antes[iid] for iid in depois])
+
+        movidas = 0
+        for i, iid in enumerate(depois):
+            if i in fixos:
+                continue
+            self._tree.detach(iid)
+            destino = self._tree.index(depois[i - 1]) + 1 if i > 0 else 0
+            self._tree.move(iid, '', destino)
+            movidas += 1
+        return movidas
+
+
+def _maior_subsequencia_crescente(valores: Sequence[int]) -> set:
+    """
+    Retorna os índices de uma maior subsequência crescente (O(n log n)).
+
+    Args:
+        valores (Sequence[int]): Valores distintos
+
+    Returns:
+        set: Índices de 'valores' que pertencem à subsequência
+    """
+    finais = []            # menor valor final de cada comprimento
+    indices_finais = []    # índice em 'valores' desse final
+    anterior = [-1] * len(valores)
+
+    for i, valor in enumerate(valores):
+        comprimento = bisect_left(finais, valor)
+        if comprimento > 0:
+            anterior[i] = indices_finais[comprimento - 1]
+        if comprimento == len(finais):
+            finais.append(valor)
+            indices_finais.append(i)
+        else:
+            finais[comprimento] = valor
+            indices_finais[comprimento] = i
+
+    resultado = set()
+    i = indices_finais[-1] if indices_finais else -1
+    while i != -1:
+        resultado.add(i)
+        i = anterior[i]
+    return resultado
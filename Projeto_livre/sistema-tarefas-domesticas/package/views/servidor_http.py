@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor HTTP (API JSON)
+========================
+
+View que expõe o GerenciadorTarefas como uma API REST em JSON, para que
+vários moradores usem o sistema ao mesmo tempo (ex.: pelo celular, na
+rede local). Só usa a biblioteca padrão (http.server) e não importa o
+tkinter.
+
+- Conexões persistentes (HTTP/1.1 com Content-Length em toda resposta)
+- ETag a partir da versão dos dados; GET com If-None-Match igual recebe
+  304 sem que a consulta seja refeita. Relatórios não têm ETag: dependem
+  também da data atual (últimos N dias, mês corrente)
+- Uma única trava na frente do gerenciador: ele não é seguro para
+  threads, e até as buscas alteram o cache do índice
+- O arquivo JSON pertence ao servidor: as alterações são agrupadas e
+  gravadas em segundo plano a cada poucos segundos, e uma última vez
+  ao encerrar
+
+Rotas:
+    GET    /api/resumo
+    GET    /api/moradores                      POST /api/moradores {"nome"}
+    GET    /api/moradores/<id>                 PATCH /api/moradores/<id> {"nome", "disponivel"}
+    DELETE /api/moradores/<id>
+    GET    /api/atividades?categoria=&situacao=&responsavel=&busca=&inicio=&limite=
+    POST   /api/atividades {"categoria", "nome", "descricao", "responsavel_id"}
+    GET    /api/atividades/<id>                DELETE /api/atividades/<id>
+    POST   /api/atividades/<id>/finalizar      POST /api/atividades/<id>/cancelar
+    POST   /api/atividades/<id>/atribuir {"morador_id"}
+    GET    /api/relatorios                     GET /api/relatorios/<nome>?mes=&ano=&dias=&limite=
+"""
+
+import json
+import re
+import threading
+import traceback
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from ..controllers.gerenciador_tarefas import GerenciadorTarefas
+from ..controllers.relatorios_paralelos import LIMITES_PARAMETROS, RELATORIOS_DISPONIVEIS
+from ..models.enums import CategoriaAtividade, SituacaoTarefa
+
+# Maior corpo de requisição aceito (bytes)
+LIMITE_CORPO = 1 << 20
+
+# Segundos que uma conexão persistente pode ficar ociosa
+TEMPO_OCIOSO = 30
+
+
+class ErroApi(Exception):
+    """Erro com o status HTTP a devolver ao cliente."""
+
+    def __init__(self, status: int, mensagem: str):
+        """
+        Args:
+            status (int): Status HTTP (ex.: 404)
+            mensagem (str): Mensagem devolvida em {"erro": ...}
+        """
+        super().__init__(mensagem)
+        self.status = status
+        self.mensagem = mensagem
+
+
+def _inteiro(consulta: Dict[str, List[str]], nome: str, padrao: Optional[int] = None) -> Optional[int]:
+    """Lê um parâmetro inteiro da query string."""
+    valores = consulta.get(nome)
+    if not valores:
+        return padrao
+    try:
+        return int(valores[0])
+    except ValueError:
+        raise ErroApi(400, f"Parâmetro '{nome}' deve ser inteiro")
+
+
+def _inteiro_na_faixa(consulta: Dict[str, List[str]], nome: str,
+                      padrao: Optional[int] = None) -> Optional[int]:
+    """Lê um parâmetro inteiro e confere a faixa de LIMITES_PARAMETROS[nome]."""
+    valor = _inteiro(consulta, nome, padrao)
+    minimo, maximo = LIMITES_PARAMETROS[nome]
+    if valor is not None and not minimo <= valor <= maximo:
+        raise ErroApi(400, f"Parâmetro '{nome}' deve estar entre {minimo} e {maximo}")
+    return valor
+
+
+def _enum(tipo, valor: Optional[str], nome: str):
+    """Converte o nome de um membro (ex.: 'cozinha') no enum."""
+    if valor is None:
+        return None
+    try:
+        return tipo[str(valor).upper()]
+    except KeyError:
+        opcoes = ', '.join(membro.name.lower() for membro in tipo)
+        raise ErroApi(400, f"'{nome}' inválido: {valor} (use: {opcoes})")
+
+
+class ApiTarefas:
+    """
+    Operações da API sobre o GerenciadorTarefas, sem nada de HTTP.
+
+    Toda chamada ao gerenciador acontece com a trava adquirida; os
+    resultados saem como dicionários novos, que podem ser serializados
+    depois de soltar a trava.
+    """
+
+    def __init__(self, gerenciador: GerenciadorTarefas, intervalo_salvamento: float = 2.0):
+        """
+        Inicializa a API.
+
+        Args:
+            gerenciador (GerenciadorTarefas): Controlador com os dados carregados
+            intervalo_salvamento (float): Segundos em que as alterações são
+                agrupadas antes de gravar o arquivo
+        """
+        self.gerenciador = gerenciador
+        self._trava = threading.Lock()
+        # Muda a cada execução, para que um ETag antigo nunca valha após reiniciar
+        self._instancia = uuid.uuid4().hex[:8]
+
+        self._intervalo_salvamento = intervalo_salvamento
+        self._alterado = threading.Event()
+        self._parar = threading.Event()
+        self._versao_inicial = gerenciador.versao
+        self._salvador: Optional[threading.Thread] = None
+
+        self._rotas: List[Tuple[str, 're.Pattern', Callable]] = [
+            (metodo, re.compile(f'^{padrao}$'), funcao) for metodo, padrao, funcao in (
+                ('GET', r'/api/resumo', self._resumo),
+                ('GET', r'/api/moradores', self._listar_moradores),
+                ('POST', r'/api/moradores', self._criar_morador),
+                ('GET', r'/api/moradores/([\w-]+)', self._obter_morador),
+                ('PATCH', r'/api/moradores/([\w-]+)', self._editar_morador),
+                ('DELETE', r'/api/moradores/([\w-]+)', self._remover_morador),
+                ('GET', r'/api/atividades', self._listar_atividades),
+                ('POST', r'/api/atividades', self._criar_atividade),
+                ('GET', r'/api/atividades/([\w-]+)', self._obter_atividade),
+                ('DELETE', r'/api/atividades/([\w-]+)', self._excluir_atividade),
+                ('POST', r'/api/atividades/([\w-]+)/finalizar', self._finalizar_atividade),
+                ('POST', r'/api/atividades/([\w-]+)/cancelar', self._cancelar_atividade),
+                ('POST', r'/api/atividades/([\w-]+)/atribuir', self._atribuir_atividade),
+                ('GET', r'/api/relatorios', self._listar_relatorios),
+                ('GET', r'/api/relatorios/(\w+)', self._relatorio),
+            )
+        ]
+        # Rotas cujo resultado muda com o relógio, sem mudar a versão dos dados
+        self._sem_etag = {self._relatorio}
+
+    # === ETAG E DESPACHO ===
+
+    def etag(self) -> str:
+        """ETag fraco da versão atual dos dados (vale para qualquer recurso, exceto relatórios)."""
+        return f'W/"{self._instancia}-{self.gerenciador.versao}"'
+
+    @staticmethod
+    def _etag_corresponde(if_none_match: Optional[str], etag: str) -> bool:
+        """Comparação fraca de If-None-Match com o ETag atual."""
+        if not if_none_match:
+            return False
+        def opaca(etiqueta: str) -> str:
+            return etiqueta[2:] if etiqueta.startswith('W/') else etiqueta
+
+        etiquetas = [e.strip() for e in if_none_match.split(',')]
+        return '*' in etiquetas or opaca(etag) in (opaca(e) for e in etiquetas)
+
+    def tratar(self, metodo: str, caminho: str, consulta: Dict[str, List[str]],
+               corpo: Optional[Dict[str, Any]],
+               if_none_match: Optional[str] = None) -> Tuple[int, Any, Optional[str]]:
+        """
+        Executa uma requisição.
+
+        Args:
+            metodo (str): Método HTTP
+            caminho (str): Caminho da URL (sem a query string)
+            consulta (Dict): Query string já interpretada
+            corpo (Dict): Corpo JSON (None se vazio)
+            if_none_match (str): Cabeçalho If-None-Match (só em GET)
+
+        Returns:
+            Tuple[int, Any, Optional[str]]: Status, resultado serializável
+            (None em 304) e ETag (None nas rotas de relatório)
+
+        Raises:
+            ErroApi: Rota inexistente, dados inválidos ou conflito
+        """
+        metodos_do_caminho = []
+        for metodo_rota, padrao, funcao in self._rotas:
+            correspondencia = padrao.match(caminho.rstrip('/') or '/')
+            if not correspondencia:
+                continue
+            if metodo_rota != metodo:
+                metodos_do_caminho.append(metodo_rota)
+                continue
+
+            condicional = funcao not in self._sem_etag
+            with self._trava:
+                etag = self.etag()
+                if metodo == 'GET' and condicional and self._etag_corresponde(if_none_match, etag):
+                    return 304, None, etag
+
+                versao = self.gerenciador.versao
+                try:
+                    status, resultado = funcao(consulta, corpo or {}, *correspondencia.groups())
+                except ValueError as e:
+                    # Validações dos modelos (nome curto, caracteres inválidos...)
+                    raise ErroApi(400, str(e))
+                if self.gerenciador.versao != versao:
+                    self._alterado.set()
+                return status, resultado, self.etag() if condicional else None
+
+        if metodos_do_caminho:
+            raise ErroApi(405, f"Método {metodo} não permitido (use: {', '.join(metodos_do_caminho)})")
+        raise ErroApi(404, f"Rota não encontrada: {caminho}")
+
+    # === SALVAMENTO ===
+
+    def iniciar_salvamento(self):
+        """Inicia a thread que grava as alterações agrupadas."""
+        if self._salvador is None:
+            self._salvador = threading.Thread(target=self._salvar_periodicamente,
+                                              name='salvamento-api', daemon=True)
+            self._salvador.start()
+
+    def _salvar_periodicamente(self):
+        """Espera alterações, agrupa as que chegarem no intervalo e grava."""
+        while not self._parar.is_set():
+            self._alterado.wait(timeout=1.0)
+            if not self._alterado.is_set():
+                continue
+            self._parar.wait(self._intervalo_salvamento)
+            self._alterado.clear()
+
+            # Cópia montada com a trava; a gravação em disco acontece sem ela
+            with self._trava:
+                dados = self.gerenciador.montar_dados()
+            self.gerenciador.gravar_dados(dados)
+
+    def encerrar(self):
+        """
+        Para a thread de salvamento e salva uma última vez.
+
+        Se algo mudou desde o início, usa salvar_dados() mesmo que a thread
+        já tenha gravado tudo: as gravações em segundo plano não atualizam o
+        cache de inicialização.
+        """
+        self._parar.set()
+        if self._salvador is not None:
+            self._salvador.join()
+            self._salvador = None
+        with self._trava:
+            if self.gerenciador.versao != self._versao_inicial:
+                if self.gerenciador.salvar_dados():
+                    self._versao_inicial = self.gerenciador.versao
+
+    # === RECURSOS ===
+
+    def _resumo(self, consulta, corpo):
+        return 200, {'residencia': self.gerenciador.residencia.nome_casa,
+                     'versao': self.gerenciador.versao,
+                     **self.gerenciador.obter_resumo_sistema()}
+
+    def _morador_existente(self, morador_id: str):
+        morador = self.gerenciador.obter_morador_por_id(morador_id)
+        if not morador:
+            raise ErroApi(404, f"Morador não encontrado: {morador_id}")
+        return morador
+
+    def _atividade_existente(self, atividade_id: str):
+        atividade = self.gerenciador.obter_atividade_por_id(atividade_id)
+        if not atividade:
+            raise ErroApi(404, f"Atividade não encontrada: {atividade_id}")
+        return atividade
+
+    def _listar_moradores(self, consulta, corpo):
+        return 200, [m.to_dict() for m in self.gerenciador.obter_moradores()]
+
+    def _criar_morador(self, consulta, corpo):
+        nome = str(corpo.get('nome', '')).strip()
+        if self.gerenciador.residencia.obter_morador_por_nome(nome):
+            raise ErroApi(409, f"Já existe um morador chamado {nome}")
+        if not self.gerenciador.adicionar_morador(nome):
+            raise ErroApi(400, f"Nome inválido: '{nome}'")
+        return 201, self.gerenciador.residencia.obter_morador_por_nome(nome).to_dict()
+
+    def _obter_morador(self, consulta, corpo, morador_id):
+        return 200, self._morador_existente(morador_id).to_dict()
+
+    def _editar_morador(self, consulta, corpo, morador_id):
+        self._morador_existente(morador_id)
+        nome = corpo.get('nome')
+        if nome is not None:
+            homonimo = self.gerenciador.residencia.obter_morador_por_nome(str(nome))
+            if homonimo and homonimo.id != morador_id:
+                raise ErroApi(409, f"Já existe um morador chamado {homonimo.nome}")
+        disponivel = corpo.get('disponivel')
+        if disponivel is not None and not isinstance(disponivel, bool):
+            raise ErroApi(400, "'disponivel' deve ser true ou false")
+        self.gerenciador.editar_morador(morador_id, nome=nome, disponivel=disponivel)
+        return 200, self._morador_existente(morador_id).to_dict()
+
+    def _remover_morador(self, consulta, corpo, morador_id):
+        self._morador_existente(morador_id)
+        self.gerenciador.remover_morador(morador_id)
+        return 200, {'removido': morador_id}
+
+    def _listar_atividades(self, consulta, corpo):
+        primeiro = lambda nome: (consulta.get(nome) or [None])[0]
+        responsavel_id = primeiro('responsavel')
+        if responsavel_id:
+            self._morador_existente(responsavel_id)
+        atividades = self.gerenciador.filtrar_atividades(
+            categoria=_enum(CategoriaAtividade, primeiro('categoria'), 'categoria'),
+            situacao=_enum(SituacaoTarefa, primeiro('situacao'), 'situacao'),
+            responsavel_id=responsavel_id,
+            busca=primeiro('busca'))
+        inicio = max(0, _inteiro(consulta, 'inicio', 0))
+        limite = _inteiro(consulta, 'limite')
+        janela = atividades[inicio:None if limite is None else inicio + max(0, limite)]
+        return 200, {'total': len(atividades), 'inicio': inicio,
+                     'atividades': [a.to_dict() for a in janela]}
+
+    def _criar_atividade(self, consulta, corpo):
+        categoria = _enum(CategoriaAtividade, corpo.get('categoria'), 'categoria')
+        if categoria is None:
+            raise ErroApi(400, "Informe a 'categoria'")
+        responsavel_id = corpo.get('responsavel_id')
+        if responsavel_id:
+            self._morador_existente(responsavel_id)
+        atividade = self.gerenciador.criar_nova_atividade(
+            categoria, str(corpo.get('nome', '')), str(corpo.get('descricao', '')), responsavel_id)
+        if atividade is None:
+            raise ErroApi(400, "Atividade inválida (o nome precisa de pelo menos 3 caracteres)")
+        return 201, atividade.to_dict()
+
+    def _obter_atividade(self, consulta, corpo, atividade_id):
+        return 200, self._atividade_existente(atividade_id).to_dict()
+
+    def _excluir_atividade(self, consulta, corpo, atividade_id):
+        self._atividade_existente(atividade_id)
+        self.gerenciador.excluir_atividade(atividade_id)
+        return 200, {'excluida': atividade_id}
+
+    def _finalizar_atividade(self, consulta, corpo, atividade_id):
+        atividade = self._atividade_existente(atividade_id)
+        if not self.gerenciador.finalizar_atividade(atividade_id):
+            raise ErroApi(409, f"A atividade não está pendente ({atividade.situacao.name.lower()})")
+        return 200, atividade.to_dict()
+
+    def _cancelar_atividade(self, consulta, corpo, atividade_id):
+        atividade = self._atividade_existente(atividade_id)
+        if not self.gerenciador.cancelar_atividade(atividade_id):
+            raise ErroApi(409, f"A atividade não está pendente ({atividade.situacao.name.lower()})")
+        return 200, atividade.to_dict()
+
+    def _atribuir_atividade(self, consulta, corpo, atividade_id):
+        atividade = self._atividade_existente(atividade_id)
+        morador_id = corpo.get('morador_id')
+        if not morador_id:
+            raise ErroApi(400, "Informe o 'morador_id'")
+        self._morador_existente(morador_id)
+        self.gerenciador.atribuir_responsavel(atividade_id, morador_id)
+        return 200, atividade.to_dict()
+
+    def _listar_relatorios(self, consulta, corpo):
+        return 200, sorted(RELATORIOS_DISPONIVEIS)
+
+    def _relatorio(self, consulta, corpo, nome):
+        if nome not in RELATORIOS_DISPONIVEIS:
+            raise ErroApi(404, f"Relatório desconhecido: {nome} "
+                               f"(use: {', '.join(sorted(RELATORIOS_DISPONIVEIS))})")
+        parametros = {
+            'historico_mes': {'mes': _inteiro_na_faixa(consulta, 'mes'), 'ano': _inteiro(consulta, 'ano')},
+            'produtividade_diaria': {'dias': _inteiro_na_faixa(consulta, 'dias', 7)},
+            'ranking': {'limite': _inteiro(consulta, 'limite', 10)}
+        }.get(nome, {})
+        return 200, getattr(self.gerenciador, RELATORIOS_DISPONIVEIS[nome])(**parametros)
+
+
+class ManipuladorHTTP(BaseHTTPRequestHandler):
+    """Traduz HTTP para ApiTarefas.tratar() (a API fica em self.server.api)."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'TarefasDomesticas/1.0'
+    timeout = TEMPO_OCIOSO
+
+    def do_GET(self):
+        self._responder('GET')
+
+    def do_POST(self):
+        self._responder('POST')
+
+    def do_PATCH(self):
+        self._responder('PATCH')
+
+    def do_DELETE(self):
+        self._responder('DELETE')
+
+    def _responder(self, metodo: str):
+        """Lê a requisição, chama a API e envia a resposta JSON."""
+        url = urlsplit(self.path)
+        etag = None
+        try:
+            corpo = self._ler_corpo()
+            status, resultado, etag = self.server.api.tratar(
+                metodo, url.path, parse_qs(url.query), corpo, self.headers.get('If-None-Match'))
+        except ErroApi as e:
+            status, resultado = e.status, {'erro': e.mensagem}
+        except Exception as e:
+            traceback.print_exc()
+            status, resultado = 500, {'erro': f"Erro interno: {e}"}
+        self._enviar(status, resultado, etag)
+
+    def _ler_corpo(self) -> Optional[Dict[str, Any]]:
+        """Lê o corpo JSON pelo Content-Length (a conexão continua utilizável)."""
+        if self.headers.get('Transfer-Encoding'):
+            self.close_connection = True
+            raise ErroApi(411, "Envie o corpo com Content-Length")
+        try:
+            tamanho = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            self.close_connection = True
+            raise ErroApi(400, "Content-Length inválido")
+        if tamanho > LIMITE_CORPO:
+            self.close_connection = True
+            raise ErroApi(413, f"Corpo maior que {LIMITE_CORPO} bytes")
+        if not tamanho:
+            return None
+
+        bruto = self.rfile.read(tamanho)
+        try:
+            corpo = json.loads(bruto.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ErroApi(400, f"JSON inválido: {e}")
+        if not isinstance(corpo, dict):
+            raise ErroApi(400, "O corpo deve ser um objeto JSON")
+        return corpo
+
+    def _enviar(self, status: int, resultado: Any, etag: Optional[str]):
+        """Envia a resposta, sempre com Content-Length (exigido pelo keep-alive)."""
+        conteudo = b'' if status == 304 else json.dumps(
+            resultado, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(conteudo)))
+        if etag:
+            self.send_header('ETag', etag)
+            # O cliente pode guardar, mas deve revalidar com If-None-Match
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if conteudo:
+            self.wfile.write(conteudo)
+
+    def log_message(self, formato, *args):
+        if not self.server.silencioso:
+            super().log_message(formato, *args)
+
+
+class ServidorTarefas(ThreadingHTTPServer):
+    """Servidor HTTP com uma thread por conexão, todas usando a mesma ApiTarefas."""
+
+    daemon_threads = True
+
+    def __init__(self, endereco: Tuple[str, int], api: ApiTarefas, silencioso: bool = False):
+        """
+        Args:
+            endereco (Tuple[str, int]): Host e porta (porta 0 escolhe uma livre)
+            api (ApiTarefas): API compartilhada pelas conexões
+            silencioso (bool): Não registrar cada requisição no terminal
+        """
+        self.api = api
+        self.silencioso = silencioso
+        super().__init__(endereco, ManipuladorHTTP)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Relatórios em Lote - Sistema de Tarefas Domésticas
+==================================================
+
+Ponto de entrada sem interface gráfica para gerar relatórios de muitas
+residências de uma vez. Cada residência tem seu próprio
+sistema_tarefas.json; os resultados vão para um único arquivo.
+
+Exemplos:
+    python relatorios_lote.py clientes/ -o fechamento.jsonl
+    python relatorios_lote.py "clientes/*/sistema_tarefas.json" -r ranking categorias -o ranking.csv -w 8
+"""
+
+import argparse
+import os
+import sys
+
+# Adicionar o diretório do projeto ao path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from package.controllers.processamento_lote import (
+    listar_arquivos_dados, executar_lote, mostrar_progresso, imprimir_resumo
+)
+from package.controllers.relatorios_paralelos import (
+    LIMITES_PARAMETROS, RELATORIOS_DISPONIVEIS, RELATORIOS_PADRAO, inteiro_entre
+)
+from package.controllers.exportador_relatorios import FORMATOS_EXPORTACAO
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Gera relatórios para vários arquivos de dados de residências.")
+    parser.add_argument('entradas', nargs='+',
+                        help="Diretórios, padrões glob ou arquivos sistema_tarefas.json")
+    parser.add_argument('-o', '--saida', required=True,
+                        help="Arquivo de saída (.csv, .jsonl ou .md)")
+    parser.add_argument('-r', '--relatorios', nargs='+', choices=sorted(RELATORIOS_DISPONIVEIS),
+                        default=RELATORIOS_PADRAO, help="Relatórios a gerar (padrão: fechamento mensal)")
+    parser.add_argument('-f', '--formato', choices=sorted(FORMATOS_EXPORTACAO),
+                        help="Formato de saída (padrão: pela extensão do arquivo)")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="Número de processos (padrão: número de CPUs)")
+    parser.add_argument('--mes', type=inteiro_entre('mes'), help="Mês do histórico mensal (1-12)")
+    parser.add_argument('--ano', type=int, help="Ano do histórico mensal")
+    parser.add_argument('--dias', type=inteiro_entre('dias'), default=7,
+                        help=f"Dias da produtividade diária (1-{LIMITES_PARAMETROS['dias'][1]})")
+    parser.add_argument('-q', '--silencioso', action='store_true',
+                        help="Não mostrar o progresso de cada arquivo")
+    return parser
+
+
+def main(argv=None) -> int:
+    """Função principal do processamento em lote."""
+    args = criar_parser().parse_args(argv)
+
+    arquivos = listar_arquivos_dados(args.entradas)
+    if not arquivos:
+        print("❌ Nenhum arquivo de dados encontrado!", file=sys.stderr)
+        return 2
+
+    parametros = {
+        'historico_mes': {'mes': args.mes, 'ano': args.ano},
+        'produtividade_diaria': {'dias': args.dias}
+    }
+
+    print(f"🏡 Processando {len(arquivos)} arquivo(s) de dados...", file=sys.stderr)
+    resumo = executar_lote(arquivos, args.saida,
+                           relatorios=args.relatorios,
+                           parametros=parametros,
+                           formato=args.formato,
+                           max_workers=args.workers,
+                           progresso=None if args.silencioso else mostrar_progresso)
+
+    imprimir_resumo(resumo)
+    print(f"💾 Resultados salvos em: {args.saida}")
+    return 1 if resumo['falhas'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
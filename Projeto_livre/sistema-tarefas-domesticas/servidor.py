@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor HTTP - Sistema de Tarefas Domésticas
+=============================================
+
+Ponto de entrada sem interface gráfica que serve os dados de uma
+residência como API JSON (ver package/views/servidor_http.py). Enquanto
+o servidor roda, o arquivo de dados pertence a ele: não abra o mesmo
+arquivo na interface gráfica ao mesmo tempo.
+
+Exemplos:
+    python servidor.py
+    python servidor.py -a dados/sistema_tarefas.json --host 0.0.0.0 --porta 8080
+"""
+
+import argparse
+import os
+import signal
+import sys
+
+# Adicionar o diretório do projeto ao path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from package.models.residencia import Residencia
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.views.servidor_http import ApiTarefas, ServidorTarefas
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Serve os dados de uma residência como API JSON via HTTP.")
+    parser.add_argument('-a', '--arquivo', default=os.path.join('dados', 'sistema_tarefas.json'),
+                        help="Arquivo de dados (padrão: %(default)s)")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="Endereço de escuta; 0.0.0.0 libera para a rede local (padrão: %(default)s)")
+    parser.add_argument('-p', '--porta', type=int, default=8080,
+                        help="Porta TCP (padrão: %(default)s)")
+    parser.add_argument('--intervalo-salvamento', type=float, default=2.0,
+                        help="Segundos em que as alterações são agrupadas antes de salvar "
+                             "(padrão: %(default)s)")
+    parser.add_argument('--sem-cache', action='store_true',
+                        help="Ignorar o cache de inicialização e ler o JSON")
+    parser.add_argument('-q', '--silencioso', action='store_true',
+                        help="Não registrar cada requisição no terminal")
+    return parser
+
+
+def _interromper(sinal, quadro):
+    """Trata SIGTERM como Ctrl+C, para que os dados sejam salvos ao encerrar."""
+    raise KeyboardInterrupt
+
+
+def main(argv=None) -> int:
+    """Função principal do servidor."""
+    args = criar_parser().parse_args(argv)
+
+    armazenamento = ArmazenamentoDados(args.arquivo, usar_cache=not args.sem_cache)
+    gerenciador = GerenciadorTarefas(Residencia("Casa Principal"), armazenamento)
+    if not gerenciador.carregar_dados() and os.path.exists(args.arquivo):
+        print(f"❌ Não foi possível carregar {args.arquivo}", file=sys.stderr)
+        return 1
+
+    api = ApiTarefas(gerenciador, intervalo_salvamento=args.intervalo_salvamento)
+    try:
+        servidor = ServidorTarefas((args.host, args.porta), api, silencioso=args.silencioso)
+    except OSError as e:
+        print(f"❌ Não foi possível abrir {args.host}:{args.porta}: {e}", file=sys.stderr)
+        return 1
+
+    host, porta = servidor.server_address[:2]
+    print(f"🌐 API em http://{host}:{porta}/api/resumo (Ctrl+C para encerrar)")
+    signal.signal(signal.SIGTERM, _interromper)
+    api.iniciar_salvamento()
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Encerrando...")
+    finally:
+        servidor.server_close()
+        api.encerrar()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
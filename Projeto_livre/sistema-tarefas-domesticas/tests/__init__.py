@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Sistema
+=================
+
+Testes sem interface gráfica (unittest; também rodam com pytest).
+Execute a partir do diretório do projeto:
+
+    python -m unittest discover -s tests -t .
+    python -m pytest -q tests
+"""
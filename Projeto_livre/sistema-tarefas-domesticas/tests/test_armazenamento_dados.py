@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Cache de Inicialização
+================================
+
+O cache gravado ao salvar é usado na carga seguinte; um JSON alterado
+(por tamanho, data ou só pelo conteúdo), um cabeçalho de outra versão ou
+um cache ilegível voltam ao JSON sem erro; --sem-cache ignora o cache.
+"""
+
+import contextlib
+import io
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from package.controllers import armazenamento_dados
+from package.controllers.armazenamento_dados import VERSAO_CACHE, ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.models.residencia import Residencia
+from package.views.linha_comando import main
+
+
+class TestCacheInicializacao(unittest.TestCase):
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+        self.arquivo = os.path.join(self._diretorio.name, 'dados.json')
+        self.cache = f"{self.arquivo}.cache"
+
+        gerenciador = self._gerenciador()
+        with contextlib.redirect_stdout(io.StringIO()):
+            gerenciador.adicionar_morador("Ana")
+            self.assertTrue(gerenciador.salvar_dados())
+        self.assertTrue(os.path.exists(self.cache))
+
+    def _gerenciador(self, usar_cache=True) -> GerenciadorTarefas:
+        armazenamento = ArmazenamentoDados(self.arquivo, usar_cache=usar_cache)
+        return GerenciadorTarefas(Residencia("Casa"), armazenamento)
+
+    def _carregar(self, usar_cache=True):
+        """Carrega um gerenciador novo; devolve (nomes dos moradores, leu o JSON?)."""
+        gerenciador = self._gerenciador(usar_cache)
+        with mock.patch.object(ArmazenamentoDados, 'carregar_do_json', autospec=True,
+                               side_effect=ArmazenamentoDados.carregar_do_json) as json_lido, \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(gerenciador.carregar_dados())
+        return sorted(morador.nome for morador in gerenciador.obter_moradores()), json_lido.called
+
+    def _reescrever_json(self, antigo: bytes, novo: bytes, manter_data: bool = False):
+        informacoes = os.stat(self.arquivo)
+        with open(self.arquivo, 'rb') as arquivo:
+            conteudo = arquivo.read()
+        with open(self.arquivo, 'wb') as arquivo:
+            arquivo.write(conteudo.replace(antigo, novo))
+        if manter_data:
+            os.utime(self.arquivo, ns=(informacoes.st_atime_ns, informacoes.st_mtime_ns))
+
+    def _reescrever_cabecalho(self, **campos):
+        with open(self.cache, 'rb') as arquivo:
+            cabecalho = pickle.load(arquivo)
+            estado = pickle.load(arquivo)
+        cabecalho.update(campos)
+        with open(self.cache, 'wb') as arquivo:
+            pickle.dump(cabecalho, arquivo)
+            pickle.dump(estado, arquivo)
+
+    def test_cache_gravado_ao_salvar_e_usado_na_carga(self):
+        self.assertEqual(self._carregar(), (["Ana"], False))
+        # Sem cache, o mesmo estado vem do JSON
+        self.assertEqual(self._carregar(usar_cache=False), (["Ana"], True))
+
+    def test_json_alterado_por_tamanho_ou_data(self):
+        self._reescrever_json(b'"Ana"', b'"Anabela"')
+        self.assertEqual(self._carregar(), (["Anabela"], True))
+        # A carga pelo JSON regravou o cache, que volta a valer
+        self.assertEqual(self._carregar(), (["Anabela"], False))
+
+        informacoes = os.stat(self.arquivo)
+        os.utime(self.arquivo, ns=(informacoes.st_atime_ns, informacoes.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self._carregar(), (["Anabela"], True))
+
+    def test_json_alterado_com_mesmo_tamanho_e_data(self):
+        self._reescrever_json(b'"Ana"', b'"Bia"', manter_data=True)
+        with mock.patch.object(ArmazenamentoDados, 'assinatura_arquivo', autospec=True,
+                               side_effect=ArmazenamentoDados.assinatura_arquivo) as assinatura:
+            self.assertIsNone(ArmazenamentoDados(self.arquivo, usar_cache=True).carregar_cache())
+        # Tamanho e data conferem: só o hash BLAKE2b do conteúdo pega a mudança
+        self.assertEqual(assinatura.call_count, 1)
+        self.assertEqual(self._carregar(), (["Bia"], True))
+
+    def test_cabecalho_de_outra_versao(self):
+        for campos in ({'versao': VERSAO_CACHE + 1}, {'python': [2, 7]}, {'versao': None}):
+            with self.subTest(campos=campos):
+                self._reescrever_cabecalho(**campos)
+                self.assertEqual(self._carregar(), (["Ana"], True))
+
+        self.assertEqual(self._carregar(), (["Ana"], False))
+        # Código com outra versão do formato recusa o cache atual
+        with mock.patch.object(armazenamento_dados, 'VERSAO_CACHE', VERSAO_CACHE + 1):
+            self.assertEqual(self._carregar(), (["Ana"], True))
+            self.assertEqual(self._carregar(), (["Ana"], False))
+        # E o cache regravado por ele não vale para a versão atual
+        self.assertEqual(self._carregar(), (["Ana"], True))
+        self.assertEqual(self._carregar(), (["Ana"], False))
+
+    def test_cache_truncado_ou_corrompido(self):
+        with open(self.cache, 'rb') as arquivo:
+            conteudo = arquivo.read()
+        for ruim in (conteudo[:len(conteudo) // 2], conteudo[:10], b'lixo' * 100, b''):
+            with self.subTest(tamanho=len(ruim)):
+                with open(self.cache, 'wb') as arquivo:
+                    arquivo.write(ruim)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertIsNone(ArmazenamentoDados(self.arquivo, usar_cache=True).carregar_cache())
+                self.assertEqual(self._carregar(), (["Ana"], True))
+
+    def test_sem_cache_ignora_o_cache(self):
+        modificado = os.stat(self.cache).st_mtime_ns
+        with mock.patch.object(ArmazenamentoDados, '_cache_valido') as validar, \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['-a', self.arquivo, '--sem-cache', 'morador', 'adicionar', "Bia"]), 0)
+        validar.assert_not_called()
+        self.assertEqual(os.stat(self.cache).st_mtime_ns, modificado)
+
+        # O cache ficou para trás do JSON e não é usado na próxima carga
+        self.assertEqual(self._carregar(), (["Ana", "Bia"], True))
+
+        os.remove(self.cache)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['-a', self.arquivo, '--sem-cache', 'morador', 'listar']), 0)
+        self.assertFalse(os.path.exists(self.cache))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['-a', self.arquivo, 'morador', 'listar']), 0)
+        self.assertTrue(os.path.exists(self.cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da Suíte de Benchmarks
+=============================
+
+Medição (percentil, lote, preparação fora do tempo, alocações), todos os
+casos registrados na escala mínima e o JSON gravado pelo executor.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import executar
+from benchmarks.casos import CASOS, Contexto, executar_caso
+from benchmarks.dados import ESCALAS, gerar_arquivo
+from benchmarks.medicao import Execucao, medir, medir_alocacoes, percentil
+
+
+def _resumo_arquivo(caminho: str) -> str:
+    with open(caminho, 'rb') as arquivo:
+        return hashlib.sha256(arquivo.read()).hexdigest()
+
+
+class TestMedicao(unittest.TestCase):
+
+    def test_percentil_posto_mais_proximo(self):
+        amostras = [5, 1, 4, 2, 3]
+        self.assertEqual(percentil(amostras, 0), 1)
+        self.assertEqual(percentil(amostras, 50), 3)
+        self.assertEqual(percentil(amostras, 95), 5)
+        self.assertEqual(percentil(amostras, 100), 5)
+        self.assertEqual(percentil([], 50), 0.0)
+
+    def test_preparacao_aquecimento_e_lote(self):
+        chamadas = {'preparar': 0, 'funcao': []}
+
+        def preparar():
+            chamadas['preparar'] += 1
+            return chamadas['preparar']
+
+        execucao = Execucao(lambda valor: chamadas['funcao'].append(valor), preparar, lote=4)
+        resultado = medir(execucao, repeticoes=3, aquecimento=2)
+
+        # aquecimento + amostras + a execução extra do tracemalloc
+        self.assertEqual(chamadas['preparar'], 6)
+        self.assertEqual(chamadas['funcao'], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(resultado['repeticoes'], 3)
+        self.assertEqual(len(resultado['amostras_ns']), 3)
+        self.assertEqual(resultado['lote'], 4)
+        self.assertLessEqual(resultado['minimo_ns'], resultado['mediana_ns'])
+        self.assertLessEqual(resultado['mediana_ns'], resultado['p95_ns'])
+        self.assertLessEqual(resultado['p95_ns'], resultado['maximo_ns'])
+
+    def test_alocacoes(self):
+        guardados = []
+        alocacoes = medir_alocacoes(Execucao(lambda _: guardados.append(bytearray(1 << 20))))
+        self.assertGreaterEqual(alocacoes['pico_bytes'], 1 << 20)
+        self.assertGreaterEqual(alocacoes['liquido_bytes'], 1 << 20)
+
+        temporario = medir_alocacoes(Execucao(lambda _: bytearray(1 << 20)))
+        self.assertGreaterEqual(temporario['pico_bytes'], 1 << 20)
+        self.assertLess(temporario['liquido_bytes'], 1 << 16)
+
+
+class TestCasos(unittest.TestCase):
+    """Cada caso roda na escala mínima sem alterar o arquivo de dados."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._diretorio = tempfile.TemporaryDirectory()
+        cls.arquivo = gerar_arquivo(os.path.join(cls._diretorio.name, 'minima.json'), ESCALAS['minima'])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._diretorio.cleanup()
+
+    def test_relatorios_registrados_automaticamente(self):
+        for nome in ('relatorios.relatorio_performance_moradores',
+                     'relatorios.relatorio_tempo_realizacao',
+                     'relatorios.estatisticas_por_categoria'):
+            self.assertIn(nome, CASOS)
+        self.assertFalse([nome for nome in CASOS if nome.startswith('relatorios._')])
+
+    def test_todos_os_casos(self):
+        original = _resumo_arquivo(self.arquivo)
+        for nome in CASOS:
+            with self.subTest(caso=nome):
+                resultado = executar_caso(nome, self.arquivo, repeticoes=2, aquecimento=0, semente=42)
+                self.assertEqual(resultado['repeticoes'], 2)
+                self.assertGreater(resultado['mediana_ns'], 0)
+                self.assertIn('pico_bytes', resultado['alocacoes'])
+        self.assertEqual(_resumo_arquivo(self.arquivo), original)
+
+    def test_contexto_conta_execucoes(self):
+        with tempfile.TemporaryDirectory() as diretorio:
+            contexto = Contexto(self.arquivo, diretorio, 42, repeticoes=3, aquecimento=2)
+            self.assertEqual(contexto.execucoes, 6)
+            self.assertNotEqual(contexto.arquivo, self.arquivo)
+
+
+class TestExecutor(unittest.TestCase):
+
+    def test_selecionar_casos(self):
+        armazenamento = executar.selecionar_casos(['armazenamento.*'])
+        self.assertEqual(armazenamento, [nome for nome in CASOS if nome.startswith('armazenamento.')])
+        self.assertEqual(executar.selecionar_casos(['nenhum.*']), [])
+
+    def test_json_de_resultados(self):
+        with tempfile.TemporaryDirectory() as diretorio:
+            saida = os.path.join(diretorio, 'resultados.json')
+            codigo = executar.main(['-e', 'minima', '-c', 'gerenciador.obter_*', '-n', '2',
+                                    '--dados', diretorio, '--sem-isolamento', '-o', saida])
+            self.assertEqual(codigo, 0)
+            with open(saida, 'r', encoding='utf-8') as arquivo:
+                documento = json.load(arquivo)
+
+        self.assertEqual(documento['versao_formato'], executar.VERSAO_FORMATO)
+        self.assertEqual(documento['parametros']['repeticoes'], 2)
+        self.assertEqual([(r['caso'], r['escala']) for r in documento['resultados']],
+                         [('gerenciador.obter_atividade_por_id', 'minima'),
+                          ('gerenciador.obter_morador_por_id', 'minima')])
+        for registro in documento['resultados']:
+            self.assertEqual(len(registro['amostras_ns']), 2)
+            self.assertEqual(registro['lote'], 1000)
+
+    def test_nenhum_caso(self):
+        self.assertEqual(executar.main(['-c', 'nenhum.*', '-o', os.devnull]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da Comparação de Benchmarks
+==================================
+
+Teste de Mann-Whitney (exato x aproximação normal), classificação de cada
+caso, códigos de saída e a linha de base versionada.
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+from itertools import combinations
+from unittest import mock
+
+from benchmarks import comparar
+from benchmarks.comparar import (ERRO, ESTAVEL, INCONCLUSIVO, LIMITE_TESTE_EXATO, MELHORIA, NOVO,
+                                 REGRESSAO, REMOVIDO, _distribuicao_u, _postos, comparar_caso,
+                                 mann_whitney_maior)
+from benchmarks.executar import VERSAO_FORMATO
+
+# Linha de base versionada junto com o código
+LINHA_BASE = os.path.join(os.path.dirname(comparar.__file__), 'linha_base.json')
+
+
+def _p_por_enumeracao(atual, base):
+    """P(U >= u observado) contando todas as divisões dos postos (sem empates)."""
+    m, n = len(atual), len(base)
+    postos = _postos(list(atual) + list(base))
+    u = sum(postos[:m]) - m * (m + 1) / 2
+    maiores = 0
+    for posicoes in combinations(range(1, m + n + 1), m):
+        if sum(posicoes) - m * (m + 1) / 2 >= u:
+            maiores += 1
+    return maiores / math.comb(m + n, m)
+
+
+def _amostras(mediana, quantidade, ruido=0.01, semente=0):
+    aleatorio = random.Random(semente)
+    return [mediana * (1 + aleatorio.uniform(-ruido, ruido)) for _ in range(quantidade)]
+
+
+class TestMannWhitney(unittest.TestCase):
+
+    def test_postos_com_empates(self):
+        self.assertEqual(_postos([30, 10, 20, 10]), [4.0, 1.5, 3.0, 1.5])
+
+    def test_distribuicao_u(self):
+        for m, n in ((1, 1), (3, 4), (7, 5)):
+            distribuicao = _distribuicao_u(m, n)
+            self.assertEqual(len(distribuicao), m * n + 1)
+            self.assertEqual(sum(distribuicao), math.comb(m + n, m))
+            self.assertEqual(distribuicao, distribuicao[::-1])
+
+    def test_exato_confere_com_enumeracao(self):
+        aleatorio = random.Random(4)
+        for m, n in ((3, 4), (5, 5), (6, 3)):
+            for _ in range(5):
+                valores = aleatorio.sample(range(1000), m + n)
+                atual, base = valores[:m], valores[m:]
+                self.assertAlmostEqual(mann_whitney_maior(atual, base), _p_por_enumeracao(atual, base))
+
+    def test_separacao_completa(self):
+        self.assertAlmostEqual(mann_whitney_maior([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]), 1 / 252)
+        self.assertEqual(mann_whitney_maior([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]), 1.0)
+        self.assertEqual(mann_whitney_maior([], [1.0]), 1.0)
+
+    def test_troca_entre_exato_e_normal(self):
+        distintos = list(range(2 * LIMITE_TESTE_EXATO + 2))
+        casos = (
+            # (atual, base, usa o exato)
+            (distintos[1::2][:LIMITE_TESTE_EXATO], distintos[0::2][:LIMITE_TESTE_EXATO], True),
+            (distintos[1::2], distintos[0::2], False),     # acima do limite
+            ([1.0, 2.0, 2.0, 3.0], [0.5, 2.0, 1.5], False),  # empates
+        )
+        for atual, base, exato in casos:
+            with self.subTest(tamanhos=(len(atual), len(base)), exato=exato):
+                with mock.patch.object(comparar, '_distribuicao_u', wraps=_distribuicao_u) as distribuicao:
+                    p = mann_whitney_maior(atual, base)
+                self.assertEqual(distribuicao.called, exato)
+                self.assertTrue(0.0 <= p <= 1.0)
+
+    def test_normal_proxima_do_exato_no_limite(self):
+        aleatorio = random.Random(9)
+        tamanho = LIMITE_TESTE_EXATO + 1
+        valores = aleatorio.sample(range(100_000), 2 * tamanho)
+        # Deslocamento sem empates, para um valor-p na faixa que importa
+        atual = [v + 8000.5 for v in valores[:tamanho]]
+        base = valores[tamanho:]
+        normal = mann_whitney_maior(atual, base)
+        self.assertTrue(0.001 < normal < 0.2, normal)
+
+        postos = _postos(atual + base)
+        u = sum(postos[:tamanho]) - tamanho * (tamanho + 1) / 2
+        exato = sum(_distribuicao_u(tamanho, tamanho)[math.ceil(u):]) / math.comb(2 * tamanho, tamanho)
+        self.assertAlmostEqual(normal, exato, delta=0.005)
+
+
+class TestCompararCaso(unittest.TestCase):
+
+    def _comparar(self, base, atual, limiar=0.05, fator_ruido=3.0, alfa=0.05):
+        return comparar_caso({'amostras_ns': base, 'erro': None}, {'amostras_ns': atual, 'erro': None},
+                             limiar, fator_ruido, alfa)
+
+    def test_situacoes(self):
+        base = _amostras(1000, 10, semente=1)
+        self.assertEqual(self._comparar(base, _amostras(1200, 10, semente=2))['situacao'], REGRESSAO)
+        self.assertEqual(self._comparar(base, _amostras(800, 10, semente=2))['situacao'], MELHORIA)
+        self.assertEqual(self._comparar(base, _amostras(1010, 10, semente=2))['situacao'], ESTAVEL)
+        # Dois contra dois: o menor valor-p possível é 1/6
+        self.assertEqual(self._comparar(base[:2], _amostras(1500, 2))['situacao'], INCONCLUSIVO)
+
+    def test_ruido_eleva_o_limiar(self):
+        base = _amostras(1000, 30, ruido=0.3, semente=1)
+        atual = _amostras(1150, 30, ruido=0.3, semente=2)
+        resultado = self._comparar(base, atual)
+        self.assertGreater(resultado['limiar'], 0.15)
+        self.assertEqual(resultado['situacao'], ESTAVEL)
+        self.assertEqual(self._comparar(base, atual, fator_ruido=0)['limiar'], 0.05)
+
+    def test_novo_removido_e_erro(self):
+        amostras = {'amostras_ns': [1.0, 2.0], 'erro': None}
+        self.assertEqual(comparar_caso(None, amostras, 0.05, 3, 0.05)['situacao'], NOVO)
+        self.assertEqual(comparar_caso(amostras, None, 0.05, 3, 0.05)['situacao'], REMOVIDO)
+        falha = {'amostras_ns': [], 'erro': "RuntimeError: x"}
+        resultado = comparar_caso(amostras, falha, 0.05, 3, 0.05)
+        self.assertEqual((resultado['situacao'], resultado['erro']), (ERRO, "RuntimeError: x"))
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+
+    def _gravar(self, nome, resultados, versao=VERSAO_FORMATO):
+        caminho = os.path.join(self._diretorio.name, nome)
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump({'versao_formato': versao, 'ambiente': {}, 'resultados': resultados}, arquivo)
+        return caminho
+
+    def _resultado(self, caso, mediana, semente=0):
+        return {'caso': caso, 'escala': 'minima', 'amostras_ns': _amostras(mediana, 10, semente=semente)}
+
+    def _main(self, *argv):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return comparar.main(list(argv))
+
+    def test_codigos_de_saida(self):
+        base = self._gravar('base.json', [self._resultado('a', 1000, 1), self._resultado('b', 1000, 2)])
+        igual = self._gravar('igual.json', [self._resultado('a', 1000, 3), self._resultado('b', 1000, 4)])
+        pior = self._gravar('pior.json', [self._resultado('a', 1500, 3), self._resultado('b', 1000, 4)])
+        sem_b = self._gravar('sem_b.json', [self._resultado('a', 1000, 3)])
+        antigo = self._gravar('antigo.json', [], versao=VERSAO_FORMATO + 1)
+
+        self.assertEqual(self._main(base, igual), 0)
+        self.assertEqual(self._main(base, pior), 1)
+        self.assertEqual(self._main(base, pior, '-c', 'b'), 0)
+        self.assertEqual(self._main(base, sem_b), 0)
+        self.assertEqual(self._main(base, sem_b, '--falhar-removidos'), 1)
+        self.assertEqual(self._main(base, antigo), 2)
+        self.assertEqual(self._main(base, os.path.join(self._diretorio.name, 'inexistente.json')), 2)
+
+    def test_rodadas_juntadas_e_json(self):
+        base = self._gravar('base.json', [self._resultado('a', 1000, 1)])
+        atual_1 = self._gravar('atual_1.json', [self._resultado('a', 1000, 2)])
+        atual_2 = self._gravar('atual_2.json', [self._resultado('a', 1000, 3)])
+        saida = os.path.join(self._diretorio.name, 'comparacao.json')
+        self.assertEqual(self._main(base, atual_1, atual_2, '--json', saida), 0)
+        with open(saida, 'r', encoding='utf-8') as arquivo:
+            comparacao = json.load(arquivo)
+        self.assertEqual(comparacao[0]['amostras'], [10, 20])
+
+    def test_linha_base_versionada(self):
+        self.assertEqual(self._main(LINHA_BASE, LINHA_BASE), 0)
+        resultados, _ = comparar.carregar_resultados([LINHA_BASE])
+        self.assertTrue(resultados)
+        self.assertFalse([chave for chave, valor in resultados.items() if valor['erro']])
+
+
+if __name__ == '__main__':
+    unittest.main()
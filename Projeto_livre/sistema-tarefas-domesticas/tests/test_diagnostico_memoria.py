@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Diagnóstico de Memória
+================================
+
+Contagem por categoria sem contar um objeto duas vezes, diagnóstico de
+um arquivo gerado (só leitura), comparação antes/depois de uma operação
+e snapshots gravados em disco.
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from benchmarks.gerador_dados import ParametrosGeracao, gravar_json
+from package.controllers.diagnostico_memoria import (OPERACOES, _relatorios, comparar_arquivos_snapshot,
+                                                     diagnosticar, formatar_bytes,
+                                                     imprimir_diagnostico, tamanho_profundo)
+
+
+class TestTamanhoProfundo(unittest.TestCase):
+
+    def test_objetos_compartilhados_contados_uma_vez(self):
+        compartilhada = ['x' * 1000]
+        vistos = set()
+        primeiro = tamanho_profundo([[compartilhada, 1]], vistos)
+        segundo = tamanho_profundo([[compartilhada, 2]], vistos)
+        self.assertIn(id(compartilhada), vistos)
+        self.assertGreater(primeiro['bytes'], 1000)
+        self.assertLess(segundo['bytes'], 1000)
+        self.assertEqual(tamanho_profundo([compartilhada], vistos), {'bytes': 0, 'objetos': 0})
+
+    def test_tipos_e_modulos_ignorados(self):
+        self.assertEqual(tamanho_profundo([int, os, len, formatar_bytes], set()),
+                         {'bytes': 0, 'objetos': 0})
+
+    def test_formatar_bytes(self):
+        self.assertEqual(formatar_bytes(512), "512 B")
+        self.assertEqual(formatar_bytes(1536), "1.5 KiB")
+        self.assertEqual(formatar_bytes(-3 * 1024 * 1024), "-3.0 MiB")
+        self.assertEqual(formatar_bytes(2 * 1024 ** 3), "2.00 GiB")
+
+
+class TestDiagnosticar(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._diretorio = tempfile.TemporaryDirectory()
+        cls.arquivo = os.path.join(cls._diretorio.name, 'dados.json')
+        cls.resumo = gravar_json(cls.arquivo, ParametrosGeracao(moradores=15, total_atividades=800,
+                                                                semente=11))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._diretorio.cleanup()
+
+    def _diagnosticar(self, **opcoes):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return diagnosticar(self.arquivo, **opcoes)
+
+    def test_carga_categorias_e_relatorios(self):
+        with open(self.arquivo, 'rb') as arquivo:
+            original = hashlib.sha256(arquivo.read()).hexdigest()
+
+        diagnostico = self._diagnosticar(limite=5)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        carga = diagnostico['carga']
+        self.assertEqual((carga['atividades'], carga['moradores']),
+                         (self.resumo['atividades'], self.resumo['moradores']))
+        self.assertGreater(carga['retido_bytes'], 0)
+        self.assertGreaterEqual(carga['pico_bytes'], carga['retido_bytes'])
+
+        categorias = {c['categoria']: c for c in diagnostico['categorias']}
+        self.assertEqual(list(categorias)[:3], ['atividades', 'historicos', 'moradores'])
+        self.assertGreater(categorias['atividades']['objetos'], 800)
+        # Contagem disjunta: a soma não passa do que a carga reteve (com folga)
+        self.assertLess(sum(c['bytes'] for c in categorias.values()), carga['retido_bytes'] * 1.5)
+
+        self.assertLessEqual(len(diagnostico['locais']), 5)
+        self.assertEqual([r['relatorio'] for r in diagnostico['relatorios']], list(_relatorios()))
+        self.assertIsNone(diagnostico['comparacao'])
+
+        with open(self.arquivo, 'rb') as arquivo:
+            self.assertEqual(hashlib.sha256(arquivo.read()).hexdigest(), original)
+
+        with contextlib.redirect_stdout(io.StringIO()) as saida:
+            imprimir_diagnostico(diagnostico)
+        self.assertIn("POR CATEGORIA", saida.getvalue())
+
+    def test_operacao_sem_retencao(self):
+        comparacao = self._diagnosticar(operacao='montar_dados', repeticoes=3)['comparacao']
+        self.assertEqual((comparacao['operacao'], comparacao['repeticoes']), ('montar_dados', 3))
+        self.assertGreater(comparacao['pico_bytes'], 0)
+        self.assertLess(comparacao['retido_bytes'], 64 * 1024)
+
+    def test_snapshots_gravados(self):
+        antes = os.path.join(self._diretorio.name, 'antes.snap')
+        depois = os.path.join(self._diretorio.name, 'depois.snap')
+        self._diagnosticar(caminho_snapshot=antes)
+        self._diagnosticar(operacao='relatorios', caminho_snapshot=depois)
+        locais = comparar_arquivos_snapshot(antes, depois, limite=3)
+        self.assertLessEqual(len(locais), 3)
+        for local in locais:
+            self.assertEqual(set(local), {'local', 'diferenca_bytes', 'diferenca_blocos', 'bytes'})
+
+    def test_tracemalloc_ja_ativo_continua_ativo(self):
+        tracemalloc.start()
+        try:
+            self._diagnosticar(limite=1)
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_entradas_invalidas(self):
+        with self.assertRaises(ValueError):
+            diagnosticar(self.arquivo, agrupar='linha')
+        with self.assertRaises(ValueError):
+            diagnosticar(self.arquivo, operacao='inexistente')
+        self.assertIn('relatorio.ranking_melhores_moradores', OPERACOES)
+
+        invalido = os.path.join(self._diretorio.name, 'invalido.json')
+        with open(invalido, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('{ não é json')
+        with self.assertRaises(RuntimeError), contextlib.redirect_stdout(io.StringIO()):
+            diagnosticar(invalido)
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+if __name__ == '__main__':
+    unittest.main()
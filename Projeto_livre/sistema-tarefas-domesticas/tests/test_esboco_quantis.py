@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Esboço de Quantis
+===========================
+
+Erro relativo dos quantis contra a ordenação exata, mesclagem, remoção,
+histograma e o relatório de tempo de realização montado sobre os esboços.
+"""
+
+import contextlib
+import io
+import math
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.mixins.gerar_relatorios import GerarRelatorios
+from package.models.residencia import Residencia
+from package.utils.esboco_quantis import EsbocoQuantis
+
+QUANTIS = [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+
+def _exato(ordenados, q):
+    """Quantil pela ordenação, na mesma posição q * (n - 1) usada pelo esboço."""
+    return ordenados[math.floor(q * (len(ordenados) - 1))]
+
+
+def _esboco(valores, precisao=0.01) -> EsbocoQuantis:
+    esboco = EsbocoQuantis(precisao)
+    for valor in valores:
+        esboco.adicionar(valor)
+    return esboco
+
+
+def _duracoes(quantidade, semente):
+    """Durações em segundos espalhadas de minutos a semanas."""
+    aleatorio = random.Random(semente)
+    return [aleatorio.lognormvariate(math.log(6 * 3600), 1.5) for _ in range(quantidade)]
+
+
+class TestEsbocoQuantis(unittest.TestCase):
+
+    def test_erro_relativo_dentro_da_precisao(self):
+        for precisao in (0.01, 0.05):
+            valores = _duracoes(20000, semente=1)
+            esboco = _esboco(valores, precisao)
+            ordenados = sorted(valores)
+            for q, estimado in zip(QUANTIS, esboco.quantis(QUANTIS)):
+                with self.subTest(precisao=precisao, q=q):
+                    exato = _exato(ordenados, q)
+                    self.assertLessEqual(abs(estimado - exato) / exato, precisao + 1e-12)
+            self.assertAlmostEqual(esboco.media, sum(valores) / len(valores), delta=1e-6)
+            self.assertEqual(esboco.quantil(0.5), esboco.quantis([0.5])[0])
+
+    def test_mesclar_igual_a_um_esboco_da_uniao(self):
+        primeira, segunda = _duracoes(5000, semente=2), _duracoes(3000, semente=3) + [0.0, 0.0]
+        mesclado = _esboco(primeira)
+        mesclado.mesclar(_esboco(segunda))
+        uniao = _esboco(primeira + segunda)
+
+        self.assertEqual(mesclado._baldes, uniao._baldes)
+        self.assertEqual((mesclado.contagem, mesclado._contagem_zero),
+                         (uniao.contagem, uniao._contagem_zero))
+        self.assertAlmostEqual(mesclado.soma, uniao.soma, delta=1e-6)
+        self.assertEqual(mesclado.quantis(QUANTIS), uniao.quantis(QUANTIS))
+
+        with self.assertRaises(ValueError):
+            mesclado.mesclar(EsbocoQuantis(0.05))
+
+    def test_remover(self):
+        valores = _duracoes(1000, semente=4) + [0.0]
+        esboco = _esboco(valores)
+        removidos, restantes = valores[:400] + [0.0], valores[400:-1]
+        for valor in removidos:
+            self.assertTrue(esboco.remover(valor))
+
+        restante = _esboco(restantes)
+        self.assertEqual(esboco._baldes, restante._baldes)
+        self.assertEqual(esboco.contagem, len(restantes))
+        self.assertEqual(esboco.quantis(QUANTIS), restante.quantis(QUANTIS))
+        self.assertAlmostEqual(esboco.soma, sum(restantes), delta=1e-3)
+
+        # Valor que nunca entrou: nenhum balde correspondente
+        self.assertFalse(esboco.remover(1e12))
+        self.assertFalse(esboco.remover(0.0))
+
+        for valor in restantes:
+            esboco.remover(valor)
+        self.assertTrue(esboco.vazio)
+        self.assertEqual((esboco.soma, esboco.quantil(0.5)), (0.0, None))
+
+    def test_histograma(self):
+        esboco = _esboco([0.0, 1, 5, 9, 50, 50, 500, 5000, 99999])
+        self.assertEqual(esboco.histograma([10, 100, 1000]), [4, 2, 1, 2])
+        self.assertEqual(esboco.histograma([]), [9])
+        self.assertEqual(sum(esboco.histograma([60, 3600, 86400])), esboco.contagem)
+
+    def test_entradas_invalidas_e_serializacao(self):
+        for precisao in (0, 1, -0.1):
+            with self.assertRaises(ValueError):
+                EsbocoQuantis(precisao)
+        esboco = _esboco(_duracoes(100, semente=5))
+        with self.assertRaises(ValueError):
+            esboco.adicionar(-1)
+        with self.assertRaises(ValueError):
+            esboco.quantil(1.5)
+
+        copia = EsbocoQuantis.from_dict(esboco.to_dict())
+        self.assertEqual(copia.to_dict(), esboco.to_dict())
+        self.assertEqual(copia.quantis(QUANTIS), esboco.quantis(QUANTIS))
+
+
+class _Relatorios(GerarRelatorios):
+    """Host mínimo do mixin: esboços montados em uma passada."""
+
+    def __init__(self, residencia, atividades):
+        self._residencia = residencia
+        self._lista_atividades = atividades
+
+
+class TestRelatorioTempoRealizacao(unittest.TestCase):
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+        caminho = os.path.join(self._diretorio.name, 'dados.json')
+        self.gerenciador = GerenciadorTarefas(Residencia("Casa"),
+                                              ArmazenamentoDados(caminho, usar_cache=False))
+        with contextlib.redirect_stdout(io.StringIO()):
+            for nome in ("Ana", "Bia"):
+                self.assertTrue(self.gerenciador.adicionar_morador(nome))
+        self.ids = {morador.nome: morador.id for morador in self.gerenciador.obter_moradores()}
+
+    def _carregar(self, tarefas):
+        """Carrega tarefas (categoria, responsável, minutos ou None se pendente)."""
+        inicio = datetime(2025, 3, 1, 8, 0)
+        dados = self.gerenciador.montar_dados()
+        for numero, (categoria, responsavel, minutos) in enumerate(tarefas):
+            dados['atividades'].append({
+                'id_atividade': f"ATV{numero:04d}",
+                'categoria': categoria,
+                'nome_tarefa': f"Tarefa {numero}",
+                'situacao': 'PENDENTE' if minutos is None else 'FINALIZADA',
+                'data_criacao': inicio.isoformat(),
+                'data_finalizacao': (None if minutos is None
+                                     else (inicio + timedelta(minutes=minutos)).isoformat()),
+                'responsavel_id': self.ids[responsavel] if responsavel else None,
+            })
+        self.gerenciador.aplicar_dados(self.gerenciador.montar_estado(dados))
+
+    def _conferir(self, resumo, segundos):
+        ordenados = sorted(segundos)
+        self.assertEqual(resumo['quantidade'], len(ordenados))
+        self.assertAlmostEqual(resumo['media_segundos'], sum(ordenados) / len(ordenados), delta=0.05)
+        for q, chave in ((0.5, 'p50_segundos'), (0.9, 'p90_segundos'), (0.99, 'p99_segundos')):
+            exato = _exato(ordenados, q)
+            self.assertLessEqual(abs(resumo[chave] - exato), exato * 0.01 + 0.05, chave)
+        self.assertEqual(sum(resumo['histograma'].values()), len(ordenados))
+
+    def test_quantis_por_categoria_e_morador(self):
+        # Ana limpa em 1..100 minutos; Bia cozinha em 2..8 horas; uma sem responsável
+        limpeza = [('LIMPEZA', "Ana", minutos) for minutos in range(1, 101)]
+        cozinha = [('COZINHA', "Bia", horas * 60) for horas in range(2, 9)]
+        atrasada = 3 * 24 * 60 + 30
+        self._carregar(limpeza + cozinha + [('COZINHA', None, atrasada), ('JARDIM', "Ana", None)])
+
+        relatorio = self.gerenciador.relatorio_tempo_realizacao()
+        self.assertEqual(relatorio['total_finalizadas'], 108)
+        self.assertEqual(set(relatorio['por_categoria']), {'🧹 Limpeza', '🍽️ Cozinha'})
+        self.assertEqual(set(relatorio['por_morador']), {"Ana", "Bia"})
+
+        segundos_limpeza = [minutos * 60 for _, _, minutos in limpeza]
+        segundos_cozinha = [minutos * 60 for _, _, minutos in cozinha]
+        self._conferir(relatorio['por_categoria']['🧹 Limpeza'], segundos_limpeza)
+        self._conferir(relatorio['por_categoria']['🍽️ Cozinha'], segundos_cozinha + [atrasada * 60])
+        self._conferir(relatorio['por_morador']["Ana"], segundos_limpeza)
+        self._conferir(relatorio['por_morador']["Bia"], segundos_cozinha)
+        self._conferir(relatorio['geral'], segundos_limpeza + segundos_cozinha + [atrasada * 60])
+
+        histograma = relatorio['por_categoria']['🍽️ Cozinha']['histograma']
+        self.assertEqual(histograma, {'Até 1 hora': 0, '1 a 6 horas': 4, '6 a 24 horas': 3,
+                                      '1 a 3 dias': 0, '3 a 7 dias': 1, 'Mais de 7 dias': 0})
+
+        # Esboços mantidos pelo gerenciador == esboços montados do zero pelo mixin
+        do_zero = _Relatorios(self.gerenciador.residencia, self.gerenciador.atividades)
+        esperado = do_zero.relatorio_tempo_realizacao()
+        for chave in ('geral', 'por_categoria', 'por_morador', 'total_finalizadas'):
+            self.assertEqual(relatorio[chave], esperado[chave], chave)
+
+    def test_sem_finalizadas(self):
+        self._carregar([('LIMPEZA', "Ana", None)])
+        self.assertEqual(self.gerenciador.relatorio_tempo_realizacao(),
+                         {'erro': 'Nenhuma atividade finalizada'})
+
+
+if __name__ == '__main__':
+    unittest.main()
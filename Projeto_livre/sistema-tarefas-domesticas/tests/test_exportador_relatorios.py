@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Exportador de Relatórios
+==================================
+
+Ida e volta em CSV, JSON Lines e Markdown (inclusive seções cujos
+registros têm chaves diferentes) e escrita linha a linha, sem esperar o
+fim dos registros.
+"""
+
+import csv
+import io
+import json
+import os
+import re
+import tempfile
+import unittest
+
+from package.controllers.exportador_relatorios import (FORMATOS_EXPORTACAO, EscritorRelatorios,
+                                                       ExportadorRelatorios, _achatar,
+                                                       registros_relatorio)
+
+# Seção cujas chaves mudam no meio, seguida de outra seção
+REGISTROS_MISTOS = [
+    ('tarefas', {'nome': 'Lavar', 'pontos': 3}),
+    ('tarefas', {'nome': 'Varrer', 'responsavel': {'id': 'm1', 'nome': 'Ana'}}),
+    ('tarefas', {'nome': 'Passar', 'pontos': 5}),
+    ('tarefas', {'pontos': 1, 'nota': 'a|b, "c"'}),
+    ('resumo', {'total': 4}),
+]
+
+
+def _ler_csv(texto: str):
+    """Lê o CSV do exportador: blocos de cabeçalho + linhas, separados por linha vazia."""
+    registros = []
+    cabecalho = None
+    for linha in csv.reader(io.StringIO(texto)):
+        if not linha:
+            cabecalho = None
+        elif cabecalho is None:
+            cabecalho = linha
+        else:
+            campos = dict(zip(cabecalho, linha))
+            secao = campos.pop('secao')
+            registros.append((secao, {chave: valor for chave, valor in campos.items() if valor != ''}))
+    return registros
+
+
+def _ler_markdown(texto: str):
+    """Lê as tabelas Markdown do exportador: '## seção' e uma ou mais tabelas por seção."""
+    registros = []
+    secao = cabecalho = None
+    for linha in texto.splitlines():
+        if linha.startswith('## '):
+            secao, cabecalho = linha[3:], None
+        elif not linha.startswith('|'):
+            cabecalho = None
+        elif linha.startswith('|---'):
+            continue
+        else:
+            celulas = [celula.strip().replace('\\|', '|')
+                       for celula in re.split(r'(?<!\\)\|', linha.strip()[1:-1])]
+            if cabecalho is None:
+                cabecalho = celulas
+            else:
+                registros.append((secao, {chave: valor for chave, valor in zip(cabecalho, celulas)
+                                          if valor != ''}))
+    return registros
+
+
+def _como_texto(registros):
+    """O que se espera ler de volta de uma tabela: campos achatados, em texto."""
+    return [(secao, {chave: str(valor) for chave, valor in _achatar(campos).items() if valor != ''})
+            for secao, campos in registros]
+
+
+class TestExportadorRelatorios(unittest.TestCase):
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+
+    def _exportar(self, formato: str, registros) -> str:
+        caminho = os.path.join(self._diretorio.name, 'sub', f'saida.{formato}')
+        exportador = ExportadorRelatorios.para_arquivo(caminho)
+        self.assertEqual(exportador.formato, formato)
+        self.assertEqual(exportador.exportar_registros(iter(registros), caminho), len(registros))
+        with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+            return arquivo.read()
+
+    def test_ida_e_volta_com_chaves_mistas(self):
+        esperado = _como_texto(REGISTROS_MISTOS)
+        self.assertEqual(_ler_csv(self._exportar('csv', REGISTROS_MISTOS)), esperado)
+        self.assertEqual(_ler_markdown(self._exportar('md', REGISTROS_MISTOS)), esperado)
+
+        linhas = self._exportar('jsonl', REGISTROS_MISTOS).splitlines()
+        self.assertEqual([json.loads(linha) for linha in linhas],
+                         [{'secao': secao, **campos} for secao, campos in REGISTROS_MISTOS])
+
+    def test_colunas_anteriores_mantidas_no_novo_cabecalho(self):
+        texto = self._exportar('csv', REGISTROS_MISTOS)
+        cabecalhos = [linha for linha in texto.splitlines() if linha.startswith('secao,')]
+        self.assertEqual(cabecalhos, ['secao,nome,pontos',
+                                      'secao,nome,pontos,responsavel.id,responsavel.nome',
+                                      'secao,nome,pontos,responsavel.id,responsavel.nome,nota',
+                                      'secao,total'])
+        # Registros que cabem nas colunas atuais não repetem o cabeçalho
+        markdown = self._exportar('md', REGISTROS_MISTOS)
+        self.assertEqual(markdown.count('## tarefas'), 1)
+        separadores = [linha for linha in markdown.splitlines() if linha.startswith('|---')]
+        self.assertEqual(len(separadores), 4)
+
+    def test_ida_e_volta_de_um_relatorio(self):
+        relatorio = {
+            'total': 3,
+            'por_categoria': {'LIMPEZA': {'quantidade': 2}, 'COZINHA': {'quantidade': 1, 'media': 2.5}},
+            'ranking': [{'posicao': 1, 'nome': 'Ana'}, {'posicao': 2, 'nome': 'Bia', 'empate': True}],
+            'vazio': {},
+        }
+        registros = list(registros_relatorio(relatorio, 'resumo'))
+        self.assertEqual([secao for secao, _ in registros],
+                         ['resumo', 'resumo.por_categoria', 'resumo.por_categoria',
+                          'resumo.ranking', 'resumo.ranking'])
+
+        for formato, ler in (('csv', _ler_csv), ('md', _ler_markdown)):
+            with self.subTest(formato=formato):
+                caminho = os.path.join(self._diretorio.name, f'resumo.{formato}')
+                ExportadorRelatorios(formato).exportar_relatorio(relatorio, caminho, 'resumo')
+                with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+                    self.assertEqual(ler(arquivo.read()), _como_texto(registros))
+
+    def test_escrita_incremental(self):
+        for formato in FORMATOS_EXPORTACAO:
+            with self.subTest(formato=formato):
+                saida = io.StringIO()
+                escrito_antes = []
+
+                def registros():
+                    for secao, campos in REGISTROS_MISTOS:
+                        escrito_antes.append(saida.getvalue())
+                        yield secao, campos
+
+                escritor = EscritorRelatorios(saida, formato)
+                self.assertEqual(escritor.escrever(registros()), len(REGISTROS_MISTOS))
+                # Cada registro já está no arquivo quando o seguinte é pedido
+                self.assertEqual(escrito_antes[0], '')
+                for anterior, seguinte in zip(escrito_antes, escrito_antes[1:]):
+                    self.assertGreater(len(seguinte), len(anterior))
+                    self.assertTrue(saida.getvalue().startswith(seguinte))
+
+    def test_varias_chamadas_no_mesmo_escritor(self):
+        saida = io.StringIO()
+        escritor = EscritorRelatorios(saida, 'csv')
+        escritor.escrever_relatorio([{'nome': 'Ana'}], 'moradores', contexto={'arquivo': 'a.json'})
+        escritor.escrever_relatorio([{'nome': 'Bia', 'pontos': 2}], 'moradores',
+                                    contexto={'arquivo': 'b.json'})
+        self.assertEqual(escritor.total_registros, 2)
+        self.assertEqual(_ler_csv(saida.getvalue()),
+                         [('moradores', {'arquivo': 'a.json', 'nome': 'Ana'}),
+                          ('moradores', {'arquivo': 'b.json', 'nome': 'Bia', 'pontos': '2'})])
+
+    def test_formato_invalido(self):
+        with self.assertRaises(ValueError):
+            ExportadorRelatorios('xlsx')
+        self.assertEqual(ExportadorRelatorios.para_arquivo('saida.json').formato, 'jsonl')
+
+
+if __name__ == '__main__':
+    unittest.main()
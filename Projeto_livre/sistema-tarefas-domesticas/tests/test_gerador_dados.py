@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Gerador de Dados Sintéticos
+=====================================
+
+O arquivo gerado carrega com carregar_dados() e volta idêntico em
+montar_dados(); mesma semente, mesmo arquivo; pontos coerentes com as
+atividades finalizadas; parâmetros inválidos não deixam arquivo.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from benchmarks.gerador_dados import ParametrosGeracao, gravar_json, main, sufixo_letras
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.models.residencia import Residencia
+
+
+def _ler(caminho: str):
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+
+class TestGeradorDados(unittest.TestCase):
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+
+    def _caminho(self, nome: str) -> str:
+        return os.path.join(self._diretorio.name, nome)
+
+    def _carregar(self, caminho: str) -> GerenciadorTarefas:
+        gerenciador = GerenciadorTarefas(Residencia("Casa"), ArmazenamentoDados(caminho))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(gerenciador.carregar_dados())
+        return gerenciador
+
+    def test_ida_e_volta_por_carregar_dados(self):
+        caminho = self._caminho('dados.json')
+        resumo = gravar_json(caminho, ParametrosGeracao(moradores=20, anos=0.5, semente=3))
+        gerenciador = self._carregar(caminho)
+
+        self.assertEqual(len(gerenciador.obter_moradores()), resumo['moradores'])
+        self.assertEqual(gerenciador.contar_atividades(), resumo['atividades'])
+        self.assertEqual(gerenciador.montar_dados(), _ler(caminho)['dados'])
+
+    def test_pontos_e_situacoes_coerentes(self):
+        caminho = self._caminho('dados.json')
+        resumo = gravar_json(caminho, ParametrosGeracao(moradores=8, total_atividades=2000, semente=5))
+        dados = _ler(caminho)['dados']
+        atividades = dados['atividades']
+
+        self.assertEqual(len(atividades), 2000)
+        self.assertEqual(Counter(a['situacao'] for a in atividades), resumo['situacoes'])
+
+        pontos = Counter()
+        for atividade in atividades:
+            if atividade['situacao'] == 'FINALIZADA' and atividade['responsavel_id']:
+                pontos[atividade['responsavel_id']] += atividade['pontos_tarefa']
+        for morador in dados['residencia']['moradores']:
+            self.assertEqual(morador['pontos_realizadas'], pontos[morador['id']])
+
+        datas = [a['data_criacao'] for a in atividades]
+        self.assertEqual(datas, sorted(datas))
+
+    def test_mesma_semente_mesmo_arquivo(self):
+        arquivos = []
+        for nome, semente in (('a.json', 7), ('b.json', 7), ('c.json', 8)):
+            gravar_json(self._caminho(nome), ParametrosGeracao(moradores=5, anos=0.2, semente=semente))
+            with open(self._caminho(nome), 'rb') as arquivo:
+                arquivos.append(arquivo.read())
+        self.assertEqual(arquivos[0], arquivos[1])
+        self.assertNotEqual(arquivos[0], arquivos[2])
+
+    def test_nomes_curtos_continuam_unicos_e_validos(self):
+        caminho = self._caminho('dados.json')
+        gravar_json(caminho, ParametrosGeracao(moradores=300, total_atividades=0,
+                                               tamanho_nome_morador=(2, 3)))
+        gerenciador = self._carregar(caminho)
+        nomes = [morador.nome for morador in gerenciador.obter_moradores()]
+        self.assertEqual(len(nomes), 300)
+        self.assertEqual(len({nome.lower() for nome in nomes}), 300)
+
+    def test_parametros_invalidos_nao_criam_arquivo(self):
+        caminho = self._caminho('dados.json')
+        for parametros in (ParametrosGeracao(moradores=0),
+                           ParametrosGeracao(taxa_finalizadas=0.8, taxa_canceladas=0.3),
+                           ParametrosGeracao(mix_categorias={'PISCINA': 1.0})):
+            with self.assertRaises(ValueError):
+                gravar_json(caminho, parametros)
+        self.assertEqual(os.listdir(self._diretorio.name), [])
+
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main([caminho, '-m', '0']), 2)
+
+    def test_sufixo_letras(self):
+        self.assertEqual([sufixo_letras(i) for i in (0, 25, 26, 27, 701, 702)],
+                         ['a', 'z', 'aa', 'ab', 'zz', 'aaa'])
+
+
+if __name__ == '__main__':
+    unittest.main()
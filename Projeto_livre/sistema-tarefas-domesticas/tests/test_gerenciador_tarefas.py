@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das Operações em Lote do Gerenciador
+===========================================
+
+Uma chamada em lote avisa os observadores (e portanto salva) uma única
+vez; contadores, esboços e índice de busca terminam iguais aos montados do
+zero; IDs inválidos ou que não se aplicam são ignorados sem erro.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+from benchmarks.gerador_dados import ParametrosGeracao, gravar_json
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.models.enums import SituacaoTarefa
+from package.models.residencia import Residencia
+
+
+class TestOperacoesEmLote(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._diretorio = tempfile.TemporaryDirectory()
+        cls.arquivo_base = os.path.join(cls._diretorio.name, 'base.json')
+        gravar_json(cls.arquivo_base, ParametrosGeracao(moradores=6, total_atividades=400, semente=21))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._diretorio.cleanup()
+
+    def setUp(self):
+        self.arquivo = os.path.join(self._diretorio.name, f'{self._testMethodName}.json')
+        with open(self.arquivo_base, 'rb') as origem, open(self.arquivo, 'wb') as destino:
+            destino.write(origem.read())
+        self.gerenciador = GerenciadorTarefas(Residencia("Casa"),
+                                              ArmazenamentoDados(self.arquivo, usar_cache=False))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(self.gerenciador.carregar_dados())
+
+        # Salvamento automático a cada alteração, como faz a interface
+        self.eventos = []
+        self.gerenciador.adicionar_observador(self._salvar_ao_alterar)
+
+    def _salvar_ao_alterar(self, evento, ids):
+        self.eventos.append((evento, ids))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.gerenciador.salvar_dados()
+
+    def _ids(self, situacao: SituacaoTarefa, quantidade: int):
+        atividades = self.gerenciador.listar_atividades_por_situacao(situacao)
+        return [a.id_atividade for a in atividades][:quantidade]
+
+    def _operar(self, operacao, ids, *argumentos):
+        """Executa uma operação em lote contando versões, eventos e gravações."""
+        versao = self.gerenciador.versao
+        self.eventos.clear()
+        with mock.patch.object(ArmazenamentoDados, 'salvar_em_json', autospec=True,
+                               side_effect=ArmazenamentoDados.salvar_em_json) as gravacao:
+            alteradas = operacao(ids, *argumentos)
+        return alteradas, self.gerenciador.versao - versao, len(self.eventos), gravacao.call_count
+
+    def test_uma_gravacao_um_aviso_uma_versao(self):
+        pendentes = self._ids(SituacaoTarefa.PENDENTE, 30)
+        morador = self.gerenciador.obter_moradores()[0].id
+        atribuir = self.gerenciador.atribuir_responsavel_em_lote
+        operacoes = (
+            ('atividade_finalizada', self.gerenciador.finalizar_atividades, pendentes[:10], ()),
+            ('atividade_cancelada', self.gerenciador.cancelar_atividades, pendentes[10:20], ()),
+            ('responsavel_atribuido', atribuir, pendentes[20:], (morador,)),
+            ('atividade_excluida', self.gerenciador.excluir_atividades, pendentes[:5] + pendentes[15:20], ()),
+        )
+        for evento, operacao, ids, argumentos in operacoes:
+            with self.subTest(evento=evento):
+                alteradas, versoes, avisos, gravacoes = self._operar(operacao, ids, *argumentos)
+                self.assertEqual(alteradas, ids)
+                self.assertEqual((versoes, avisos, gravacoes), (1, 1, 1))
+                self.assertEqual(self.eventos, [(evento, tuple(ids))])
+
+    def test_ids_invalidos_ignorados_e_informados(self):
+        pendentes = self._ids(SituacaoTarefa.PENDENTE, 3)
+        finalizada = self._ids(SituacaoTarefa.FINALIZADA, 1)
+        cancelada = self._ids(SituacaoTarefa.CANCELADA, 1)
+        ids = ['inexistente', pendentes[0], pendentes[0]] + finalizada + cancelada + [pendentes[1], '']
+
+        alteradas, versoes, avisos, _ = self._operar(self.gerenciador.finalizar_atividades, ids)
+        self.assertEqual(alteradas, pendentes[:2])
+        self.assertEqual((versoes, avisos), (1, 1))
+        self.assertEqual(set(ids) - set(alteradas), {'inexistente', '', *finalizada, *cancelada})
+
+        alteradas, _, _, _ = self._operar(self.gerenciador.cancelar_atividades, ids)
+        self.assertEqual(alteradas, [])
+
+        # Nada aplicável: nenhum aviso, nenhuma gravação, mesma versão
+        for operacao, argumentos in ((self.gerenciador.finalizar_atividades, ()),
+                                     (self.gerenciador.cancelar_atividades, ()),
+                                     (self.gerenciador.excluir_atividades, ()),
+                                     (self.gerenciador.atribuir_responsavel_em_lote, ('inexistente',))):
+            with self.subTest(operacao=operacao.__name__):
+                self.assertEqual(self._operar(operacao, ['inexistente', ''], *argumentos), ([], 0, 0, 0))
+        self.assertEqual(self._operar(self.gerenciador.atribuir_responsavel_em_lote, pendentes,
+                                      'inexistente'), ([], 0, 0, 0))
+
+    def test_estruturas_iguais_as_montadas_do_zero(self):
+        moradores = [m.id for m in self.gerenciador.obter_moradores()]
+        pendentes = self._ids(SituacaoTarefa.PENDENTE, 60)
+        finalizadas = self._ids(SituacaoTarefa.FINALIZADA, 20)
+        canceladas = self._ids(SituacaoTarefa.CANCELADA, 5)
+
+        self.gerenciador.finalizar_atividades(pendentes[:25] + finalizadas[:3])
+        self.gerenciador.cancelar_atividades(pendentes[20:40])
+        # Troca o responsável de finalizadas antigas e recém-finalizadas
+        self.gerenciador.atribuir_responsavel_em_lote(finalizadas[:10] + pendentes[:5], moradores[0])
+        self.gerenciador.atribuir_responsavel_em_lote(pendentes[40:50], moradores[1])
+        self.gerenciador.excluir_atividades(finalizadas[5:15] + pendentes[:3] + pendentes[30:35]
+                                            + canceladas[:2] + ['inexistente'])
+
+        do_zero = self.gerenciador.montar_estado(self.gerenciador.montar_dados())
+
+        self.assertEqual(+self.gerenciador._contagem_situacao, +do_zero['contagem_situacao'])
+        self.assertEqual(sum(self.gerenciador._contagem_situacao.values()),
+                         self.gerenciador.contar_atividades())
+        self.assertEqual(Counter(a.situacao for a in self.gerenciador.atividades),
+                         +self.gerenciador._contagem_situacao)
+
+        for nome in ('esbocos_categoria', 'esbocos_morador'):
+            atuais = {chave: esboco for chave, esboco in getattr(self.gerenciador, f'_{nome}').items()
+                      if not esboco.vazio}
+            esperados = {chave: esboco for chave, esboco in do_zero[nome].items() if not esboco.vazio}
+            self.assertEqual(set(atuais), set(esperados), nome)
+            for chave, esboco in atuais.items():
+                with self.subTest(esbocos=nome, chave=chave):
+                    self.assertEqual(esboco._baldes, esperados[chave]._baldes)
+                    self.assertEqual(esboco.contagem, esperados[chave].contagem)
+                    self.assertAlmostEqual(esboco.soma, esperados[chave].soma, delta=1e-3)
+
+        nomes = [self.gerenciador.obter_morador_por_id(m).nome for m in moradores[:2]]
+        for consulta in ['', 'finalizada', 'cancelada', 'pendente', 'limpeza', 'não atribuído', *nomes]:
+            with self.subTest(consulta=consulta):
+                self.assertEqual(self.gerenciador.buscar_atividades(consulta),
+                                 do_zero['indice_busca'].buscar(consulta))
+
+        self.assertEqual(self.gerenciador.filtrar_atividades(responsavel_id=moradores[0],
+                                                             situacao=SituacaoTarefa.FINALIZADA),
+                         [a for a in do_zero['atividades']
+                          if a.responsavel_id == moradores[0] and a.esta_finalizada])
+
+
+if __name__ == '__main__':
+    unittest.main()
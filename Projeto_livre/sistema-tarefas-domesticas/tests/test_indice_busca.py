@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do IndiceBusca
+=====================
+
+Busca sem acentos, uso por duas threads (a interface busca em segundo
+plano enquanto a thread principal altera as atividades) e pickle do
+índice no cache de inicialização.
+"""
+
+import pickle
+import threading
+import unittest
+
+from package.utils.indice_busca import IndiceBusca
+
+
+def _indice(quantidade: int) -> IndiceBusca:
+    """Índice com 'quantidade' documentos em duas situações."""
+    indice = IndiceBusca()
+    for i in range(quantidade):
+        indice.adicionar(f"d{i}", [f"Lavar louça {i}", "Cozinha"],
+                         {'situacao': 'pendente' if i % 2 else 'finalizada'})
+    return indice
+
+
+class TestIndiceBusca(unittest.TestCase):
+
+    def test_busca_sem_acentos_e_por_faceta(self):
+        indice = _indice(10)
+        self.assertEqual(len(indice.buscar("LOUCA")), 10)
+        self.assertEqual(indice.buscar("pendente lou"), [f"d{i}" for i in range(1, 10, 2)])
+
+    def test_busca_concorrente_com_alteracoes(self):
+        indice = _indice(20000)
+        erros = []
+        parar = threading.Event()
+
+        def buscar():
+            try:
+                while not parar.is_set():
+                    for consulta in ("l", "pendente", "lou", "lavar 1"):
+                        indice.buscar(consulta)
+            except Exception as e:  # dicionário alterado durante a iteração, etc.
+                erros.append(e)
+
+        thread = threading.Thread(target=buscar)
+        thread.start()
+        try:
+            for i in range(2000):
+                indice.definir_faceta(f"d{i}", 'situacao', 'cancelada')
+                indice.adicionar(f"n{i}", [f"Novo {i}"], {'situacao': 'pendente'})
+                indice.remover(f"d{i + 5000}")
+        finally:
+            parar.set()
+            thread.join()
+
+        self.assertEqual(erros, [])
+        self.assertEqual(len(indice.buscar("cancelada")), 2000)
+        self.assertEqual(len(indice), 20000)
+
+    def test_pickle_sem_trava_nem_cache(self):
+        indice = _indice(50)
+        indice.buscar("lou")
+        copia = pickle.loads(pickle.dumps(indice))
+        self.assertEqual(copia.buscar("pendente"), indice.buscar("pendente"))
+        copia.adicionar("x", ["Varrer"], {'situacao': 'pendente'})
+        self.assertEqual(copia.buscar("varrer"), ["x"])
+        self.assertNotIn("x", indice)
+
+
+if __name__ == '__main__':
+    unittest.main()
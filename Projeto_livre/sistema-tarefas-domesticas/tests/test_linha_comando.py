@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da Linha de Comando
+==========================
+
+Lote atômico (nada é salvo se uma linha falha, a menos que --continuar),
+--simular e validação dos parâmetros de relatório.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from package.views.linha_comando import main
+
+
+class TestLinhaComando(unittest.TestCase):
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+        self.arquivo = os.path.join(self._diretorio.name, 'dados.json')
+        self.assertEqual(self._executar('morador', 'adicionar', 'Ana')[0], 0)
+
+    def _executar(self, *argv):
+        """Roda a linha de comando e devolve (código, stdout, stderr)."""
+        saida, erros = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(saida), contextlib.redirect_stderr(erros):
+            codigo = main(['-a', self.arquivo, '--sem-cache', *argv])
+        return codigo, saida.getvalue(), erros.getvalue()
+
+    def _lote(self, linhas, *opcoes):
+        caminho = os.path.join(self._diretorio.name, 'comandos.txt')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(linhas))
+        return self._executar('lote', caminho, *opcoes)
+
+    def _dados(self):
+        with open(self.arquivo, 'r', encoding='utf-8') as arquivo:
+            return json.load(arquivo)['dados']
+
+    def test_lote_com_erro_nao_salva_nada(self):
+        antes = self._dados()
+        codigo, _, erros = self._lote([
+            'morador adicionar Bruno',
+            'atividade adicionar limpeza "Varrer a sala" -r Bruno',
+            'atividade finalizar inexistente',
+            'morador adicionar Carla'
+        ])
+        self.assertEqual(codigo, 1)
+        self.assertIn("linha 3", erros)
+        self.assertIn("Nada foi salvo", erros)
+        self.assertEqual(self._dados(), antes)
+
+    def test_lote_completo_salva_uma_vez(self):
+        codigo, _, _ = self._lote([
+            '# comentário',
+            'morador adicionar Bruno',
+            'atividade adicionar limpeza "Varrer a sala" -r Bruno',
+            'atividade finalizar @ultima'
+        ])
+        self.assertEqual(codigo, 0)
+        dados = self._dados()
+        self.assertEqual(sorted(m['nome'] for m in dados['residencia']['moradores']), ['Ana', 'Bruno'])
+        self.assertEqual(len(dados['atividades']), 1)
+
+    def test_lote_continuar_salva_o_que_deu_certo(self):
+        codigo, _, erros = self._lote(['atividade finalizar inexistente',
+                                       'morador adicionar Bruno'], '--continuar')
+        self.assertEqual(codigo, 1)
+        self.assertNotIn("Nada foi salvo", erros)
+        self.assertEqual(len(self._dados()['residencia']['moradores']), 2)
+
+    def test_lote_simular_nao_salva(self):
+        antes = self._dados()
+        codigo, _, _ = self._lote(['morador adicionar Bruno'], '--simular')
+        self.assertEqual(codigo, 0)
+        self.assertEqual(self._dados(), antes)
+
+    def test_parametros_do_relatorio_fora_da_faixa(self):
+        for argumentos in (['--dias', '0'], ['--dias', '99999999999'], ['--dias', 'x'],
+                           ['--mes', '0'], ['--mes', '13']):
+            nome = 'historico_mes' if argumentos[0] == '--mes' else 'produtividade_diaria'
+            codigo, _, erros = self._executar('relatorio', nome, *argumentos)
+            self.assertEqual(codigo, 2, argumentos)
+            self.assertIn(argumentos[0], erros)
+
+    def test_parametros_do_relatorio_validos(self):
+        codigo, saida, _ = self._executar('relatorio', 'produtividade_diaria', '--dias', '30')
+        self.assertEqual(codigo, 0)
+        self.assertEqual(json.loads(saida)['periodo'], "Últimos 30 dias")
+        codigo, saida, _ = self._executar('relatorio', 'historico_mes', '--mes', '12', '--ano', '2024')
+        self.assertEqual(codigo, 0)
+        self.assertEqual(json.loads(saida)['mes'], 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das Métricas de Desempenho
+=================================
+
+Histograma acumulado, formato de texto do Prometheus, exportação em JSON
+e instrumentação que liga e desliga sem deixar rastro nas classes.
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+import unittest
+
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.models.residencia import Residencia
+from package.utils.metricas import (LIMITES_LATENCIA, Instrumentacao, PontoInstrumentado,
+                                    RegistroMetricas)
+
+# Uma linha de amostra do Prometheus: nome{rótulos} valor
+LINHA_AMOSTRA = re.compile(r'^([a-z_]+)\{(.*)\} (\S+)$')
+
+
+def _registro_exemplo() -> RegistroMetricas:
+    """Registro com latências longe dos limites das faixas."""
+    registro = RegistroMetricas()
+    for segundos in (0.0001, 0.003, 0.3, 20.0):
+        registro.registrar_chamada('Exemplo.operar', segundos)
+    registro.registrar_chamada('Exemplo.operar', 0.003, erro=True)
+    registro.registrar_bytes('Exemplo.operar', 'escrita', 1024)
+    registro.registrar_bytes('Exemplo.operar', 'escrita', 512)
+    return registro
+
+
+class _Falha:
+    """Classe instrumentada nos testes de erro."""
+
+    def falhar(self):
+        raise RuntimeError("falha de teste")
+
+
+class TestRegistroMetricas(unittest.TestCase):
+
+    def test_histograma_acumulado(self):
+        histograma = _registro_exemplo().para_json()['operacoes']['Exemplo.operar']['histograma']
+        self.assertEqual(list(histograma), [repr(limite) for limite in LIMITES_LATENCIA] + ['+Inf'])
+        esperado = {'0.0005': 1, '0.0025': 1, '0.005': 3, '0.25': 3, '0.5': 4, '10.0': 4, '+Inf': 5}
+        for limite, quantidade in esperado.items():
+            self.assertEqual(histograma[limite], quantidade, limite)
+        valores = list(histograma.values())
+        self.assertEqual(valores, sorted(valores))
+
+    def test_json(self):
+        operacao = _registro_exemplo().para_json()['operacoes']['Exemplo.operar']
+        self.assertEqual((operacao['chamadas'], operacao['erros']), (5, 1))
+        self.assertEqual(operacao['maximo_segundos'], 20.0)
+        self.assertAlmostEqual(operacao['soma_segundos'], 20.3061)
+        self.assertAlmostEqual(operacao['p50_segundos'], 0.003, delta=0.003 * 0.02)
+        self.assertEqual(operacao['bytes'], {'escrita': 1536})
+
+    def test_prometheus(self):
+        registro = _registro_exemplo()
+        registro.registrar_chamada('Rotulo "com" aspas\\barra', 0.01)
+        texto = registro.para_prometheus()
+        self.assertTrue(texto.endswith('\n'))
+
+        amostras = {}
+        tipos = {}
+        for linha in texto.splitlines():
+            if linha.startswith('# TYPE'):
+                _, _, nome, tipo = linha.split()
+                self.assertNotIn(nome, tipos)
+                tipos[nome] = tipo
+                continue
+            if linha.startswith('#'):
+                continue
+            correspondencia = LINHA_AMOSTRA.match(linha)
+            self.assertIsNotNone(correspondencia, linha)
+            nome, rotulos, valor = correspondencia.groups()
+            amostras[(nome, rotulos)] = float(valor)
+
+        self.assertEqual(tipos, {'tarefas_chamadas_total': 'counter', 'tarefas_erros_total': 'counter',
+                                 'tarefas_latencia_segundos': 'histogram', 'tarefas_bytes_total': 'counter'})
+        rotulo = 'operacao="Exemplo.operar"'
+        self.assertEqual(amostras[('tarefas_chamadas_total', rotulo)], 5)
+        self.assertEqual(amostras[('tarefas_erros_total', rotulo)], 1)
+        self.assertEqual(amostras[('tarefas_bytes_total', rotulo + ',direcao="escrita"')], 1536)
+        self.assertEqual(amostras[('tarefas_latencia_segundos_bucket', rotulo + ',le="0.005"')], 3)
+        self.assertEqual(amostras[('tarefas_latencia_segundos_bucket', rotulo + ',le="+Inf"')],
+                         amostras[('tarefas_latencia_segundos_count', rotulo)])
+        self.assertAlmostEqual(amostras[('tarefas_latencia_segundos_sum', rotulo)], 20.3061)
+        self.assertIn(('tarefas_chamadas_total', r'operacao="Rotulo \"com\" aspas\\barra"'), amostras)
+
+    def test_salvar_pela_extensao(self):
+        registro = _registro_exemplo()
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho_json = os.path.join(diretorio, 'sub', 'metricas.json')
+            caminho_prom = os.path.join(diretorio, 'metricas.prom')
+            self.assertTrue(registro.salvar(caminho_json))
+            self.assertTrue(registro.salvar(caminho_prom))
+            with open(caminho_json, 'r', encoding='utf-8') as arquivo:
+                self.assertIn('Exemplo.operar', json.load(arquivo)['operacoes'])
+            with open(caminho_prom, 'r', encoding='utf-8') as arquivo:
+                self.assertEqual(arquivo.read(), registro.para_prometheus())
+
+    def test_varias_threads(self):
+        registro = RegistroMetricas()
+
+        def registrar():
+            for _ in range(2000):
+                registro.registrar_chamada('Exemplo.operar', 0.001)
+
+        threads = [threading.Thread(target=registrar) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(registro.para_json()['operacoes']['Exemplo.operar']['chamadas'], 16000)
+
+        registro.limpar()
+        self.assertEqual(registro.para_json()['operacoes'], {})
+
+
+class TestInstrumentacao(unittest.TestCase):
+
+    PONTOS = [
+        PontoInstrumentado('.controllers.gerenciador_tarefas', 'GerenciadorTarefas',
+                           ('salvar_dados', 'carregar_dados')),
+        PontoInstrumentado('.controllers.armazenamento_dados', 'ArmazenamentoDados',
+                           ('salvar_em_json',), bytes='escrita'),
+    ]
+
+    def test_ativar_medir_e_restaurar(self):
+        originais = {nome: vars(GerenciadorTarefas)[nome] for nome in ('salvar_dados', 'carregar_dados')}
+        instrumentacao = Instrumentacao(RegistroMetricas(), self.PONTOS)
+        self.assertFalse(instrumentacao.ativa)
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'dados.json')
+            gerenciador = GerenciadorTarefas(Residencia("Casa"), ArmazenamentoDados(caminho))
+            instrumentacao.ativar()
+            try:
+                self.assertIs(instrumentacao.ativar(), instrumentacao)
+                self.assertTrue(instrumentacao.ativa)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    gerenciador.salvar_dados()
+                    gerenciador.salvar_dados()
+            finally:
+                instrumentacao.desativar()
+            tamanho = os.path.getsize(caminho)
+
+        self.assertFalse(instrumentacao.ativa)
+        for nome, original in originais.items():
+            self.assertIs(vars(GerenciadorTarefas)[nome], original)
+
+        operacoes = instrumentacao.registro.para_json()['operacoes']
+        self.assertEqual(operacoes['GerenciadorTarefas.salvar_dados']['chamadas'], 2)
+        self.assertNotIn('GerenciadorTarefas.carregar_dados', operacoes)
+        self.assertEqual(operacoes['ArmazenamentoDados.salvar_em_json']['bytes'], {'escrita': 2 * tamanho})
+
+    def test_erros_contados_e_propagados(self):
+        ponto = PontoInstrumentado(__name__, '_Falha', ('falhar',))
+        instrumentacao = Instrumentacao(RegistroMetricas(), [ponto]).ativar()
+        try:
+            with self.assertRaises(RuntimeError):
+                _Falha().falhar()
+        finally:
+            instrumentacao.desativar()
+        operacao = instrumentacao.registro.para_json()['operacoes']['_Falha.falhar']
+        self.assertEqual((operacao['chamadas'], operacao['erros']), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
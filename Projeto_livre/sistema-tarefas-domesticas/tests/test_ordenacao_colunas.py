@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da Ordenação por Coluna
+==============================
+
+Chaves calculadas uma vez por linha; uma linha alterada depois da
+ordenação vai, por bisect, para a mesma posição de uma ordenação completa,
+nas duas direções; na Treeview falsa isso vira um item() e um move.
+"""
+
+import random
+import unittest
+
+from package.views.ordenacao_colunas import OrdenacaoColunas
+from package.views.reconciliador_treeview import ReconciliadorTreeview
+from tests.test_reconciliador_treeview import TreeviewFalsa
+
+COLUNAS = ('Tarefa', 'Pontos')
+
+
+class TestOrdenacaoColunas(unittest.TestCase):
+
+    def setUp(self):
+        aleatorio = random.Random(5)
+        # Poucos valores distintos: muitas chaves iguais, desempatadas pelo iid
+        self.linhas = {f"ATV{numero:04d}": {'Tarefa': f"Tarefa {aleatorio.randrange(40):02d}",
+                                            'Pontos': aleatorio.randrange(10)}
+                       for numero in range(300)}
+        self.calculadas = []
+        self.ordenacao = OrdenacaoColunas(self._chave)
+
+    def _chave(self, coluna, iid):
+        self.calculadas.append((coluna, iid))
+        return self.linhas[iid][coluna]
+
+    def _reordenada(self, coluna, decrescente, iids=None):
+        """Ordem de uma ordenação completa, do zero."""
+        iids = self.linhas if iids is None else iids
+        return sorted(iids, key=lambda iid: (self.linhas[iid][coluna], iid), reverse=decrescente)
+
+    def _exibida(self):
+        return self.ordenacao.janela(0, len(self.linhas) + 10)
+
+    def test_chaves_calculadas_uma_vez(self):
+        self.ordenacao.ordenar('Pontos', False, self.linhas)
+        self.ordenacao.ordenar('Tarefa', True, self.linhas)
+        self.ordenacao.ordenar('Pontos', True, self.linhas)
+        self.ordenacao.inverter()
+        self.assertEqual(sorted(self.calculadas),
+                         sorted((coluna, iid) for coluna in COLUNAS for iid in self.linhas))
+        self.assertEqual(self._exibida(), self._reordenada('Pontos', False))
+
+        # Só a linha invalidada é recalculada
+        self.calculadas.clear()
+        self.ordenacao.invalidar('ATV0010')
+        self.assertEqual(self.calculadas, [('Pontos', 'ATV0010')])
+
+    def test_linha_alterada_na_posicao_da_ordenacao_completa(self):
+        aleatorio = random.Random(9)
+        for coluna in COLUNAS:
+            for decrescente in (False, True):
+                with self.subTest(coluna=coluna, decrescente=decrescente):
+                    self.ordenacao.ordenar(coluna, decrescente, self.linhas)
+                    for _ in range(40):
+                        iid = aleatorio.choice(list(self.linhas))
+                        self.linhas[iid]['Tarefa'] = f"Tarefa {aleatorio.randrange(40):02d}"
+                        self.linhas[iid]['Pontos'] = aleatorio.randrange(10)
+                        versao = self.ordenacao.versao
+                        self.ordenacao.invalidar(iid)
+                        self.assertGreater(self.ordenacao.versao, versao)
+                        self.assertEqual(self._exibida(), self._reordenada(coluna, decrescente))
+
+                    # Inverter só muda a leitura
+                    self.ordenacao.inverter()
+                    self.assertEqual(self._exibida(), self._reordenada(coluna, not decrescente))
+
+    def test_adicionar_remover_janela_e_filtro(self):
+        self.ordenacao.ordenar('Tarefa', True, list(self.linhas)[:-20])
+        for iid in list(self.linhas)[-20:]:
+            self.ordenacao.adicionar(iid)
+        for iid in list(self.linhas)[:15]:
+            self.ordenacao.remover(iid)
+            del self.linhas[iid]
+        completa = self._reordenada('Tarefa', True)
+        self.assertEqual(self._exibida(), completa)
+        self.assertEqual(len(self.ordenacao), len(completa))
+
+        for decrescente in (True, False):
+            with self.subTest(decrescente=decrescente):
+                for inicio, limite in ((0, 50), (100, 37), (len(completa) - 5, 50), (-3, 4), (10, 0)):
+                    inicio_real = max(0, inicio)
+                    self.assertEqual(self.ordenacao.janela(inicio, limite),
+                                     completa[inicio_real:inicio_real + max(0, limite)])
+                # Filtro pequeno (bisect por chave) e grande (varredura da lista)
+                for quantidade in (10, 200):
+                    subconjunto = random.Random(quantidade).sample(list(self.linhas), quantidade)
+                    self.assertEqual(self.ordenacao.filtrar(subconjunto),
+                                     self._reordenada('Tarefa', decrescente, subconjunto))
+                self.ordenacao.inverter()
+                completa.reverse()
+
+    def test_invalidar_coluna_reordena(self):
+        self.ordenacao.ordenar('Tarefa', False, self.linhas)
+        for linha in self.linhas.values():
+            linha['Tarefa'] = linha['Tarefa'][::-1]
+        self.ordenacao.invalidar_coluna('Pontos')
+        self.assertNotEqual(self._exibida(), self._reordenada('Tarefa', False))
+        self.ordenacao.invalidar_coluna('Tarefa')
+        self.assertEqual(self._exibida(), self._reordenada('Tarefa', False))
+
+        self.ordenacao.limpar()
+        self.assertFalse(self.ordenacao.ativa)
+        self.assertEqual(self._exibida(), [])
+
+    def test_linha_alterada_na_treeview(self):
+        tree = TreeviewFalsa()
+        reconciliador = ReconciliadorTreeview(tree)
+
+        def exibir():
+            reconciliador.reconciliar([(iid, (self.linhas[iid]['Tarefa'], self.linhas[iid]['Pontos']), ())
+                                       for iid in self._exibida()])
+
+        for decrescente in (False, True):
+            with self.subTest(decrescente=decrescente):
+                self.ordenacao.ordenar('Pontos', decrescente, self.linhas)
+                exibir()
+                iid = self._exibida()[len(self.linhas) // 2]
+                self.linhas[iid]['Pontos'] = 9 if decrescente else 0
+                self.ordenacao.invalidar(iid)
+
+                tree.chamadas.clear()
+                exibir()
+                self.assertEqual(tree.get_children(), tuple(self._reordenada('Pontos', decrescente)))
+                self.assertEqual(sorted(tree.chamadas), ['detach', 'item', 'move'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes das Exportações do Pacote
+================================
+
+Importação preguiçosa e "from package import *" sem tkinter. Cada caso
+roda num interpretador novo, porque outros testes já carregam módulos.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Diretório do projeto (onde fica o pacote "package")
+DIRETORIO_PROJETO = Path(__file__).resolve().parent.parent
+
+
+def _executar(codigo: str) -> str:
+    """Executa 'codigo' num interpretador novo e devolve a saída."""
+    processo = subprocess.run([sys.executable, '-c', codigo], cwd=DIRETORIO_PROJETO,
+                              capture_output=True, text=True, check=True)
+    return processo.stdout.strip()
+
+
+class TestExportacoes(unittest.TestCase):
+
+    def test_importacao_com_asterisco_sem_views(self):
+        saida = _executar(
+            "import sys\n"
+            "from package import *\n"
+            "print('tkinter' in sys.modules, 'package.views' in sys.modules,"
+            " GerenciadorTarefas.__name__, 'InterfaceVisual' in dir())"
+        )
+        self.assertEqual(saida, "False False GerenciadorTarefas False")
+
+    def test_all_cobre_exportacoes_sem_interface(self):
+        import package
+        esperado = [nome for nome, subpacote in package._EXPORTACOES.items()
+                    if subpacote != 'views']
+        self.assertEqual(package.__all__, esperado)
+        self.assertNotIn('InterfaceVisual', package.__all__)
+        for nome in ('executar_lote', 'diagnosticar', 'IndiceBusca', 'RegistroMetricas'):
+            self.assertIn(nome, package.__all__)
+
+    def test_views_continuam_acessiveis_pelo_nome(self):
+        saida = _executar(
+            "from package import ApiTarefas\n"
+            "print(ApiTarefas.__name__)"
+        )
+        self.assertEqual(saida, "ApiTarefas")
+
+    def test_subpacotes_importam_so_no_primeiro_acesso(self):
+        saida = _executar(
+            "import sys\n"
+            "import package.utils, package.controllers, package.views\n"
+            "print('cProfile' in sys.modules, 'package.views.interface_visual' in sys.modules,"
+            " 'criar_perfilador' in dir(package.utils), 'criar_perfilador' in vars(package.utils))\n"
+            "package.utils.criar_perfilador\n"
+            "print('cProfile' in sys.modules, 'criar_perfilador' in vars(package.utils))"
+        )
+        self.assertEqual(saida, "False False True False\nTrue True")
+
+        import package.controllers
+        import package.views
+        for subpacote in (package.controllers, package.utils, package.views):
+            with self.subTest(subpacote=subpacote.__name__):
+                self.assertEqual(subpacote.__all__, list(subpacote._EXPORTACOES))
+                with self.assertRaises(AttributeError):
+                    getattr(subpacote, 'inexistente')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes dos Perfiladores
+=======================
+
+Perfil determinístico com duas threads no escopo ao mesmo tempo (no
+Python 3.12+ só um cProfile pode estar ativo) e a base abstrata.
+"""
+
+import threading
+import unittest
+
+from package.utils.perfilador import Perfilador, PerfiladorDeterministico
+
+
+def _quadrados(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+class TestPerfiladorDeterministico(unittest.TestCase):
+
+    def test_threads_simultaneas_no_escopo(self):
+        perfilador = PerfiladorDeterministico()
+        erros = []
+
+        def trabalho():
+            try:
+                with perfilador.escopo():
+                    _quadrados(20000)
+            except Exception as e:
+                erros.append(e)
+
+        with perfilador.escopo():
+            thread = threading.Thread(target=trabalho)
+            thread.start()
+            thread.join()
+            _quadrados(10000)
+
+        self.assertEqual(erros, [])
+        self.assertFalse(perfilador.ativo)
+        resumo = perfilador.resumo(100)
+        self.assertIn("2 thread(s)", resumo)
+        self.assertIn("_quadrados", resumo)
+
+    def test_escopo_aninhado_e_reaberto(self):
+        perfilador = PerfiladorDeterministico()
+        for _ in range(2):
+            with perfilador.escopo():
+                with perfilador.escopo():
+                    _quadrados(100)
+        self.assertIn("_quadrados", perfilador.resumo(100))
+
+    def test_sem_chamadas(self):
+        self.assertIn("Nenhuma chamada", PerfiladorDeterministico().resumo())
+
+    def test_base_abstrata(self):
+        with self.assertRaises(TypeError):
+            Perfilador()
+
+
+if __name__ == '__main__':
+    unittest.main()
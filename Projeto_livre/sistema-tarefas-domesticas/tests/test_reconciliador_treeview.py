@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes do Reconciliador de Treeview
+===================================
+
+Uma Treeview falsa (sem Tk) registra cada chamada: a mudança de uma linha
+vira um único item(); uma reordenação termina na ordem pedida movendo só
+as linhas fora da maior subsequência já em ordem.
+"""
+
+import random
+import unittest
+
+from package.views.reconciliador_treeview import ReconciliadorTreeview, _maior_subsequencia_crescente
+
+
+class TreeviewFalsa:
+    """Imita a parte da ttk.Treeview usada pelo reconciliador e conta as chamadas."""
+
+    def __init__(self):
+        self.filhos = []
+        self.itens = {}
+        self.chamadas = []
+
+    def insert(self, pai, indice, iid, values, tags):
+        self.chamadas.append('insert')
+        assert pai == '' and iid not in self.itens
+        self.filhos.insert(indice, iid)
+        self.itens[iid] = (tuple(values), tuple(tags))
+
+    def item(self, iid, values, tags):
+        self.chamadas.append('item')
+        self.itens[iid] = (tuple(values), tuple(tags))
+
+    def delete(self, *iids):
+        self.chamadas.append('delete')
+        for iid in iids:
+            self.filhos.remove(iid)
+            del self.itens[iid]
+
+    def detach(self, *iids):
+        self.chamadas.append('detach')
+        for iid in iids:
+            self.filhos.remove(iid)
+
+    def move(self, iid, pai, indice):
+        """Como no Tk: a linha vai para a posição 'indice'; desanexada, é reanexada."""
+        self.chamadas.append('move')
+        assert pai == '' and iid in self.itens
+        if iid in self.filhos:
+            self.filhos.remove(iid)
+        self.filhos.insert(indice, iid)
+
+    def index(self, iid):
+        return self.filhos.index(iid)
+
+    def get_children(self):
+        return tuple(self.filhos)
+
+    def conteudo(self):
+        return [(iid, *self.itens[iid]) for iid in self.filhos]
+
+
+def _linhas(iids, sufixo=''):
+    return [(iid, (f"Tarefa {iid}{sufixo}", 'PENDENTE'), ('pendente',)) for iid in iids]
+
+
+def _minimo_de_movimentos(antes, depois):
+    """Linhas fora de uma maior subsequência comum, pela programação dinâmica O(n²)."""
+    posicao = {iid: i for i, iid in enumerate(antes)}
+    valores = [posicao[iid] for iid in depois]
+    maior = [1] * len(valores)
+    for i in range(len(valores)):
+        for j in range(i):
+            if valores[j] < valores[i]:
+                maior[i] = max(maior[i], maior[j] + 1)
+    return len(valores) - max(maior, default=0)
+
+
+class TestReconciliadorTreeview(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = TreeviewFalsa()
+        self.reconciliador = ReconciliadorTreeview(self.tree)
+        self.iids = [f"ATV{numero:04d}" for numero in range(200)]
+        self.reconciliador.reconciliar(_linhas(self.iids))
+        self.tree.chamadas.clear()
+
+    def _reconciliar(self, linhas):
+        estatisticas = self.reconciliador.reconciliar(linhas)
+        self.assertEqual(self.tree.conteudo(), [(iid, tuple(v), tuple(t)) for iid, v, t in linhas])
+        self.assertEqual(self.reconciliador.iids, [iid for iid, _, _ in linhas])
+        return estatisticas
+
+    def test_uma_linha_alterada_uma_chamada(self):
+        linhas = _linhas(self.iids)
+        linhas[57] = (self.iids[57], ("Tarefa alterada", 'FINALIZADA'), ('finalizada',))
+        estatisticas = self._reconciliar(linhas)
+        self.assertEqual(self.tree.chamadas, ['item'])
+        self.assertEqual(estatisticas, {'inseridas': 0, 'atualizadas': 1, 'movidas': 0, 'removidas': 0})
+
+        # Sem mudanças, nenhuma chamada ao Tk
+        self.tree.chamadas.clear()
+        self._reconciliar(linhas)
+        self.assertEqual(self.tree.chamadas, [])
+
+    def test_reordenacao_com_minimo_de_movimentos(self):
+        aleatorio = random.Random(7)
+        casos = {
+            'uma linha para o fim': self.iids[:10] + self.iids[11:] + [self.iids[10]],
+            'uma linha para o início': [self.iids[150]] + self.iids[:150] + self.iids[151:],
+            'invertida': self.iids[::-1],
+            'embaralhada': aleatorio.sample(self.iids, len(self.iids)),
+        }
+        antes = self.iids
+        for nome, depois in casos.items():
+            with self.subTest(caso=nome):
+                self.tree.chamadas.clear()
+                estatisticas = self._reconciliar(_linhas(depois))
+                esperado = _minimo_de_movimentos(antes, depois)
+                self.assertEqual(estatisticas['movidas'], esperado)
+                self.assertEqual(self.tree.chamadas, ['detach', 'move'] * esperado)
+                antes = depois
+
+    def test_insercoes_remocoes_e_movimentos_juntos(self):
+        aleatorio = random.Random(11)
+        atuais = list(self.iids)
+        proximo = len(self.iids)
+        for rodada in range(20):
+            mantidos = [iid for iid in atuais if aleatorio.random() > 0.1]
+            trocados = set(aleatorio.sample(range(len(mantidos)), 10))
+            mantidos = [iid for indice, iid in enumerate(mantidos) if indice not in trocados] + \
+                [mantidos[indice] for indice in sorted(trocados)]
+            novos = [f"ATV{numero:04d}" for numero in range(proximo, proximo + 15)]
+            proximo += 15
+            depois = list(mantidos)
+            for iid in novos:
+                depois.insert(aleatorio.randrange(len(depois) + 1), iid)
+
+            with self.subTest(rodada=rodada):
+                self.tree.chamadas.clear()
+                linhas = _linhas(depois, sufixo=f" ({rodada})" if rodada % 2 else '')
+                estatisticas = self._reconciliar(linhas)
+                removidos = len(atuais) - len(mantidos)
+                self.assertEqual(estatisticas['removidas'], removidos)
+                self.assertEqual(estatisticas['inseridas'], len(novos))
+                self.assertEqual(estatisticas['movidas'],
+                                 _minimo_de_movimentos([i for i in atuais if i in set(mantidos)], mantidos))
+                self.assertEqual(self.tree.chamadas.count('delete'), 1 if removidos else 0)
+                self.assertEqual(self.tree.chamadas.count('insert'), len(novos))
+            atuais = depois
+
+        self.reconciliador.limpar()
+        self.assertEqual((self.tree.filhos, len(self.reconciliador)), ([], 0))
+
+    def test_maior_subsequencia_crescente(self):
+        self.assertEqual(_maior_subsequencia_crescente([]), set())
+        self.assertEqual(_maior_subsequencia_crescente([3, 1, 2, 0, 4]), {1, 2, 4})
+        aleatorio = random.Random(3)
+        for _ in range(50):
+            valores = aleatorio.sample(range(100), 40)
+            indices = sorted(_maior_subsequencia_crescente(valores))
+            escolhidos = [valores[i] for i in indices]
+            self.assertEqual(escolhidos, sorted(escolhidos))
+            self.assertEqual(len(valores) - len(indices), _minimo_de_movimentos(valores, sorted(valores)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes dos Relatórios em Lote
+=============================
+
+Parâmetros fora da faixa são recusados pelo argparse antes de qualquer
+arquivo de dados ser procurado ou carregado.
+"""
+
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import relatorios_lote
+
+
+class TestRelatoriosLote(unittest.TestCase):
+
+    def test_parametros_fora_da_faixa(self):
+        for argumentos in (['--dias', '0'], ['--mes', '0'], ['--mes', '13'], ['--dias', 'sete']):
+            with self.subTest(argumentos=argumentos), \
+                    mock.patch.object(relatorios_lote, 'listar_arquivos_dados') as listar, \
+                    mock.patch.object(relatorios_lote, 'executar_lote') as executar, \
+                    contextlib.redirect_stderr(io.StringIO()) as erro:
+                with self.assertRaises(SystemExit) as saida:
+                    relatorios_lote.main(['dados/', '-o', 'saida.jsonl'] + argumentos)
+                self.assertEqual(saida.exception.code, 2)
+                self.assertIn(argumentos[0], erro.getvalue())
+                listar.assert_not_called()
+                executar.assert_not_called()
+
+    def test_limites_aceitos(self):
+        args = relatorios_lote.criar_parser().parse_args(['dados/', '-o', 'saida.jsonl',
+                                                          '--mes', '12', '--dias', '1'])
+        self.assertEqual((args.mes, args.dias), (12, 1))
+        self.assertEqual(relatorios_lote.criar_parser().parse_args(['dados/', '-o', 'x.md']).dias, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da Geração Paralela de Relatórios
+========================================
+
+Resultados do pool (processos ou threads) iguais aos do mixin chamado em
+série, snapshot que passa por pickle e validação de nomes e parâmetros
+antes de o pool ser criado.
+"""
+
+import contextlib
+import io
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.gerador_dados import ParametrosGeracao, gravar_json
+from package.controllers import processamento_lote, relatorios_paralelos
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.controllers.relatorios_paralelos import (RELATORIOS_DISPONIVEIS, GeradorSnapshot,
+                                                      criar_snapshot, gerar_relatorios_em_paralelo)
+from package.models.residencia import Residencia
+
+PARAMETROS = {
+    'historico_mes': {'mes': 6, 'ano': 2025},
+    'produtividade_diaria': {'dias': 400},
+    'ranking': {'limite': 3}
+}
+
+
+def _sem_data_geracao(relatorio):
+    """Remove o carimbo de hora (pode virar o minuto entre duas chamadas)."""
+    if isinstance(relatorio, dict):
+        return {chave: _sem_data_geracao(valor) for chave, valor in relatorio.items()
+                if chave != 'data_geracao'}
+    if isinstance(relatorio, list):
+        return [_sem_data_geracao(item) for item in relatorio]
+    return relatorio
+
+
+def _em_serie(gerador, nomes):
+    """Chama cada relatório direto no gerador, um por vez."""
+    return {nome: _sem_data_geracao(getattr(gerador, RELATORIOS_DISPONIVEIS[nome])(
+                **PARAMETROS.get(nome, {})))
+            for nome in nomes}
+
+
+class TestRelatoriosParalelos(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._diretorio = tempfile.TemporaryDirectory()
+        arquivo = os.path.join(cls._diretorio.name, 'dados.json')
+        gravar_json(arquivo, ParametrosGeracao(moradores=5, total_atividades=300, semente=13))
+        cls.gerenciador = GerenciadorTarefas(Residencia("Casa"), ArmazenamentoDados(arquivo))
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert cls.gerenciador.carregar_dados()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._diretorio.cleanup()
+
+    def test_igual_ao_mixin_em_serie(self):
+        nomes = list(RELATORIOS_DISPONIVEIS)
+        esperado = _em_serie(self.gerenciador, nomes)
+        for usar_processos in (True, False):
+            with self.subTest(usar_processos=usar_processos):
+                resultados = gerar_relatorios_em_paralelo(self.gerenciador, nomes, PARAMETROS,
+                                                          max_workers=2, usar_processos=usar_processos)
+                self.assertEqual(list(resultados), nomes)
+                self.assertEqual(_sem_data_geracao(resultados), esperado)
+        self.assertEqual(gerar_relatorios_em_paralelo(self.gerenciador, []), {})
+
+    def test_snapshot_por_pickle(self):
+        snapshot = criar_snapshot(self.gerenciador)
+        self.assertEqual(len(snapshot['atividades']), self.gerenciador.contar_atividades())
+
+        gerador = GeradorSnapshot(pickle.loads(pickle.dumps(snapshot)))
+        copia = pickle.loads(pickle.dumps(gerador, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual([a.to_dict() for a in copia._lista_atividades],
+                         [a.to_dict() for a in self.gerenciador.atividades])
+        self.assertEqual(copia._residencia.to_dict(), self.gerenciador.residencia.to_dict())
+        nomes = list(RELATORIOS_DISPONIVEIS)
+        self.assertEqual(_em_serie(copia, nomes), _em_serie(self.gerenciador, nomes))
+
+    def test_erros_antes_do_pool(self):
+        invalidos = (
+            (['inexistente'], None),
+            (['ranking', 'outro'], None),
+            (['produtividade_diaria'], {'produtividade_diaria': {'dias': 0}}),
+            (['produtividade_diaria'], {'produtividade_diaria': {'dias': 10 ** 9}}),
+            (['historico_mes'], {'historico_mes': {'mes': 13}}),
+            (['historico_mes'], {'historico_mes': {'mes': '5'}}),
+        )
+        for relatorios, parametros in invalidos:
+            for usar_processos in (True, False):
+                with self.subTest(relatorios=relatorios, parametros=parametros, processos=usar_processos), \
+                        mock.patch.object(relatorios_paralelos, 'ProcessPoolExecutor') as processos, \
+                        mock.patch.object(relatorios_paralelos, 'ThreadPoolExecutor') as threads, \
+                        mock.patch.object(relatorios_paralelos, 'criar_snapshot') as snapshot:
+                    with self.assertRaises(ValueError):
+                        gerar_relatorios_em_paralelo(self.gerenciador, relatorios, parametros,
+                                                     usar_processos=usar_processos)
+                    processos.assert_not_called()
+                    threads.assert_not_called()
+                    snapshot.assert_not_called()
+
+        # O lote de arquivos valida do mesmo jeito, antes de abrir a saída
+        saida = os.path.join(self._diretorio.name, 'lote.csv')
+        for relatorios, parametros in invalidos:
+            with self.subTest(lote=relatorios, parametros=parametros), \
+                    mock.patch.object(processamento_lote, 'ProcessPoolExecutor') as processos:
+                with self.assertRaises(ValueError):
+                    processamento_lote.executar_lote([], saida, relatorios, parametros)
+                processos.assert_not_called()
+                self.assertFalse(os.path.exists(saida))
+
+
+if __name__ == '__main__':
+    unittest.main()
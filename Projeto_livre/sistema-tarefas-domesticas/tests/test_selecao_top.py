@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da Seleção Top-K
+=======================
+
+Compara AcumuladorTopK, AmostraLimitada, mais_comuns, os auxiliares de
+GerarRelatorios e Residencia.obter_ranking_moradores com as versões
+anteriores (Counter.most_common e fatias de listas ordenadas), em fluxos
+de um milhão de atividades.
+"""
+
+import random
+import unittest
+from collections import Counter
+from datetime import datetime
+
+from benchmarks.gerador_dados import sufixo_letras
+from package.mixins.gerar_relatorios import GerarRelatorios
+from package.models.enums import CategoriaAtividade
+from package.models.morador import Morador
+from package.models.residencia import Residencia
+from package.utils.selecao_top import AcumuladorTopK, AmostraLimitada, mais_comuns
+
+# Tamanho do fluxo nos testes de escala
+TOTAL_ATIVIDADES = 1_000_000
+
+
+class _Atividade:
+    """Atividade mínima com os atributos lidos pelos relatórios."""
+
+    __slots__ = ('categoria', 'nome_tarefa', 'responsavel_id', 'pontos_tarefa',
+                 'esta_finalizada', 'esta_pendente', 'esta_cancelada', 'data_criacao')
+
+    def __init__(self, categoria, nome_tarefa, responsavel_id, situacao):
+        self.categoria = categoria
+        self.nome_tarefa = nome_tarefa
+        self.responsavel_id = responsavel_id
+        self.pontos_tarefa = 10
+        self.esta_finalizada = situacao == 'finalizada'
+        self.esta_pendente = situacao == 'pendente'
+        self.esta_cancelada = situacao == 'cancelada'
+        self.data_criacao = datetime(2025, 3, 1)
+
+
+class _Casa(GerarRelatorios):
+    """Hospedeiro do mixin sem o GerenciadorTarefas."""
+
+    def __init__(self, residencia, atividades):
+        self._residencia = residencia
+        self._lista_atividades = atividades
+
+
+def _fluxo_atividades(residencia: Residencia, semente: int = 7):
+    """
+    Um milhão de referências a um conjunto pequeno de atividades.
+
+    As contagens (o que os relatórios acumulam) são as de um milhão de
+    atividades, sem o custo de memória de um milhão de objetos.
+    """
+    aleatorio = random.Random(semente)
+    ids = [None] + [m.id for m in residencia]
+    modelos = [
+        _Atividade(categoria, f"{categoria.name.lower()} {i}", ids[i % len(ids)], situacao)
+        for categoria in CategoriaAtividade
+        for i in range(40)
+        for situacao in ('pendente', 'finalizada', 'cancelada')
+    ]
+    # Pesos desiguais, para que haja vencedores claros e também empates
+    pesos = [aleatorio.choice((1, 1, 2, 5)) for _ in modelos]
+    return aleatorio.choices(modelos, weights=pesos, k=TOTAL_ATIVIDADES)
+
+
+def _residencia(quantidade: int, semente: int = 3) -> Residencia:
+    """
+    Residência cujos pontos vêm de um milhão de atividades finalizadas.
+
+    Cada atividade vale 10 pontos para um morador sorteado, o que gera
+    muitas pontuações repetidas (empates no ranking).
+    """
+    aleatorio = random.Random(semente)
+    finalizadas = Counter(aleatorio.choices(range(quantidade), k=TOTAL_ATIVIDADES))
+    residencia = Residencia("Casa de Teste")
+    for i in range(quantidade):
+        morador = Morador.from_dict({'nome': f"Morador {sufixo_letras(i)}",
+                                     'pontos_realizadas': finalizadas[i] * 10})
+        residencia.adicionar_morador(morador)
+    return residencia
+
+
+class TestAcumuladorTopK(unittest.TestCase):
+    """AcumuladorTopK deve coincidir com sorted(..., reverse=True)[:k]."""
+
+    def test_um_milhao_de_valores_com_empates(self):
+        aleatorio = random.Random(1)
+        valores = [aleatorio.randrange(1000) for _ in range(TOTAL_ATIVIDADES)]
+        for k in (0, 1, 10, 1000):
+            top = AcumuladorTopK(k)
+            top.adicionar_varios(valores)
+            self.assertEqual(top.resultado(), sorted(valores, reverse=True)[:k])
+            self.assertEqual(top.total_observado, TOTAL_ATIVIDADES)
+
+    def test_empates_mantem_ordem_de_chegada(self):
+        itens = [('a', 2), ('b', 3), ('c', 2), ('d', 3), ('e', 1)]
+        top = AcumuladorTopK(3, chave=lambda par: par[1])
+        top.adicionar_varios(itens)
+        self.assertEqual(top.resultado(), sorted(itens, key=lambda par: par[1], reverse=True)[:3])
+
+    def test_k_negativo(self):
+        with self.assertRaises(ValueError):
+            AcumuladorTopK(-1)
+
+
+class TestAmostraLimitada(unittest.TestCase):
+    """AmostraLimitada deve coincidir com lista[:k]."""
+
+    def test_primeiros_itens(self):
+        itens = list(range(TOTAL_ATIVIDADES))
+        amostra = AmostraLimitada(5)
+        for item in itens:
+            amostra.adicionar(item)
+        self.assertEqual(amostra.resultado(), itens[:5])
+        self.assertEqual(amostra.total_observado, TOTAL_ATIVIDADES)
+        self.assertEqual(len(amostra), 5)
+
+    def test_k_negativo(self):
+        with self.assertRaises(ValueError):
+            AmostraLimitada(-1)
+
+
+class TestMaisComuns(unittest.TestCase):
+    """mais_comuns deve coincidir com Counter.most_common(k)."""
+
+    def test_um_milhao_de_valores(self):
+        aleatorio = random.Random(2)
+        valores = [aleatorio.choice('abcdefghij') * aleatorio.randrange(1, 4)
+                   for _ in range(TOTAL_ATIVIDADES)]
+        for k in (0, 3, 5, 100):
+            self.assertEqual(mais_comuns(valores, k), Counter(valores).most_common(k))
+
+    def test_empates(self):
+        valores = ['x', 'y', 'z', 'y', 'x', 'w']
+        self.assertEqual(mais_comuns(valores, 2), Counter(valores).most_common(2))
+
+
+class TestRelatorios(unittest.TestCase):
+    """Auxiliares de GerarRelatorios contra a contagem anterior."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.residencia = _residencia(30)
+        cls.atividades = _fluxo_atividades(cls.residencia)
+        cls.casa = _Casa(cls.residencia, cls.atividades)
+
+    def test_categorias_favoritas(self):
+        for morador in list(self.residencia)[:5]:
+            esperado = Counter(a.categoria.value for a in self.atividades
+                               if a.responsavel_id == morador.id and a.esta_finalizada)
+            self.assertEqual(self.casa._obter_categorias_favoritas_morador(morador.id),
+                             [cat for cat, _ in esperado.most_common(3)])
+
+    def test_top_moradores_mes(self):
+        contagem = Counter(a.responsavel_id for a in self.atividades
+                           if a.esta_finalizada and a.responsavel_id)
+        esperado = [{'nome': self.residencia.obter_morador_por_id(morador_id).nome,
+                     'tarefas_finalizadas': total}
+                    for morador_id, total in contagem.most_common(5)]
+        self.assertEqual(self.casa._obter_top_moradores_mes(self.atividades), esperado)
+
+    def test_categorias_mais_ativas_mes(self):
+        contagem = Counter(a.categoria.value for a in self.atividades)
+        esperado = [{'categoria': cat, 'quantidade': total} for cat, total in contagem.most_common(5)]
+        self.assertEqual(self.casa._obter_categorias_mais_ativas_mes(self.atividades), esperado)
+
+    def test_exemplos_por_categoria(self):
+        estatisticas = self.casa.estatisticas_por_categoria()
+        for categoria in CategoriaAtividade:
+            nomes = [a.nome_tarefa for a in self.atividades if a.categoria == categoria]
+            dados = estatisticas['categorias'][categoria.value]
+            self.assertEqual(dados['total_atividades'], len(nomes))
+            self.assertEqual(dados['atividades_exemplo'], nomes[:5])
+
+
+class TestRankingMoradores(unittest.TestCase):
+    """obter_ranking_moradores(limite) contra a fatia da lista ordenada."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.residencia = _residencia(2000)
+
+    def _nomes(self, ranking):
+        return [(item['posicao'], item['nome']) for item in ranking]
+
+    def test_limites(self):
+        ordenados = self.residencia.obter_ranking_moradores()
+        for limite in (0, 1, 10, 1999, 2000, 5000):
+            self.assertEqual(self._nomes(self.residencia.obter_ranking_moradores(limite)),
+                             self._nomes(ordenados[:limite]))
+
+    def test_limite_negativo_mantem_semantica_de_fatia(self):
+        ordenados = self.residencia.listar_moradores_ordenados_por_pontos()
+        ranking = self.residencia.obter_ranking_moradores(-3)
+        self.assertEqual([item['nome'] for item in ranking], [m.nome for m in ordenados[:-3]])
+
+    def test_ranking_do_mixin(self):
+        casa = _Casa(self.residencia, [])
+        ordenados = self.residencia.listar_moradores_ordenados_por_pontos()
+        self.assertEqual([item['nome'] for item in casa.ranking_melhores_moradores(10)],
+                         [m.nome for m in ordenados[:10]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes da API HTTP
+==================
+
+ETag e 304 (nunca nos relatórios), conflitos (409), métodos não permitidos
+(405), validação dos parâmetros de relatório (400) e uma conexão HTTP real
+com keep-alive.
+"""
+
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from package.controllers.armazenamento_dados import ArmazenamentoDados
+from package.controllers.gerenciador_tarefas import GerenciadorTarefas
+from package.models.residencia import Residencia
+from package.views.servidor_http import ApiTarefas, ErroApi, ServidorTarefas
+
+
+def _api(diretorio: str) -> ApiTarefas:
+    """API sobre um gerenciador vazio gravando em 'diretorio'."""
+    armazenamento = ArmazenamentoDados(os.path.join(diretorio, 'dados.json'))
+    return ApiTarefas(GerenciadorTarefas(Residencia("Casa de Teste"), armazenamento))
+
+
+class TestApiTarefas(unittest.TestCase):
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.api = _api(diretorio.name)
+
+    def _status_erro(self, metodo, caminho, consulta=None, corpo=None):
+        with self.assertRaises(ErroApi) as contexto:
+            self.api.tratar(metodo, caminho, consulta or {}, corpo)
+        return contexto.exception.status
+
+    def test_etag_e_304(self):
+        status, resultado, etag = self.api.tratar('GET', '/api/moradores', {}, None)
+        self.assertEqual((status, resultado), (200, []))
+        self.assertTrue(etag.startswith('W/"'))
+
+        self.assertEqual(self.api.tratar('GET', '/api/moradores', {}, None, etag), (304, None, etag))
+        # Comparação fraca: com ou sem W/, em lista, ou *
+        forte = etag[2:]
+        for cabecalho in (forte, f'"outro", {etag}', '*'):
+            self.assertEqual(self.api.tratar('GET', '/api/resumo', {}, None, cabecalho)[0], 304)
+
+        # Uma alteração muda o ETag, e o antigo deixa de valer
+        status, _, novo = self.api.tratar('POST', '/api/moradores', {}, {'nome': 'Ana'})
+        self.assertEqual(status, 201)
+        self.assertNotEqual(novo, etag)
+        self.assertEqual(self.api.tratar('GET', '/api/moradores', {}, None, etag)[0], 200)
+
+    def test_relatorios_sem_etag(self):
+        _, _, etag = self.api.tratar('GET', '/api/moradores', {}, None)
+        # O mesmo ETag valeria amanhã para "últimos 7 dias": relatórios sempre são refeitos
+        for cabecalho in (None, etag, '*'):
+            status, resultado, etiqueta = self.api.tratar('GET', '/api/relatorios/produtividade_diaria',
+                                                          {}, None, cabecalho)
+            self.assertEqual((status, etiqueta), (200, None))
+            self.assertIn('periodo', resultado)
+        self.assertIsNone(self.api.tratar('GET', '/api/relatorios/historico_mes', {}, None, '*')[2])
+        self.assertEqual(self.api.tratar('GET', '/api/relatorios', {}, None, etag)[0], 304)
+
+    def test_etag_compara_so_o_prefixo_fraco(self):
+        etag = 'W/"abc-1"'
+        self.assertTrue(ApiTarefas._etag_corresponde('"abc-1"', etag))
+        self.assertTrue(ApiTarefas._etag_corresponde('W/"abc-1"', etag))
+        # lstrip('W/') aceitaria estes, que não são o mesmo ETag
+        self.assertFalse(ApiTarefas._etag_corresponde('WW/"abc-1"', etag))
+        self.assertFalse(ApiTarefas._etag_corresponde('W//"abc-1"', etag))
+        self.assertFalse(ApiTarefas._etag_corresponde('', etag))
+
+    def test_conflitos(self):
+        self.api.tratar('POST', '/api/moradores', {}, {'nome': 'Ana'})
+        self.assertEqual(self._status_erro('POST', '/api/moradores', corpo={'nome': 'Ana'}), 409)
+
+        _, atividade, _ = self.api.tratar('POST', '/api/atividades', {},
+                                          {'categoria': 'limpeza', 'nome': 'Varrer a sala'})
+        caminho = f"/api/atividades/{atividade['id_atividade']}"
+        self.assertEqual(self.api.tratar('POST', f'{caminho}/finalizar', {}, None)[0], 200)
+        self.assertEqual(self._status_erro('POST', f'{caminho}/finalizar'), 409)
+        self.assertEqual(self._status_erro('POST', f'{caminho}/cancelar'), 409)
+
+    def test_renomear_para_nome_existente(self):
+        _, ana, _ = self.api.tratar('POST', '/api/moradores', {}, {'nome': 'Ana'})
+        _, bia, _ = self.api.tratar('POST', '/api/moradores', {}, {'nome': 'Bia'})
+        caminho = f"/api/moradores/{bia['id']}"
+        versao = self.api.gerenciador.versao
+
+        for nome in ('Ana', ' ana '):
+            self.assertEqual(self._status_erro('PATCH', caminho, corpo={'nome': nome}), 409)
+        self.assertEqual(self.api.gerenciador.versao, versao)
+        self.assertEqual(self.api.tratar('GET', caminho, {}, None)[1]['nome'], 'Bia')
+
+        # O próprio nome (com outra caixa) e nomes livres continuam aceitos
+        self.assertEqual(self.api.tratar('PATCH', caminho, {}, {'nome': 'bia'})[0], 200)
+        status, morador, _ = self.api.tratar('PATCH', caminho, {}, {'nome': 'Bianca'})
+        self.assertEqual((status, morador['nome']), (200, 'Bianca'))
+        self.assertEqual(self.api.tratar('GET', f"/api/moradores/{ana['id']}", {}, None)[1]['nome'], 'Ana')
+
+    def test_metodo_nao_permitido_e_rota_inexistente(self):
+        with self.assertRaises(ErroApi) as contexto:
+            self.api.tratar('DELETE', '/api/moradores', {}, None)
+        self.assertEqual(contexto.exception.status, 405)
+        self.assertIn('GET', contexto.exception.mensagem)
+        self.assertIn('POST', contexto.exception.mensagem)
+        self.assertEqual(self._status_erro('GET', '/api/inexistente'), 404)
+        self.assertEqual(self._status_erro('GET', '/api/relatorios/inexistente'), 404)
+
+    def test_parametros_do_relatorio(self):
+        for nome, consulta in (('produtividade_diaria', {'dias': ['0']}),
+                               ('produtividade_diaria', {'dias': ['99999999999']}),
+                               ('produtividade_diaria', {'dias': ['x']}),
+                               ('historico_mes', {'mes': ['0']}),
+                               ('historico_mes', {'mes': ['13']})):
+            self.assertEqual(self._status_erro('GET', f'/api/relatorios/{nome}', consulta), 400, consulta)
+
+        status, resultado, _ = self.api.tratar('GET', '/api/relatorios/produtividade_diaria',
+                                               {'dias': ['30']}, None)
+        self.assertEqual((status, resultado['periodo']), (200, "Últimos 30 dias"))
+        status, resultado, _ = self.api.tratar('GET', '/api/relatorios/historico_mes',
+                                               {'mes': ['12'], 'ano': ['2024']}, None)
+        self.assertEqual((status, resultado['mes']), (200, 12))
+
+
+class TestServidorTarefas(unittest.TestCase):
+    """Uma conexão persistente contra o servidor numa porta livre."""
+
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.servidor = ServidorTarefas(('127.0.0.1', 0), _api(diretorio.name), silencioso=True)
+        thread = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.servidor.server_close)
+        self.addCleanup(self.servidor.shutdown)
+        self.conexao = http.client.HTTPConnection(*self.servidor.server_address, timeout=5)
+        self.addCleanup(self.conexao.close)
+
+    def _requisitar(self, metodo, caminho, corpo=None, cabecalhos=None):
+        conteudo = None if corpo is None else json.dumps(corpo)
+        self.conexao.request(metodo, caminho, conteudo, cabecalhos or {})
+        resposta = self.conexao.getresponse()
+        return resposta, resposta.read()
+
+    def test_304_sem_corpo_na_mesma_conexao(self):
+        resposta, conteudo = self._requisitar('GET', '/api/resumo')
+        self.assertEqual(resposta.status, 200)
+        etag = resposta.getheader('ETag')
+        self.assertEqual(json.loads(conteudo)['residencia'], "Casa de Teste")
+
+        resposta, conteudo = self._requisitar('GET', '/api/resumo', cabecalhos={'If-None-Match': etag})
+        self.assertEqual((resposta.status, conteudo), (304, b''))
+
+        resposta, conteudo = self._requisitar('POST', '/api/moradores', {'nome': 'Ana'})
+        self.assertEqual(resposta.status, 201)
+        resposta, _ = self._requisitar('GET', '/api/resumo', cabecalhos={'If-None-Match': etag})
+        self.assertEqual(resposta.status, 200)
+
+    def test_relatorio_sem_etag_na_resposta(self):
+        resposta, conteudo = self._requisitar('GET', '/api/relatorios/produtividade_diaria',
+                                              cabecalhos={'If-None-Match': '*'})
+        self.assertEqual(resposta.status, 200)
+        self.assertIsNone(resposta.getheader('ETag'))
+        self.assertIn('periodo', json.loads(conteudo))
+
+    def test_erros_em_json(self):
+        resposta, conteudo = self._requisitar('PATCH', '/api/atividades')
+        self.assertEqual(resposta.status, 405)
+        self.assertIn('erro', json.loads(conteudo))
+        resposta, conteudo = self._requisitar('GET', '/api/relatorios/produtividade_diaria?dias=0')
+        self.assertEqual(resposta.status, 400)
+        self.assertIn('dias', json.loads(conteudo)['erro'])
+
+
+if __name__ == '__main__':
+    unittest.main()